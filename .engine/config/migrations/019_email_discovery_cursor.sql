@@ -0,0 +1,13 @@
+-- Email Discovery Cursor
+-- Per-account high-water mark for the pipeline's new-mail discovery.
+-- Discovery fetches only Apple Mail messages after (since_ts, since_rowid),
+-- so bursts larger than one poll page are no longer missed.
+
+CREATE TABLE IF NOT EXISTS email_discovery_cursor (
+    account_id TEXT NOT NULL,
+    mailbox TEXT NOT NULL DEFAULT 'INBOX',
+    since_ts INTEGER NOT NULL,      -- Apple Mail date_received of the last message seen
+    since_rowid INTEGER NOT NULL,   -- Apple Mail ROWID tiebreak
+    updated_at TEXT NOT NULL,
+    PRIMARY KEY (account_id, mailbox)
+);
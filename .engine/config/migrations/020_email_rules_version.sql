@@ -0,0 +1,9 @@
+-- Email Rules Version
+-- Single-row counter bumped with every email_sender_rules write (API, MCP
+-- tools, reclassify). The pipeline keeps an in-memory sender-rule index and
+-- rebuilds it only when this version moves.
+
+CREATE TABLE IF NOT EXISTS email_rules_version (
+    id INTEGER PRIMARY KEY CHECK (id = 1),
+    version INTEGER NOT NULL
+);
@@ -0,0 +1,9 @@
+-- Email Classification Queue
+-- Unclassified email_metadata rows are the pipeline's persistent work queue.
+-- classify_priority is set at discovery (0 VIP sender, 1 thread reply,
+-- 2 everything else) and workers take the lowest value first.
+
+ALTER TABLE email_metadata ADD COLUMN classify_priority INTEGER NOT NULL DEFAULT 2;
+
+CREATE INDEX IF NOT EXISTS idx_email_meta_queue
+ON email_metadata(classify_priority, first_seen_at DESC) WHERE classified = 0;
@@ -345,6 +345,9 @@ CREATE TABLE IF NOT EXISTS email_metadata (
     first_seen_at TEXT NOT NULL,  -- When pipeline first discovered this email
     last_updated_at TEXT NOT NULL,
 
+    -- Classification queue order: 0 VIP sender, 1 thread reply, 2 everything else
+    classify_priority INTEGER NOT NULL DEFAULT 2,
+
     PRIMARY KEY (email_message_id, account_id)
 );
 CREATE TABLE IF NOT EXISTS email_classifications (
@@ -414,6 +417,21 @@ CREATE TABLE IF NOT EXISTS email_classification_feedback (
     promoted_to_eval BOOLEAN DEFAULT 0,
     FOREIGN KEY (classification_id) REFERENCES email_classifications(id)
 );
+CREATE TABLE IF NOT EXISTS email_discovery_cursor (
+    account_id TEXT NOT NULL,
+    mailbox TEXT NOT NULL DEFAULT 'INBOX',
+    since_ts INTEGER NOT NULL,      -- Apple Mail date_received of the last message seen
+    since_rowid INTEGER NOT NULL,   -- Apple Mail ROWID tiebreak
+    updated_at TEXT NOT NULL,
+    PRIMARY KEY (account_id, mailbox)
+);
+
+-- Email rules version: bumped with every email_sender_rules write so the
+-- pipeline rebuilds its in-memory rule index only when rules change
+CREATE TABLE IF NOT EXISTS email_rules_version (
+    id INTEGER PRIMARY KEY CHECK (id = 1),
+    version INTEGER NOT NULL
+);
 CREATE INDEX IF NOT EXISTS idx_sessions_active ON sessions(ended_at) WHERE ended_at IS NULL;
 CREATE INDEX IF NOT EXISTS idx_sessions_type ON sessions(session_type);
 CREATE INDEX IF NOT EXISTS idx_sessions_role ON sessions(role);
@@ -457,6 +475,8 @@ CREATE INDEX IF NOT EXISTS idx_email_meta_processed
 ON email_metadata(processed, first_seen_at DESC);
 CREATE INDEX IF NOT EXISTS idx_email_meta_classified
 ON email_metadata(classified) WHERE classified = 0;
+CREATE INDEX IF NOT EXISTS idx_email_meta_queue
+ON email_metadata(classify_priority, first_seen_at DESC) WHERE classified = 0;
 CREATE INDEX IF NOT EXISTS idx_classifications_email
 ON email_classifications(email_message_id, account_id);
 CREATE INDEX IF NOT EXISTS idx_classifications_category
@@ -31,7 +31,7 @@ sys.path.insert(0, str(REPO_ROOT / ".engine" / "src"))
 
 from core.storage import SystemStorage
 from modules.handoff import HandoffService
-from modules.handoff.transcript_parser import parse_transcript
+from modules.handoff.digest import build_handoff_transcript, discard_handoff_digest
 from modules.sessions.transcript import get_transcript_path_for_session
 
 DB_PATH = REPO_ROOT / ".engine" / "data" / "db" / "system.db"
@@ -282,13 +282,17 @@ def write_fallback_handoff(handoff_path: str, summary: str, spec_path: str = Non
 
 
 def get_transcript_text(session_id: str) -> str:
-    """Get formatted transcript text for a session using the parser."""
+    """Get formatted transcript text for a session.
+
+    Uses the handoff digest the context monitor keeps for sessions past
+    70% context, so only the tail since its last checkpoint is parsed here.
+    """
     transcript_path = get_transcript_path_for_session(session_id, DB_PATH)
     if not transcript_path:
         logger.warning(f"No transcript found for session {session_id}")
         return ""
 
-    return parse_transcript(transcript_path)
+    return build_handoff_transcript(session_id, transcript_path)
 
 
 def get_operational_state() -> dict:
@@ -299,7 +303,7 @@ def get_operational_state() -> dict:
     active_sessions = storage.fetchall(
         """SELECT session_id, role, status_text
            FROM sessions
-           WHERE ended_at IS NULL
+           WHERE ended_at IS NULL AND role IS NOT 'standby'
            ORDER BY started_at DESC"""
     )
 
@@ -480,6 +484,7 @@ def execute_handoff(handoff_id: str):
                 handoff["handoff_path"] = None
                 logger.info("Continuing without handoff - replacement will spawn with no context")
             finally:
+                discard_handoff_digest(handoff["session_id"])
                 # Clean up the summarizer session that was created during generation
                 conv_id = handoff.get("conversation_id")
                 if conv_id:
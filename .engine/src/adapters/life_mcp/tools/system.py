@@ -176,7 +176,7 @@ def _resolve_team_id(id: Optional[str]) -> Optional[Dict[str, Any]]:
         cursor = conn.execute("""
             SELECT session_id, role, conversation_id, tmux_pane, mode, status_text, spec_path
             FROM sessions
-            WHERE session_id LIKE ? AND ended_at IS NULL
+            WHERE session_id LIKE ? AND ended_at IS NULL AND role IS NOT 'standby'
         """, (f"{id}%",))
         row = cursor.fetchone()
         return dict(row) if row else None
@@ -362,7 +362,7 @@ def _team_list() -> Dict[str, Any]:
                    (SELECT COUNT(*) FROM sessions s2
                     WHERE s2.conversation_id = s.conversation_id) as sessions_count
             FROM sessions s
-            WHERE s.ended_at IS NULL
+            WHERE s.ended_at IS NULL AND s.role IS NOT 'standby'
             ORDER BY s.started_at DESC
         """)
         rows = cursor.fetchall()
@@ -600,35 +600,38 @@ class TelegramService:
         """Handle spec submission for /spawn command."""
         try:
             # Write spec to conversations directory
-            import uuid
             spec_id = str(uuid.uuid4())[:8]
-            spec_filename = f"telegram-spawn-{role}-{spec_id}.md"
-
-            from pathlib import Path
-            repo_root = Path(__file__).parent.parent.parent.parent
-            spec_path = repo_root / "Desktop" / "conversations" / spec_filename
-
-            # Write spec
+            conversations_dir = settings.repo_root / "Desktop" / "conversations"
+            spec_path = conversations_dir / f"telegram-spawn-{role}-{spec_id}.md"
             spec_path.write_text(spec_text)
 
-            # Spawn specialist via team tool (import inline to avoid circular deps)
-            from adapters.life_mcp.tools.core import team
+            # Specialist workspace, same layout as team("spawn")
+            now = datetime.now(settings.timezone)
+            conversation_id = f"{now.strftime('%m%d-%H%M')}-{role}-{uuid.uuid4().hex[:8]}"
+            workspace = conversations_dir / conversation_id
+            workspace.mkdir(parents=True, exist_ok=True)
+            (workspace / "progress.md").write_text(
+                f"# Progress Log\n\nStarted: {now.strftime('%Y-%m-%d %H:%M')}\nMax iterations: 10\n\n"
+            )
 
-            result = team(
-                operation="spawn",
+            # Readiness is awaited on the event loop; no thread blocks on the boot
+            handle = await self.session_manager.spawn_async(
                 role=role,
-                spec_path=str(spec_path)
+                mode="preparation",
+                conversation_id=conversation_id,
+                description=f"{role.title()} (Telegram)",
+                spec_path=str(spec_path),
             )
+            await update.message.reply_text(f"⏳ Starting {role} (ID: {handle.session_id[:8]})...")
 
-            if result.get("success"):
-                session_id = result.get("session_id", "unknown")[:8]
+            result = await handle
+            if result.success:
                 await update.message.reply_text(
-                    f"✅ {role.capitalize()} spawned (ID: {session_id})"
+                    f"✅ {role.capitalize()} spawned (ID: {handle.session_id[:8]})"
                 )
             else:
-                error = result.get("error", "Unknown error")
                 await update.message.reply_text(
-                    f"⚠️ Failed to spawn {role}: {error}"
+                    f"⚠️ Failed to spawn {role}: {result.error or 'Unknown error'}"
                 )
 
         except Exception as e:
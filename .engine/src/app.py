@@ -44,6 +44,14 @@ def _build_lifespan(testing: bool):
             except Exception as e:
                 logger.error(f"Session reconciliation failed: {e}")
 
+            # Pre-launch standby Claude sessions (settings.session_pool; off when empty)
+            try:
+                from modules.sessions.pool import start_standby_pool
+                from modules.sessions.service import SessionService
+                await start_standby_pool(SessionService(settings.db_path))
+            except Exception as e:
+                logger.error(f"Standby pool startup failed: {e}")
+
             # Run account discovery on startup
             try:
                 from modules.accounts.discovery import AccountDiscoveryService
@@ -133,6 +141,10 @@ def _build_lifespan(testing: bool):
             # Stop Telegram service gracefully
             await telegram_service.stop()
 
+            # Close idle standby sessions
+            from modules.sessions.pool import stop_standby_pool
+            await stop_standby_pool()
+
             # Stop email pipeline gracefully
             if hasattr(app.state, 'email_pipeline'):
                 app.state.email_pipeline.stop()
@@ -151,6 +163,12 @@ def _build_lifespan(testing: bool):
                 for task in all_tasks:
                     task.cancel()
                 await asyncio.gather(*all_tasks, return_exceptions=True)
+
+            # Drain write-behind event log before connections go away
+            from core import event_log
+            from core.database import close_pools
+            event_log.flush()
+            close_pools()
         else:
             logger.info("Testing mode - background services disabled")
             yield
@@ -38,6 +38,9 @@ class Settings:
         self.db_path = self.data_dir / "db" / "system.db"
         self.outputs_dir = self.data_dir / "outputs"
         self.logs_dir = self.data_dir / "logs"
+        self.transcript_index_dir = self.data_dir / "transcript_index"  # Sidecar offset indexes
+        self.mail_body_cache_dir = self.data_dir / "mail_body_cache"  # Extracted .emlx bodies
+        self.handoff_digest_dir = self.data_dir / "handoff_digests"  # Transcripts parsed ahead of reset
 
         # Config paths
         self.config_dir = self.engine_dir / "config"
@@ -69,6 +72,35 @@ class Settings:
         ]
         self.watcher_debounce_ms = 1600  # Batch changes within this window
 
+        # === Event Bus Configuration ===
+        self.event_replay_size = 1000  # SystemEvents kept for Last-Event-ID resume
+        # Spill events evicted from the replay log to the event_replay table
+        self.event_replay_spill = os.environ.get("CLAUDE_OS_EVENT_SPILL", "false").lower() == "true"
+
+        # === tmux Configuration ===
+        # Route tmux commands over one control-mode (tmux -C) connection;
+        # when off or unavailable, each command spawns a tmux process
+        self.tmux_control_mode = os.environ.get("CLAUDE_OS_TMUX_CONTROL", "true").lower() == "true"
+
+        # === Session Pool Configuration ===
+        # Idle pre-launched Claude windows kept per model, e.g. "sonnet=2,opus=1".
+        # Empty (the default) disables the pool: every spawn starts cold.
+        self.session_pool: Dict[str, int] = {
+            model.strip(): int(count)
+            for model, _, count in (
+                item.partition("=") for item in os.environ.get("CLAUDE_OS_SESSION_POOL", "").split(",")
+            )
+            if model.strip() and count.strip()
+        }
+        self.session_pool_warm_timeout = 60  # seconds for a standby to reach its prompt
+
+        # === Context Monitor Configuration ===
+        # Usage comes from transcript token counts, so warnings can fire at any level
+        self.context_warning_percent = int(os.environ.get("CLAUDE_OS_CONTEXT_WARNING", "90"))
+        self.context_window_tokens = int(os.environ.get("CLAUDE_OS_CONTEXT_WINDOW", "200000"))
+        # Past this, the session's transcript is parsed for its handoff each tick
+        self.handoff_prepare_percent = int(os.environ.get("CLAUDE_OS_HANDOFF_PREPARE", "70"))
+
         # === Worker Configuration ===
         self.executor_poll_interval = 60  # seconds between polling for new tasks
         self.executor_batch_size = 10  # max concurrent workers
@@ -2,13 +2,15 @@
 Core Database - Connection management and migrations.
 
 Provides:
+- Process-wide connection pool (per-thread readers, one serialized writer)
 - Sync and async database connections
 - Migration system
 - Helper utilities
 """
 import sqlite3
+import threading
 from contextlib import contextmanager, asynccontextmanager
-from typing import Generator, AsyncGenerator, Optional
+from typing import Generator, AsyncGenerator, Dict, List, Optional
 from pathlib import Path
 from datetime import datetime
 import aiosqlite
@@ -16,25 +18,256 @@ import aiosqlite
 from .config import settings
 
 
+# === Connection Pool ===
+
+# Per-connection tuning. journal_mode is persistent in the file, the rest
+# are per-connection — pooled connections pay for these once, not per call.
+_CONNECTION_PRAGMAS = (
+    "PRAGMA busy_timeout=5000;",
+    "PRAGMA foreign_keys=ON;",
+    "PRAGMA synchronous=NORMAL;",
+    "PRAGMA temp_store=MEMORY;",
+    "PRAGMA cache_size=-16000;",      # 16 MB page cache
+    "PRAGMA mmap_size=134217728;",    # 128 MB memory-mapped I/O
+)
+
+STATEMENT_CACHE_SIZE = 256  # Prepared statements kept per connection
+MAX_IDLE_CONNECTIONS = 8    # Checked-in connections kept for get_db()/get_async_db()
+
+
+class ConnectionPool:
+    """Long-lived SQLite connections for one database file.
+
+    Three kinds of connection, all opened once and tuned once:
+    - reader(): one autocommit connection per thread, for plain SELECTs
+    - writer(): a single autocommit connection shared by the process,
+      guarded by a lock so writes are serialized in-process
+    - connection(): an exclusive transactional connection checked out
+      from an idle list (what get_db() hands out)
+
+    Python's sqlite3 keeps an LRU of prepared statements per connection
+    (cached_statements), so keeping connections alive also means hot
+    queries skip re-preparation.
+    """
+
+    def __init__(self, db_path: Path):
+        self.db_path = Path(db_path)
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._writer: Optional[sqlite3.Connection] = None
+        self._writer_lock = threading.RLock()
+        self._idle: List[sqlite3.Connection] = []
+        self._async_idle: List[aiosqlite.Connection] = []
+        self._all: List[sqlite3.Connection] = []
+        self._wal_checked = False
+        self.stats = {"opened": 0, "reused": 0}
+
+    # ------------------------------------------------------------------ open
+    def _connect(self, isolation_level: Optional[str]) -> sqlite3.Connection:
+        conn = sqlite3.connect(
+            str(self.db_path),
+            isolation_level=isolation_level,
+            check_same_thread=False,
+            cached_statements=STATEMENT_CACHE_SIZE,
+        )
+        conn.row_factory = sqlite3.Row
+        self._tune(conn)
+        with self._lock:
+            self._all.append(conn)
+            self.stats["opened"] += 1
+        return conn
+
+    def _tune(self, conn: sqlite3.Connection) -> None:
+        if not self._wal_checked:
+            conn.execute("PRAGMA journal_mode=WAL;")
+            self._wal_checked = True
+        for pragma in _CONNECTION_PRAGMAS:
+            conn.execute(pragma)
+
+    # --------------------------------------------------------------- readers
+    def reader(self) -> sqlite3.Connection:
+        """Autocommit connection owned by the calling thread."""
+        conn = getattr(self._local, "reader", None)
+        if conn is None:
+            conn = self._connect(isolation_level=None)
+            self._local.reader = conn
+        else:
+            self.stats["reused"] += 1
+        return conn
+
+    # ---------------------------------------------------------------- writer
+    @contextmanager
+    def writer(self) -> Generator[sqlite3.Connection, None, None]:
+        """The process-wide autocommit writer, held exclusively while in use."""
+        with self._writer_lock:
+            if self._writer is None:
+                self._writer = self._connect(isolation_level=None)
+            else:
+                self.stats["reused"] += 1
+            self._local.writer_depth = getattr(self._local, "writer_depth", 0) + 1
+            try:
+                yield self._writer
+            finally:
+                self._local.writer_depth -= 1
+
+    def owns_writer(self) -> bool:
+        """True if the calling thread is inside a writer() block."""
+        return getattr(self._local, "writer_depth", 0) > 0
+
+    @contextmanager
+    def write_transaction(self) -> Generator[sqlite3.Cursor, None, None]:
+        """BEGIN IMMEDIATE ... COMMIT on the shared writer."""
+        with self.writer() as conn:
+            cursor = conn.cursor()
+            try:
+                cursor.execute("BEGIN IMMEDIATE;")
+                yield cursor
+            except Exception:
+                cursor.execute("ROLLBACK;")
+                raise
+            else:
+                cursor.execute("COMMIT;")
+
+    # ---------------------------------------------------------- checked-out
+    @contextmanager
+    def connection(self) -> Generator[sqlite3.Connection, None, None]:
+        """Exclusive transactional connection, returned to the pool on exit.
+
+        Uncommitted work is rolled back on check-in, matching the old
+        connect()/close() semantics.
+        """
+        with self._lock:
+            conn = self._idle.pop() if self._idle else None
+        if conn is None:
+            conn = self._connect(isolation_level="")
+        else:
+            self.stats["reused"] += 1
+        try:
+            yield conn
+        finally:
+            self._checkin(conn)
+
+    def _checkin(self, conn: sqlite3.Connection) -> None:
+        try:
+            if conn.in_transaction:
+                conn.rollback()
+            conn.row_factory = sqlite3.Row
+        except sqlite3.Error:
+            self._discard(conn)
+            return
+        with self._lock:
+            if len(self._idle) < MAX_IDLE_CONNECTIONS:
+                self._idle.append(conn)
+                return
+        self._discard(conn)
+
+    def _discard(self, conn: sqlite3.Connection) -> None:
+        with self._lock:
+            if conn in self._all:
+                self._all.remove(conn)
+        try:
+            conn.close()
+        except sqlite3.Error:
+            pass
+
+    # ------------------------------------------------------------------ async
+    @asynccontextmanager
+    async def async_connection(self) -> AsyncGenerator[aiosqlite.Connection, None]:
+        """Exclusive aiosqlite connection, returned to the pool on exit."""
+        with self._lock:
+            conn = self._async_idle.pop() if self._async_idle else None
+        if conn is None:
+            conn = await aiosqlite.connect(
+                str(self.db_path), cached_statements=STATEMENT_CACHE_SIZE
+            )
+            for pragma in _CONNECTION_PRAGMAS:
+                await conn.execute(pragma)
+            self.stats["opened"] += 1
+        else:
+            self.stats["reused"] += 1
+        conn.row_factory = aiosqlite.Row
+        try:
+            yield conn
+        finally:
+            keep = True
+            try:
+                if conn.in_transaction:
+                    await conn.rollback()
+            except (sqlite3.Error, ValueError):
+                keep = False
+            with self._lock:
+                if keep and len(self._async_idle) < MAX_IDLE_CONNECTIONS:
+                    self._async_idle.append(conn)
+                    conn = None
+            if conn is not None:
+                await conn.close()
+
+    # ------------------------------------------------------------------ close
+    def close(self) -> None:
+        """Close every connection this pool opened (shutdown, tests)."""
+        with self._lock:
+            conns, self._all = self._all, []
+            async_conns, self._async_idle = self._async_idle, []
+            self._idle = []
+            self._writer = None
+            self._local = threading.local()
+        for conn in conns:
+            try:
+                conn.close()
+            except sqlite3.Error:
+                pass
+        # Idle aiosqlite connections each own a worker thread; stop() closes
+        # the sqlite handle on that thread and lets it exit without needing
+        # an event loop here.
+        for async_conn in async_conns:
+            try:
+                async_conn.stop()
+            except (sqlite3.Error, RuntimeError):
+                pass
+
+
+_pools: Dict[Path, ConnectionPool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_pool(db_path: Optional[Path] = None) -> ConnectionPool:
+    """Get the process-wide pool for a database file (default: settings.db_path)."""
+    path = Path(db_path or settings.db_path)
+    pool = _pools.get(path)
+    if pool is None:
+        with _pools_lock:
+            pool = _pools.get(path)
+            if pool is None:
+                pool = ConnectionPool(path)
+                _pools[path] = pool
+    return pool
+
+
+def close_pools() -> None:
+    """Close all pooled connections."""
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        pool.close()
+
+
 # === Connection Management ===
 
 @contextmanager
 def get_db() -> Generator[sqlite3.Connection, None, None]:
     """Get a sync database connection with row factory.
 
+    Connections come from the process-wide pool; uncommitted work is
+    rolled back when the block exits.
+
     Usage:
         with get_db() as conn:
             cursor = conn.execute("SELECT ...")
             rows = cursor.fetchall()
     """
-    conn = sqlite3.connect(str(settings.db_path))
-    conn.row_factory = sqlite3.Row
-    conn.execute("PRAGMA busy_timeout=5000;")
-    conn.execute("PRAGMA foreign_keys=ON;")
-    try:
+    with get_pool().connection() as conn:
         yield conn
-    finally:
-        conn.close()
 
 
 @asynccontextmanager
@@ -46,10 +279,7 @@ async def get_async_db() -> AsyncGenerator[aiosqlite.Connection, None]:
             cursor = await conn.execute("SELECT ...")
             rows = await cursor.fetchall()
     """
-    async with aiosqlite.connect(str(settings.db_path)) as conn:
-        conn.row_factory = aiosqlite.Row
-        await conn.execute("PRAGMA busy_timeout=5000;")
-        await conn.execute("PRAGMA foreign_keys=ON;")
+    async with get_pool().async_connection() as conn:
         yield conn
 
 
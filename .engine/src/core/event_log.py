@@ -11,26 +11,154 @@ Event Types:
 - worker: spawned, completed, acked, failed
 - marker: manual markers from the user or Claude
 
+Writes are write-behind: emit_event() appends to an in-memory buffer and
+a background thread flushes it in one executemany transaction every
+FLUSH_INTERVAL_MS or FLUSH_BATCH_SIZE events. get_events() reads through
+the unflushed buffer, and flush() drains it synchronously (shutdown, tests).
+
 Usage:
     from core.event_log import emit_event
 
     emit_event("session", "started", actor="abc123", data={"role": "focus", "status": "DS&A"})
 """
 
+import atexit
 import json
+import logging
 import sqlite3
+import threading
 import uuid
+from collections import deque
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Deque, Dict, List, Optional, Tuple
 
 from core.config import settings
+from core.database import get_pool
+
+logger = logging.getLogger(__name__)
 
 
 # Use settings for paths and timezone
 DB_PATH = settings.db_path
 PACIFIC = settings.timezone
 
+FLUSH_INTERVAL_MS = 250    # Max time an event waits in the buffer
+FLUSH_BATCH_SIZE = 100     # Wake the writer early once this many are pending
+BUFFER_CAPACITY = 10_000   # Past this, emit_event() flushes inline
+
+_INSERT_SQL = """
+    INSERT INTO events (id, timestamp, event_type, event_action, actor, data, date)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
+
+# (id, timestamp, event_type, event_action, actor, data_json, date)
+EventRow = Tuple[str, str, str, str, Optional[str], Optional[str], str]
+
+
+class _WriteBehindLog:
+    """Buffer of unwritten event rows plus the thread that flushes them."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._pending: Deque[Tuple[Path, EventRow]] = deque()
+        self._wake = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def append(self, db: Path, row: EventRow) -> None:
+        with self._lock:
+            self._pending.append((db, row))
+            size = len(self._pending)
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._run, name="event-log-writer", daemon=True
+                )
+                self._thread.start()
+        if size >= BUFFER_CAPACITY:
+            self.flush()
+        elif size >= FLUSH_BATCH_SIZE:
+            self._wake.set()
+
+    def pending(self, db: Path) -> List[EventRow]:
+        with self._lock:
+            return [row for row_db, row in self._pending if row_db == db]
+
+    def flush(self) -> int:
+        """Write everything buffered so far. Returns number of rows written."""
+        with self._flush_lock:
+            with self._lock:
+                batch = list(self._pending)
+            if not batch:
+                return 0
+
+            by_db: Dict[Path, List[EventRow]] = {}
+            for db, row in batch:
+                by_db.setdefault(db, []).append(row)
+
+            retry: List[Tuple[Path, EventRow]] = []
+            written = 0
+            for db, rows in by_db.items():
+                try:
+                    written += self._write(db, rows)
+                except sqlite3.OperationalError as e:
+                    if "locked" in str(e).lower():
+                        retry.extend((db, row) for row in rows)
+                    else:
+                        logger.error(f"Dropping {len(rows)} events for {db}: {e}")
+                except sqlite3.Error as e:
+                    logger.error(f"Dropping {len(rows)} events for {db}: {e}")
+
+            # Rows stay visible in the buffer until they're committed
+            with self._lock:
+                for _ in range(len(batch)):
+                    self._pending.popleft()
+                self._pending.extendleft(reversed(retry))
+            return written
+
+    @staticmethod
+    def _write(db: Path, rows: List[EventRow]) -> int:
+        """Insert rows in one transaction. Returns rows written.
+
+        If an event id collides with a stored one, the rows go in one by one
+        instead, so only the colliding events are dropped - and logged.
+        """
+        pool = get_pool(db)
+        try:
+            with pool.write_transaction() as cursor:
+                cursor.executemany(_INSERT_SQL, rows)
+            return len(rows)
+        except sqlite3.IntegrityError:
+            pass
+
+        written = 0
+        with pool.write_transaction() as cursor:
+            for row in rows:
+                try:
+                    cursor.execute(_INSERT_SQL, row)
+                    written += 1
+                except sqlite3.IntegrityError as e:
+                    logger.error(f"Dropping event {row[0]} ({row[2]}.{row[3]}): {e}")
+        return written
+
+    def _run(self) -> None:
+        while True:
+            self._wake.wait(FLUSH_INTERVAL_MS / 1000)
+            self._wake.clear()
+            try:
+                self.flush()
+            except Exception as e:
+                logger.error(f"Event log flush failed: {e}")
+
+
+_buffer = _WriteBehindLog()
+atexit.register(lambda: _buffer.flush())
+
+
+def flush() -> int:
+    """Synchronously write all buffered events. Returns rows written."""
+    return _buffer.flush()
+
 
 def emit_event(
     event_type: str,
@@ -42,6 +170,9 @@ def emit_event(
     """
     Emit an event to the event bus.
 
+    The row is buffered and written by the background flusher; call
+    flush() if it must be on disk before returning.
+
     Args:
         event_type: Type of event (session, priority, calendar, worker, marker)
         event_action: Action taken (started, ended, created, completed, etc.)
@@ -62,20 +193,10 @@ def emit_event(
     date_pacific = now_pacific.strftime("%Y-%m-%d")
     data_json = json.dumps(data) if data else None
 
-    db = db_path or DB_PATH
-    conn = sqlite3.connect(str(db))
-
-    try:
-        conn.execute(
-            """
-            INSERT INTO events (id, timestamp, event_type, event_action, actor, data, date)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
-            """,
-            (event_id, timestamp, event_type, event_action, actor, data_json, date_pacific)
-        )
-        conn.commit()
-    finally:
-        conn.close()
+    _buffer.append(
+        Path(db_path or DB_PATH),
+        (event_id, timestamp, event_type, event_action, actor, data_json, date_pacific),
+    )
 
     return event_id
 
@@ -97,54 +218,65 @@ def get_events(
 
     Returns:
         List of event dicts with id, timestamp, event_type, event_action, actor, data
+
+    Events still waiting in the write-behind buffer are included.
     """
     if date is None:
         date = datetime.now().strftime("%Y-%m-%d")
 
-    db = db_path or DB_PATH
-    conn = sqlite3.connect(str(db))
-    conn.row_factory = sqlite3.Row
-
-    try:
-        if event_type:
-            cursor = conn.execute(
-                """
-                SELECT id, timestamp, event_type, event_action, actor, data
-                FROM events
-                WHERE date = ? AND event_type = ?
-                ORDER BY timestamp ASC
-                LIMIT ?
-                """,
-                (date, event_type, limit)
-            )
-        else:
-            cursor = conn.execute(
-                """
-                SELECT id, timestamp, event_type, event_action, actor, data
-                FROM events
-                WHERE date = ?
-                ORDER BY timestamp ASC
-                LIMIT ?
-                """,
-                (date, limit)
-            )
-
-        events = []
-        for row in cursor.fetchall():
-            event = {
-                "id": row["id"],
-                "timestamp": row["timestamp"],
-                "event_type": row["event_type"],
-                "event_action": row["event_action"],
-                "actor": row["actor"],
-            }
-            if row["data"]:
-                try:
-                    event["data"] = json.loads(row["data"])
-                except json.JSONDecodeError:
-                    event["data"] = row["data"]
-            events.append(event)
-
-        return events
-    finally:
-        conn.close()
+    db = Path(db_path or DB_PATH)
+    unflushed = [
+        row for row in _buffer.pending(db)
+        if row[6] == date and (not event_type or row[2] == event_type)
+    ]
+
+    conn = get_pool(db).reader()
+
+    if event_type:
+        cursor = conn.execute(
+            """
+            SELECT id, timestamp, event_type, event_action, actor, data
+            FROM events
+            WHERE date = ? AND event_type = ?
+            ORDER BY timestamp ASC
+            LIMIT ?
+            """,
+            (date, event_type, limit)
+        )
+    else:
+        cursor = conn.execute(
+            """
+            SELECT id, timestamp, event_type, event_action, actor, data
+            FROM events
+            WHERE date = ?
+            ORDER BY timestamp ASC
+            LIMIT ?
+            """,
+            (date, limit)
+        )
+
+    rows = [tuple(row) for row in cursor.fetchall()]
+    if unflushed:
+        # A row can be in both places between commit and buffer trim
+        seen = {row[0] for row in rows}
+        rows.extend(row[:6] for row in unflushed if row[0] not in seen)
+        rows.sort(key=lambda row: row[1])
+        rows = rows[:limit]
+
+    events = []
+    for event_id, timestamp, row_type, action, actor, data in rows:
+        event = {
+            "id": event_id,
+            "timestamp": timestamp,
+            "event_type": row_type,
+            "event_action": action,
+            "actor": actor,
+        }
+        if data:
+            try:
+                event["data"] = json.loads(data)
+            except json.JSONDecodeError:
+                event["data"] = data
+        events.append(event)
+
+    return events
@@ -13,14 +13,41 @@ Usage (Subscribing - SSE endpoint):
     from core.events import event_bus
 
     async def event_stream():
-        queue = event_bus.subscribe()
+        queue = event_bus.subscribe(patterns=["file.*"])
         try:
-            while True:
+            while not queue.closed:
                 event = await asyncio.wait_for(queue.get(), timeout=30.0)
                 yield {"event": event.event_type, "data": event.to_json()}
         finally:
             event_bus.unsubscribe(queue)
 
+Patterns are dot-separated topics. "*" matches one segment, and a
+trailing "*" matches everything below it ("file.*" gets file.created and
+file.x.y). Routing happens at publish time, so a subscriber only sees
+events it asked for. When a subscriber falls behind, its overflow policy
+decides what happens:
+    drop_oldest  - discard the oldest queued event (default)
+    coalesce     - drop a queued event with the same key (e.g. an older
+                   session.state for the same session_id) and queue the
+                   new one at the tail, else drop oldest
+    disconnect   - close the subscription; the consumer gets a final
+                   "bus.disconnected" event and should stop reading
+
+Resume (Last-Event-ID):
+    Every published event gets a monotonically increasing id and is kept
+    in a bounded replay log. An SSE endpoint that sends the id with each
+    event can resume a dropped client:
+
+        queue = event_bus.subscribe(patterns)
+        missed = event_bus.replay(request.headers.get("last-event-id"), patterns)
+        if missed is None:
+            ...  # gap - tell the client to resync
+        for event in missed: ...
+
+    subscribe() and replay() must run without an await in between so no
+    event is missed or duplicated. Ids carry a per-process epoch, so ids
+    from before a restart always report a gap.
+
 Event Types:
     Session: session.started, session.ended, session.state
     Worker: worker.created, worker.started, worker.completed, worker.acked
@@ -33,10 +60,19 @@ Event Types:
 """
 
 import asyncio
+import itertools
 import json
+import logging
+import threading
+import time
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Any, Dict, Optional, Set
+from typing import Any, Deque, Dict, Iterable, List, Optional, Set, Tuple
+
+from .config import settings
+
+logger = logging.getLogger(__name__)
 
 
 @dataclass
@@ -45,6 +81,7 @@ class SystemEvent:
     event_type: str  # e.g., 'session.started', 'file.modified'
     data: Dict[str, Any]
     timestamp: str = field(default_factory=lambda: datetime.now(timezone.utc).isoformat())
+    id: Optional[str] = None  # "<epoch>-<seq>", assigned by EventBus.publish
 
     def to_json(self) -> str:
         """Serialize for SSE data field."""
@@ -55,40 +92,417 @@ class SystemEvent:
         })
 
 
+OVERFLOW_POLICIES = ("drop_oldest", "coalesce", "disconnect")
+
+# Event type -> data field that identifies "the same thing" for coalescing
+DEFAULT_COALESCE_KEYS: Dict[str, str] = {
+    "session.state": "session_id",
+}
+
+DISCONNECTED_EVENT = "bus.disconnected"
+
+
+class Subscription:
+    """A subscriber's buffer plus its routing patterns and overflow policy.
+
+    Consumers read it like an asyncio.Queue: await get(), get_nowait()
+    (raises asyncio.QueueEmpty), qsize(), empty(). The subscription owns
+    its deque, so overflow policies can edit it directly.
+    """
+
+    def __init__(
+        self,
+        patterns: Optional[Tuple[str, ...]],
+        policy: str,
+        maxsize: int,
+        coalesce_keys: Dict[str, str],
+    ):
+        self.patterns = patterns
+        self.policy = policy
+        self.maxsize = maxsize
+        self.coalesce_keys = coalesce_keys
+        self.closed = False
+        self.delivered = 0
+        self.dropped = 0
+        self.coalesced = 0
+        self._buffer: Deque[SystemEvent] = deque()
+        self._ready = asyncio.Event()  # Set while the buffer is non-empty
+
+    def qsize(self) -> int:
+        return len(self._buffer)
+
+    def empty(self) -> bool:
+        return not self._buffer
+
+    def full(self) -> bool:
+        return 0 < self.maxsize <= len(self._buffer)
+
+    def get_nowait(self) -> SystemEvent:
+        if not self._buffer:
+            raise asyncio.QueueEmpty
+        event = self._buffer.popleft()
+        if not self._buffer:
+            self._ready.clear()
+        return event
+
+    async def get(self) -> SystemEvent:
+        while not self._buffer:
+            await self._ready.wait()
+        return self.get_nowait()
+
+    def _put(self, event: SystemEvent) -> None:
+        self._buffer.append(event)
+        self._ready.set()
+
+    def offer(self, event: SystemEvent) -> bool:
+        """Enqueue without blocking. Returns False if the subscriber must be removed."""
+        if self.closed:
+            return False
+
+        if self.full():
+            if self.policy == "disconnect":
+                self._close()
+                return False
+            if self.policy == "coalesce" and self._coalesce(event):
+                self.coalesced += 1
+            else:
+                self._buffer.popleft()
+                self.dropped += 1
+
+        self._put(event)
+        self.delivered += 1
+        return True
+
+    def _coalesce(self, event: SystemEvent) -> bool:
+        """Drop a queued event with the same key to make room for this one.
+
+        The stale entry is removed rather than overwritten, so the new
+        event still lands at the tail, after everything queued before it.
+        """
+        key_field = self.coalesce_keys.get(event.event_type)
+        if key_field is None:
+            return False
+        key = event.data.get(key_field)
+        for i, queued in enumerate(self._buffer):
+            if queued.event_type == event.event_type and queued.data.get(key_field) == key:
+                del self._buffer[i]
+                return True
+        return False
+
+    def _close(self) -> None:
+        self.closed = True
+        self.dropped += len(self._buffer) + 1
+        self._buffer.clear()
+        self._put(SystemEvent(DISCONNECTED_EVENT, {"reason": "overflow"}))
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "patterns": list(self.patterns) if self.patterns else ["*"],
+            "policy": self.policy,
+            "queued": self.qsize(),
+            "delivered": self.delivered,
+            "dropped": self.dropped,
+            "coalesced": self.coalesced,
+            "closed": self.closed,
+        }
+
+
+class _TopicNode:
+    """One segment of the topic trie."""
+
+    __slots__ = ("children", "exact", "rest")
+
+    def __init__(self):
+        self.children: Dict[str, _TopicNode] = {}
+        self.exact: Set[Subscription] = set()  # pattern ends at this node
+        self.rest: Set[Subscription] = set()   # pattern ends with "*" here
+
+
+class _TopicTrie:
+    """Maps dot-separated topics to the subscriptions whose patterns match."""
+
+    def __init__(self):
+        self._root = _TopicNode()
+
+    def add(self, pattern: str, sub: Subscription) -> None:
+        segments = pattern.split(".")
+        node = self._root
+        for i, segment in enumerate(segments):
+            if segment == "*" and i == len(segments) - 1:
+                node.rest.add(sub)
+                return
+            node = node.children.setdefault(segment, _TopicNode())
+        node.exact.add(sub)
+
+    def remove(self, pattern: str, sub: Subscription) -> None:
+        segments = pattern.split(".")
+        node = self._root
+        for i, segment in enumerate(segments):
+            if segment == "*" and i == len(segments) - 1:
+                node.rest.discard(sub)
+                return
+            node = node.children.get(segment)
+            if node is None:
+                return
+        node.exact.discard(sub)
+
+    def match(self, topic: str) -> Set[Subscription]:
+        segments = topic.split(".")
+        matched: Set[Subscription] = set()
+        stack = [(self._root, 0)]
+        while stack:
+            node, i = stack.pop()
+            if i == len(segments):
+                matched |= node.exact
+                continue
+            matched |= node.rest
+            for key in (segments[i], "*"):
+                child = node.children.get(key)
+                if child is not None:
+                    stack.append((child, i + 1))
+        return matched
+
+
+def topic_matches(pattern: str, topic: str) -> bool:
+    """Same semantics as the trie, for one pattern."""
+    pattern_segments = pattern.split(".")
+    topic_segments = topic.split(".")
+    for i, segment in enumerate(pattern_segments):
+        if segment == "*" and i == len(pattern_segments) - 1:
+            return len(topic_segments) > i
+        if i >= len(topic_segments):
+            return False
+        if segment != "*" and segment != topic_segments[i]:
+            return False
+    return len(pattern_segments) == len(topic_segments)
+
+
+class _ReplayLog:
+    """Bounded, sequenced history of published events.
+
+    Evicted events can optionally spill to the event_replay table (keyed
+    by epoch and seq) so longer disconnects can still be replayed. Spilled
+    rows are buffered and written SPILL_BATCH_SIZE at a time on a worker
+    thread, never on the publishing event loop; since() reads the buffer
+    alongside the table, and rows stay in it until they're committed.
+    Spilled rows are capped at SPILL_KEEP per epoch.
+    """
+
+    SPILL_BATCH_SIZE = 100  # Evicted events buffered before one executemany
+    SPILL_KEEP = 10_000     # Spilled events kept (and replayable) per epoch
+
+    _SCHEMA = """
+        CREATE TABLE IF NOT EXISTS event_replay (
+            epoch TEXT NOT NULL,
+            seq INTEGER NOT NULL,
+            topic TEXT NOT NULL,
+            data TEXT,
+            timestamp TEXT NOT NULL,
+            PRIMARY KEY (epoch, seq)
+        ) WITHOUT ROWID
+    """
+
+    def __init__(self, size: int, spill: bool):
+        self.epoch = format(int(time.time() * 1000), "x")
+        self._seq = itertools.count(1)
+        self._events: Deque[Tuple[int, SystemEvent]] = deque(maxlen=size)
+        self._spill = spill
+        # (seq, event, data as JSON), oldest first, until written
+        self._spill_pending: List[Tuple[int, SystemEvent, str]] = []
+        self._spill_lock = threading.Lock()   # Guards _spill_pending
+        self._flush_lock = threading.Lock()   # One flush at a time
+        self._flush_scheduled = False
+        self._spill_ready = False
+
+    def append(self, event: SystemEvent) -> None:
+        seq = next(self._seq)
+        event.id = f"{self.epoch}-{seq}"
+        if self._spill and len(self._events) == self._events.maxlen:
+            self._spill_event(*self._events[0])
+        self._events.append((seq, event))
+
+    def _spill_event(self, seq: int, event: SystemEvent) -> None:
+        with self._spill_lock:
+            self._spill_pending.append((seq, event, json.dumps(event.data)))
+            due = len(self._spill_pending) >= self.SPILL_BATCH_SIZE and not self._flush_scheduled
+            if due:
+                self._flush_scheduled = True
+        if due:
+            try:
+                asyncio.get_running_loop().run_in_executor(None, self._flush_in_background)
+            except RuntimeError:
+                self._flush_in_background()  # No loop to hand off from
+
+    def _flush_in_background(self) -> None:
+        try:
+            self.flush()
+        finally:
+            self._flush_scheduled = False
+
+    def flush(self) -> None:
+        """Write buffered evicted events to event_replay (blocking)."""
+        with self._flush_lock:
+            with self._spill_lock:
+                batch = list(self._spill_pending)
+            if not batch:
+                return
+            try:
+                from .database import get_pool
+                with get_pool(settings.db_path).write_transaction() as cursor:
+                    if not self._spill_ready:
+                        cursor.execute(self._SCHEMA)
+                        # Ids from earlier processes always report a gap
+                        cursor.execute("DELETE FROM event_replay WHERE epoch != ?", (self.epoch,))
+                        self._spill_ready = True
+                    cursor.executemany(
+                        "INSERT OR REPLACE INTO event_replay (epoch, seq, topic, data, timestamp) "
+                        "VALUES (?, ?, ?, ?, ?)",
+                        [(self.epoch, seq, event.event_type, data, event.timestamp)
+                         for seq, event, data in batch],
+                    )
+                    cursor.execute(
+                        "DELETE FROM event_replay WHERE epoch = ? AND seq <= ?",
+                        (self.epoch, batch[-1][0] - self.SPILL_KEEP),
+                    )
+            except Exception as e:
+                # Dropped rows show up as a gap (resync) if a client needs them
+                logger.debug(f"Event spill failed: {e}")
+            with self._spill_lock:
+                del self._spill_pending[:len(batch)]
+
+    def _parse(self, last_event_id: str) -> Optional[int]:
+        epoch, _, seq = last_event_id.rpartition("-")
+        if epoch != self.epoch or not seq.isdigit():
+            return None
+        return int(seq)
+
+    def since(self, last_event_id: str) -> Optional[List[SystemEvent]]:
+        """Events after last_event_id, or None if some were lost."""
+        last_seq = self._parse(last_event_id)
+        if last_seq is None:
+            return None
+
+        oldest = self._events[0][0] if self._events else last_seq + 1
+        missed: List[SystemEvent] = []
+        if last_seq + 1 < oldest:
+            # Older than the in-memory window: only recoverable from the spill
+            if not self._spill or oldest - 1 - last_seq > self.SPILL_KEEP:
+                return None
+            # Buffer first: everything older than its first row is committed
+            with self._spill_lock:
+                buffered = [(seq, event) for seq, event, _ in self._spill_pending if seq > last_seq]
+                unwritten = self._spill_pending[0][0] if self._spill_pending else oldest
+            spilled: Optional[List[Tuple[int, SystemEvent]]] = []
+            if last_seq + 1 < unwritten:
+                spilled = self._load_spilled(last_seq, unwritten)
+            if spilled is None:
+                return None
+            spilled.extend(buffered)
+            if len(spilled) != oldest - 1 - last_seq:
+                return None
+            missed = [event for _, event in spilled]
+        missed.extend(event for seq, event in self._events if seq > last_seq)
+        return missed
+
+    def _load_spilled(self, last_seq: int, oldest: int) -> Optional[List[Tuple[int, SystemEvent]]]:
+        """Spilled events with last_seq < seq < oldest, in order."""
+        try:
+            from .database import get_pool
+            rows = get_pool(settings.db_path).reader().execute(
+                "SELECT seq, topic, data, timestamp FROM event_replay "
+                "WHERE epoch = ? AND seq > ? AND seq < ? ORDER BY seq LIMIT ?",
+                (self.epoch, last_seq, oldest, self.SPILL_KEEP),
+            ).fetchall()
+        except Exception as e:
+            logger.debug(f"Event spill read failed: {e}")
+            return None
+
+        return [
+            (seq, SystemEvent(topic, json.loads(data) if data else {}, timestamp, f"{self.epoch}-{seq}"))
+            for seq, topic, data, timestamp in rows
+        ]
+
+
 class EventBus:
     """
     Async pub/sub for all Dashboard real-time updates.
 
-    Subscribers get asyncio.Queue instances.
-    Publishing pushes to all subscriber queues.
+    Subscribers get Subscription queues. Publishing resolves the topic
+    against a trie of subscriber patterns (cached per event type) and
+    pushes only to matching queues.
     """
 
-    def __init__(self):
-        self._subscribers: Set[asyncio.Queue] = set()
-
-    def subscribe(self) -> asyncio.Queue:
-        """Register a new subscriber. Returns queue for receiving events."""
-        queue: asyncio.Queue = asyncio.Queue(maxsize=100)
+    def __init__(
+        self,
+        coalesce_keys: Optional[Dict[str, str]] = None,
+        replay_size: Optional[int] = None,
+        spill: Optional[bool] = None,
+    ):
+        self._replay = _ReplayLog(
+            replay_size or settings.event_replay_size,
+            settings.event_replay_spill if spill is None else spill,
+        )
+        self._subscribers: Set[Subscription] = set()
+        self._firehose: Set[Subscription] = set()
+        self._trie = _TopicTrie()
+        self._routes: Dict[str, List[Subscription]] = {}
+        self._coalesce_keys = dict(coalesce_keys or DEFAULT_COALESCE_KEYS)
+
+    def subscribe(
+        self,
+        patterns: Optional[Iterable[str]] = None,
+        policy: str = "drop_oldest",
+        maxsize: int = 100,
+    ) -> Subscription:
+        """Register a new subscriber. Returns queue for receiving events.
+
+        Args:
+            patterns: Topic patterns to receive (default: everything)
+            policy: Overflow policy - drop_oldest, coalesce or disconnect
+            maxsize: Queue bound before the policy kicks in
+        """
+        if policy not in OVERFLOW_POLICIES:
+            raise ValueError(f"Unknown overflow policy: {policy}")
+
+        pattern_tuple = tuple(patterns) if patterns else None
+        if pattern_tuple and "*" in pattern_tuple:
+            pattern_tuple = None
+
+        queue = Subscription(pattern_tuple, policy, maxsize, self._coalesce_keys)
         self._subscribers.add(queue)
+        if pattern_tuple is None:
+            self._firehose.add(queue)
+        else:
+            for pattern in pattern_tuple:
+                self._trie.add(pattern, queue)
+        self._routes.clear()
         return queue
 
-    def unsubscribe(self, queue: asyncio.Queue) -> None:
+    def unsubscribe(self, queue: Subscription) -> None:
         """Remove a subscriber."""
+        if queue not in self._subscribers:
+            return
         self._subscribers.discard(queue)
+        self._firehose.discard(queue)
+        for pattern in queue.patterns or ():
+            self._trie.remove(pattern, queue)
+        self._routes.clear()
+
+    def _route(self, event_type: str) -> List[Subscription]:
+        route = self._routes.get(event_type)
+        if route is None:
+            route = list(self._firehose | self._trie.match(event_type))
+            self._routes[event_type] = route
+        return route
 
     async def publish(self, event_type: str, data: Dict[str, Any]) -> None:
-        """Publish event to all subscribers."""
+        """Publish event to all subscribers interested in its type."""
         event = SystemEvent(event_type=event_type, data=data)
+        self._replay.append(event)
 
-        # Copy to avoid modifying set during iteration
-        subscribers = list(self._subscribers)
-
-        for queue in subscribers:
-            try:
-                queue.put_nowait(event)
-            except asyncio.QueueFull:
-                # Consumer too slow, drop event
-                pass
+        overflowed = [queue for queue in self._route(event_type) if not queue.offer(event)]
+        for queue in overflowed:
+            self.unsubscribe(queue)
 
     def publish_sync(self, event_type: str, data: Dict[str, Any]) -> None:
         """Synchronous publish for non-async contexts. Use sparingly."""
@@ -98,11 +512,36 @@ class EventBus:
         except RuntimeError:
             asyncio.run(self.publish(event_type, data))
 
+    def replay(
+        self,
+        last_event_id: Optional[str],
+        patterns: Optional[Iterable[str]] = None,
+    ) -> Optional[List[SystemEvent]]:
+        """Events published after last_event_id that match patterns.
+
+        Returns [] when there is nothing to resume from, and None when
+        the client missed events that are no longer available (it should
+        do a full reload).
+        """
+        if not last_event_id:
+            return []
+        missed = self._replay.since(last_event_id)
+        if missed is None or not patterns:
+            return missed
+        patterns = [p for p in patterns]
+        if "*" in patterns:
+            return missed
+        return [e for e in missed if any(topic_matches(p, e.event_type) for p in patterns)]
+
     @property
     def subscriber_count(self) -> int:
         """Number of active subscribers."""
         return len(self._subscribers)
 
+    def stats(self) -> List[Dict[str, Any]]:
+        """Per-subscriber delivery and drop counters."""
+        return [queue.stats() for queue in self._subscribers]
+
 
 # Global singleton
 event_bus = EventBus()
@@ -2,7 +2,8 @@
 
 Replaces duty_scheduler.py, triggers.py, and mission executor with one system.
 Desktop/SCHEDULE.md is the human-readable source of truth. This module parses it,
-manages a 60-second polling loop, and routes entries by action type.
+keeps enabled entries in a min-heap keyed on next_run, sleeps until the earliest
+one is due (or the schedule changes), and routes entries by action type.
 
 Three action types:
 - inject <target>: Send text into a live Claude session's tmux pane
@@ -12,16 +13,19 @@ Three action types:
 
 import asyncio
 import hashlib
+import heapq
 import logging
 import os
 import re
 import subprocess
+import threading
 import time
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 from zoneinfo import ZoneInfo
 
 from croniter import croniter
@@ -36,6 +40,23 @@ logger = logging.getLogger("scheduler")
 
 PACIFIC = ZoneInfo("America/Los_Angeles")
 
+# Housekeeping cadence: SCHEDULE.md mtime check and calendar triggers
+HOUSEKEEPING_INTERVAL = 60.0
+
+# Due entries dispatched at once; injects to one tmux target still run one at a time
+DISPATCH_CONCURRENCY = 4
+EXEC_WORKERS = 2
+
+# Per-action dispatch timeouts (seconds). Inject may resurrect Chief first.
+DISPATCH_TIMEOUTS: Dict[str, float] = {
+    "inject": 120.0,
+    "spawn": 60.0,
+    "exec": 900.0,
+}
+
+# Seconds before a one-off whose dispatch crashed is tried again
+ENTRY_RETRY_DELAY = 60.0
+
 
 # =============================================================================
 # DATA MODEL
@@ -228,6 +249,12 @@ def _is_iso_datetime(s: str) -> bool:
     return bool(re.match(r'^\d{4}-\d{2}-\d{2}', s))
 
 
+def _to_timestamp(s: str) -> Optional[float]:
+    """Convert a stored next_run ISO string to a POSIX timestamp."""
+    dt = _parse_iso_datetime(s)
+    return dt.timestamp() if dt else None
+
+
 def _parse_iso_datetime(s: str) -> Optional[datetime]:
     """Parse ISO datetime string to timezone-aware datetime."""
     try:
@@ -247,7 +274,7 @@ class CronScheduler:
     """Unified cron dispatcher.
 
     - Parses SCHEDULE.md on startup and watches for changes
-    - 60-second polling loop
+    - Min-heap of (next_run, entry_id); sleeps until the head is due
     - Routes actions: inject → tmux, spawn → SessionService, exec → registry
     - Tracks state in cron_entries/cron_log DB tables
     - Absorbs calendar triggers from the old triggers.py
@@ -259,6 +286,24 @@ class CronScheduler:
         self.storage = SystemStorage(settings.db_path)
         self.entries: List[CronEntry] = []
         self._schedule_mtime: float = 0
+
+        # Due-time index. Heap items are (timestamp, entry_id); an item is live
+        # only while _next_run[entry_id] still equals its timestamp, so
+        # rescheduling just pushes a new item and stale ones are skipped on pop.
+        self._by_id: Dict[str, CronEntry] = {}
+        self._heap: List[Tuple[float, str]] = []
+        self._next_run: Dict[str, float] = {}
+        self._lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wake: Optional[asyncio.Event] = None
+
+        # Concurrent dispatch
+        self._dispatch_slots = asyncio.Semaphore(DISPATCH_CONCURRENCY)
+        self._target_locks: Dict[str, asyncio.Lock] = {}
+        self._in_flight: Dict[str, asyncio.Task] = {}
+        self._overrun: Set[asyncio.Task] = set()  # Timed-out actions still running
+        self._exec_pool: Optional[ThreadPoolExecutor] = None
+
         self._triggered_events: set = set()  # Calendar events already triggered
         self._caffeinate_proc: Optional[subprocess.Popen] = None
 
@@ -311,6 +356,7 @@ class CronScheduler:
         self.entries = parse_schedule(self.schedule_path)
         self._schedule_mtime = self._get_mtime(self.schedule_path)
         self._sync_db()
+        self._notify()
         logger.info(f"Loaded {len(self.entries)} schedule entries")
 
     def _schedule_changed(self) -> bool:
@@ -326,45 +372,80 @@ class CronScheduler:
             return 0
 
     def _sync_db(self):
-        """Sync parsed entries with DB. Preserve last_run for existing entries."""
-        # Get existing entries
+        """Sync parsed entries with DB and rebuild the due-time heap.
+
+        Preserves last_run and enabled for existing entries. Everything is
+        written in one transaction, so reloading a large schedule costs a
+        single commit instead of several statements per entry.
+        """
         existing = {}
-        for row in self.storage.fetchall("SELECT id, last_run, enabled FROM cron_entries"):
-            existing[row["id"]] = {"last_run": row["last_run"], "enabled": row["enabled"]}
+        for row in self.storage.fetchall("SELECT id, last_run, next_run, enabled FROM cron_entries"):
+            existing[row["id"]] = dict(row)
 
-        current_ids = set()
+        now_ts = time.time()
+        rows = []
+        schedule = {}
         for entry in self.entries:
-            current_ids.add(entry.id)
-            if entry.id in existing:
-                # Update expression/payload but keep last_run and enabled
-                self.storage.execute("""
-                    UPDATE cron_entries
-                    SET expression = ?, action_type = ?, target = ?, payload = ?,
-                        critical = ?, one_off = ?
-                    WHERE id = ?
-                """, (entry.expression, entry.action_type, entry.target, entry.payload,
-                      int(entry.critical), int(entry.one_off), entry.id))
+            prior = existing.get(entry.id)
+            if prior and self._stored_next_run_valid(entry, prior, now_ts):
+                # Same answer croniter would give; expanding thousands of
+                # expressions dominates reload time otherwise
+                next_run = prior["next_run"]
             else:
-                # New entry
-                next_run = self._compute_next_run(entry)
-                self.storage.execute("""
-                    INSERT INTO cron_entries (id, expression, action_type, target, payload,
-                                            critical, one_off, next_run)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                """, (entry.id, entry.expression, entry.action_type, entry.target,
-                      entry.payload, int(entry.critical), int(entry.one_off), next_run))
-
-        # Remove stale entries (in DB but not in file)
-        stale_ids = set(existing.keys()) - current_ids
-        for stale_id in stale_ids:
-            self.storage.execute("DELETE FROM cron_entries WHERE id = ?", (stale_id,))
-
-        # Recompute next_run for all entries
-        for entry in self.entries:
-            row = self.storage.fetchone("SELECT last_run FROM cron_entries WHERE id = ?", (entry.id,))
-            last_run = row["last_run"] if row else None
-            next_run = self._compute_next_run(entry, last_run)
-            self.storage.execute("UPDATE cron_entries SET next_run = ? WHERE id = ?", (next_run, entry.id))
+                next_run = self._compute_next_run(entry, prior["last_run"] if prior else None)
+            rows.append((entry.id, entry.expression, entry.action_type, entry.target,
+                         entry.payload, int(entry.critical), int(entry.one_off), next_run))
+            if next_run and (prior is None or prior["enabled"]):
+                schedule[entry.id] = next_run
+
+        stale_ids = set(existing) - {entry.id for entry in self.entries}
+
+        with self.storage.transaction() as cursor:
+            # Update expression/payload/next_run but keep last_run and enabled
+            cursor.executemany("""
+                INSERT INTO cron_entries (id, expression, action_type, target, payload,
+                                          critical, one_off, next_run)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(id) DO UPDATE SET
+                    expression = excluded.expression,
+                    action_type = excluded.action_type,
+                    target = excluded.target,
+                    payload = excluded.payload,
+                    critical = excluded.critical,
+                    one_off = excluded.one_off,
+                    next_run = excluded.next_run
+            """, rows)
+            # Remove stale entries (in DB but not in file)
+            cursor.executemany(
+                "DELETE FROM cron_entries WHERE id = ?",
+                [(stale_id,) for stale_id in stale_ids],
+            )
+
+        with self._lock:
+            self._by_id = {entry.id: entry for entry in self.entries}
+            self._next_run = {}
+            self._heap = []
+            for entry_id, next_run in schedule.items():
+                ts = _to_timestamp(next_run)
+                if ts is not None:
+                    self._next_run[entry_id] = ts
+                    self._heap.append((ts, entry_id))
+            heapq.heapify(self._heap)
+
+    @staticmethod
+    def _stored_next_run_valid(entry: CronEntry, prior: Dict[str, Any], now_ts: float) -> bool:
+        """Whether a stored next_run equals what _compute_next_run would return.
+
+        Recurring next_run is always written as the first match after last_run
+        (or after "now" when never run), and the id pins the expression. So it
+        stays valid if last_run is set, or if it is still in the future.
+        """
+        if entry.one_off or not prior["next_run"]:
+            return False
+        if prior["last_run"]:
+            return True
+        stored_ts = _to_timestamp(prior["next_run"])
+        return stored_ts is not None and stored_ts > now_ts
 
     def _compute_next_run(self, entry: CronEntry, last_run: Optional[str] = None) -> Optional[str]:
         """Compute next_run time for an entry."""
@@ -393,14 +474,79 @@ class CronScheduler:
         except Exception:
             return None
 
+    # =========================================================================
+    # DUE-TIME HEAP
+    # =========================================================================
+
+    def _schedule(self, entry_id: str, next_run: Optional[str]):
+        """Set (or clear, if next_run is None) an entry's slot in the heap."""
+        ts = _to_timestamp(next_run) if next_run else None
+        with self._lock:
+            if ts is None or entry_id not in self._by_id:
+                self._next_run.pop(entry_id, None)
+            else:
+                self._next_run[entry_id] = ts
+                heapq.heappush(self._heap, (ts, entry_id))
+        self._notify()
+
+    def _pop_due(self, now_ts: float) -> List[str]:
+        """Pop every live heap item due at or before now_ts, earliest first."""
+        due = []
+        with self._lock:
+            while self._heap and self._heap[0][0] <= now_ts:
+                ts, entry_id = heapq.heappop(self._heap)
+                if self._next_run.get(entry_id) == ts:
+                    del self._next_run[entry_id]
+                    due.append(entry_id)
+        return due
+
+    def _seconds_until_due(self) -> Optional[float]:
+        """Seconds until the earliest live entry is due, None if nothing is scheduled."""
+        with self._lock:
+            while self._heap and self._next_run.get(self._heap[0][1]) != self._heap[0][0]:
+                heapq.heappop(self._heap)
+            if not self._heap:
+                return None
+            return max(0.0, self._heap[0][0] - time.time())
+
+    def _notify(self):
+        """Wake the main loop so it re-reads the heap head. Safe from any thread."""
+        if self._loop is None or self._wake is None or self._loop.is_closed():
+            return
+        try:
+            self._loop.call_soon_threadsafe(self._wake.set)
+        except RuntimeError:
+            pass
+
+    async def _sleep(self, stop_event: asyncio.Event, timeout: float):
+        """Sleep for up to timeout seconds, returning early on stop or wake."""
+        waiters = [
+            asyncio.ensure_future(stop_event.wait()),
+            asyncio.ensure_future(self._wake.wait()),
+        ]
+        try:
+            await asyncio.wait(waiters, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            for waiter in waiters:
+                waiter.cancel()
+        self._wake.clear()
+
     # =========================================================================
     # MAIN LOOP
     # =========================================================================
 
     async def run_forever(self, stop_event: asyncio.Event):
-        """Main scheduler loop — runs until stop_event is set."""
+        """Main scheduler loop — runs until stop_event is set.
+
+        Due entries are dispatched as soon as the heap head comes due.
+        Housekeeping (schedule mtime check, calendar triggers) keeps its
+        60-second cadence; add_entry/set_enabled/reloads wake the loop early.
+        """
         logger.info("Cron scheduler starting...")
 
+        self._loop = asyncio.get_running_loop()
+        self._wake = asyncio.Event()
+
         # Initial load
         self.load_schedule()
 
@@ -410,15 +556,17 @@ class CronScheduler:
         logger.info(f"Cron scheduler running ({len(self.entries)} entries)")
 
         cleanup_counter = 0
+        next_housekeeping = 0.0
 
         try:
             while not stop_event.is_set():
                 tick_start = time.perf_counter()
                 errored = False
+                housekeeping = time.monotonic() >= next_housekeeping
 
                 try:
                     # Reload schedule if file changed
-                    if self._schedule_changed():
+                    if housekeeping and self._schedule_changed():
                         self.load_schedule()
                         logger.info("Schedule reloaded (file changed)")
 
@@ -426,7 +574,8 @@ class CronScheduler:
                     await self._process_due_entries()
 
                     # Check calendar triggers (absorbed from triggers.py)
-                    await self._check_calendar_triggers()
+                    if housekeeping:
+                        await self._check_calendar_triggers()
 
                 except Exception as e:
                     errored = True
@@ -435,106 +584,214 @@ class CronScheduler:
                     elapsed_ms = (time.perf_counter() - tick_start) * 1000
                     record_worker_latency("scheduler.tick", elapsed_ms, errored)
 
-                # Periodic calendar event set cleanup (every ~60 ticks = 1 hour)
-                cleanup_counter += 1
-                if cleanup_counter >= 60:
-                    self._triggered_events.clear()
-                    cleanup_counter = 0
+                if housekeeping:
+                    next_housekeeping = time.monotonic() + HOUSEKEEPING_INTERVAL
 
-                # Wait 60 seconds (or until stop)
-                try:
-                    await asyncio.wait_for(stop_event.wait(), timeout=60.0)
-                    break
-                except asyncio.TimeoutError:
-                    continue
+                    # Periodic calendar event set cleanup (every ~60 ticks = 1 hour)
+                    cleanup_counter += 1
+                    if cleanup_counter >= 60:
+                        self._triggered_events.clear()
+                        cleanup_counter = 0
+
+                # Sleep until the next entry is due, housekeeping, wake, or stop
+                timeout = max(0.0, next_housekeeping - time.monotonic())
+                until_due = self._seconds_until_due()
+                if until_due is not None:
+                    timeout = min(timeout, until_due)
+                await self._sleep(stop_event, timeout)
 
         except Exception as e:
             logger.error(f"Scheduler fatal error: {e}", exc_info=True)
         finally:
+            # Drop dispatches still running; their threads finish on their own
+            pending = list(self._in_flight.values()) + list(self._overrun)
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+            if self._exec_pool:
+                self._exec_pool.shutdown(wait=False)
+                self._exec_pool = None
+
             # Kill caffeinate if running
             if self._caffeinate_proc:
                 try:
                     self._caffeinate_proc.terminate()
                 except Exception:
                     pass
+            self._loop = None
             logger.info("Cron scheduler stopped")
 
     # =========================================================================
     # ENTRY PROCESSING
     # =========================================================================
 
-    async def _process_due_entries(self):
-        """Check all entries and dispatch any that are due."""
+    async def _process_due_entries(self) -> List[asyncio.Task]:
+        """Start a dispatch task for every entry whose heap slot has come due.
+
+        Returns without waiting, so a slow action never delays the next one.
+        An entry already being dispatched is skipped (a reload can re-add its
+        old slot); it is rescheduled when its dispatch finishes.
+        """
         now = datetime.now(PACIFIC)
         now_iso = now.isoformat()
 
-        rows = self.storage.fetchall("""
-            SELECT id, expression, action_type, target, payload, critical, one_off, last_run, next_run
-            FROM cron_entries
-            WHERE enabled = 1 AND next_run IS NOT NULL AND next_run <= ?
-        """, (now_iso,))
+        started = []
+        for entry_id in self._pop_due(now.timestamp()):
+            entry = self._by_id.get(entry_id)
+            if entry is None or entry_id in self._in_flight:
+                continue
+            task = asyncio.create_task(
+                self._run_entry(entry, now_iso, time.perf_counter()),
+                name=f"cron-{entry_id}",
+            )
+            self._in_flight[entry_id] = task
+            task.add_done_callback(lambda t, e=entry: self._entry_done(e, t))
+            started.append(task)
+        return started
 
-        for row in rows:
-            entry_id = row["id"]
-            action_type = row["action_type"]
-            target = row["target"]
-            payload = row["payload"]
-            one_off = bool(row["one_off"])
+    def _entry_done(self, entry: CronEntry, task: asyncio.Task):
+        """Done-callback for _run_entry: log a crash and keep the entry scheduled.
+
+        If the dispatch raised before the entry was put back on the heap, it
+        would never fire again. Recurring entries go to their next cron slot;
+        one-offs are retried after ENTRY_RETRY_DELAY.
+        """
+        self._in_flight.pop(entry.id, None)
+        if task.cancelled() or task.exception() is None:
+            return
+        logger.error(f"Cron entry {entry.id} failed: {task.exception()}", exc_info=task.exception())
 
-            start = time.perf_counter()
-            status = "error"
-            notes = None
+        with self._lock:
+            needs_slot = entry.id in self._by_id and entry.id not in self._next_run
+        if not needs_slot:
+            return
+        now = datetime.now(PACIFIC)
+        if entry.one_off:
+            next_run = (now + timedelta(seconds=ENTRY_RETRY_DELAY)).isoformat()
+        else:
+            next_run = self._compute_next_run(entry, now.isoformat())
+        self._schedule(entry.id, next_run)
 
-            try:
-                if action_type == "inject":
-                    status, notes = await self._dispatch_inject(target, payload)
-                elif action_type == "spawn":
-                    status, notes = await self._dispatch_spawn(target, payload)
-                elif action_type == "exec":
-                    status, notes = await self._dispatch_exec(payload)
-                else:
-                    status = "error"
-                    notes = f"Unknown action type: {action_type}"
-            except Exception as e:
-                status = "error"
-                notes = str(e)
-                logger.error(f"Dispatch error for {entry_id}: {e}", exc_info=True)
+    async def _run_entry(self, entry: CronEntry, now_iso: str, queued_at: float):
+        """Dispatch one due entry, log it, and put it back on the heap."""
+        entry_id = entry.id
+        action_type = entry.action_type
+        target = entry.target
+        payload = entry.payload
+        one_off = entry.one_off
 
-            elapsed_ms = int((time.perf_counter() - start) * 1000)
+        status, notes, elapsed_ms = await self._dispatch(action_type, target, payload, queued_at)
 
-            # Log execution
-            self.storage.execute("""
+        # Update last_run and compute next_run
+        next_run = self._compute_next_run(entry, now_iso) if not one_off else None
+
+        # Log execution
+        with self.storage.transaction() as cursor:
+            cursor.execute("""
                 INSERT INTO cron_log (entry_id, fired_at, status, notes, duration_ms)
                 VALUES (?, ?, ?, ?, ?)
             """, (entry_id, now_iso, status, notes, elapsed_ms))
-
-            # Update last_run and compute next_run
-            entry_obj = self._find_entry(entry_id)
-            next_run = self._compute_next_run(entry_obj, now_iso) if entry_obj and not one_off else None
-
-            self.storage.execute("""
+            cursor.execute("""
                 UPDATE cron_entries SET last_run = ?, next_run = ? WHERE id = ?
             """, (now_iso, next_run, entry_id))
+        self._schedule(entry_id, next_run)
+
+        # Handle one-off cleanup
+        if one_off and status == "delivered":
+            await self._remove_one_off(entry_id, entry.expression)
+
+        # Emit event
+        await event_bus.publish("cron.fired", {
+            "entry_id": entry_id,
+            "action_type": action_type,
+            "target": target,
+            "payload": payload[:100],
+            "status": status,
+        })
+
+    async def _dispatch(self, action_type: str, target: str, payload: str,
+                        queued_at: float) -> Tuple[str, Optional[str], int]:
+        """Route an action through the worker pool. Returns (status, notes, duration_ms).
+
+        Waits for the target's lock (injects only), then a dispatch slot, and
+        runs the action under its DISPATCH_TIMEOUTS budget. Taking the lock
+        first keeps entries queued behind a busy pane from holding slots
+        other targets could use. A timed-out action keeps running in its
+        thread, so the target lock stays held until it actually finishes.
+        Queue wait and execution time are recorded separately as
+        cron.<action>.queue and cron.<action>.
+        """
+        lock = None
+        if action_type == "inject":
+            lock = self._target_locks.setdefault(f"life:{target}", asyncio.Lock())
 
-            # Handle one-off cleanup
-            if one_off and status == "delivered":
-                await self._remove_one_off(entry_id, row["expression"])
+        if lock:
+            await lock.acquire()
+        release_lock = lock is not None
+        try:
+            async with self._dispatch_slots:
+                queue_ms = (time.perf_counter() - queued_at) * 1000
+                record_worker_latency(f"cron.{action_type}.queue", queue_ms, False)
 
-            # Emit event
-            await event_bus.publish("cron.fired", {
-                "entry_id": entry_id,
-                "action_type": action_type,
-                "target": target,
-                "payload": payload[:100],
-                "status": status,
-            })
+                start = time.perf_counter()
+                status = "error"
+                notes = None
+                timeout = DISPATCH_TIMEOUTS.get(action_type, 60.0)
+                action_task = None
+                try:
+                    if action_type == "inject":
+                        action = self._dispatch_inject(target, payload)
+                    elif action_type == "spawn":
+                        action = self._dispatch_spawn(target, payload)
+                    elif action_type == "exec":
+                        action = self._dispatch_exec(payload)
+                    else:
+                        action = None
+                        notes = f"Unknown action type: {action_type}"
+                    if action is not None:
+                        action_task = asyncio.ensure_future(action)
+                        status, notes = await asyncio.wait_for(
+                            asyncio.shield(action_task), timeout=timeout
+                        )
+                except asyncio.TimeoutError:
+                    status = "timeout"
+                    notes = f"{action_type} exceeded {timeout:.0f}s"
+                    logger.error(f"Dispatch timeout: {action_type} {target} {payload[:50]}")
+                    self._track_overrun(action_task, lock)
+                    release_lock = False
+                except asyncio.CancelledError:
+                    if action_task is not None:
+                        action_task.cancel()
+                    raise
+                except Exception as e:
+                    status = "error"
+                    notes = str(e)
+                    logger.error(f"Dispatch error for {action_type} {target}: {e}", exc_info=True)
+
+                elapsed = (time.perf_counter() - start) * 1000
+                record_worker_latency(f"cron.{action_type}", elapsed, status != "delivered")
+                return status, notes, int(elapsed)
+        finally:
+            if release_lock:
+                lock.release()
+
+    def _track_overrun(self, task: asyncio.Task, lock: Optional[asyncio.Lock]):
+        """Let a timed-out action finish, then release its target lock."""
+        self._overrun.add(task)
+
+        def finished(t: asyncio.Task):
+            self._overrun.discard(t)
+            if lock:
+                lock.release()
+            if not t.cancelled() and t.exception() is not None:
+                logger.error(f"Timed-out dispatch failed: {t.exception()}")
+
+        task.add_done_callback(finished)
 
     def _find_entry(self, entry_id: str) -> Optional[CronEntry]:
         """Find a CronEntry by ID."""
-        for entry in self.entries:
-            if entry.id == entry_id:
-                return entry
-        return None
+        return self._by_id.get(entry_id)
 
     # =========================================================================
     # ACTION DISPATCHERS
@@ -603,27 +860,27 @@ class CronScheduler:
             f"# Progress Log\n\nStarted: {timestamp}\nMax iterations: 10\n\n"
         )
 
-        # Spawn in background thread (non-blocking)
-        def _do_spawn():
+        # Spawn in the background: readiness is awaited, not polled from a thread
+        def _log_spawn(task: asyncio.Task) -> None:
             try:
-                manager = SessionManager(repo_root=settings.repo_root)
-                result = manager.spawn(
-                    role=role,
-                    mode="preparation",
-                    conversation_id=conversation_id,
-                    description=f"Scheduled {role}",
-                    spec_path=str(full_spec),
-                )
-                if result.success:
-                    logger.info(f"Scheduled spawn succeeded: {role}/{conversation_id}")
-                else:
-                    logger.error(f"Scheduled spawn failed: {result.error}")
+                result = task.result()
             except Exception as e:
                 logger.error(f"Scheduled spawn error: {e}")
-
-        import threading
-        thread = threading.Thread(target=_do_spawn, daemon=True, name=f"cron-spawn-{conversation_id}")
-        thread.start()
+                return
+            if result.success:
+                logger.info(f"Scheduled spawn succeeded: {role}/{conversation_id}")
+            else:
+                logger.error(f"Scheduled spawn failed: {result.error}")
+
+        manager = SessionManager(repo_root=settings.repo_root)
+        handle = await manager.spawn_async(
+            role=role,
+            mode="preparation",
+            conversation_id=conversation_id,
+            description=f"Scheduled {role}",
+            spec_path=str(full_spec),
+        )
+        handle.task.add_done_callback(_log_spawn)
 
         return "delivered", f"Spawned {role} as {conversation_id}"
 
@@ -633,8 +890,15 @@ class CronScheduler:
         if not func:
             return "error", f"Function '{func_name}' not in EXEC_REGISTRY"
 
+        if self._exec_pool is None:
+            self._exec_pool = ThreadPoolExecutor(
+                max_workers=EXEC_WORKERS, thread_name_prefix="cron-exec"
+            )
+
         try:
-            await asyncio.to_thread(func)
+            # Own pool so long jobs (VACUUM) can't starve asyncio.to_thread users.
+            # A timeout abandons the wait; the thread runs to completion.
+            await asyncio.get_running_loop().run_in_executor(self._exec_pool, func)
             return "delivered", None
         except Exception as e:
             return "error", str(e)
@@ -649,12 +913,9 @@ class CronScheduler:
             from modules.sessions import SessionManager
             manager = SessionManager(repo_root=settings.repo_root)
 
-            # Spawn Chief (blocking — we need to wait for readiness)
-            def _spawn():
-                result = manager.spawn_chief()
-                return result.success
-
-            success = await asyncio.to_thread(_spawn)
+            # Spawn Chief (same as spawn_chief) and wait for readiness
+            handle = await manager.spawn_async(role="chief", mode="interactive", window_name="chief")
+            success = (await handle).success
             if success:
                 logger.info("Chief resurrected successfully")
                 # Wait a bit for hooks to load
@@ -738,23 +999,14 @@ class CronScheduler:
             if critical:
                 # Critical entries: run immediately
                 logger.info(f"Catching up missed critical entry: {entry_id} ({payload[:50]})")
-                status = "error"
-                notes = None
-
-                try:
-                    if action_type == "inject":
-                        status, notes = await self._dispatch_inject(target, payload)
-                    elif action_type == "spawn":
-                        status, notes = await self._dispatch_spawn(target, payload)
-                    elif action_type == "exec":
-                        status, notes = await self._dispatch_exec(payload)
-                except Exception as e:
-                    notes = str(e)
+                status, notes, elapsed_ms = await self._dispatch(
+                    action_type, target, payload, time.perf_counter()
+                )
 
                 self.storage.execute("""
-                    INSERT INTO cron_log (entry_id, fired_at, status, notes)
-                    VALUES (?, ?, ?, ?)
-                """, (entry_id, now_iso, f"caught_up:{status}", notes))
+                    INSERT INTO cron_log (entry_id, fired_at, status, notes, duration_ms)
+                    VALUES (?, ?, ?, ?, ?)
+                """, (entry_id, now_iso, f"caught_up:{status}", notes, elapsed_ms))
 
             elif one_off:
                 # One-off: deliver late
@@ -786,6 +1038,7 @@ class CronScheduler:
                     "UPDATE cron_entries SET last_run = ?, next_run = ? WHERE id = ?",
                     (now_iso, next_run, entry_id)
                 )
+                self._schedule(entry_id, next_run)
 
     # =========================================================================
     # ONE-OFF CLEANUP
@@ -817,6 +1070,9 @@ class CronScheduler:
 
             # Remove from in-memory entries
             self.entries = [e for e in self.entries if e.id != entry_id]
+            with self._lock:
+                self._by_id.pop(entry_id, None)
+                self._next_run.pop(entry_id, None)
 
         except Exception as e:
             logger.error(f"Failed to remove one-off {entry_id}: {e}")
@@ -923,6 +1179,11 @@ class CronScheduler:
             "UPDATE cron_entries SET enabled = ? WHERE id = ?",
             (int(enabled), entry_id)
         )
+        if enabled:
+            row = self.storage.fetchone("SELECT next_run FROM cron_entries WHERE id = ?", (entry_id,))
+            self._schedule(entry_id, row["next_run"] if row else None)
+        else:
+            self._schedule(entry_id, None)
         return True
 
     def _append_to_schedule(self, section: str, line: str):
@@ -9,37 +9,40 @@ from pathlib import Path
 from typing import Iterable, Sequence
 
 from core.config import settings
+from core.database import get_pool
 
 
 class SystemStorage:
-    """Thin wrapper around the shared SQLite database."""
+    """Thin wrapper around the shared SQLite database.
+
+    Instances are cheap: connections come from the process-wide pool in
+    core.database. SELECTs run on the calling thread's reader, everything
+    else goes through the single serialized writer.
+    """
 
     _schema_initialized = False
 
     def __init__(self, db_path: Path):
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
-        self._conn = sqlite3.connect(
-            str(self.db_path),
-            isolation_level=None,
-            check_same_thread=False,
-        )
-        self._conn.row_factory = sqlite3.Row
-        self._conn.execute("PRAGMA journal_mode=WAL;")
-        self._conn.execute("PRAGMA busy_timeout=5000;")
-        self._conn.execute("PRAGMA foreign_keys=ON;")
+        self._pool = get_pool(self.db_path)
         if not SystemStorage._schema_initialized:
             self._initialize_schema()
             SystemStorage._schema_initialized = True
 
     def close(self) -> None:
-        self._conn.close()
+        """No-op: pooled connections stay open for the next caller."""
 
     def execute(self, sql: str, params: Sequence | None = None):
-        return self._execute_with_retry(self._conn.execute, sql, params or [])
+        if _is_read(sql) and not self._pool.owns_writer():
+            conn = self._pool.reader()
+            return self._execute_with_retry(conn.execute, sql, params or [])
+        with self._pool.writer() as conn:
+            return self._execute_with_retry(conn.execute, sql, params or [])
 
     def executemany(self, sql: str, seq_of_params: Iterable[Sequence]):
-        return self._execute_with_retry(self._conn.executemany, sql, seq_of_params)
+        with self._pool.writer() as conn:
+            return self._execute_with_retry(conn.executemany, sql, seq_of_params)
 
     def fetchone(self, sql: str, params: Sequence | None = None):
         cursor = self.execute(sql, params)
@@ -66,15 +69,8 @@ class SystemStorage:
 
     @contextmanager
     def transaction(self):
-        cursor = self._conn.cursor()
-        try:
-            cursor.execute("BEGIN IMMEDIATE;")
+        with self._pool.write_transaction() as cursor:
             yield cursor
-        except Exception:
-            cursor.execute("ROLLBACK;")
-            raise
-        else:
-            cursor.execute("COMMIT;")
 
     # ------------------------------------------------------------------ schema
     def _initialize_schema(self) -> None:
@@ -91,7 +87,14 @@ class SystemStorage:
         schema_sql = schema_path.read_text()
 
         # Execute entire schema (idempotent due to IF NOT EXISTS)
-        self._conn.executescript(schema_sql)
+        with self._pool.writer() as conn:
+            conn.executescript(schema_sql)
+
+
+def _is_read(sql: str) -> bool:
+    """True for statements that can run on a per-thread reader."""
+    head = sql.lstrip()[:8].upper()
+    return head.startswith("SELECT") or head.startswith("WITH")
 
 
 __all__ = ["SystemStorage"]
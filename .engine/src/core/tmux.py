@@ -8,7 +8,7 @@ Three patterns:
 2. send_text(target, text, submit=True) - Short text with delayed Enter
    Use for: Commands, short messages, env vars
 
-3. inject_message(target, message) - Long text via load-buffer
+3. inject_message(target, message) - Long text via a named paste buffer
    Use for: Multi-line content, Claude prompts, anything over ~100 chars
 
 Reliability: send_text and inject_message deliver content first, then send
@@ -17,15 +17,31 @@ React-based) needs a render cycle to process pasted text before it can handle
 the Enter/submit keystroke. Atomic command chaining (`;`) delivers both in
 the same byte stream, causing Enter to arrive before the TUI is ready.
 
+Transport: commands go over one long-lived control-mode connection
+(TmuxControlClient, `tmux -C`) instead of forking a tmux process each.
+Replies are matched to commands in order, so callers can pipeline, and
+pane output / title changes arrive as TmuxEvents. If control mode is
+disabled (CLAUDE_OS_TMUX_CONTROL=false) or can't attach yet (no "life"
+session), every helper falls back to spawning tmux as before.
+
 """
 
 import asyncio
+import codecs
+import logging
+import re
 import subprocess
 import threading
 import time
 import uuid
+from collections import deque
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Deque, Dict, FrozenSet, Iterable, List, Optional, Sequence
+
+from .config import settings
+
+logger = logging.getLogger(__name__)
 
 # Default tmux session name
 TMUX_SESSION = "life"
@@ -49,6 +65,460 @@ def _get_pane_lock(target: str) -> threading.Lock:
 TMP_DIR = Path("/tmp/life-tmux")
 
 
+# =============================================================================
+# CONTROL MODE CLIENT
+# =============================================================================
+
+CONTROL_TIMEOUT = 5.0  # seconds per command (matches the subprocess timeout)
+CONTROL_RETRY_DELAY = 5.0  # wait this long after a failed attach before retrying
+_READ_LIMIT = 16 * 1024 * 1024  # longest line we accept from tmux (big %output bursts)
+
+
+class TmuxError(Exception):
+    """A tmux command failed, or the control connection went away."""
+
+
+@dataclass
+class TmuxEvent:
+    """A control-mode notification.
+
+    kind is "output" (pane wrote data), "title" (pane title changed),
+    "window-add", "window-close", "window-renamed", or "exit" (the
+    connection closed; re-subscribe via get_control_client()).
+    pane is a pane id like "%3", window a window id like "@2".
+    """
+    kind: str
+    pane: Optional[str] = None
+    window: Optional[str] = None
+    data: str = ""
+
+
+def quote_arg(arg: str) -> str:
+    """Quote one argument for a control-mode command line.
+
+    Double quotes with backslash escapes, so arguments can carry spaces,
+    semicolons, newlines and control bytes without tmux re-parsing them.
+    """
+    out = ['"']
+    for ch in arg:
+        if ch in '\\"$':
+            out.append("\\" + ch)
+        elif ch < " " or ch == "\x7f":
+            out.append(f"\\{ord(ch):03o}")
+        else:
+            out.append(ch)
+    out.append('"')
+    return "".join(out)
+
+
+_OCTAL_RE = re.compile(rb"\\([0-7]{3})")
+
+
+def unescape_output(data: bytes) -> bytes:
+    """Decode %output data (tmux escapes control bytes and backslash as \\ooo)."""
+    return _OCTAL_RE.sub(lambda m: bytes([int(m.group(1), 8)]), data)
+
+
+class _Subscriber:
+    def __init__(self, loop: asyncio.AbstractEventLoop, queue: asyncio.Queue, kinds: Optional[FrozenSet[str]]):
+        self.loop = loop
+        self.queue = queue
+        self.kinds = kinds
+        self.dropped = 0
+
+    def wants(self, kind: str) -> bool:
+        return self.kinds is None or kind in self.kinds
+
+    def deliver(self, event: TmuxEvent) -> None:
+        # Slow consumers lose the oldest events rather than stalling tmux
+        if self.queue.full():
+            self.queue.get_nowait()
+            self.dropped += 1
+        self.queue.put_nowait(event)
+
+
+class TmuxControlClient:
+    """One long-lived tmux control-mode connection.
+
+    Commands are written one per line and may be pipelined: tmux runs
+    them in order and answers each with a %begin/%end (or %error) block,
+    so replies are matched to a FIFO of futures. Lines outside those
+    blocks are notifications, published to subscribers as TmuxEvents.
+
+    Pane output is only streamed while someone subscribes to "output";
+    otherwise tmux is asked not to send it (no-output), since busy Claude
+    panes redraw constantly.
+
+    Asyncio-native: use it from the loop that called start(). The module
+    helpers run a shared instance on a background loop so sync code and
+    other loops can use it too (see get_control_client()).
+    """
+
+    def __init__(self, session: str = TMUX_SESSION, tmux: str = "tmux"):
+        self.session = session
+        self.tmux = tmux
+        self._proc: Optional[asyncio.subprocess.Process] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._reader: Optional[asyncio.Task] = None
+        self._pending: Deque[asyncio.Future] = deque()
+        self._block: Optional[List[str]] = None  # output lines of the reply being read
+        self._block_tag = b""
+        self._block_ours = False
+        self._exit_reason = ""
+        self._attached: Optional[asyncio.Event] = None
+        self._decoders: Dict[str, codecs.IncrementalDecoder] = {}
+        self._subscribers: List[_Subscriber] = []
+        self._subscribers_lock = threading.Lock()
+        self._output_on = False
+        self.stats = {"commands": 0, "events": 0}
+
+    @property
+    def running(self) -> bool:
+        return self._reader is not None and not self._reader.done()
+
+    async def start(self, timeout: float = CONTROL_TIMEOUT) -> None:
+        """Attach to the session; raises if tmux isn't there to attach to."""
+        self._loop = asyncio.get_running_loop()
+        self._attached = asyncio.Event()
+        self._proc = await asyncio.create_subprocess_exec(
+            self.tmux, "-C", "attach-session", "-f", "ignore-size,no-output", "-t", self.session,
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
+            limit=_READ_LIMIT,
+        )
+        self._reader = asyncio.create_task(self._read_loop())
+        try:
+            # Commands sent before the attach completes run without a
+            # client, so wait for its reply (or for tmux to give up)
+            attached = asyncio.ensure_future(self._attached.wait())
+            await asyncio.wait({attached, self._reader}, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+            if not attached.done():
+                attached.cancel()
+                raise TmuxError(f"could not attach to tmux session {self.session!r} {self._exit_reason}".strip())
+            # Title changes for every pane, pushed as %subscription-changed
+            await asyncio.wait_for(
+                self.command("refresh-client", "-B", "title:%*:#{pane_title}"), timeout
+            )
+        except BaseException:
+            await self.close()
+            raise
+
+    async def close(self) -> None:
+        """Detach (tmux exits when stdin closes) and fail anything in flight."""
+        proc = self._proc
+        if proc is not None and proc.returncode is None:
+            try:
+                proc.stdin.close()
+                await asyncio.wait_for(proc.wait(), 2)
+            except Exception:
+                proc.kill()
+        if self._reader is not None:
+            try:
+                await self._reader
+            except Exception:
+                pass
+
+    async def command(self, *args: str) -> List[str]:
+        """Run one tmux command; returns its output lines, raises TmuxError on failure."""
+        (lines,) = await self.pipeline([args])
+        return lines
+
+    async def pipeline(self, commands: Sequence[Sequence[str]]) -> List[List[str]]:
+        """Send several commands in one write and wait for all their replies.
+
+        tmux runs them in order; every command runs even if an earlier one
+        fails. Returns each command's output lines, or raises TmuxError for
+        the first failure.
+        """
+        futures = self._send(commands)
+        await self._proc.stdin.drain()
+
+        results = await asyncio.gather(*futures, return_exceptions=True)
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+        return results
+
+    def _send(self, commands: Sequence[Sequence[str]]) -> List[asyncio.Future]:
+        """Write commands now, in call order; returns a future per reply."""
+        if not self.running:
+            raise TmuxError("tmux control client is not running")
+        futures = []
+        payload = []
+        for args in commands:
+            future = self._loop.create_future()
+            self._pending.append(future)
+            futures.append(future)
+            # The command name goes unquoted: tmux won't resolve a quoted one
+            payload.append(" ".join([args[0], *(quote_arg(arg) for arg in args[1:])]))
+        self.stats["commands"] += len(futures)
+        self._proc.stdin.write(("\n".join(payload) + "\n").encode())
+        return futures
+
+    # =========================================================================
+    # EVENTS
+    # =========================================================================
+
+    def subscribe(self, kinds: Optional[Iterable[str]] = None, maxsize: int = 1000) -> asyncio.Queue:
+        """Queue of TmuxEvents, delivered on the calling loop.
+
+        kinds limits which events arrive (default: all). The queue drops
+        its oldest event when full.
+        """
+        subscriber = _Subscriber(
+            asyncio.get_running_loop(),
+            asyncio.Queue(maxsize),
+            frozenset(kinds) if kinds is not None else None,
+        )
+        with self._subscribers_lock:
+            self._subscribers.append(subscriber)
+        self._call_soon(self._sync_output_flag)
+        return subscriber.queue
+
+    def unsubscribe(self, queue: asyncio.Queue) -> None:
+        with self._subscribers_lock:
+            self._subscribers = [s for s in self._subscribers if s.queue is not queue]
+        self._call_soon(self._sync_output_flag)
+
+    def _call_soon(self, callback) -> None:
+        if self._loop is None or self._loop.is_closed():
+            return
+        try:
+            if asyncio.get_running_loop() is self._loop:
+                callback()
+                return
+        except RuntimeError:
+            pass
+        self._loop.call_soon_threadsafe(callback)
+
+    def _sync_output_flag(self) -> None:
+        """Ask tmux for pane output only while an "output" subscriber exists."""
+        with self._subscribers_lock:
+            wanted = any(s.wants("output") for s in self._subscribers)
+        if wanted == self._output_on or not self.running:
+            return
+        self._output_on = wanted
+        # Written synchronously so it precedes any command sent after subscribe()
+        (future,) = self._send([("refresh-client", "-f", "!no-output" if wanted else "no-output")])
+        future.add_done_callback(lambda f: f.cancelled() or f.exception())
+
+    def _publish(self, event: TmuxEvent) -> None:
+        self.stats["events"] += 1
+        with self._subscribers_lock:
+            subscribers = [s for s in self._subscribers if s.wants(event.kind)]
+        for subscriber in subscribers:
+            if subscriber.loop is self._loop:
+                subscriber.deliver(event)
+                continue
+            try:
+                subscriber.loop.call_soon_threadsafe(subscriber.deliver, event)
+            except RuntimeError:
+                # Subscriber's loop is gone
+                self.unsubscribe(subscriber.queue)
+
+    # =========================================================================
+    # PROTOCOL
+    # =========================================================================
+
+    async def _read_loop(self) -> None:
+        stdout = self._proc.stdout
+        try:
+            while True:
+                line = await stdout.readline()
+                if not line:
+                    break
+                self._handle_line(line.rstrip(b"\n"))
+        except Exception as e:
+            logger.warning(f"tmux control connection failed: {e}")
+        finally:
+            error = TmuxError(f"tmux control connection closed {self._exit_reason}".strip())
+            while self._pending:
+                future = self._pending.popleft()
+                if not future.done():
+                    future.set_exception(error)
+            self._publish(TmuxEvent("exit", data=self._exit_reason))
+
+    def _handle_line(self, line: bytes) -> None:
+        if self._block is not None:
+            if line.startswith((b"%end ", b"%error ")) and line.split(b" ", 1)[1] == self._block_tag:
+                self._finish_block(failed=line.startswith(b"%error"))
+            else:
+                self._block.append(line.decode("utf-8", "replace"))
+            return
+
+        kind, _, rest = line.partition(b" ")
+        if kind == b"%begin":
+            # %begin <time> <number> <flags>; flags & 1 marks replies to our
+            # own commands (the attach itself answers with flags 0)
+            self._block = []
+            self._block_tag = rest
+            fields = rest.split(b" ")
+            self._block_ours = len(fields) >= 3 and int(fields[2]) & 1 == 1
+        elif kind == b"%output":
+            pane, _, data = rest.partition(b" ")
+            self._publish_output(pane.decode(), unescape_output(data))
+        elif kind == b"%subscription-changed":
+            # %subscription-changed <name> $<session> @<window> <index> %<pane> ... : <value>
+            head, _, value = rest.partition(b" : ")
+            fields = head.decode().split(" ")
+            if len(fields) >= 5 and fields[0] == "title":
+                self._publish(TmuxEvent("title", pane=fields[4], window=fields[2], data=value.decode("utf-8", "replace")))
+        elif kind in (b"%window-add", b"%window-close", b"%unlinked-window-close"):
+            name = "window-add" if kind == b"%window-add" else "window-close"
+            self._publish(TmuxEvent(name, window=rest.decode()))
+        elif kind == b"%window-renamed":
+            window, _, name = rest.partition(b" ")
+            self._publish(TmuxEvent("window-renamed", window=window.decode(), data=name.decode("utf-8", "replace")))
+        elif kind == b"%exit":
+            self._exit_reason = rest.decode("utf-8", "replace")
+
+    def _finish_block(self, failed: bool) -> None:
+        lines = self._block
+        self._block = None
+        if not self._block_ours:
+            self._attached.set()  # The attach-session reply
+            return
+        if not self._pending:
+            return
+        future = self._pending.popleft()
+        if future.done():  # Caller gave up waiting
+            return
+        if failed:
+            future.set_exception(TmuxError("\n".join(lines) or "tmux command failed"))
+        else:
+            future.set_result(lines)
+
+    def _publish_output(self, pane: str, data: bytes) -> None:
+        # Output chunks can split a UTF-8 sequence; decode per pane
+        decoder = self._decoders.get(pane)
+        if decoder is None:
+            decoder = self._decoders[pane] = codecs.getincrementaldecoder("utf-8")("replace")
+        self._publish(TmuxEvent("output", pane=pane, data=decoder.decode(data)))
+
+
+# Shared client on a background loop, used by the helpers below
+_control: Optional[TmuxControlClient] = None
+_control_loop: Optional[asyncio.AbstractEventLoop] = None
+_control_thread: Optional[threading.Thread] = None
+_control_lock = threading.Lock()
+_control_retry_at = 0.0
+
+
+def _ensure_control_loop() -> asyncio.AbstractEventLoop:
+    global _control_loop, _control_thread
+    if _control_loop is None:
+        _control_loop = asyncio.new_event_loop()
+        _control_thread = threading.Thread(target=_control_loop.run_forever, name="tmux-control", daemon=True)
+        _control_thread.start()
+    return _control_loop
+
+
+def get_control_client() -> Optional[TmuxControlClient]:
+    """The shared control-mode client, (re)attached on demand.
+
+    Returns None if control mode is disabled or tmux can't attach (no
+    server or session yet); callers then spawn tmux per command. After a
+    failed attach, waits CONTROL_RETRY_DELAY before trying again.
+    """
+    global _control, _control_retry_at
+    client = _control
+    if client is not None and client.running:
+        return client
+    if not settings.tmux_control_mode or threading.current_thread() is _control_thread:
+        return None
+    with _control_lock:
+        if _control is not None and _control.running:
+            return _control
+        if time.monotonic() < _control_retry_at:
+            return None
+        client = TmuxControlClient()
+        try:
+            asyncio.run_coroutine_threadsafe(client.start(), _ensure_control_loop()).result(CONTROL_TIMEOUT + 1)
+        except Exception as e:
+            logger.debug(f"tmux control mode unavailable, spawning tmux per command: {e}")
+            _control_retry_at = time.monotonic() + CONTROL_RETRY_DELAY
+            return None
+        _control = client
+        return client
+
+
+def close_control_client() -> None:
+    """Detach the shared client (the next command re-attaches)."""
+    global _control, _control_retry_at
+    with _control_lock:
+        client, _control = _control, None
+        _control_retry_at = 0.0
+        if client is not None and _control_loop is not None:
+            try:
+                asyncio.run_coroutine_threadsafe(client.close(), _control_loop).result(CONTROL_TIMEOUT)
+            except Exception:
+                pass
+
+
+def _control_pipeline(commands: Sequence[Sequence[str]]) -> Optional[List[List[str]]]:
+    """Run commands on the shared client from sync code; None if unavailable."""
+    client = get_control_client()
+    if client is None:
+        return None
+    future = asyncio.run_coroutine_threadsafe(client.pipeline(commands), _control_loop)
+    try:
+        return future.result(CONTROL_TIMEOUT)
+    except TimeoutError:
+        future.cancel()
+        raise TmuxError(f"tmux command timed out: {commands[0][0]}")
+
+
+async def _control_pipeline_async(commands: Sequence[Sequence[str]]) -> Optional[List[List[str]]]:
+    """Run commands on the shared client from any event loop; None if unavailable."""
+    client = _control if _control is not None and _control.running else await asyncio.to_thread(get_control_client)
+    if client is None:
+        return None
+    future = asyncio.run_coroutine_threadsafe(client.pipeline(commands), _control_loop)
+    try:
+        return await asyncio.wait_for(asyncio.wrap_future(future), CONTROL_TIMEOUT)
+    except asyncio.TimeoutError:
+        raise TmuxError(f"tmux command timed out: {commands[0][0]}")
+
+
+def _completed(cmd: List[str], lines: Optional[List[str]] = None, error: Optional[Exception] = None) -> subprocess.CompletedProcess:
+    """A control-mode reply in the shape subprocess.run(text=True) returns."""
+    if error is not None:
+        return subprocess.CompletedProcess(cmd, 1, stdout="", stderr=str(error))
+    return subprocess.CompletedProcess(cmd, 0, stdout="".join(f"{line}\n" for line in lines), stderr="")
+
+
+def run(*args: str, timeout: float = CONTROL_TIMEOUT) -> subprocess.CompletedProcess:
+    """Run one tmux command (check=False semantics).
+
+    Over the control connection when available, else as a subprocess;
+    either way returns a CompletedProcess with text stdout/stderr.
+
+    Example:
+        run("display-message", "-t", "life:chief", "-p", "#{pane_pid}").stdout
+    """
+    cmd = ["tmux", *args]
+    try:
+        replies = _control_pipeline([args])
+    except TmuxError as e:
+        return _completed(cmd, error=e)
+    if replies is not None:
+        return _completed(cmd, replies[0])
+    return subprocess.run(cmd, capture_output=True, text=True, timeout=timeout)
+
+
+async def run_async(*args: str, timeout: float = CONTROL_TIMEOUT) -> subprocess.CompletedProcess:
+    """Async run(): awaits the control connection directly, no worker thread."""
+    cmd = ["tmux", *args]
+    try:
+        replies = await _control_pipeline_async([args])
+    except TmuxError as e:
+        return _completed(cmd, error=e)
+    if replies is not None:
+        return _completed(cmd, replies[0])
+    return await asyncio.to_thread(subprocess.run, cmd, capture_output=True, text=True, timeout=timeout)
+
+
 def send_keys(target: str, *keys: str, check: bool = True) -> subprocess.CompletedProcess:
     """Send raw keys to a tmux target.
 
@@ -64,8 +534,10 @@ def send_keys(target: str, *keys: str, check: bool = True) -> subprocess.Complet
         send_keys("life:chief", "C-c")  # Cancel current command
         send_keys("life:chief", "ls", "C-m")  # List files + Enter
     """
-    cmd = ["tmux", "send-keys", "-t", target] + list(keys)
-    return subprocess.run(cmd, capture_output=True, text=True, check=check, timeout=5)
+    result = run("send-keys", "-t", target, *keys)
+    if check:
+        result.check_returncode()
+    return result
 
 
 def send_text(
@@ -119,8 +591,9 @@ def inject_message(
     """Inject long text via load-buffer pattern.
 
     The most reliable pattern for multi-line content or Claude prompts.
-    Writes message to temp file, loads it into a tmux buffer, pastes it,
-    then sends Enter after a short delay.
+    Loads message into a tmux buffer (set-buffer over the control
+    connection, or load-buffer from a temp file), pastes it, then sends
+    Enter after a short delay.
 
     The delay between paste and Enter is critical: Claude Code's TUI
     (Ink/React-based) needs a render cycle to process pasted text before
@@ -155,36 +628,17 @@ def inject_message(
 
     for attempt in range(1 + retries):
         try:
-            # Create temp file
-            TMP_DIR.mkdir(parents=True, exist_ok=True)
-            msg_id = uuid.uuid4().hex[:8]
-            msg_file = TMP_DIR / f"msg-{msg_id}.txt"
-            msg_file.write_text(message)
-
             # Use a named buffer unique to this injection to prevent
             # race conditions with concurrent injections
-            buffer_name = f"inject-{msg_id}"
+            buffer_name = f"inject-{uuid.uuid4().hex[:8]}"
+            pasted = False
 
             try:
                 with _get_pane_lock(target):
                     # Step 1: Load buffer and paste content into the pane.
                     # -d deletes the named buffer after pasting.
-                    # No -p flag — bracket paste is unnecessary (Claude Code
-                    # doesn't opt into bracket paste mode) and the sequences
-                    # can interfere with TUI input parsing.
-                    cmd = [
-                        "tmux",
-                        "load-buffer", "-b", buffer_name, str(msg_file),
-                        ";",
-                        "paste-buffer", "-b", buffer_name, "-d", "-t", target,
-                    ]
-
-                    subprocess.run(
-                        cmd,
-                        check=True,
-                        capture_output=True,
-                        timeout=5,
-                    )
+                    _paste_message(target, buffer_name, message, cleanup)
+                    pasted = True
 
                     # Step 2: Send Enter after a delay.
                     # The delay lets Claude Code's Ink/React TUI complete a
@@ -198,17 +652,12 @@ def inject_message(
                 return True
 
             finally:
-                if cleanup:
-                    msg_file.unlink(missing_ok=True)
                 # Clean up buffer if it wasn't deleted by -d (e.g., paste failed)
-                try:
-                    subprocess.run(
-                        ["tmux", "delete-buffer", "-b", buffer_name],
-                        capture_output=True,
-                        timeout=2,
-                    )
-                except Exception:
-                    pass
+                if not pasted:
+                    try:
+                        run("delete-buffer", "-b", buffer_name, timeout=2)
+                    except Exception:
+                        pass
 
         except Exception:
             if attempt < retries:
@@ -219,9 +668,47 @@ def inject_message(
     return False
 
 
+def _paste_message(target: str, buffer_name: str, message: str, cleanup: bool = True) -> None:
+    """Load message into a named buffer and paste it into target.
+
+    No -p flag — bracket paste is unnecessary (Claude Code doesn't opt
+    into bracket paste mode) and the sequences can interfere with TUI
+    input parsing. Raises on failure.
+    """
+    replies = _control_pipeline([
+        ("set-buffer", "-b", buffer_name, message),
+        ("paste-buffer", "-b", buffer_name, "-d", "-t", target),
+    ])
+    if replies is not None:
+        return
+
+    # Spawning tmux: pass the text through a temp file, not argv
+    TMP_DIR.mkdir(parents=True, exist_ok=True)
+    msg_file = TMP_DIR / f"msg-{buffer_name}.txt"
+    msg_file.write_text(message)
+    try:
+        subprocess.run(
+            [
+                "tmux",
+                "load-buffer", "-b", buffer_name, str(msg_file),
+                ";",
+                "paste-buffer", "-b", buffer_name, "-d", "-t", target,
+            ],
+            check=True,
+            capture_output=True,
+            timeout=5,
+        )
+    finally:
+        if cleanup:
+            msg_file.unlink(missing_ok=True)
+
+
 async def send_keys_async(target: str, *keys: str, check: bool = True) -> subprocess.CompletedProcess:
-    """Async wrapper for send_keys."""
-    return await asyncio.to_thread(send_keys, target, *keys, check=check)
+    """Async send_keys: awaits the control connection, no worker thread."""
+    result = await run_async("send-keys", "-t", target, *keys)
+    if check:
+        result.check_returncode()
+    return result
 
 
 async def send_text_async(
@@ -229,8 +716,29 @@ async def send_text_async(
     text: str,
     submit: bool = True,
 ) -> bool:
-    """Async wrapper for send_text."""
-    return await asyncio.to_thread(send_text, target, text, submit=submit)
+    """Async send_text: no thread is held during the Enter delay.
+
+    The pane lock is the threading.Lock sync senders use, so it is taken on
+    a worker thread. If we are cancelled while waiting, the lock is released
+    as soon as that thread gets it.
+    """
+    lock = _get_pane_lock(target)
+    acquire = asyncio.ensure_future(asyncio.to_thread(lock.acquire))
+    try:
+        await asyncio.shield(acquire)
+    except asyncio.CancelledError:
+        acquire.add_done_callback(lambda f: None if f.cancelled() else lock.release())
+        raise
+    try:
+        await send_keys_async(target, "-l", text)
+        if submit:
+            await asyncio.sleep(0.3)
+            await send_keys_async(target, "Enter")
+        return True
+    except Exception:
+        return False
+    finally:
+        lock.release()
 
 
 async def inject_message_async(
@@ -262,12 +770,7 @@ def window_exists(window_name: str, session: str = TMUX_SESSION) -> bool:
         True if window exists
     """
     try:
-        result = subprocess.run(
-            ["tmux", "list-windows", "-t", session, "-F", "#{window_name}"],
-            capture_output=True,
-            text=True,
-            timeout=5
-        )
+        result = run("list-windows", "-t", session, "-F", "#{window_name}")
         if result.returncode == 0:
             windows = result.stdout.strip().split('\n')
             return window_name in windows
@@ -305,19 +808,17 @@ def send_escape_to_pane(target: str) -> bool:
         send_escape_to_pane("life:chief")  # Interrupt Chief
     """
     try:
-        result = subprocess.run(
-            ["tmux", "send-keys", "-t", target, "Escape"],
-            capture_output=True,
-            timeout=5
-        )
-        return result.returncode == 0
+        return run("send-keys", "-t", target, "Escape").returncode == 0
     except Exception:
         return False
 
 
 async def send_escape_to_pane_async(target: str) -> bool:
     """Async wrapper for send_escape_to_pane."""
-    return await asyncio.to_thread(send_escape_to_pane, target)
+    try:
+        return (await run_async("send-keys", "-t", target, "Escape")).returncode == 0
+    except Exception:
+        return False
 
 
 def display_message(
@@ -339,11 +840,7 @@ def display_message(
         True if successful
     """
     try:
-        subprocess.run(
-            ["tmux", "display-message", "-t", target, "-d", str(duration), message],
-            capture_output=True,
-            timeout=5
-        )
+        run("display-message", "-t", target, "-d", str(duration), message)
         return True
     except Exception:
         return False
@@ -355,4 +852,150 @@ async def display_message_async(
     duration: int = 5000
 ) -> bool:
     """Async wrapper for display_message."""
-    return await asyncio.to_thread(display_message, target, message, duration)
+    try:
+        await run_async("display-message", "-t", target, "-d", str(duration), message)
+        return True
+    except Exception:
+        return False
+
+
+def capture_pane(target: str, lines: Optional[int] = None) -> Optional[str]:
+    """Capture a pane's text.
+
+    Args:
+        target: tmux pane or window (e.g., "life:chief", "%21")
+        lines: Also include this many lines of scrollback (default: visible only)
+
+    Returns:
+        Pane content, or None on error
+    """
+    args = ["capture-pane", "-t", target, "-p"]
+    if lines is not None:
+        args += ["-S", f"-{lines}"]
+    try:
+        result = run(*args)
+        return result.stdout if result.returncode == 0 else None
+    except Exception:
+        return None
+
+
+async def capture_pane_async(target: str, lines: Optional[int] = None) -> Optional[str]:
+    """Async wrapper for capture_pane."""
+    args = ["capture-pane", "-t", target, "-p"]
+    if lines is not None:
+        args += ["-S", f"-{lines}"]
+    try:
+        result = await run_async(*args)
+        return result.stdout if result.returncode == 0 else None
+    except Exception:
+        return None
+
+
+def capture_pane_title(target: str) -> Optional[str]:
+    """A pane's title (Claude Code shows its current task there), or None on error."""
+    try:
+        result = run("display-message", "-t", target, "-p", "#{pane_title}")
+        return result.stdout.strip() if result.returncode == 0 else None
+    except Exception:
+        return None
+
+
+# =============================================================================
+# WAITING ON PANE CONTENT
+# =============================================================================
+
+PANE_RECHECK_INTERVAL = 1.0  # re-capture this often even without output (dropped events)
+
+
+async def _pane_printed(queue: asyncio.Queue, pane: str, wait: float) -> bool:
+    """True if pane writes output within `wait` seconds; drains the burst."""
+    loop = asyncio.get_running_loop()
+    end = loop.time() + wait
+    while True:
+        remaining = end - loop.time()
+        if remaining <= 0:
+            return False
+        try:
+            event = await asyncio.wait_for(queue.get(), remaining)
+        except asyncio.TimeoutError:
+            return False
+        if event.kind == "exit":
+            return False
+        if event.pane == pane:
+            while not queue.empty():
+                queue.get_nowait()
+            return True
+
+
+async def wait_for_pane_async(
+    target: str,
+    ready: Callable[[str], bool],
+    timeout: float = 30.0,
+    poll_interval: float = 0.5,
+    quiet: float = 0.3,
+    settle: float = 1.0,
+) -> bool:
+    """Wait until ready(pane text) is true. Returns False on timeout.
+
+    With control mode the pane is re-captured when it prints (%output)
+    instead of on a timer, and once ready we wait for `quiet` seconds
+    without output (at most `settle`) so a TUI can finish drawing before
+    input arrives. Without control mode: capture every poll_interval,
+    then sleep `settle`.
+    """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    client = _control if _control is not None and _control.running else await asyncio.to_thread(get_control_client)
+    pane = (await run_async("display-message", "-t", target, "-p", "#{pane_id}")).stdout.strip() if client else ""
+    if not pane:
+        while loop.time() < deadline:
+            await asyncio.sleep(poll_interval)
+            content = await capture_pane_async(target)
+            if content is not None and ready(content):
+                await asyncio.sleep(settle)
+                return True
+        return False
+
+    queue = client.subscribe(kinds=("output", "exit"))
+    try:
+        while True:
+            content = await capture_pane_async(target)
+            if content is not None and ready(content):
+                break
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                return False
+            await _pane_printed(queue, pane, min(remaining, PANE_RECHECK_INTERVAL))
+
+        settled_by = loop.time() + settle
+        while loop.time() < settled_by and await _pane_printed(queue, pane, min(quiet, settled_by - loop.time())):
+            pass
+        return True
+    finally:
+        client.unsubscribe(queue)
+
+
+def wait_for_pane(
+    target: str,
+    ready: Callable[[str], bool],
+    timeout: float = 30.0,
+    poll_interval: float = 0.5,
+    quiet: float = 0.3,
+    settle: float = 1.0,
+) -> bool:
+    """Blocking wait_for_pane_async() (runs on the control client's loop)."""
+    if get_control_client() is not None:
+        future = asyncio.run_coroutine_threadsafe(
+            wait_for_pane_async(target, ready, timeout, poll_interval, quiet, settle), _control_loop
+        )
+        return future.result(timeout + settle + CONTROL_TIMEOUT)
+
+    waited = 0.0
+    while waited < timeout:
+        time.sleep(poll_interval)
+        waited += poll_interval
+        content = capture_pane(target)
+        if content is not None and ready(content):
+            time.sleep(settle)
+            return True
+    return False
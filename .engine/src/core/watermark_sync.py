@@ -0,0 +1,165 @@
+"""Local mirrors of append-only SQLite databases, synced past a ROWID watermark.
+
+Mail.app's Envelope Index and Messages' chat.db only ever grow their
+message ROWIDs, so a mirror in our own database can remember the highest
+ROWID it has folded in (the watermark) and copy rows past it whenever the
+source file (or its WAL) changes on disk.
+
+WatermarkMirror handles the shared parts: schema setup and rebuild when the
+source path moves, the mtime/size stamp, the stored watermark, and
+ensure_fresh() with its background first build. Subclasses define the
+schema and sync().
+
+A sync only counts once it has finished: the source stamp is recorded
+after sync() returns, so a failed sync is retried on the next call and
+callers keep falling back to the source instead of reading a partial
+mirror.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import sqlite3
+import threading
+from abc import ABC, abstractmethod
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Type, TypeVar
+
+from .database import get_pool
+
+logger = logging.getLogger(__name__)
+
+M = TypeVar("M", bound="WatermarkMirror")
+
+
+class WatermarkMirror(ABC):
+    """Base for a mirror table set kept in sync with one source database.
+
+    Subclasses set:
+        SCHEMA_SQL     - CREATE statements, including STATE_TABLE
+        STATE_TABLE    - single-row (id = 1) table with source, watermark, synced_at
+        DATA_TABLES    - tables cleared when the source path changes
+        LABEL          - human name for logs and the backfill thread
+    and implement sync(); a subclass without it can't be instantiated.
+    """
+
+    SCHEMA_SQL = ""
+    STATE_TABLE = ""
+    DATA_TABLES: Tuple[str, ...] = ()
+    LABEL = "mirror"
+
+    _instances: Dict[Tuple[type, str, str], "WatermarkMirror"] = {}
+    _instances_lock = threading.Lock()
+
+    def __init__(self, source_path: str | Path, db_path: Optional[Path] = None):
+        self.source_path = str(source_path)
+        self._pool = get_pool(db_path)
+        self._lock = threading.Lock()
+        self._schema_ready = False
+        self._source_stamp: Optional[Tuple[int, ...]] = None
+        self._backfill: Optional[threading.Thread] = None
+
+    @classmethod
+    def shared(cls: Type[M], source_path: str | Path, db_path: Optional[Path] = None) -> M:
+        """Process-wide instance for a source / system DB pair."""
+        key = (cls, str(source_path), str(get_pool(db_path).db_path))
+        with cls._instances_lock:
+            mirror = cls._instances.get(key)
+            if mirror is None:
+                mirror = cls(source_path, db_path)
+                cls._instances[key] = mirror
+            return mirror
+
+    # =========================================================================
+    # STATE
+    # =========================================================================
+
+    def _ensure_schema(self) -> None:
+        if self._schema_ready:
+            return
+        with self._pool.writer() as conn:
+            conn.executescript(self.SCHEMA_SQL)
+            row = conn.execute(f"SELECT source FROM {self.STATE_TABLE} WHERE id = 1").fetchone()
+            if row is not None and row["source"] != self.source_path:
+                # The source moved (e.g. a new Mail V* directory) - ROWIDs are not comparable
+                logger.info(f"{self.LABEL}: source path changed, rebuilding")
+                for table in (*self.DATA_TABLES, self.STATE_TABLE):
+                    conn.execute(f"DELETE FROM {table}")
+        self._schema_ready = True
+
+    def _stamp(self) -> Tuple[int, ...]:
+        """mtime/size of the source and its WAL; changes on every write to it."""
+        stamp: List[int] = []
+        for suffix in ("", "-wal"):
+            try:
+                st = os.stat(self.source_path + suffix)
+                stamp.extend((st.st_mtime_ns, st.st_size))
+            except OSError:
+                stamp.extend((0, 0))
+        return tuple(stamp)
+
+    @property
+    def watermark(self) -> int:
+        self._ensure_schema()
+        row = self._pool.reader().execute(
+            f"SELECT watermark FROM {self.STATE_TABLE} WHERE id = 1"
+        ).fetchone()
+        return int(row["watermark"]) if row else 0
+
+    def _set_watermark(self, cur: sqlite3.Cursor, watermark: int) -> None:
+        """Record progress inside the transaction that wrote the rows."""
+        cur.execute(
+            f"""
+            INSERT INTO {self.STATE_TABLE} (id, source, watermark, synced_at)
+            VALUES (1, ?, ?, ?)
+            ON CONFLICT(id) DO UPDATE SET
+                source = excluded.source,
+                watermark = excluded.watermark,
+                synced_at = excluded.synced_at
+            """,
+            (self.source_path, watermark, datetime.now().isoformat()),
+        )
+
+    # =========================================================================
+    # SYNC
+    # =========================================================================
+
+    @abstractmethod
+    def sync(self) -> int:
+        """Copy source rows past the watermark into the mirror. Returns rows added."""
+
+    def ensure_fresh(self) -> bool:
+        """Sync if the source changed since the last successful sync.
+
+        The first build over a large source takes seconds, so an empty
+        mirror is backfilled on a background thread; returns False until it
+        is usable (callers fall back to querying the source directly).
+        """
+        if self._backfill is not None:
+            if self._backfill.is_alive():
+                return False
+            self._backfill = None
+        stamp = self._stamp()
+        if stamp == self._source_stamp:
+            return True
+        if self.watermark == 0:
+            self._backfill = threading.Thread(
+                target=self._backfill_from, args=(stamp,), name=f"{self.LABEL}-backfill", daemon=True
+            )
+            self._backfill.start()
+            return False
+        self._sync_from(stamp)
+        return True
+
+    def _sync_from(self, stamp: Tuple[int, ...]) -> None:
+        # Stamp taken before the sync: writes that land during it trigger another
+        self.sync()
+        self._source_stamp = stamp
+
+    def _backfill_from(self, stamp: Tuple[int, ...]) -> None:
+        try:
+            self._sync_from(stamp)
+        except Exception as e:
+            logger.warning(f"{self.LABEL}: backfill failed, will retry: {e}")
@@ -258,7 +258,7 @@ def _sessions(days: int) -> Dict[str, Any]:
 
         # Active sessions right now
         active = conn.execute(
-            "SELECT COUNT(*) as c FROM sessions WHERE ended_at IS NULL"
+            "SELECT COUNT(*) as c FROM sessions WHERE ended_at IS NULL AND role IS NOT 'standby'"
         ).fetchone()["c"]
 
         # Work rhythm (hour x day heatmap)
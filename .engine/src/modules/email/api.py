@@ -16,6 +16,8 @@ from core.events import event_bus
 from core.storage import SystemStorage
 from core.config import settings
 
+from .rules import bump_rules_version
+
 
 def _ensure_utc_suffix(ts: str | None) -> str | None:
     """Ensure ISO timestamp has timezone suffix so JS parses as UTC."""
@@ -1203,6 +1205,7 @@ async def create_classifier_rule(data: CreateRuleRequest):
                     now, now,
                 ),
             )
+            bump_rules_version(conn)
             conn.commit()
 
         return {
@@ -1263,6 +1266,7 @@ async def update_classifier_rule(rule_id: str, data: UpdateRuleRequest):
                 f"UPDATE email_sender_rules SET {', '.join(updates)} WHERE id = ?",
                 params,
             )
+            bump_rules_version(conn)
             conn.commit()
 
             if result.rowcount == 0:
@@ -1281,6 +1285,7 @@ async def delete_classifier_rule(rule_id: str):
             result = conn.execute(
                 "DELETE FROM email_sender_rules WHERE id = ?", (rule_id,)
             )
+            bump_rules_version(conn)
             conn.commit()
 
             if result.rowcount == 0:
@@ -1362,6 +1367,7 @@ async def reclassify_email(classification_id: str, data: ReclassifyRequest):
                        VALUES (?, 'sender', ?, 'always', ?, 'correction', ?, ?)""",
                     (rule_id, sender_email.lower(), data.category, now, now),
                 )
+                bump_rules_version(conn)
                 rule_created = True
 
             conn.execute(
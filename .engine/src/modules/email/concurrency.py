@@ -0,0 +1,103 @@
+"""Adaptive concurrency limit for the classification workers.
+
+The pipeline runs MAX_WORKERS worker tasks, but only `limit` of them may
+run an agent at once. The limit moves with what the agents report:
+
+- a failed run: one fewer straight away (at most once per window, since a
+  rate-limit burst fails several runs together), and the old limit becomes
+  a ceiling that later increases stop below
+- more than MAX_ERROR_RATE of a window failed: halve (the API is down)
+- mean latency above LATENCY_BACKOFF x the best window seen: one fewer
+  (agents are queueing behind each other or being throttled)
+- otherwise: one more, up to the ceiling; after PROBE_AFTER healthy
+  windows at the ceiling, try one above it
+
+so a post-vacation backlog ramps up to what the API will take and stays
+there, while a flaky API backs the pipeline off to a single agent.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import List, Optional
+
+
+class AdaptiveLimiter:
+    """Async gate whose capacity follows observed agent latency and errors."""
+
+    WINDOW = 6  # Agent runs between adjustments
+    MAX_ERROR_RATE = 0.5
+    LATENCY_BACKOFF = 1.5
+    PROBE_AFTER = 5  # Healthy windows at the ceiling before raising it
+
+    def __init__(self, minimum: int, maximum: int, initial: Optional[int] = None):
+        self.minimum = minimum
+        self.maximum = maximum
+        self.limit = max(minimum, min(maximum, initial if initial is not None else minimum))
+        self.ceiling = maximum
+        self.active = 0
+        self._baseline_ms: Optional[float] = None
+        self._latencies: List[float] = []  # Successful runs in the current window
+        self._runs = 0
+        self._errors = 0
+        self._backed_off = False
+        self._healthy_at_ceiling = 0
+        self._cond = asyncio.Condition()
+
+    async def acquire(self) -> None:
+        async with self._cond:
+            await self._cond.wait_for(lambda: self.active < self.limit)
+            self.active += 1
+
+    async def release(self) -> None:
+        async with self._cond:
+            self.active -= 1
+            self._cond.notify_all()
+
+    async def record(self, elapsed_ms: float, errored: bool) -> None:
+        """Feed one agent run; may move the limit."""
+        self._runs += 1
+        if errored:
+            self._errors += 1
+            if not self._backed_off:
+                self._backed_off = True
+                self.ceiling = max(self.minimum, self.limit - 1)
+                self._healthy_at_ceiling = 0
+                await self._set_limit(self.ceiling)
+        else:
+            self._latencies.append(elapsed_ms)
+        if self._runs < self.WINDOW:
+            return
+
+        mean_ms = sum(self._latencies) / len(self._latencies) if self._latencies else 0.0
+        errors = self._errors
+        error_rate = errors / self._runs
+        self._latencies.clear()
+        self._runs = self._errors = 0
+        self._backed_off = False
+
+        limit = self.limit
+        if error_rate > self.MAX_ERROR_RATE:
+            limit = self.limit // 2
+        elif errors:
+            pass  # Already backed off when the run failed
+        elif self._baseline_ms is not None and mean_ms > self._baseline_ms * self.LATENCY_BACKOFF:
+            limit = self.limit - 1
+        elif self.limit < self.ceiling:
+            limit = self.limit + 1
+        else:
+            self._healthy_at_ceiling += 1
+            if self._healthy_at_ceiling >= self.PROBE_AFTER:
+                self._healthy_at_ceiling = 0
+                self.ceiling = min(self.maximum, self.ceiling + 1)
+                limit = self.ceiling
+        if not errors:
+            self._baseline_ms = mean_ms if self._baseline_ms is None else min(self._baseline_ms, mean_ms)
+        await self._set_limit(limit)
+
+    async def _set_limit(self, limit: int) -> None:
+        limit = max(self.minimum, min(self.maximum, limit))
+        if limit != self.limit:
+            async with self._cond:
+                self.limit = limit
+                self._cond.notify_all()
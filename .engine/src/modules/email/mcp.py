@@ -8,6 +8,7 @@ from fastmcp import FastMCP
 
 from core.mcp_helpers import get_db, get_services, notify_backend_event
 from modules.accounts.access import get_access_service
+from .rules import bump_rules_version
 from .service import EmailService
 
 mcp = FastMCP("life-email")
@@ -35,6 +36,7 @@ def email(
     display_name: Optional[str] = None,
     suggested_actions: Optional[str] = None,
     extracted_content: Optional[str] = None,
+    classifications: Optional[List[Dict[str, Any]]] = None,
     # Rules operations
     match_type: Optional[str] = None,
     match_value: Optional[str] = None,
@@ -56,7 +58,7 @@ def email(
 
     Args:
         operation: Operation - 'send', 'draft', 'accounts', 'search', 'read',
-                   'classify', 'triage', 'handle', 'classification',
+                   'classify', 'classify_batch', 'triage', 'handle', 'classification',
                    'rules', 'rule_create', 'rule_delete',
                    'reclassify', 'feedback', 'digests'
 
@@ -83,6 +85,9 @@ def email(
         display_name: Human-friendly sender identity (e.g. "Modal (via Ashby)", "GitHub", "Alex Chen")
         suggested_actions: Newline-separated action suggestions for Chief (for classify operation)
         extracted_content: Structured content extraction from newsletters/digests
+        classifications: List of classify payloads for classify_batch, each with
+                         message_id, account, category, summary and optionally
+                         reasoning, display_name, suggested_actions, extracted_content
 
         # Rules operations (rule_create, rule_delete, rules)
         match_type: 'domain' or 'sender' (required for rule_create)
@@ -128,6 +133,12 @@ def email(
               category="action_needed", reasoning="Known recruiter",
               summary="Interview follow-up", display_name="Alex Chen",
               extracted_content="**AI launches new model** — Summary here...")
+        email("classify_batch", classifications=[
+            {"message_id": "abc1", "account": "user@gmail.com", "category": "noise",
+             "summary": "Weekly sale", "display_name": "Acme Store"},
+            {"message_id": "abc2", "account": "user@gmail.com", "category": "fyi",
+             "summary": "Release notes for v2.3", "display_name": "GitHub"},
+        ])
 
         # Triage operations (for Chief and Dashboard)
         email("triage", limit=20)  # Get unhandled classifications
@@ -179,6 +190,8 @@ def email(
                 suggested_actions=suggested_actions,
                 extracted_content=extracted_content,
             )
+        elif operation == "classify_batch":
+            return _email_classify_batch(classifications)
         elif operation == "triage":
             return _email_triage(category=category, limit=limit)
         elif operation == "handle":
@@ -208,7 +221,7 @@ def email(
             return {
                 "success": False,
                 "error": f"Unknown operation: {operation}. Valid: send, draft, accounts, search, read, "
-                         "classify, triage, handle, classification, rules, rule_create, rule_delete, "
+                         "classify, classify_batch, triage, handle, classification, rules, rule_create, rule_delete, "
                          "reclassify, feedback, digests"
             }
 
@@ -609,6 +622,81 @@ def _email_classify(
         return {"success": False, "error": f"Failed to store classification: {str(e)}"}
 
 
+def _email_classify_batch(classifications: Optional[List[Dict[str, Any]]]) -> Dict[str, Any]:
+    """Store several classifications from one batch agent in a single transaction.
+
+    Each item takes the same fields as classify. Invalid items are reported
+    and skipped; the rest are written together. Noise is auto-marked as
+    handled, and the Dashboard gets one event for the whole batch.
+    """
+    import uuid
+    from datetime import datetime, timezone
+
+    if not classifications:
+        return {"success": False, "error": "classifications (a list of classify payloads) is required for classify_batch"}
+
+    valid_categories = {"action_needed", "heads_up", "fyi", "noise"}
+    now = datetime.now(timezone.utc).isoformat()
+    rows = []
+    errors = []
+    for i, item in enumerate(classifications):
+        if not isinstance(item, dict):
+            errors.append({"index": i, "error": "expected an object"})
+            continue
+        message_id, account, category = item.get("message_id"), item.get("account"), item.get("category")
+        if not message_id or not account or not category:
+            errors.append({"index": i, "message_id": message_id, "error": "message_id, account, and category are required"})
+            continue
+        if category not in valid_categories:
+            errors.append({"index": i, "message_id": message_id, "error": f"Invalid category '{category}'"})
+            continue
+        rows.append((
+            str(uuid.uuid4()), str(message_id), account, category,
+            item.get("summary"), item.get("reasoning"), item.get("display_name"),
+            item.get("suggested_actions"), item.get("extracted_content"),
+            1 if category == "noise" else 0, now,
+        ))
+
+    try:
+        with get_db() as conn:
+            conn.executemany(
+                """INSERT OR REPLACE INTO email_classifications
+                   (id, email_message_id, account_id, category, summary, briefing,
+                    display_name, suggested_actions, extracted_content, handled, classified_at)
+                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+                rows,
+            )
+            conn.executemany(
+                "UPDATE email_metadata SET classified = 1, last_updated_at = ? WHERE email_message_id = ? AND account_id = ?",
+                [(now, row[1], row[2]) for row in rows],
+            )
+            conn.commit()
+    except Exception as e:
+        return {"success": False, "error": f"Failed to store classifications: {str(e)}"}
+
+    # Mark noise as read in Apple Mail (auto-handled)
+    noise = [row for row in rows if row[9]]
+    if noise:
+        try:
+            svc = EmailService(get_services().storage)
+            for row in noise:
+                svc.mark_as_read(row[1], "INBOX", row[2])
+        except Exception:
+            pass  # Non-critical
+
+    surfaced = [{"message_id": row[1], "category": row[3]} for row in rows if not row[9]]
+    if surfaced:
+        notify_backend_event("email.classified", {"batch": surfaced})
+
+    return {
+        "success": bool(rows),
+        "stored": len(rows),
+        "classifications": [{"message_id": row[1], "classification_id": row[0], "category": row[3]} for row in rows],
+        "errors": errors,
+        "message": f"Stored {len(rows)} of {len(classifications)} classifications",
+    }
+
+
 def _email_triage(
     category: Optional[str] = None,
     limit: int = 50,
@@ -876,6 +964,7 @@ def _email_rule_create(
                     now, now,
                 ),
             )
+            bump_rules_version(conn)
             conn.commit()
 
         return {
@@ -898,6 +987,7 @@ def _email_rule_delete(rule_id: Optional[str]) -> Dict[str, Any]:
             result = conn.execute(
                 "DELETE FROM email_sender_rules WHERE id = ?", (rule_id,)
             )
+            bump_rules_version(conn)
             conn.commit()
 
             if result.rowcount == 0:
@@ -977,6 +1067,7 @@ def _email_reclassify(
                        VALUES (?, 'sender', ?, 'always', ?, 'correction', ?, ?)""",
                     (new_rule_id, sender_email.lower(), category, now, now),
                 )
+                bump_rules_version(conn)
                 rule_created = True
 
             # Log feedback
@@ -17,12 +17,20 @@ import asyncio
 import logging
 import os
 import re
+import threading
 import time
 import uuid
+from collections import Counter
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
+from core.perf import record_worker_latency
+
+from .concurrency import AdaptiveLimiter
+from .html_text import html_to_text
+from .rules import SenderRuleIndex, get_rules_version
+
 logger = logging.getLogger(__name__)
 
 
@@ -42,26 +50,88 @@ _FALLBACK_PROMPT = """You are an email classifier for Claude OS. Classify this e
 Call email("classify", message_id="{message_id}", account="{account_id}", category="...", summary="...", display_name="...", reasoning="...")
 """
 
+# Prompt for one agent classifying a batch of low-signal emails
+_BATCH_PROMPT = """You are an email classifier for Claude OS. The {count} emails below look like low-signal bulk mail (newsletters, notifications, promotions). Classify every one of them.
+
+Categories: action_needed (the user must do something), heads_up (worth knowing soon), fyi (informational), noise (safe to ignore).
+
+{emails}
+
+Write all classifications with ONE call:
+email("classify_batch", classifications=[{{"message_id": "...", "account": "...", "category": "...", "summary": "...", "display_name": "...", "reasoning": "..."}}, ...])
+
+If an email is not bulk mail after all and needs investigation, leave it out; it will be classified on its own.
+"""
+
 # Regex to detect thread subjects (Re:/RE:/Fwd:/FW:)
 _THREAD_PREFIX_RE = re.compile(r'^(?:Re|RE|Fwd|FW|Fw|re):\s*', re.IGNORECASE)
 
+# Low-signal sender features. The Envelope Index summaries discovery reads
+# carry no List-Unsubscribe/Precedence headers, so the address stands in.
+# Only clearly automated local parts: hello@/info@/news@ are also what
+# people and small businesses write from.
+_BULK_LOCAL_PART_RE = re.compile(
+    r'^(?:no-?reply|do-?not-?reply|newsletters?|digest|marketing|'
+    r'promo(?:tions)?|notifications?|mailer(?:-daemon)?|bounces?)\b',
+    re.IGNORECASE,
+)
+_BULK_DOMAINS = frozenset({
+    "substack.com", "beehiiv.com", "mailchimpapp.com", "mcsv.net", "mcdlv.net",
+    "sendgrid.net", "mailgun.org", "convertkit.com", "ck.page", "medium.com",
+    "klaviyomail.com", "hubspotemail.net", "customeriomail.com",
+})
+
 
 class EmailPipeline:
     """Background email classification pipeline.
 
-    Polls for unclassified emails, pre-fetches sender history,
-    matches sender rules, and runs each through an agentic classifier
-    that investigates and writes classifications via MCP tool call.
+    Polls Apple Mail for new emails and queues them (unclassified
+    email_metadata rows, ordered by classify_priority). Always-rule noise is
+    classified at discovery without an agent. Workers take the next queued
+    email as soon as they finish one, pre-fetch sender history, match sender
+    rules, and run an agentic classifier that writes its classification via
+    MCP tool call. How many agents run at once adapts to their latency and
+    error rate.
     """
 
-    MAX_WORKERS = 3  # Concurrent classification agents
+    MIN_WORKERS = 1
+    MAX_WORKERS = 6  # Worker tasks; AdaptiveLimiter decides how many run agents
+    INITIAL_WORKERS = 3
+    MAX_ATTEMPTS = 3  # Per email per process, in case a failure leaves it queued
+    DISCOVERY_PAGE_SIZE = 200  # Messages per get_messages_since call
+    DISCOVERY_MAX_PER_CYCLE = 5000  # Larger bursts finish on the next poll
+
+    PRIORITY_VIP = 0  # Pinned contact
+    PRIORITY_THREAD = 1  # Re:/Fwd: subject
+    PRIORITY_NORMAL = 2
+    PRIORITY_BULK = 3  # Low-signal; classified BATCH_SIZE at a time
 
-    def __init__(self, db_path: str, poll_interval: int = 60):
+    BATCH_SIZE = 10
+    BATCH_BODY_CHARS = 600
+    NEWSLETTER_MIN_EMAILS = 3  # Past fyi/noise emails before a sender counts as a newsletter
+
+    def __init__(self, db_path: str, poll_interval: int = 60, batch_size: int = BATCH_SIZE):
         self._db_path = db_path
         self._poll_interval = poll_interval
+        self._batch_size = batch_size  # 1 turns batch classification off
         self._running = False
         self._task: Optional[asyncio.Task] = None
-        self._semaphore = asyncio.Semaphore(self.MAX_WORKERS)
+
+        # Classification workers
+        self._limiter = AdaptiveLimiter(self.MIN_WORKERS, self.MAX_WORKERS, self.INITIAL_WORKERS)
+        self._queue_ready = asyncio.Event()
+        self._in_flight: set = set()  # (msg_id, acct_id) being classified
+        self._attempts: Counter = Counter()  # Claims so far, for emails still retryable
+        self._exhausted: set = set()  # Claimed MAX_ATTEMPTS times and still unclassified
+        self._claim_lock = threading.Lock()  # Guards the three above; claims run on worker threads
+
+        self._service = None  # EmailService, created on first use
+
+        # Sender rules: index rebuilt when the rules version moves; hit
+        # counts batched in memory and written once per poll
+        self._rule_index: Optional[SenderRuleIndex] = None
+        self._rule_hits: Counter = Counter()
+        self._rule_hits_lock = threading.Lock()
 
         # Prompt cache
         self._prompt_cache: Optional[str] = None
@@ -113,50 +183,45 @@ class EmailPipeline:
     def _match_rules(self, sender: str) -> List[Dict[str, Any]]:
         """Find all enabled sender rules matching this sender.
 
-        Returns rules sorted by specificity: sender > domain,
+        Returns rules sorted by specificity: sender > domain (a domain
+        rule also matches its subdomains, most specific domain first),
         then by rule type priority: always > never > suggest.
         """
         sender_email = self._extract_sender_email(sender).lower()
-        sender_domain = self._extract_sender_domain(sender_email)
-
-        conn = self._get_conn()
-        try:
-            rows = conn.execute(
-                """SELECT id, match_type, match_value, rule_type, category,
-                          instructions, extract_content
-                   FROM email_sender_rules
-                   WHERE enabled = 1
-                   ORDER BY
-                       CASE match_type WHEN 'sender' THEN 0 ELSE 1 END,
-                       CASE rule_type WHEN 'always' THEN 0 WHEN 'never' THEN 1 ELSE 2 END
-                """,
-            ).fetchall()
-
-            matched = []
-            for row in rows:
-                match_type = row["match_type"]
-                match_value = row["match_value"].lower()
-
-                if match_type == "sender" and sender_email == match_value:
-                    matched.append(dict(row))
-                elif match_type == "domain" and sender_domain == match_value:
-                    matched.append(dict(row))
+        return self._get_rule_index().match(sender_email)
 
-            return matched
-        finally:
-            conn.close()
+    def _get_rule_index(self) -> SenderRuleIndex:
+        """Current sender-rule index, rebuilt only if the rules changed."""
+        with self._get_conn() as conn:
+            version = get_rules_version(conn)
+            if self._rule_index is None or self._rule_index.version != version:
+                self._rule_index = SenderRuleIndex.load(conn)
+                logger.debug(f"Loaded {self._rule_index.size} sender rules (version {version})")
+            return self._rule_index
 
     def _increment_rule_applied(self, rule_id: str) -> None:
-        """Increment the times_applied counter for a rule."""
-        conn = self._get_conn()
+        """Count a rule application; written by _flush_rule_hits."""
+        with self._rule_hits_lock:
+            self._rule_hits[rule_id] += 1
+
+    def _flush_rule_hits(self) -> None:
+        """Add the batched rule hit counts to times_applied."""
+        with self._rule_hits_lock:
+            hits, self._rule_hits = self._rule_hits, Counter()
+        if not hits:
+            return
+        now = datetime.now(timezone.utc).isoformat()
         try:
-            conn.execute(
-                "UPDATE email_sender_rules SET times_applied = times_applied + 1, updated_at = ? WHERE id = ?",
-                (datetime.now(timezone.utc).isoformat(), rule_id),
-            )
-            conn.commit()
-        finally:
-            conn.close()
+            with self._get_conn() as conn:
+                conn.executemany(
+                    "UPDATE email_sender_rules SET times_applied = times_applied + ?, updated_at = ? WHERE id = ?",
+                    [(count, now, rule_id) for rule_id, count in hits.items()],
+                )
+                conn.commit()
+        except Exception as e:
+            logger.warning(f"Failed to record sender rule hits: {e}")
+            with self._rule_hits_lock:
+                self._rule_hits.update(hits)
 
     def _build_rules_section(self, rules: List[Dict[str, Any]]) -> str:
         """Build the rules section to inject into the prompt."""
@@ -204,6 +269,13 @@ class EmailPipeline:
 
         return "\n".join(lines)
 
+    def _auto_rule(self, matched_rules: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """The always-rule that settles an email without an agent, if any."""
+        always_rules = [r for r in matched_rules if r["rule_type"] == "always"]
+        if always_rules and not always_rules[0].get("instructions") and not always_rules[0].get("extract_content"):
+            return always_rules[0]
+        return None
+
     def _auto_classify(
         self, msg_id: str, acct_id: str, category: str, rule_id: str,
         sender: str, subject: str, snippet: str, received_at: str
@@ -223,8 +295,7 @@ class EmailPipeline:
             domain = self._extract_sender_domain(self._extract_sender_email(sender))
             display_name = domain.split(".")[0].capitalize() if domain else "Unknown"
 
-        conn = self._get_conn()
-        try:
+        with self._get_conn() as conn:
             conn.execute(
                 """INSERT OR REPLACE INTO email_classifications
                    (id, email_message_id, account_id, category, summary,
@@ -248,15 +319,10 @@ class EmailPipeline:
             )
             conn.commit()
             logger.info(f"Auto-classified {msg_id} as {category} (rule {rule_id})")
-        finally:
-            conn.close()
 
         # Mark as read in Apple Mail (noise is auto-handled, no need to see it)
         try:
-            from .service import EmailService
-            from core.storage import SystemStorage
-            storage = SystemStorage(self._db_path)
-            svc = EmailService(storage)
+            svc = self._get_service()
             svc.mark_as_read(msg_id, "INBOX", acct_id)
         except Exception:
             pass  # Non-critical
@@ -277,21 +343,40 @@ class EmailPipeline:
         except Exception as e:
             logger.error(f"Pipeline initialization failed: {e}")
 
-        # Phase 2: Normal operation — discover new emails, classify them
+        # Phase 2: Normal operation — workers drain the queue continuously,
+        # this loop discovers new emails and wakes them
+        workers = [
+            asyncio.create_task(self._worker(), name=f"email_classifier_{i}")
+            for i in range(self.MAX_WORKERS)
+        ]
+        try:
+            await self._poll(stop_event)
+        finally:
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+            self._flush_rule_hits()
+
+        logger.info("Email classification pipeline stopped")
+
+    async def _poll(self, stop_event: Optional[asyncio.Event]) -> None:
+        """Discover new emails every poll_interval and wake idle workers."""
         while self._running:
             if stop_event and stop_event.is_set():
                 break
 
             # Discover new emails (INSERT OR IGNORE — only new IDs get classified=0)
+            start = time.perf_counter()
+            errored = False
             try:
                 await self._discover_new_emails()
             except Exception as e:
+                errored = True
                 logger.error(f"Pipeline discovery failed: {e}")
-
-            try:
-                await self._classify_pending()
-            except Exception as e:
-                logger.error(f"Pipeline classification pass failed: {e}")
+            finally:
+                record_worker_latency("email_pipeline.discovery", (time.perf_counter() - start) * 1000, errored)
+            self._queue_ready.set()
+            self._flush_rule_hits()
 
             # Wait for next poll
             try:
@@ -303,26 +388,34 @@ class EmailPipeline:
             except asyncio.TimeoutError:
                 pass
 
-        logger.info("Email classification pipeline stopped")
-
     def stop(self):
         """Signal the pipeline to stop."""
         self._running = False
 
+    def _get_service(self, reload_accounts: bool = False):
+        """Shared EmailService, so the Apple Mail adapter keeps its connection and caches.
+
+        reload_accounts picks up accounts added/disabled since the last call.
+        """
+        from .service import EmailService
+        from core.storage import SystemStorage
+
+        if self._service is None:
+            self._service = EmailService(SystemStorage(self._db_path))
+        elif reload_accounts:
+            self._service.reload_accounts()
+        return self._service
+
     def _get_conn(self):
-        """Get a database connection."""
-        import sqlite3
-        conn = sqlite3.connect(str(self._db_path))
-        conn.row_factory = sqlite3.Row
-        conn.execute("PRAGMA busy_timeout=5000;")
-        return conn
+        """Check out a pooled database connection (use as a context manager)."""
+        from core.database import get_pool
+        return get_pool(Path(self._db_path)).connection()
 
     def _ensure_initialized_sync(self):
         """Sync: mark existing inbox as seen. Runs in thread to avoid
         blocking the event loop with Apple Mail AppleScript calls.
         """
-        conn = self._get_conn()
-        try:
+        with self._get_conn() as conn:
             # Check if we've already initialized
             row = conn.execute(
                 "SELECT 1 FROM _migrations WHERE name = 'email_pipeline_initialized'"
@@ -332,11 +425,7 @@ class EmailPipeline:
 
             logger.info("Pipeline initial setup: marking all current inbox emails as seen...")
 
-            from .service import EmailService
-            from core.storage import SystemStorage
-
-            storage = SystemStorage(self._db_path)
-            svc = EmailService(storage)
+            svc = self._get_service()
 
             now = datetime.now(timezone.utc).isoformat()
             accounts = svc.get_accounts_with_capabilities()
@@ -375,8 +464,6 @@ class EmailPipeline:
                 f"Pipeline initialized: {total_marked} inbox emails marked as seen. "
                 f"Only new emails from this point forward will be classified."
             )
-        finally:
-            conn.close()
 
     async def _ensure_initialized(self):
         """Phase 1: Initial setup. Runs in thread to avoid blocking event loop."""
@@ -384,63 +471,167 @@ class EmailPipeline:
 
     def _discover_new_emails_sync(self):
         """Sync: discover new emails via Apple Mail. Runs in thread to avoid
-        blocking the event loop with AppleScript calls every poll cycle.
+        blocking the event loop every poll cycle.
+
+        Each account keeps a (date_received, rowid) high-water mark in
+        email_discovery_cursor. Only messages past it are fetched, a page at
+        a time, so bursts larger than one page are not missed. New rows and
+        cursor moves for the whole cycle commit in one transaction.
+
+        New rows get their queue priority here. Emails settled by an
+        always-rule are classified here rather than left to the workers.
         """
-        from .service import EmailService
-        from core.storage import SystemStorage
+        svc = self._get_service(reload_accounts=True)
+        now = datetime.now(timezone.utc).isoformat()
 
-        storage = SystemStorage(self._db_path)
-        svc = EmailService(storage)
+        with self._get_conn() as conn:
+            cursors = {
+                row["account_id"]: (row["since_ts"], row["since_rowid"])
+                for row in conn.execute(
+                    "SELECT account_id, since_ts, since_rowid FROM email_discovery_cursor WHERE mailbox = 'INBOX'"
+                )
+            }
+
+        # message id -> (account id, message). First account wins, which
+        # deduplicates aliases of one mailbox (e.g. Exchange + IMAP)
+        candidates: Dict[str, Tuple[str, Any]] = {}
+        moved: List[Tuple[str, int, int]] = []
+
+        for acct in svc.get_accounts_with_capabilities():
+            if not acct.get("can_read"):
+                continue
+            acct_id = acct["id"]
+
+            cursor = cursors.get(acct_id)
+            if cursor is None:
+                # First poll for this account: start at its newest message and
+                # pick up the latest few the old way
+                latest = svc.get_latest_cursor("INBOX", acct_id)
+                if latest is None:
+                    continue
+                messages = svc.get_messages("INBOX", acct_id, limit=50, unread_only=False)
+                for msg in messages:
+                    candidates.setdefault(msg.id, (acct_id, msg))
+                moved.append((acct_id, *latest))
+                continue
+
+            since_ts, since_rowid = cursor
+            fetched = 0
+            while fetched < self.DISCOVERY_MAX_PER_CYCLE:
+                messages, since_ts, since_rowid = svc.get_messages_since(
+                    "INBOX", acct_id, since_ts, since_rowid, limit=self.DISCOVERY_PAGE_SIZE
+                )
+                for msg in messages:
+                    candidates.setdefault(msg.id, (acct_id, msg))
+                fetched += len(messages)
+                if len(messages) < self.DISCOVERY_PAGE_SIZE:
+                    break
+            if (since_ts, since_rowid) != cursor:
+                moved.append((acct_id, since_ts, since_rowid))
 
-        conn = self._get_conn()
-        try:
-            now = datetime.now(timezone.utc).isoformat()
-            accounts = svc.get_accounts_with_capabilities()
+        if not candidates and not moved:
+            return
 
-            discovered = 0
-            # Track message IDs we've already seen this cycle to deduplicate
-            # across accounts (e.g. Exchange + IMAP alias for same mailbox)
-            seen_msg_ids: set = set()
+        with self._get_conn() as conn:
+            # Skip messages already tracked under any account
+            ids = list(candidates)
+            existing: set = set()
+            for i in range(0, len(ids), 500):
+                chunk = ids[i:i + 500]
+                placeholders = ", ".join("?" * len(chunk))
+                existing.update(
+                    row[0] for row in conn.execute(
+                        f"SELECT email_message_id FROM email_metadata WHERE email_message_id IN ({placeholders})",
+                        chunk,
+                    )
+                )
 
-            for acct in accounts:
-                if not acct.get("can_read"):
-                    continue
+            new = [(msg_id, acct_id, msg) for msg_id, (acct_id, msg) in candidates.items() if msg_id not in existing]
+            vips = self._vip_senders(conn) if new else set()
+            newsletters = self._newsletter_senders(conn) if new else set()
+
+            before = conn.total_changes
+            conn.executemany(
+                """INSERT OR IGNORE INTO email_metadata
+                   (email_message_id, account_id, first_seen_at, last_updated_at,
+                    received_at, classify_priority)
+                   VALUES (?, ?, ?, ?, ?, ?)""",
+                [
+                    (msg_id, acct_id, now, now, msg.date_received, self._queue_priority(msg, vips, newsletters))
+                    for msg_id, acct_id, msg in new
+                ],
+            )
+            discovered = conn.total_changes - before
+            conn.executemany(
+                """INSERT INTO email_discovery_cursor (account_id, mailbox, since_ts, since_rowid, updated_at)
+                   VALUES (?, 'INBOX', ?, ?, ?)
+                   ON CONFLICT(account_id, mailbox) DO UPDATE SET
+                       since_ts = excluded.since_ts,
+                       since_rowid = excluded.since_rowid,
+                       updated_at = excluded.updated_at""",
+                [(acct_id, ts, rowid, now) for acct_id, ts, rowid in moved],
+            )
+            conn.commit()
 
-                # Fetch recent emails — 50 is plenty for 60s poll intervals
-                messages = svc.get_messages("INBOX", acct["id"], limit=50, unread_only=False)
-                for msg in messages:
-                    # Skip if already seen in another account this cycle
-                    if msg.id in seen_msg_ids:
-                        continue
-                    seen_msg_ids.add(msg.id)
-
-                    # Also skip if this message_id exists in ANY account already
-                    existing = conn.execute(
-                        "SELECT 1 FROM email_metadata WHERE email_message_id = ? LIMIT 1",
-                        (msg.id,),
-                    ).fetchone()
-                    if existing:
-                        continue
+        if discovered:
+            logger.info(f"Discovered {discovered} new emails")
 
-                    try:
-                        result = conn.execute(
-                            """INSERT OR IGNORE INTO email_metadata
-                               (email_message_id, account_id, first_seen_at, last_updated_at,
-                                received_at)
-                               VALUES (?, ?, ?, ?, ?)""",
-                            (msg.id, acct["id"], now, now, msg.date_received),
-                        )
-                        if result.rowcount > 0:
-                            discovered += 1
-                    except Exception:
-                        pass
+        # Rule-matched noise skips the queue
+        for msg_id, acct_id, msg in new:
+            rule = self._auto_rule(self._match_rules(msg.sender or ""))
+            if rule:
+                self._auto_classify(
+                    msg_id, acct_id, rule["category"], rule["id"], msg.sender or "Unknown",
+                    msg.subject, msg.snippet, msg.date_received,
+                )
 
-                conn.commit()
+    def _vip_senders(self, conn) -> set:
+        """Lowercased email addresses of pinned contacts."""
+        return {
+            row[0].lower()
+            for row in conn.execute("SELECT email FROM contacts WHERE pinned = 1 AND email IS NOT NULL")
+        }
 
-            if discovered:
-                logger.info(f"Discovered {discovered} new emails")
-        finally:
-            conn.close()
+    def _newsletter_senders(self, conn, recent: int = 2000) -> set:
+        """Sender addresses whose recent mail was always classified fyi or noise.
+
+        Keyed by full address, not domain: a few newsletters from gmail.com
+        senders must not push every personal gmail.com message into a batch.
+        """
+        counts: Counter = Counter()
+        signal: set = set()
+        for row in conn.execute(
+            "SELECT sender, category FROM email_classifications WHERE sender IS NOT NULL ORDER BY classified_at DESC LIMIT ?",
+            (recent,),
+        ):
+            address = self._extract_sender_email(row["sender"]).lower()
+            if "@" not in address:
+                continue
+            counts[address] += 1
+            if row["category"] not in ("fyi", "noise"):
+                signal.add(address)
+        return {a for a, n in counts.items() if n >= self.NEWSLETTER_MIN_EMAILS and a not in signal}
+
+    def _is_low_signal(self, sender_email: str, newsletters: set) -> bool:
+        """Bulk-looking sender: automated local part, bulk-mail service or known newsletter sender."""
+        local, _, domain = sender_email.rpartition("@")
+        if not domain:
+            return False
+        if _BULK_LOCAL_PART_RE.match(local) or sender_email in newsletters:
+            return True
+        return any(domain == d or domain.endswith("." + d) for d in _BULK_DOMAINS)
+
+    def _queue_priority(self, msg, vips: set, newsletters: set = frozenset()) -> int:
+        """Queue order for a new email: VIP senders, then thread replies, then
+        the rest, with low-signal bulk mail last (it is classified in batches)."""
+        sender_email = self._extract_sender_email(msg.sender or "").lower()
+        if sender_email in vips:
+            return self.PRIORITY_VIP
+        if _THREAD_PREFIX_RE.match(msg.subject or ""):
+            return self.PRIORITY_THREAD
+        if self._is_low_signal(sender_email, newsletters):
+            return self.PRIORITY_BULK
+        return self.PRIORITY_NORMAL
 
     async def _discover_new_emails(self):
         """Phase 2: Discover new emails. Runs in thread to avoid blocking event loop."""
@@ -449,16 +640,12 @@ class EmailPipeline:
     def _get_previous_emails(self, sender: str, account_id: str, limit: int = 5) -> List[Dict[str, str]]:
         """Pre-fetch recent emails from the same sender."""
         try:
-            from .service import EmailService
-            from core.storage import SystemStorage
-
-            storage = SystemStorage(self._db_path)
-            svc = EmailService(storage)
+            svc = self._get_service()
 
             sender_email = self._extract_sender_email(sender)
 
             results = svc.search_messages(
-                sender_email, "INBOX", account_id, limit=limit + 1
+                f"from:{sender_email}", "INBOX", account_id, limit=limit + 1
             )
 
             if not results:
@@ -490,13 +677,10 @@ class EmailPipeline:
             return None
 
         try:
-            from .service import EmailService
-            from core.storage import SystemStorage
-
-            storage = SystemStorage(self._db_path)
-            svc = EmailService(storage)
+            svc = self._get_service()
 
-            related = svc.search_messages(base_subject, "INBOX", account_id, limit=6)
+            phrase = base_subject.replace('"', " ")
+            related = svc.search_messages(f'"{phrase}"', "INBOX", account_id, limit=6)
 
             if not related or len(related) <= 1:
                 return None
@@ -585,207 +769,202 @@ class EmailPipeline:
                     logger.debug(f"Classifier {classifier_id} tool call: {tool_name}")
 
     async def _classify_one(self, msg_id: str, acct_id: str) -> None:
-        """Classify a single email. Designed to run concurrently."""
-        from .service import EmailService
-        from core.storage import SystemStorage
-
-        async with self._semaphore:
-            storage = SystemStorage(self._db_path)
-            svc = EmailService(storage)
+        """Classify a single email. Designed to run concurrently.
 
-            try:
-                msg = await asyncio.to_thread(svc.get_message, msg_id, "INBOX", acct_id)
+        Stage timings go to core.perf as email_pipeline.fetch, .prefetch
+        and .agent.
+        """
+        svc = self._get_service()
 
-                if not msg:
-                    conn = self._get_conn()
-                    try:
-                        conn.execute(
-                            "UPDATE email_metadata SET classified = 1 WHERE email_message_id = ? AND account_id = ?",
-                            (msg_id, acct_id),
-                        )
-                        conn.commit()
-                    finally:
-                        conn.close()
-                    return
-
-                # ── Match sender rules ──────────────────────────────
-                matched_rules = self._match_rules(msg.sender or "")
-                always_rules = [r for r in matched_rules if r["rule_type"] == "always"]
-
-                # Fast path: always rule with no instructions → skip agent
-                if always_rules:
-                    first_always = always_rules[0]
-                    if not first_always.get("instructions") and not first_always.get("extract_content"):
-                        self._auto_classify(
-                            msg_id, acct_id, first_always["category"],
-                            first_always["id"], msg.sender or "Unknown",
-                            msg.subject, msg.snippet, msg.date_received,
-                        )
-                        # Mark metadata
-                        conn = self._get_conn()
-                        try:
-                            conn.execute(
-                                "UPDATE email_metadata SET classified = 1, last_updated_at = ? WHERE email_message_id = ? AND account_id = ?",
-                                (datetime.now(timezone.utc).isoformat(), msg_id, acct_id),
-                            )
-                            conn.commit()
-                        finally:
-                            conn.close()
-                        return
-
-                # ── Build prompt ────────────────────────────────────
-                content_section = ""
-                body = msg.content or msg.html_content or ""
-                if body:
-                    truncated = body[:3000]
-                    if len(body) > 3000:
-                        truncated += "\n... [truncated]"
-                    content_section = f"**Body:**\n{truncated}"
-
-                # Pre-fetch previous emails from sender (threaded — Apple Mail call)
-                previous_emails = await asyncio.to_thread(
-                    self._get_previous_emails, msg.sender or "", acct_id, 5
-                )
-                previous_emails_section = ""
-                if previous_emails:
-                    lines = ["## Previous Emails From This Sender (most recent first)"]
-                    for pe in previous_emails:
-                        lines.append(
-                            f"- **{pe['subject']}** ({pe['date']}): {pe['snippet']}"
-                        )
-                    previous_emails_section = "\n".join(lines) + "\n"
+        try:
+            stage_start = time.perf_counter()
+            msg = await asyncio.to_thread(svc.get_message, msg_id, "INBOX", acct_id)
+            record_worker_latency("email_pipeline.fetch", (time.perf_counter() - stage_start) * 1000, False)
 
-                # Thread context for Re:/Fwd: emails (threaded — Apple Mail call)
-                thread_context = await asyncio.to_thread(
-                    self._get_thread_context, msg.subject, acct_id
-                )
-                thread_section = ""
-                if thread_context:
-                    lines = ["## Thread Context (previous messages in this conversation)"]
-                    for tc in thread_context:
-                        lines.append(
-                            f"- **{tc.get('sender', '?')}** ({tc.get('date', '?')}): "
-                            f"{tc.get('snippet', '')}"
-                        )
-                    thread_section = "\n".join(lines) + "\n"
-
-                # Build rules section
-                rules_section = self._build_rules_section(matched_rules)
-
-                # Load prompt from filesystem
-                prompt_template = self._load_prompt()
-
-                now_pt = datetime.now(timezone(timedelta(hours=-8)))
-                prompt = prompt_template.format(
-                    current_datetime=now_pt.strftime("%A, %B %d, %Y, %I:%M %p PT"),
-                    sender=msg.sender or "Unknown",
-                    subject=msg.subject or "(no subject)",
-                    date=now_pt.strftime("%Y-%m-%d %I:%M %p PT"),
-                    message_id=msg_id,
-                    account_id=acct_id,
-                    content_section=content_section,
-                    previous_emails_section=previous_emails_section,
-                    thread_section=thread_section,
-                    rules_section=rules_section,
+            if not msg:
+                with self._get_conn() as conn:
+                    conn.execute(
+                        "UPDATE email_metadata SET classified = 1 WHERE email_message_id = ? AND account_id = ?",
+                        (msg_id, acct_id),
+                    )
+                    conn.commit()
+                return
+
+            # ── Match sender rules ──────────────────────────────
+            matched_rules = self._match_rules(msg.sender or "")
+
+            # Fast path: always rule with no instructions → skip agent (rules
+            # added since discovery)
+            auto_rule = self._auto_rule(matched_rules)
+            if auto_rule:
+                self._auto_classify(
+                    msg_id, acct_id, auto_rule["category"],
+                    auto_rule["id"], msg.sender or "Unknown",
+                    msg.subject, msg.snippet, msg.date_received,
                 )
+                return
+
+            # ── Build prompt ────────────────────────────────────
+            content_section = ""
+            body = msg.content or ""
+            if not body and msg.html_content:
+                body = html_to_text(msg.html_content, limit=3001)
+            if body:
+                truncated = body[:3000]
+                if len(body) > 3000:
+                    truncated += "\n... [truncated]"
+                content_section = f"**Body:**\n{truncated}"
+
+            # Pre-fetch previous emails from sender and thread context for
+            # Re:/Fwd: emails (threaded — Apple Mail calls, run together)
+            stage_start = time.perf_counter()
+            previous_emails, thread_context = await asyncio.gather(
+                asyncio.to_thread(self._get_previous_emails, msg.sender or "", acct_id, 5),
+                asyncio.to_thread(self._get_thread_context, msg.subject, acct_id),
+            )
+            record_worker_latency("email_pipeline.prefetch", (time.perf_counter() - stage_start) * 1000, False)
+            previous_emails_section = ""
+            if previous_emails:
+                lines = ["## Previous Emails From This Sender (most recent first)"]
+                for pe in previous_emails:
+                    lines.append(
+                        f"- **{pe['subject']}** ({pe['date']}): {pe['snippet']}"
+                    )
+                previous_emails_section = "\n".join(lines) + "\n"
+
+            thread_section = ""
+            if thread_context:
+                lines = ["## Thread Context (previous messages in this conversation)"]
+                for tc in thread_context:
+                    lines.append(
+                        f"- **{tc.get('sender', '?')}** ({tc.get('date', '?')}): "
+                        f"{tc.get('snippet', '')}"
+                    )
+                thread_section = "\n".join(lines) + "\n"
+
+            # Build rules section
+            rules_section = self._build_rules_section(matched_rules)
+
+            # Load prompt from filesystem
+            prompt_template = self._load_prompt()
+
+            now_pt = datetime.now(timezone(timedelta(hours=-8)))
+            prompt = prompt_template.format(
+                current_datetime=now_pt.strftime("%A, %B %d, %Y, %I:%M %p PT"),
+                sender=msg.sender or "Unknown",
+                subject=msg.subject or "(no subject)",
+                date=now_pt.strftime("%Y-%m-%d %I:%M %p PT"),
+                message_id=msg_id,
+                account_id=acct_id,
+                content_section=content_section,
+                previous_emails_section=previous_emails_section,
+                thread_section=thread_section,
+                rules_section=rules_section,
+            )
 
-                # Run the agent
-                start = time.monotonic()
+            # Run the agent
+            start = time.monotonic()
+            errored = False
+            try:
                 await self._run_agent(prompt)
-                elapsed_ms = int((time.monotonic() - start) * 1000)
+            except Exception:
+                errored = True
+                raise
+            finally:
+                agent_ms = (time.monotonic() - start) * 1000
+                record_worker_latency("email_pipeline.agent", agent_ms, errored)
+                await self._limiter.record(agent_ms, errored)
+            elapsed_ms = int(agent_ms)
+
+            # Check if the agent wrote the classification
+            with self._get_conn() as conn:
+                result = conn.execute(
+                    "SELECT category, summary, briefing FROM email_classifications WHERE email_message_id = ? AND account_id = ?",
+                    (msg_id, acct_id),
+                ).fetchone()
+
+                if result:
+                    category = result["category"]
+
+                    # Enforce never-rules: if agent picked a forbidden category, override
+                    never_rules = [r for r in matched_rules if r["rule_type"] == "never"]
+                    for nr in never_rules:
+                        if category == nr["category"]:
+                            # Override to fyi as safe default
+                            category = "fyi"
+                            conn.execute(
+                                "UPDATE email_classifications SET category = ? WHERE email_message_id = ? AND account_id = ?",
+                                (category, msg_id, acct_id),
+                            )
+                            logger.info(f"Never-rule override: {msg_id} changed from {nr['category']} to fyi")
+                            break
 
-                # Check if the agent wrote the classification
-                conn = self._get_conn()
-                try:
-                    result = conn.execute(
-                        "SELECT category, summary, briefing FROM email_classifications WHERE email_message_id = ? AND account_id = ?",
-                        (msg_id, acct_id),
-                    ).fetchone()
-
-                    if result:
-                        category = result["category"]
-
-                        # Enforce never-rules: if agent picked a forbidden category, override
-                        never_rules = [r for r in matched_rules if r["rule_type"] == "never"]
-                        for nr in never_rules:
-                            if category == nr["category"]:
-                                # Override to fyi as safe default
-                                category = "fyi"
-                                conn.execute(
-                                    "UPDATE email_classifications SET category = ? WHERE email_message_id = ? AND account_id = ?",
-                                    (category, msg_id, acct_id),
-                                )
-                                logger.info(f"Never-rule override: {msg_id} changed from {nr['category']} to fyi")
-                                break
-
-                        # Track which rule was applied
-                        rule_id = matched_rules[0]["id"] if matched_rules else None
-
-                        # Backfill context snapshot + timing + rule_id
-                        conn.execute(
-                            """UPDATE email_classifications
-                               SET sender = ?, subject = ?, preview = ?, processing_time_ms = ?,
-                                   received_at = ?, rule_id = ?
-                               WHERE email_message_id = ? AND account_id = ?""",
-                            (msg.sender, msg.subject, msg.snippet, elapsed_ms,
-                             msg.date_received, rule_id, msg_id, acct_id),
-                        )
-                        conn.commit()
+                    # Track which rule was applied
+                    rule_id = matched_rules[0]["id"] if matched_rules else None
 
-                        logger.info(
-                            f"Classified {msg_id}: {category} "
-                            f"({elapsed_ms}ms) — {(result['summary'] or '')[:60]}"
-                        )
+                    # Backfill context snapshot + timing + rule_id
+                    conn.execute(
+                        """UPDATE email_classifications
+                           SET sender = ?, subject = ?, preview = ?, processing_time_ms = ?,
+                               received_at = ?, rule_id = ?
+                           WHERE email_message_id = ? AND account_id = ?""",
+                        (msg.sender, msg.subject, msg.snippet, elapsed_ms,
+                         msg.date_received, rule_id, msg_id, acct_id),
+                    )
+                    conn.commit()
 
-                        # Increment rule counters
-                        for rule in matched_rules:
-                            self._increment_rule_applied(rule["id"])
+                    logger.info(
+                        f"Classified {msg_id}: {category} "
+                        f"({elapsed_ms}ms) — {(result['summary'] or '')[:60]}"
+                    )
 
-                        # Notify Chief
-                        self._notify_chief(
-                            category,
-                            msg.sender or "Unknown",
-                            result["summary"] or "",
-                            result["briefing"] or "",
-                        )
+                    # Increment rule counters
+                    for rule in matched_rules:
+                        self._increment_rule_applied(rule["id"])
 
-                        # Update morning brief draft
-                        try:
-                            from .brief_draft import update_draft
-                            update_draft(str(self._db_path))
-                        except Exception:
-                            pass  # Non-critical
-                    else:
-                        # Agent didn't classify — write fyi fallback
-                        logger.warning(f"Agent did not classify {msg_id} — defaulting to fyi")
-                        now = datetime.now(timezone.utc).isoformat()
-                        conn.execute(
-                            """INSERT OR REPLACE INTO email_classifications
-                               (id, email_message_id, account_id, category, summary,
-                                briefing, sender, subject, preview, processing_time_ms,
-                                received_at, classified_at)
-                               VALUES (?, ?, ?, 'fyi', ?, ?, ?, ?, ?, ?, ?, ?)""",
-                            (
-                                str(uuid.uuid4()), msg_id, acct_id,
-                                "Classifier did not produce a classification.",
-                                "Agent failed to classify this email. Defaulted to FYI.",
-                                msg.sender, msg.subject, msg.snippet,
-                                elapsed_ms, msg.date_received, now,
-                            ),
-                        )
-                        conn.execute(
-                            "UPDATE email_metadata SET classified = 1, last_updated_at = ? WHERE email_message_id = ? AND account_id = ?",
-                            (now, msg_id, acct_id),
-                        )
-                        conn.commit()
-                finally:
-                    conn.close()
+                    # Notify Chief
+                    self._notify_chief(
+                        category,
+                        msg.sender or "Unknown",
+                        result["summary"] or "",
+                        result["briefing"] or "",
+                    )
 
-            except Exception as e:
-                logger.error(f"Failed to classify {msg_id}: {e}")
-                now = datetime.now(timezone.utc).isoformat()
-                conn = self._get_conn()
-                try:
+                    # Update morning brief draft
+                    try:
+                        from .brief_draft import update_draft
+                        update_draft(str(self._db_path))
+                    except Exception:
+                        pass  # Non-critical
+                else:
+                    # Agent didn't classify — write fyi fallback
+                    logger.warning(f"Agent did not classify {msg_id} — defaulting to fyi")
+                    now = datetime.now(timezone.utc).isoformat()
+                    conn.execute(
+                        """INSERT OR REPLACE INTO email_classifications
+                           (id, email_message_id, account_id, category, summary,
+                            briefing, sender, subject, preview, processing_time_ms,
+                            received_at, classified_at)
+                           VALUES (?, ?, ?, 'fyi', ?, ?, ?, ?, ?, ?, ?, ?)""",
+                        (
+                            str(uuid.uuid4()), msg_id, acct_id,
+                            "Classifier did not produce a classification.",
+                            "Agent failed to classify this email. Defaulted to FYI.",
+                            msg.sender, msg.subject, msg.snippet,
+                            elapsed_ms, msg.date_received, now,
+                        ),
+                    )
+                    conn.execute(
+                        "UPDATE email_metadata SET classified = 1, last_updated_at = ? WHERE email_message_id = ? AND account_id = ?",
+                        (now, msg_id, acct_id),
+                    )
+                    conn.commit()
+
+        except Exception as e:
+            logger.error(f"Failed to classify {msg_id}: {e}")
+            now = datetime.now(timezone.utc).isoformat()
+            try:
+                with self._get_conn() as conn:
                     conn.execute(
                         """INSERT OR REPLACE INTO email_classifications
                            (id, email_message_id, account_id, category, summary,
@@ -803,35 +982,189 @@ class EmailPipeline:
                         (now, msg_id, acct_id),
                     )
                     conn.commit()
-                except Exception:
-                    pass
-                finally:
-                    conn.close()
+            except Exception:
+                pass
 
-    async def _classify_pending(self):
-        """Find and classify unclassified emails (up to 3 concurrently)."""
-        conn = self._get_conn()
-        try:
-            cursor = conn.execute(
-                """SELECT em.email_message_id, em.account_id
-                   FROM email_metadata em
-                   WHERE em.classified = 0
-                   ORDER BY em.first_seen_at DESC
+    async def _classify_batch(self, items: List[Tuple[str, str]]) -> None:
+        """Classify several low-signal emails with one agent run.
+
+        The agent writes them through email("classify_batch"). Emails with
+        sender rules, and any the agent leaves out or fails on, go back in
+        the queue at normal priority for the single-email classifier.
+        """
+        svc = self._get_service()
+        stage_start = time.perf_counter()
+        messages = await asyncio.gather(
+            *(asyncio.to_thread(svc.get_message, msg_id, "INBOX", acct_id) for msg_id, acct_id in items),
+            return_exceptions=True,
+        )
+        record_worker_latency("email_pipeline.fetch", (time.perf_counter() - stage_start) * 1000, False)
+
+        batch = []
+        single: List[Tuple[str, str]] = []
+        for (msg_id, acct_id), msg in zip(items, messages):
+            if isinstance(msg, BaseException):
+                single.append((msg_id, acct_id))
+                continue
+            if not msg:
+                with self._get_conn() as conn:
+                    conn.execute(
+                        "UPDATE email_metadata SET classified = 1 WHERE email_message_id = ? AND account_id = ?",
+                        (msg_id, acct_id),
+                    )
+                    conn.commit()
+                continue
+            matched_rules = self._match_rules(msg.sender or "")
+            auto_rule = self._auto_rule(matched_rules)
+            if auto_rule:
+                self._auto_classify(
+                    msg_id, acct_id, auto_rule["category"], auto_rule["id"], msg.sender or "Unknown",
+                    msg.subject, msg.snippet, msg.date_received,
+                )
+            elif matched_rules:
+                single.append((msg_id, acct_id))  # Rule instructions need the full prompt
+            else:
+                batch.append((msg_id, acct_id, msg))
+
+        if batch:
+            entries = []
+            for i, (msg_id, acct_id, msg) in enumerate(batch, 1):
+                body = msg.content or ""
+                if not body and msg.html_content:
+                    body = html_to_text(msg.html_content, limit=self.BATCH_BODY_CHARS)
+                entries.append(
+                    f"### {i}. message_id={msg_id} account={acct_id}\n"
+                    f"**From:** {msg.sender or 'Unknown'}\n"
+                    f"**Subject:** {msg.subject or '(no subject)'}\n"
+                    f"{body[:self.BATCH_BODY_CHARS]}\n"
+                )
+            prompt = _BATCH_PROMPT.format(count=len(batch), emails="\n".join(entries))
+
+            start = time.monotonic()
+            errored = False
+            try:
+                await self._run_agent(prompt)
+            except Exception as e:
+                errored = True
+                logger.error(f"Batch classification of {len(batch)} emails failed: {e}")
+            finally:
+                agent_ms = (time.monotonic() - start) * 1000
+                record_worker_latency("email_pipeline.agent_batch", agent_ms, errored)
+                if errored:
+                    # Batch runs are slower by design; only failures feed the limiter
+                    await self._limiter.record(agent_ms, True)
+
+            per_email_ms = int(agent_ms / len(batch))
+            missed = 0
+            with self._get_conn() as conn:
+                for msg_id, acct_id, msg in batch:
+                    result = conn.execute(
+                        """UPDATE email_classifications
+                           SET sender = ?, subject = ?, preview = ?, processing_time_ms = ?, received_at = ?
+                           WHERE email_message_id = ? AND account_id = ?""",
+                        (msg.sender, msg.subject, msg.snippet, per_email_ms, msg.date_received, msg_id, acct_id),
+                    )
+                    if result.rowcount == 0:
+                        single.append((msg_id, acct_id))
+                        missed += 1
+                conn.commit()
+            logger.info(f"Batch-classified {len(batch) - missed} of {len(batch)} emails ({int(agent_ms)}ms)")
+
+        if single:
+            with self._get_conn() as conn:
+                conn.executemany(
+                    "UPDATE email_metadata SET classify_priority = ? WHERE email_message_id = ? AND account_id = ? AND classified = 0",
+                    [(self.PRIORITY_NORMAL, msg_id, acct_id) for msg_id, acct_id in single],
+                )
+                conn.commit()
+            self._queue_ready.set()
+
+    def _claim_next(self) -> List[Tuple[str, str]]:
+        """Next unit of work, highest priority first: one queued email, or up
+        to batch_size low-signal ones. Skips emails already being classified.
+        """
+        with self._claim_lock:
+            skip = len(self._in_flight) + len(self._exhausted)
+        with self._get_conn() as conn:
+            rows = conn.execute(
+                """SELECT email_message_id, account_id, classify_priority
+                   FROM email_metadata
+                   WHERE classified = 0
+                   ORDER BY classify_priority, first_seen_at DESC
                    LIMIT ?""",
-                (self.MAX_WORKERS * 3,),  # Fetch enough to keep workers busy
-            )
-            pending = cursor.fetchall()
-        finally:
-            conn.close()
+                (skip + self._batch_size,),
+            ).fetchall()
 
-        if not pending:
-            return
+        claimed: List[Tuple[str, str]] = []
+        with self._claim_lock:
+            for row in rows:
+                item = (row["email_message_id"], row["account_id"])
+                if item in self._in_flight or item in self._exhausted:
+                    continue
+                self._in_flight.add(item)
+                self._attempts[item] += 1
+                if self._attempts[item] >= self.MAX_ATTEMPTS:
+                    # Last try: park it so the counter only holds retryable emails
+                    del self._attempts[item]
+                    self._exhausted.add(item)
+                claimed.append(item)
+                # Bulk sorts last, so everything after a bulk row is bulk too
+                if row["classify_priority"] != self.PRIORITY_BULK or len(claimed) >= self._batch_size:
+                    break
+        return claimed
 
-        logger.info(f"Classifying {len(pending)} pending emails ({self.MAX_WORKERS} workers)")
+    def _settle(self, items: List[Tuple[str, str]]) -> None:
+        """Release claimed emails, forgetting attempt tracking for the ones now classified."""
+        if not items:
+            return
+        with self._claim_lock:
+            self._in_flight.difference_update(items)
+        try:
+            with self._get_conn() as conn:
+                rows = conn.execute(
+                    f"""SELECT email_message_id, account_id FROM email_metadata
+                        WHERE classified = 0 AND email_message_id IN ({', '.join('?' * len(items))})""",
+                    [msg_id for msg_id, _ in items],
+                ).fetchall()
+        except Exception as e:
+            logger.error(f"Pipeline settle failed: {e}")
+            return
+        queued = {(row["email_message_id"], row["account_id"]) for row in rows}
+        with self._claim_lock:
+            for item in items:
+                if item not in queued:
+                    self._attempts.pop(item, None)
+                    self._exhausted.discard(item)
+
+    async def _worker(self) -> None:
+        """Classify queued emails one after another until cancelled.
+
+        A worker takes a limiter slot before claiming, so whatever is most
+        urgent when a slot frees up goes next. Claiming and settling read
+        SQLite, so they run on a thread like discovery does.
+        """
+        while True:
+            await self._limiter.acquire()
+            items: List[Tuple[str, str]] = []
+            # Cleared before the claim: a discovery pass that lands after
+            # it sets the event again, so an empty claim cannot miss it
+            self._queue_ready.clear()
+            try:
+                try:
+                    items = await asyncio.to_thread(self._claim_next)
+                except Exception as e:
+                    logger.error(f"Pipeline queue read failed: {e}")
+                if len(items) == 1:
+                    await self._classify_one(*items[0])
+                elif items:
+                    await self._classify_batch(items)
+            finally:
+                try:
+                    if items:
+                        await asyncio.to_thread(self._settle, items)
+                finally:
+                    await self._limiter.release()
 
-        # Dispatch all concurrently — semaphore limits to MAX_WORKERS at a time
-        tasks = [
-            self._classify_one(row["email_message_id"], row["account_id"])
-            for row in pending
-        ]
-        await asyncio.gather(*tasks, return_exceptions=True)
+            if not items:
+                # Queue empty: sleep until the next discovery pass
+                await self._queue_ready.wait()
@@ -24,18 +24,22 @@ Use cases:
 from __future__ import annotations
 
 import hashlib
+import html as html_module
 import logging
 import os
 import sqlite3
 import sys
-import email
+import threading
 import uuid
 from urllib.parse import unquote
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
+from ..html_text import clean_text, html_to_text
 from ..models import DraftMessage, EmailMessage, Mailbox, ProviderType
+from .apple_body import get_body_cache, read_emlx_text_parts
+from .apple_search import MailSearchIndex, get_search_index, parse_query
 from .base import EmailAdapter
 
 logger = logging.getLogger(__name__)
@@ -102,7 +106,19 @@ class AppleMailAdapter(EmailAdapter):
         self._account_aliases_cache: Dict[str, set[str]] = {}
         self._account_name_cache: Dict[str, str] = {}
         self._account_identifier_cache: Dict[str, str] = {}
-        self._account_identifier_cache: Dict[str, str] = {}
+        # Per-thread read-only connections; bumping _generation retires them
+        self._local = threading.local()
+        self._generation = 0
+        # Memoized mailbox ids / Gmail-ness / storage dirs, cleared when the
+        # Envelope Index changes (inode, mtime_ns)
+        self._memo_cache: Dict[str, Dict[Any, Any]] = {}
+        self._memo_lock = threading.Lock()
+        self._source_stamp: Optional[Tuple[int, int]] = None
+        self._schema_version: Optional[int] = None
+        self.cache_stats: Dict[str, Any] = {
+            "connection": {"hits": 0, "misses": 0},
+            "invalidations": 0,
+        }
     
     @property
     def provider_type(self) -> ProviderType:
@@ -113,7 +129,12 @@ class AppleMailAdapter(EmailAdapter):
         return "Apple Mail"
     
     def _get_db_connection(self) -> Optional[sqlite3.Connection]:
-        """Get connection to Mail.app database."""
+        """Read-only connection to Mail.app's database (one per thread, kept open).
+
+        Reusing the connection keeps sqlite3's prepared-statement cache warm.
+        It is reopened when the Envelope Index is replaced or its schema
+        changes. Callers must not close it.
+        """
         if not IS_MACOS:
             logger.debug("Apple Mail adapter only available on macOS")
             return None
@@ -124,17 +145,88 @@ class AppleMailAdapter(EmailAdapter):
         if not self._db_path:
             logger.warning("Mail.app database not found")
             return None
+
+        self._check_source()
+        conn = getattr(self._local, "conn", None)
+        if conn is not None and self._local.generation == self._generation:
+            self.cache_stats["connection"]["hits"] += 1
+            return conn
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
         
         try:
             conn = sqlite3.connect(
                 f"file:{self._db_path}?mode=ro",
                 uri=True,
+                cached_statements=256,
             )
             conn.row_factory = sqlite3.Row
-            return conn
         except Exception as e:
             logger.error(f"Failed to connect to Mail.app database: {e}")
             return None
+
+        self._local.conn = conn
+        self._local.generation = self._generation
+        self.cache_stats["connection"]["misses"] += 1
+        return conn
+
+    def _check_source(self) -> None:
+        """Drop memoized lookups when the Envelope Index changes on disk.
+
+        A new inode (file replaced) or schema version also retires the open
+        connections; plain content changes are visible to them already.
+        """
+        try:
+            st = os.stat(self._db_path)
+        except (OSError, TypeError):
+            return
+        stamp = (st.st_ino, st.st_mtime_ns)
+        if stamp == self._source_stamp:
+            return
+
+        with self._memo_lock:
+            if stamp == self._source_stamp:
+                return
+            previous = self._source_stamp
+            self._source_stamp = stamp
+            self._memo_cache.clear()
+            schema_version = self._read_schema_version()
+            if previous is not None:
+                self.cache_stats["invalidations"] += 1
+                if previous[0] != stamp[0] or schema_version != self._schema_version:
+                    self._generation += 1
+            self._schema_version = schema_version
+
+    def _read_schema_version(self) -> Optional[int]:
+        try:
+            probe = sqlite3.connect(f"file:{self._db_path}?mode=ro", uri=True)
+            try:
+                return probe.execute("PRAGMA schema_version").fetchone()[0]
+            finally:
+                probe.close()
+        except sqlite3.Error:
+            return None
+
+    def _memo(self, kind: str, key: Any, resolve: Callable[[], Any]) -> Any:
+        """Memoize resolve() under (kind, key) until the Envelope Index changes."""
+        self._check_source()
+        cache = self._memo_cache.setdefault(kind, {})
+        stats = self.cache_stats.setdefault(kind, {"hits": 0, "misses": 0})
+        if key in cache:
+            stats["hits"] += 1
+            return cache[key]
+        stats["misses"] += 1
+        value = resolve()
+        cache[key] = value
+        return value
+
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Hit/miss counters for the connection and memoized lookups."""
+        return {
+            key: dict(value) if isinstance(value, dict) else value
+            for key, value in self.cache_stats.items()
+        }
     
     def _get_mail_handler(self):
         """Get pyapple_mcp MailHandler for AppleScript operations."""
@@ -366,7 +458,6 @@ class AppleMailAdapter(EmailAdapter):
 
         account_identifier = self._get_account_identifier(account)
         if not account_identifier:
-            conn.close()
             return None
 
         cursor = conn.cursor()
@@ -403,7 +494,6 @@ class AppleMailAdapter(EmailAdapter):
             (message_id, f"%//{account_identifier}/%"),
         )
         row = cursor.fetchone()
-        conn.close()
 
         if not row:
             return None
@@ -429,7 +519,7 @@ class AppleMailAdapter(EmailAdapter):
         account: Optional[str] = None,
         limit: int = 20,
     ) -> List[EmailMessage]:
-        """Search emails in Mail.app (SQLite-backed only)."""
+        """Search emails in Mail.app (ranked FTS5; supports from:/domain:/thread: filters)."""
         return self._search_messages_from_db(
             query=query,
             mailbox=mailbox,
@@ -602,7 +692,6 @@ class AppleMailAdapter(EmailAdapter):
                         if count > best_count:
                             best_identifier = candidate
                             best_count = count
-                    mail_conn.close()
 
                 if best_identifier and best_count > 0:
                     identifier = best_identifier
@@ -621,7 +710,6 @@ class AppleMailAdapter(EmailAdapter):
                         (f"%//{identifier}/%",),
                     )
                     has_mailboxes = mail_cur.fetchone()[0] > 0
-                    mail_conn.close()
 
                 if not has_mailboxes:
                     identifier = self._fallback_mailbox_identifier(account_key)
@@ -643,7 +731,6 @@ class AppleMailAdapter(EmailAdapter):
         cursor = mail_conn.cursor()
         cursor.execute("SELECT url FROM mailboxes")
         rows = cursor.fetchall()
-        mail_conn.close()
 
         accounts: Dict[str, Dict[str, int]] = {}
         for row in rows:
@@ -697,7 +784,6 @@ class AppleMailAdapter(EmailAdapter):
             (f"%//{identifier}/%",),
         )
         count = cursor.fetchone()[0]
-        mail_conn.close()
         return count > 0
 
     def _mailbox_name_from_url(self, url: str, account_identifier: str) -> str:
@@ -733,12 +819,15 @@ class AppleMailAdapter(EmailAdapter):
         return mapping.get(normalized, name)
 
     def _is_gmail_account(self, conn: sqlite3.Connection, account_identifier: str) -> bool:
-        cursor = conn.cursor()
-        cursor.execute(
-            "SELECT 1 FROM mailboxes WHERE url LIKE ? LIMIT 1",
-            (f"%//{account_identifier}/%5BGmail%5D/%",),
-        )
-        return cursor.fetchone() is not None
+        def resolve() -> bool:
+            cursor = conn.cursor()
+            cursor.execute(
+                "SELECT 1 FROM mailboxes WHERE url LIKE ? LIMIT 1",
+                (f"%//{account_identifier}/%5BGmail%5D/%",),
+            )
+            return cursor.fetchone() is not None
+
+        return self._memo("is_gmail", account_identifier, resolve)
 
     def _gmail_label_url(self, account_identifier: str, mailbox: str) -> Optional[str]:
         mailbox_lower = mailbox.lower()
@@ -765,7 +854,6 @@ class AppleMailAdapter(EmailAdapter):
 
         account_identifier = self._get_account_identifier(account)
         if not account_identifier:
-            conn.close()
             return []
 
         cursor = conn.cursor()
@@ -808,7 +896,6 @@ class AppleMailAdapter(EmailAdapter):
                     total_count=total or 0,
                     provider=ProviderType.APPLE_MAIL,
                 ))
-            conn.close()
             return mailboxes
 
         cursor.execute(
@@ -820,7 +907,6 @@ class AppleMailAdapter(EmailAdapter):
             (f"%//{account_identifier}/%",),
         )
         rows = cursor.fetchall()
-        conn.close()
 
         mailboxes: List[Mailbox] = []
         for row in rows:
@@ -850,7 +936,6 @@ class AppleMailAdapter(EmailAdapter):
 
         account_identifier = self._get_account_identifier(account)
         if not account_identifier:
-            conn.close()
             return []
 
         unread_filter = "AND m.read = 0" if unread_only else ""
@@ -863,7 +948,6 @@ class AppleMailAdapter(EmailAdapter):
         if use_gmail_labels:
             label_url = self._gmail_label_url(account_identifier, mailbox)
             if not label_url:
-                conn.close()
                 return []
             query = f"""
                 SELECT m.ROWID as rowid,
@@ -899,12 +983,10 @@ class AppleMailAdapter(EmailAdapter):
             """
             cursor.execute(query, [label_url, limit, offset])
             rows = cursor.fetchall()
-            conn.close()
             return self._rows_to_messages(rows, account_identifier, account)
 
         mailbox_ids = self._get_mailbox_ids(cursor, account_identifier, mailbox)
         if not mailbox_ids:
-            conn.close()
             return []
 
         mailbox_placeholders = ", ".join(["?"] * len(mailbox_ids))
@@ -941,7 +1023,6 @@ class AppleMailAdapter(EmailAdapter):
 
         cursor.execute(query, mailbox_ids + [limit, offset])
         rows = cursor.fetchall()
-        conn.close()
 
         return self._rows_to_messages(rows, account_identifier, account)
 
@@ -959,16 +1040,13 @@ class AppleMailAdapter(EmailAdapter):
 
         account_identifier = self._get_account_identifier(account)
         if not account_identifier:
-            conn.close()
             return []
 
         cursor = conn.cursor()
-        mailbox_ids = self._get_mailbox_ids(cursor, account_identifier, mailbox)
-        if not mailbox_ids:
-            conn.close()
+        source = self._mailbox_source(conn, account_identifier, mailbox)
+        if source is None:
             return []
-
-        mailbox_placeholders = ", ".join(["?"] * len(mailbox_ids))
+        join_sql, filter_sql, filter_params = source
 
         query = f"""
             SELECT m.ROWID as rowid,
@@ -992,7 +1070,8 @@ class AppleMailAdapter(EmailAdapter):
             LEFT JOIN recipients r ON r.message = m.ROWID
             LEFT JOIN addresses raddr ON raddr.ROWID = r.address
             LEFT JOIN mailboxes mb ON mb.ROWID = m.mailbox
-            WHERE m.mailbox IN ({mailbox_placeholders})
+            {join_sql}
+            WHERE {filter_sql}
               AND m.deleted = 0
               AND (
                 m.date_received > ?
@@ -1003,12 +1082,65 @@ class AppleMailAdapter(EmailAdapter):
             LIMIT ?
         """
 
-        params: List[Any] = mailbox_ids + [since_ts, since_ts, since_rowid, limit]
+        params: List[Any] = filter_params + [since_ts, since_ts, since_rowid, limit]
         cursor.execute(query, params)
         rows = cursor.fetchall()
-        conn.close()
         return rows
 
+    def get_latest_cursor(self, mailbox: str, account: Optional[str]) -> Optional[Tuple[int, int]]:
+        """(date_received, rowid) of the newest message in a mailbox, for seeding get_messages_since."""
+        conn = self._get_db_connection()
+        if not conn:
+            return None
+
+        account_identifier = self._get_account_identifier(account)
+        if not account_identifier:
+            return None
+
+        source = self._mailbox_source(conn, account_identifier, mailbox)
+        if source is None:
+            return None
+        join_sql, filter_sql, filter_params = source
+
+        row = conn.execute(
+            f"""
+            SELECT m.date_received, m.ROWID as rowid
+            FROM messages m
+            {join_sql}
+            WHERE {filter_sql}
+            ORDER BY m.date_received DESC, m.ROWID DESC
+            LIMIT 1
+            """,
+            filter_params,
+        ).fetchone()
+        if not row:
+            return (0, 0)
+        return (int(row["date_received"] or 0), int(row["rowid"]))
+
+    def _mailbox_source(
+        self,
+        conn: sqlite3.Connection,
+        account_identifier: str,
+        mailbox: str,
+    ) -> Optional[Tuple[str, str, List[Any]]]:
+        """(join, where, params) selecting a mailbox's messages; Gmail goes through labels."""
+        if self._is_gmail_account(conn, account_identifier):
+            label_url = self._gmail_label_url(account_identifier, mailbox)
+            if not label_url:
+                return None
+            join_sql = """
+                JOIN server_messages sm ON sm.message = m.ROWID
+                JOIN server_labels sl ON sl.server_message = sm.ROWID
+                JOIN mailboxes lmb ON lmb.ROWID = sl.label
+            """
+            return join_sql, "lmb.url LIKE ?", [label_url]
+
+        mailbox_ids = self._get_mailbox_ids(conn.cursor(), account_identifier, mailbox)
+        if not mailbox_ids:
+            return None
+        placeholders = ", ".join(["?"] * len(mailbox_ids))
+        return "", f"m.mailbox IN ({placeholders})", list(mailbox_ids)
+
     def _get_flags_since_from_db(
         self,
         mailbox: str,
@@ -1022,13 +1154,11 @@ class AppleMailAdapter(EmailAdapter):
 
         account_identifier = self._get_account_identifier(account)
         if not account_identifier:
-            conn.close()
             return []
 
         cursor = conn.cursor()
         mailbox_ids = self._get_mailbox_ids(cursor, account_identifier, mailbox)
         if not mailbox_ids:
-            conn.close()
             return []
 
         mailbox_placeholders = ", ".join(["?"] * len(mailbox_ids))
@@ -1051,7 +1181,6 @@ class AppleMailAdapter(EmailAdapter):
         params: List[Any] = mailbox_ids + [since_ts, limit]
         cursor.execute(query, params)
         rows = cursor.fetchall()
-        conn.close()
 
         results: List[Dict[str, Any]] = []
         for row in rows:
@@ -1065,6 +1194,17 @@ class AppleMailAdapter(EmailAdapter):
             })
         return results
 
+    def _get_search_index(self) -> Optional[MailSearchIndex]:
+        """Local FTS5 index over the Envelope Index, or None while it is still being built."""
+        if not self._db_path:
+            return None
+        try:
+            index = get_search_index(self._db_path, self._config.get("search_index_db"))
+            return index if index.ensure_fresh() else None
+        except Exception as e:
+            logger.warning(f"Mail search index unavailable, falling back to LIKE scan: {e}")
+            return None
+
     def _search_messages_from_db(
         self,
         query: str,
@@ -1072,13 +1212,131 @@ class AppleMailAdapter(EmailAdapter):
         account: Optional[str],
         limit: int,
     ) -> List[EmailMessage]:
+        """Ranked search via the FTS5 shadow index, hydrated from the Envelope Index."""
+        conn = self._get_db_connection()
+        if not conn:
+            return []
+
+        account_identifier = self._get_account_identifier(account)
+        if not account_identifier:
+            return []
+
+        index = self._get_search_index()
+        parsed = parse_query(query)
+        if index is None or not (parsed.match or parsed.sender or parsed.domain or parsed.thread_id is not None):
+            return self._search_messages_like(
+                parsed.sender or parsed.domain or query, mailbox, account, limit
+            )
+
+        cursor = conn.cursor()
+        label_url = None
+        if mailbox and self._is_gmail_account(conn, account_identifier):
+            # Gmail keeps everything in All Mail; the label is checked at hydration
+            label_url = self._gmail_label_url(account_identifier, mailbox)
+            if not label_url:
+                return []
+            mailbox_ids = None
+        elif mailbox:
+            mailbox_ids = self._get_mailbox_ids(cursor, account_identifier, mailbox)
+        else:
+            mailbox_ids = None
+        if mailbox_ids is None:
+            mailbox_ids = [rowid for rowid, _ in self._account_mailboxes(cursor, account_identifier)]
+
+        # Hydration drops deleted/relabelled rows, so over-fetch candidates
+        page_size = max(limit * 3, 50)
+        offset = 0
+        results: List[sqlite3.Row] = []
+        while len(results) < limit:
+            candidates = index.search(parsed, mailbox_ids=mailbox_ids, limit=page_size, offset=offset)
+            if not candidates:
+                break
+            rows = self._hydrate_rows(cursor, candidates, label_url, mailbox_ids)
+            results.extend(rows[: limit - len(results)])
+            if len(candidates) < page_size:
+                break
+            offset += page_size
+
+        return self._rows_to_messages(results, account_identifier, account)
+
+    def _hydrate_rows(
+        self,
+        cursor: sqlite3.Cursor,
+        rowids: List[int],
+        label_url: Optional[str] = None,
+        mailbox_ids: Optional[List[int]] = None,
+    ) -> List[sqlite3.Row]:
+        """Fetch full envelope rows for rowids, keeping their order.
+
+        Rows deleted or moved out of mailbox_ids since they were indexed are
+        dropped here; the index itself never sees those changes.
+        """
+        placeholders = ", ".join(["?"] * len(rowids))
+        join_labels = ""
+        label_filter = ""
+        mailbox_filter = ""
+        params: List[Any] = list(rowids)
+        if mailbox_ids:
+            mailbox_filter = f"AND m.mailbox IN ({', '.join(['?'] * len(mailbox_ids))})"
+            params.extend(mailbox_ids)
+        if label_url:
+            join_labels = """
+                JOIN server_messages sm ON sm.message = m.ROWID
+                JOIN server_labels sl ON sl.server_message = sm.ROWID
+                JOIN mailboxes lmb ON lmb.ROWID = sl.label
+            """
+            label_filter = "AND lmb.url LIKE ?"
+            params.append(label_url)
+
+        cursor.execute(
+            f"""
+            SELECT m.ROWID as rowid,
+                   m.message_id,
+                   m.document_id,
+                   m.date_sent,
+                   m.date_received,
+                   m.read,
+                   m.flagged,
+                   m.deleted,
+                   mb.url as mailbox_url,
+                   subj.subject,
+                   summ.summary,
+                   addr.address,
+                   addr.comment,
+                   GROUP_CONCAT(raddr.address) as recipients
+            FROM messages m
+            LEFT JOIN subjects subj ON subj.ROWID = m.subject
+            LEFT JOIN summaries summ ON summ.ROWID = m.summary
+            LEFT JOIN addresses addr ON addr.ROWID = m.sender
+            LEFT JOIN recipients r ON r.message = m.ROWID
+            LEFT JOIN addresses raddr ON raddr.ROWID = r.address
+            LEFT JOIN mailboxes mb ON mb.ROWID = m.mailbox
+            {join_labels}
+            WHERE m.ROWID IN ({placeholders})
+              AND m.deleted = 0
+              {mailbox_filter}
+              {label_filter}
+            GROUP BY m.ROWID
+            """,
+            params,
+        )
+        by_id = {row["rowid"]: row for row in cursor.fetchall()}
+        return [by_id[rowid] for rowid in rowids if rowid in by_id]
+
+    def _search_messages_like(
+        self,
+        query: str,
+        mailbox: Optional[str],
+        account: Optional[str],
+        limit: int,
+    ) -> List[EmailMessage]:
+        """Unindexed substring search (fallback when the FTS index is unavailable)."""
         conn = self._get_db_connection()
         if not conn:
             return []
 
         account_identifier = self._get_account_identifier(account)
         if not account_identifier:
-            conn.close()
             return []
 
         mailbox_filter = ""
@@ -1090,7 +1348,6 @@ class AppleMailAdapter(EmailAdapter):
                 if label_url:
                     mailbox_filter = "AND lmb.url LIKE ?"
                 else:
-                    conn.close()
                     return []
             else:
                 mailbox_ids = self._get_mailbox_ids(cursor, account_identifier, mailbox)
@@ -1153,7 +1410,6 @@ class AppleMailAdapter(EmailAdapter):
         cursor = conn.cursor()
         cursor.execute(query_sql, params)
         rows = cursor.fetchall()
-        conn.close()
 
         return self._rows_to_messages(rows, account_identifier, account)
 
@@ -1164,14 +1420,12 @@ class AppleMailAdapter(EmailAdapter):
 
         account_identifier = self._get_account_identifier(account)
         if not account_identifier:
-            conn.close()
             return None
 
         cursor = conn.cursor()
         if self._is_gmail_account(conn, account_identifier):
             label_url = self._gmail_label_url(account_identifier, mailbox)
             if not label_url:
-                conn.close()
                 return None
             cursor.execute(
                 """
@@ -1185,12 +1439,10 @@ class AppleMailAdapter(EmailAdapter):
                 (label_url,),
             )
             row = cursor.fetchone()
-            conn.close()
             return row["count"] if row else 0
 
         mailbox_ids = self._get_mailbox_ids(cursor, account_identifier, mailbox)
         if not mailbox_ids:
-            conn.close()
             return None
 
         placeholders = ", ".join(["?"] * len(mailbox_ids))
@@ -1203,7 +1455,6 @@ class AppleMailAdapter(EmailAdapter):
             mailbox_ids,
         )
         row = cursor.fetchone()
-        conn.close()
         return row["count"] if row else 0
 
     def _get_mailbox_ids(
@@ -1212,22 +1463,36 @@ class AppleMailAdapter(EmailAdapter):
         account_identifier: str,
         mailbox: str,
     ) -> List[int]:
-        cursor.execute(
-            """
-            SELECT ROWID, url
-            FROM mailboxes
-            WHERE url LIKE ?
-            """,
-            (f"%//{account_identifier}/%",),
-        )
-        mailbox_ids: List[int] = []
         mailbox_lower = mailbox.lower()
-        for row in cursor.fetchall():
-            name = self._mailbox_name_from_url(row["url"], account_identifier).lower()
-            if name == mailbox_lower:
-                mailbox_ids.append(row["ROWID"])
+        mailbox_ids = [
+            rowid
+            for rowid, name in self._account_mailboxes(cursor, account_identifier)
+            if name.lower() == mailbox_lower
+        ]
         return mailbox_ids
 
+    def _account_mailboxes(
+        self,
+        cursor: sqlite3.Cursor,
+        account_identifier: str,
+    ) -> List[Tuple[int, str]]:
+        """(ROWID, normalized name) of every mailbox for an account, memoized."""
+        def resolve() -> List[Tuple[int, str]]:
+            cursor.execute(
+                """
+                SELECT ROWID, url
+                FROM mailboxes
+                WHERE url LIKE ?
+                """,
+                (f"%//{account_identifier}/%",),
+            )
+            return [
+                (row["ROWID"], self._mailbox_name_from_url(row["url"], account_identifier))
+                for row in cursor.fetchall()
+            ]
+
+        return self._memo("mailboxes", account_identifier, resolve)
+
     def _rows_to_messages(
         self,
         rows: List[sqlite3.Row],
@@ -1285,7 +1550,7 @@ class AppleMailAdapter(EmailAdapter):
         mailbox: str,
         account: Optional[str],
     ) -> Optional[str]:
-        """Load message content from a local .emlx file."""
+        """Load message content from a local .emlx file (through the body cache)."""
         try:
             rowid = int(message_id)
         except (TypeError, ValueError):
@@ -1295,50 +1560,69 @@ class AppleMailAdapter(EmailAdapter):
         if not account_identifier:
             return None
 
-        mailbox_path = self._mailbox_path(account_identifier, mailbox)
-        storage_dir = self._mailbox_storage_dir(mailbox_path) if mailbox_path else None
-
-        # Gmail fallback: if mailbox has no storage dir, try All Mail
-        if not storage_dir:
-            mail_conn = self._get_db_connection()
-            if mail_conn and self._is_gmail_account(mail_conn, account_identifier):
-                mail_conn.close()
-                fallback_path = self._mailbox_path(account_identifier, "[Gmail]/All Mail")
-                if fallback_path:
-                    storage_dir = self._mailbox_storage_dir(fallback_path)
-            elif mail_conn:
-                mail_conn.close()
-
+        storage_dir = self._resolve_storage_dir(account_identifier, mailbox)
         if not storage_dir:
             return None
 
-        candidates = self._emlx_candidates(storage_dir, rowid)
-        emlx_path = next((p for p in candidates if p.exists()), None)
+        emlx_path, mtime_ns = self._find_emlx(storage_dir, rowid)
         if not emlx_path:
             return None
 
-        raw = emlx_path.read_bytes()
-        size_line, _, payload = raw.partition(b"\n")
-        # emlx format: first line is message size (may have trailing spaces)
-        if size_line.strip().isdigit():
-            raw_message = payload
-        else:
-            raw_message = raw
+        cache = get_body_cache()
+        key = (account_identifier, rowid, mtime_ns)
+        content = cache.get(key)
+        if content is None:
+            plain_text, html_text = read_emlx_text_parts(emlx_path)
+            content = self._body_text(plain_text, html_text)
+            cache.put(key, content)
+        return content
+
+    def _find_emlx(self, storage_dir: Path, rowid: int) -> Tuple[Optional[Path], int]:
+        """First existing .emlx for a rowid, with its mtime_ns."""
+        for path in self._emlx_candidates(storage_dir, rowid):
+            try:
+                return path, path.stat().st_mtime_ns
+            except OSError:
+                continue
+        return None, 0
 
-        msg = email.message_from_bytes(raw_message)
-        return self._extract_body(msg)
+    def _resolve_storage_dir(self, account_identifier: str, mailbox: str) -> Optional[Path]:
+        """Storage dir (the folder holding Data/) for a mailbox, memoized."""
+        def resolve() -> Optional[Path]:
+            mailbox_path = self._mailbox_path(account_identifier, mailbox)
+            storage_dir = self._mailbox_storage_dir(mailbox_path) if mailbox_path else None
+
+            # Gmail fallback: if mailbox has no storage dir, try All Mail
+            if not storage_dir:
+                mail_conn = self._get_db_connection()
+                if mail_conn and self._is_gmail_account(mail_conn, account_identifier):
+                    fallback_path = self._mailbox_path(account_identifier, "[Gmail]/All Mail")
+                    if fallback_path:
+                        storage_dir = self._mailbox_storage_dir(fallback_path)
+            return storage_dir
+
+        return self._memo("storage_dir", (account_identifier, mailbox.lower()), resolve)
+
+    def _mail_version_dir(self) -> Optional[Path]:
+        """Latest ~/Library/Mail/V* directory, memoized."""
+        def resolve() -> Optional[Path]:
+            base_dir = Path.home() / "Library" / "Mail"
+            if not base_dir.exists():
+                return None
+
+            versions = [p for p in base_dir.iterdir() if p.is_dir() and p.name.startswith("V") and p.name[1:].isdigit()]
+            if not versions:
+                return None
+            return sorted(versions, key=lambda p: int(p.name[1:]))[-1]
+
+        return self._memo("version_dir", None, resolve)
 
     def _mailbox_path(self, account_identifier: str, mailbox: str) -> Optional[Path]:
         """Resolve mailbox name to .mbox folder path."""
-        base_dir = Path.home() / "Library" / "Mail"
-        if not base_dir.exists():
-            return None
-
-        versions = [p for p in base_dir.iterdir() if p.is_dir() and p.name.startswith("V") and p.name[1:].isdigit()]
-        if not versions:
+        latest = self._mail_version_dir()
+        if latest is None:
             return None
 
-        latest = sorted(versions, key=lambda p: int(p.name[1:]))[-1]
         account_root = latest / account_identifier
         if not account_root.exists():
             return None
@@ -1373,126 +1657,22 @@ class AppleMailAdapter(EmailAdapter):
 
         return candidates
 
-    def _extract_body(self, msg: email.message.Message) -> str:
-        """Extract a plain text body from a MIME message.
+    def _body_text(self, plain_text: Optional[str], html_text: Optional[str]) -> str:
+        """Readable body from a message's text parts.
 
         Prefers text/plain. Falls back to HTML converted to readable text.
         """
-        plain_text = None
-        html_text = None
-
-        if msg.is_multipart():
-            for part in msg.walk():
-                content_type = part.get_content_type()
-                content_disposition = str(part.get("Content-Disposition", ""))
-
-                if "attachment" in content_disposition:
-                    continue
-
-                payload = part.get_payload(decode=True)
-                if not payload:
-                    continue
-
-                try:
-                    text = payload.decode(part.get_content_charset() or "utf-8", errors="replace")
-                except Exception:
-                    text = payload.decode("utf-8", errors="replace")
-
-                if content_type == "text/plain" and not plain_text:
-                    plain_text = text
-                elif content_type == "text/html" and not html_text:
-                    html_text = text
-        else:
-            payload = msg.get_payload(decode=True)
-            if payload:
-                try:
-                    text = payload.decode(msg.get_content_charset() or "utf-8", errors="replace")
-                except Exception:
-                    text = payload.decode("utf-8", errors="replace")
-
-                content_type = msg.get_content_type()
-                if content_type == "text/html":
-                    html_text = text
-                else:
-                    plain_text = text
-
         # Prefer plain text
         if plain_text:
-            import html as html_module
             # Some emails have HTML entities even in text/plain parts
-            plain_text = html_module.unescape(plain_text)
-            return self._clean_text(plain_text)
+            return clean_text(html_module.unescape(plain_text))
 
         # Convert HTML to readable text
         if html_text:
-            return self._html_to_text(html_text)
+            return html_to_text(html_text)
 
         return ""
 
-    def _html_to_text(self, html: str) -> str:
-        """Convert HTML to readable plain text."""
-        import html as html_module
-        import re
-
-        text = html
-
-        # Remove style and script blocks entirely
-        text = re.sub(r'<style[^>]*>.*?</style>', '', text, flags=re.DOTALL | re.IGNORECASE)
-        text = re.sub(r'<script[^>]*>.*?</script>', '', text, flags=re.DOTALL | re.IGNORECASE)
-
-        # Convert common block elements to newlines
-        text = re.sub(r'<br\s*/?>', '\n', text, flags=re.IGNORECASE)
-        text = re.sub(r'</?p[^>]*>', '\n', text, flags=re.IGNORECASE)
-        text = re.sub(r'</?div[^>]*>', '\n', text, flags=re.IGNORECASE)
-        text = re.sub(r'</?tr[^>]*>', '\n', text, flags=re.IGNORECASE)
-        text = re.sub(r'</?li[^>]*>', '\n• ', text, flags=re.IGNORECASE)
-        text = re.sub(r'</?h[1-6][^>]*>', '\n', text, flags=re.IGNORECASE)
-
-        # Extract link URLs inline: <a href="url">text</a> -> text (url)
-        text = re.sub(r'<a[^>]+href=["\']([^"\']+)["\'][^>]*>([^<]*)</a>', r'\2 (\1)', text, flags=re.IGNORECASE)
-
-        # Remove all remaining HTML tags
-        text = re.sub(r'<[^>]+>', '', text)
-
-        # Decode HTML entities
-        text = html_module.unescape(text)
-
-        # Clean up whitespace
-        text = self._clean_text(text)
-
-        return text
-
-    def _clean_text(self, text: str) -> str:
-        """Clean up text whitespace."""
-        import re
-
-        # Remove invisible Unicode characters (zero-width joiners, BOM, figure spaces, etc.)
-        # These come from HTML entities like &#847; &zwnj; that decode to invisible chars
-        text = re.sub(r'[\u200b-\u200f\u2028-\u202f\u00ad\ufeff\u034f\u2000-\u200a\u2060-\u206f\u061c\u180e\u2800\u3000\u3164\uffa0]', '', text)
-
-        # Normalize line endings
-        text = text.replace('\r\n', '\n').replace('\r', '\n')
-
-        # Replace multiple spaces/tabs with single space (but preserve newlines)
-        text = re.sub(r'[^\S\n]+', ' ', text)
-
-        # Remove leading/trailing whitespace from each line
-        lines = [line.strip() for line in text.split('\n')]
-
-        # Collapse multiple blank lines into max 2
-        result = []
-        blank_count = 0
-        for line in lines:
-            if not line:
-                blank_count += 1
-                if blank_count <= 2:
-                    result.append('')
-            else:
-                blank_count = 0
-                result.append(line)
-
-        return '\n'.join(result).strip()
-
     def _account_matches_filter(
         self,
         account_filter: str,
@@ -1652,8 +1832,6 @@ class AppleMailAdapter(EmailAdapter):
         except Exception as e:
             logger.warning(f"Failed to look up message info for ROWID {rowid}: {e}")
             return None
-        finally:
-            conn.close()
 
     def _get_applescript_account_name(self, account_identifier: Optional[str]) -> Optional[str]:
         """Get the Mail.app account name for AppleScript commands."""
@@ -1855,7 +2033,6 @@ end tell'''
             conn = self._get_db_connection()
             if conn:
                 is_gmail = self._is_gmail_account(conn, account_identifier)
-                conn.close()
 
         archive_mailbox = 'All Mail' if is_gmail else 'Archive'
 
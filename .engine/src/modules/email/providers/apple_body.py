@@ -0,0 +1,345 @@
+"""Message body extraction and caching for Mail.app .emlx files.
+
+Reading a body used to mean loading the whole .emlx, building a full
+email.message tree (decoding every attachment on the way) and running the
+HTML-to-text passes - again for every request, though the classifier, the
+/messages/{id} route and draft generation all fetch the same bodies.
+
+extract_text_parts walks the MIME structure in place over an mmap of the
+file: only the text parts it keeps are decoded, attachments are skipped
+unread, and the walk stops at the first text/plain part.
+
+BodyCache keeps the finished text, keyed on (account, rowid, .emlx
+mtime), in two tiers: an in-memory LRU bounded by bytes, and zlib-
+compressed files under settings.mail_body_cache_dir that survive
+restarts. A changed mtime (Mail.app finished downloading a partial, or
+rewrote the file) makes the old entry a miss.
+"""
+
+from __future__ import annotations
+
+import email
+import hashlib
+import logging
+import mmap
+import re
+import struct
+import sys
+import threading
+import zlib
+from collections import OrderedDict
+from email.message import Message
+from email.parser import BytesHeaderParser
+from pathlib import Path
+from typing import Dict, Iterator, Optional, Tuple
+
+from core.config import settings
+
+logger = logging.getLogger(__name__)
+
+MAX_MEMORY_BYTES = 32 * 1024 * 1024
+MAX_DISK_BYTES = 256 * 1024 * 1024
+# Pruning the disk tier goes down to this fraction of MAX_DISK_BYTES
+DISK_PRUNE_TARGET = 0.75
+MAX_MIME_DEPTH = 12
+
+# Bump when extraction or HTML conversion output changes; older entries become misses
+CACHE_FORMAT = 2
+
+_HEADER_END = re.compile(rb"\r?\n\r?\n")
+_STAMP = struct.Struct(">Hq")  # (CACHE_FORMAT, mtime_ns)
+
+BodyKey = Tuple[str, int, int]  # (account identifier, rowid, mtime_ns)
+
+
+# =============================================================================
+# PARSING
+# =============================================================================
+
+
+class _TextParts:
+    __slots__ = ("plain", "html")
+
+    def __init__(self):
+        self.plain: Optional[str] = None
+        self.html: Optional[str] = None
+
+
+def read_emlx_text_parts(path: Path) -> Tuple[Optional[str], Optional[str]]:
+    """(text/plain, text/html) bodies of an .emlx file; either may be None.
+
+    An .emlx is a byte-count line, the RFC 822 message, then an Apple
+    plist; only the message bytes are parsed.
+    """
+    with open(path, "rb") as f:
+        try:
+            buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # empty file
+            return None, None
+    with buf:
+        start, end = 0, len(buf)
+        line_end = buf.find(b"\n")
+        size_line = buf[:line_end].strip() if line_end >= 0 else b""
+        if size_line.isdigit():
+            start = line_end + 1
+            end = min(end, start + int(size_line))
+        return extract_text_parts(buf, start, end)
+
+
+def extract_text_parts(buf, start: int = 0, end: Optional[int] = None) -> Tuple[Optional[str], Optional[str]]:
+    """First text/plain and first text/html bodies of the message in buf[start:end].
+
+    buf may be bytes or an mmap. Parts with an attachment disposition are
+    skipped, as is everything after the first text/plain part. A
+    single-part message that is not HTML counts as plain text.
+    """
+    found = _TextParts()
+    _walk(buf, start, len(buf) if end is None else end, found, top=True, depth=0)
+    return found.plain, found.html
+
+
+def _walk(buf, start: int, end: int, found: _TextParts, top: bool, depth: int) -> None:
+    if depth > MAX_MIME_DEPTH:
+        return
+    headers, body_start = _parse_headers(buf, start, end)
+    content_type = headers.get_content_type()
+
+    if headers.get_content_maintype() == "multipart":
+        boundary = headers.get_boundary()
+        if not boundary:
+            return
+        for part_start, part_end in _subparts(buf, body_start, end, boundary.encode("ascii", "surrogateescape")):
+            _walk(buf, part_start, part_end, found, top=False, depth=depth + 1)
+            if found.plain is not None:
+                return
+        return
+
+    if content_type == "message/rfc822":
+        _walk(buf, body_start, end, found, top=False, depth=depth + 1)
+        return
+
+    if not top and "attachment" in str(headers.get("Content-Disposition", "")):
+        return
+
+    if content_type == "text/html":
+        if found.html is None:
+            found.html = _decode_leaf(buf[start:end])
+    elif content_type == "text/plain" or top:
+        found.plain = _decode_leaf(buf[start:end])
+
+
+def _parse_headers(buf, start: int, end: int) -> Tuple[Message, int]:
+    """Parse the header block at start. Returns (headers, body offset)."""
+    if buf[start:start + 1] == b"\n":
+        return Message(), start + 1
+    if buf[start:start + 2] == b"\r\n":
+        return Message(), start + 2
+    match = _HEADER_END.search(buf, start, end)
+    header_end, body_start = (match.start(), match.end()) if match else (end, end)
+    return BytesHeaderParser().parsebytes(buf[start:header_end]), body_start
+
+
+def _subparts(buf, start: int, end: int, boundary: bytes) -> Iterator[Tuple[int, int]]:
+    """Yield (start, end) of each body part between multipart boundaries."""
+    delimiter = b"--" + boundary
+    if buf[start:start + len(delimiter)] == delimiter:
+        pos = start
+    else:
+        pos = buf.find(b"\n" + delimiter, start, end)
+        if pos < 0:
+            return
+        pos += 1
+
+    while True:
+        after = pos + len(delimiter)
+        if buf[after:after + 2] == b"--":
+            return  # close delimiter
+        line_end = buf.find(b"\n", after, end)
+        if line_end < 0:
+            return
+        part_start = line_end + 1
+        nxt = buf.find(b"\n" + delimiter, line_end, end)
+        if nxt < 0:
+            yield part_start, end
+            return
+        # The line break before a delimiter belongs to the delimiter
+        part_end = nxt - 1 if buf[nxt - 1:nxt] == b"\r" else nxt
+        yield part_start, max(part_start, part_end)
+        pos = nxt + 1
+
+
+def _decode_leaf(raw: bytes) -> Optional[str]:
+    """Decode one leaf part (headers + body) to text, None if empty."""
+    part = email.message_from_bytes(raw)
+    payload = part.get_payload(decode=True)
+    if not payload:
+        return None
+    try:
+        return payload.decode(part.get_content_charset() or "utf-8", errors="replace")
+    except LookupError:
+        return payload.decode("utf-8", errors="replace")
+
+
+# =============================================================================
+# CACHE
+# =============================================================================
+
+
+class BodyCache:
+    """Two-tier cache of extracted message bodies."""
+
+    def __init__(
+        self,
+        cache_dir: Optional[Path],
+        max_memory_bytes: int = MAX_MEMORY_BYTES,
+        max_disk_bytes: int = MAX_DISK_BYTES,
+    ):
+        self.cache_dir = cache_dir
+        self.max_memory_bytes = max_memory_bytes
+        self.max_disk_bytes = max_disk_bytes
+        self._lock = threading.Lock()
+        # (account, rowid) -> (mtime_ns, text), least recently used first
+        self._memory: "OrderedDict[Tuple[str, int], Tuple[int, str]]" = OrderedDict()
+        self._memory_bytes = 0
+        self._disk_bytes: Optional[int] = None
+        self.stats: Dict[str, int] = {"memory_hits": 0, "disk_hits": 0, "misses": 0, "evictions": 0}
+
+    def get(self, key: BodyKey) -> Optional[str]:
+        account, rowid, mtime_ns = key
+        with self._lock:
+            entry = self._memory.get((account, rowid))
+            if entry is not None and entry[0] == mtime_ns:
+                self._memory.move_to_end((account, rowid))
+                self.stats["memory_hits"] += 1
+                return entry[1]
+
+        text = self._read_disk(key)
+        if text is None:
+            with self._lock:
+                self.stats["misses"] += 1
+            return None
+        with self._lock:
+            self.stats["disk_hits"] += 1
+        self._remember(key, text)
+        return text
+
+    def put(self, key: BodyKey, text: str) -> None:
+        self._remember(key, text)
+        self._write_disk(key, text)
+
+    def clear_memory(self) -> None:
+        with self._lock:
+            self._memory.clear()
+            self._memory_bytes = 0
+
+    @property
+    def memory_bytes(self) -> int:
+        return self._memory_bytes
+
+    # --- memory tier ---
+
+    def _remember(self, key: BodyKey, text: str) -> None:
+        account, rowid, mtime_ns = key
+        size = sys.getsizeof(text)
+        if size > self.max_memory_bytes:
+            return
+        with self._lock:
+            old = self._memory.pop((account, rowid), None)
+            if old is not None:
+                self._memory_bytes -= sys.getsizeof(old[1])
+            self._memory[(account, rowid)] = (mtime_ns, text)
+            self._memory_bytes += size
+            while self._memory_bytes > self.max_memory_bytes:
+                _, (_, evicted) = self._memory.popitem(last=False)
+                self._memory_bytes -= sys.getsizeof(evicted)
+                self.stats["evictions"] += 1
+
+    # --- disk tier ---
+
+    def _path(self, account: str, rowid: int) -> Path:
+        digest = hashlib.blake2b(account.encode(), digest_size=6).hexdigest()
+        return self.cache_dir / digest / f"{rowid}.z"
+
+    def _read_disk(self, key: BodyKey) -> Optional[str]:
+        if self.cache_dir is None:
+            return None
+        account, rowid, mtime_ns = key
+        try:
+            data = self._path(account, rowid).read_bytes()
+        except OSError:
+            return None
+        if len(data) < _STAMP.size or _STAMP.unpack_from(data) != (CACHE_FORMAT, mtime_ns):
+            return None  # stale; the next put overwrites it
+        try:
+            return zlib.decompress(data[_STAMP.size:]).decode("utf-8")
+        except (zlib.error, UnicodeDecodeError):
+            return None
+
+    def _write_disk(self, key: BodyKey, text: str) -> None:
+        if self.cache_dir is None:
+            return
+        account, rowid, mtime_ns = key
+        path = self._path(account, rowid)
+        data = _STAMP.pack(CACHE_FORMAT, mtime_ns) + zlib.compress(text.encode("utf-8"), 6)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_suffix(f".{threading.get_ident()}.tmp")
+            tmp.write_bytes(data)
+            tmp.replace(path)
+        except OSError as e:
+            logger.warning(f"Could not write mail body cache entry {path.name}: {e}")
+            return
+
+        with self._lock:
+            if self._disk_bytes is None:
+                self._disk_bytes = self._scan_disk_bytes()
+            else:
+                self._disk_bytes += len(data)
+            over = self._disk_bytes > self.max_disk_bytes
+        if over:
+            self._prune_disk()
+
+    def _scan_disk_bytes(self) -> int:
+        return sum(p.stat().st_size for p in self.cache_dir.glob("*/*.z"))
+
+    def _prune_disk(self) -> None:
+        """Delete the oldest-written entries until under DISK_PRUNE_TARGET."""
+        entries = []
+        for path in self.cache_dir.glob("*/*.z"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        entries.sort()
+        total = sum(size for _, size, _ in entries)
+        target = self.max_disk_bytes * DISK_PRUNE_TARGET
+        for _, size, path in entries:
+            if total <= target:
+                break
+            try:
+                path.unlink()
+                total -= size
+            except OSError:
+                pass
+        with self._lock:
+            self._disk_bytes = total
+
+
+# =============================================================================
+# REGISTRY
+# =============================================================================
+
+_CACHES: Dict[Optional[Path], BodyCache] = {}
+_CACHES_LOCK = threading.Lock()
+
+
+def get_body_cache(cache_dir: Optional[Path] = None) -> BodyCache:
+    """Shared BodyCache for a directory (default settings.mail_body_cache_dir)."""
+    cache_dir = cache_dir or settings.mail_body_cache_dir
+    with _CACHES_LOCK:
+        cache = _CACHES.get(cache_dir)
+        if cache is None:
+            cache = BodyCache(cache_dir)
+            _CACHES[cache_dir] = cache
+        return cache
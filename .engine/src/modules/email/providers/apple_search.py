@@ -0,0 +1,315 @@
+"""Full-text shadow index over Mail.app's Envelope Index.
+
+Mail.app's database has no text index, so a LIKE '%q%' search over
+subject/sender/summary scans every message. This module keeps a local FTS5
+copy of those envelope fields in our own database and answers searches
+with ranked rowid lists; AppleMailAdapter then hydrates just those rows
+from the Envelope Index.
+
+Sync is incremental (core.watermark_sync): Mail.app's messages.ROWID only
+grows, so we remember the highest ROWID indexed (the watermark) and copy
+rows past it whenever the Envelope Index (or its WAL) changes on disk. Deleted flags and mailbox
+moves are not tracked here - hydration re-checks both against Mail.app.
+
+Query syntax (parse_query):
+- bare words match as prefixes:     invoice acme
+- quoted text matches as a phrase:  "quarterly report"
+- filters:                          from:jane@acme.com  domain:acme.com  thread:1234
+- column terms:                     from:jane  subject:interview
+"""
+
+from __future__ import annotations
+
+import logging
+import re
+import sqlite3
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, List, Optional, Sequence, Tuple
+
+from core.watermark_sync import WatermarkMirror
+
+logger = logging.getLogger(__name__)
+
+SYNC_BATCH_SIZE = 5000
+
+# bm25 column weights: subject, sender, summary
+_BM25_WEIGHTS = (10.0, 5.0, 1.0)
+
+SCHEMA_SQL = """
+CREATE TABLE IF NOT EXISTS mail_search_state (
+    id INTEGER PRIMARY KEY CHECK (id = 1),
+    source TEXT NOT NULL,              -- Envelope Index path the index mirrors
+    watermark INTEGER NOT NULL,        -- highest Mail.app messages.ROWID indexed
+    synced_at TEXT
+);
+
+CREATE TABLE IF NOT EXISTS mail_search_docs (
+    rowid INTEGER PRIMARY KEY,         -- Mail.app messages.ROWID
+    mailbox INTEGER,
+    date_received INTEGER,
+    sender TEXT,                       -- lowercased address
+    sender_rdomain TEXT,               -- reversed domain labels: com.acme.mail
+    thread_id INTEGER                  -- Mail.app conversation_id
+);
+
+CREATE INDEX IF NOT EXISTS idx_mail_search_docs_sender
+ON mail_search_docs(sender, date_received DESC);
+
+CREATE INDEX IF NOT EXISTS idx_mail_search_docs_domain
+ON mail_search_docs(sender_rdomain, date_received DESC);
+
+CREATE INDEX IF NOT EXISTS idx_mail_search_docs_thread
+ON mail_search_docs(thread_id, date_received DESC);
+
+CREATE INDEX IF NOT EXISTS idx_mail_search_docs_mailbox
+ON mail_search_docs(mailbox, date_received DESC);
+
+CREATE VIRTUAL TABLE IF NOT EXISTS mail_search_fts USING fts5(
+    subject, sender, summary,
+    tokenize = 'unicode61 remove_diacritics 2',
+    prefix = '2 3'
+);
+"""
+
+_FILTER_RE = re.compile(r'(from|sender|subject|domain|thread):("[^"]*"|\S+)', re.IGNORECASE)
+_PHRASE_RE = re.compile(r'"([^"]*)"')
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+
+@dataclass
+class SearchQuery:
+    """A parsed search: FTS5 match expression plus structured filters."""
+    match: str = ""
+    sender: Optional[str] = None
+    domain: Optional[str] = None
+    thread_id: Optional[int] = None
+    terms: List[str] = field(default_factory=list)
+
+
+def _phrase(text: str, prefix: bool) -> Optional[str]:
+    tokens = _TOKEN_RE.findall(text.lower())
+    if not tokens:
+        return None
+    return f'"{" ".join(tokens)}"' + ("*" if prefix else "")
+
+
+def parse_query(text: str) -> SearchQuery:
+    """Turn user search text into an FTS5 expression and filters.
+
+    Each bare word becomes a prefix phrase of its tokens, so an address like
+    jane@acme.com matches the token run "jane acme com". Terms are ANDed.
+    """
+    parsed = SearchQuery()
+    text = text or ""
+    terms: List[str] = []
+
+    def take_filter(m: re.Match) -> str:
+        key, value = m.group(1).lower(), m.group(2).strip('"').strip().lower()
+        if key in ("from", "sender") and "@" in value:
+            parsed.sender = value
+        elif key in ("from", "sender", "subject"):
+            # Not an address: match the words within that column only
+            term = _phrase(value, prefix=True)
+            if term:
+                terms.append(f"{'subject' if key == 'subject' else 'sender'} : {term}")
+        elif key == "domain":
+            parsed.domain = value.lstrip("@")
+        elif value.isdigit():
+            parsed.thread_id = int(value)
+        return " "
+
+    text = _FILTER_RE.sub(take_filter, text)
+
+    for phrase in _PHRASE_RE.findall(text):
+        term = _phrase(phrase, prefix=False)
+        if term:
+            terms.append(term)
+    for word in _PHRASE_RE.sub(" ", text).split():
+        term = _phrase(word, prefix=True)
+        if term:
+            terms.append(term)
+
+    parsed.terms = terms
+    parsed.match = " AND ".join(terms)
+    return parsed
+
+
+def reverse_domain(domain: str) -> str:
+    """mail.acme.com -> com.acme.mail, so subdomains share a sortable prefix."""
+    return ".".join(reversed(domain.strip(".").split(".")))
+
+
+def _sender_rdomain(address: str) -> Optional[str]:
+    if "@" not in address:
+        return None
+    return reverse_domain(address.rsplit("@", 1)[1]) or None
+
+
+class MailSearchIndex(WatermarkMirror):
+    """FTS5 mirror of Envelope Index subjects, senders and summaries."""
+
+    SCHEMA_SQL = SCHEMA_SQL
+    STATE_TABLE = "mail_search_state"
+    DATA_TABLES = ("mail_search_docs", "mail_search_fts")
+    LABEL = "mail-search"
+
+    def __init__(self, source_path: str | Path, db_path: Optional[Path] = None):
+        super().__init__(source_path, db_path)
+        self._thread_column: Optional[bool] = None
+        self.stats = {"syncs": 0, "rows_indexed": 0, "searches": 0}
+
+    # =========================================================================
+    # SYNC
+    # =========================================================================
+
+    def _has_thread_column(self, src: sqlite3.Connection) -> bool:
+        if self._thread_column is None:
+            columns = {row[1] for row in src.execute("PRAGMA table_info(messages)")}
+            self._thread_column = "conversation_id" in columns
+        return self._thread_column
+
+    def sync(self, batch_size: int = SYNC_BATCH_SIZE) -> int:
+        """Copy messages past the watermark into the index. Returns rows added."""
+        with self._lock:
+            self._ensure_schema()
+            src = sqlite3.connect(f"file:{self.source_path}?mode=ro", uri=True)
+            try:
+                thread_expr = "m.conversation_id" if self._has_thread_column(src) else "NULL"
+                query = f"""
+                    SELECT m.ROWID as rowid,
+                           m.mailbox,
+                           m.date_received,
+                           {thread_expr} as thread_id,
+                           subj.subject,
+                           summ.summary,
+                           addr.address,
+                           addr.comment
+                    FROM messages m
+                    LEFT JOIN subjects subj ON subj.ROWID = m.subject
+                    LEFT JOIN summaries summ ON summ.ROWID = m.summary
+                    LEFT JOIN addresses addr ON addr.ROWID = m.sender
+                    WHERE m.ROWID > ?
+                    ORDER BY m.ROWID
+                    LIMIT ?
+                """
+                watermark = self.watermark
+                added = 0
+                while True:
+                    rows = src.execute(query, (watermark, batch_size)).fetchall()
+                    if not rows:
+                        break
+                    watermark = self._index_batch(rows)
+                    added += len(rows)
+                    if len(rows) < batch_size:
+                        break
+            finally:
+                src.close()
+
+            self.stats["syncs"] += 1
+            self.stats["rows_indexed"] += added
+            if added:
+                logger.debug(f"Mail search index: +{added} messages (watermark {watermark})")
+            return added
+
+    def _index_batch(self, rows: Sequence[Tuple[Any, ...]]) -> int:
+        docs = []
+        texts = []
+        for rowid, mailbox, date_received, thread_id, subject, summary, address, comment in rows:
+            address = (address or "").lower()
+            docs.append((rowid, mailbox, date_received, address, _sender_rdomain(address), thread_id))
+            sender_text = f"{comment} {address}" if comment else address
+            texts.append((rowid, subject or "", sender_text, summary or ""))
+
+        watermark = rows[-1][0]
+        with self._pool.write_transaction() as cur:
+            cur.executemany(
+                "INSERT OR REPLACE INTO mail_search_docs "
+                "(rowid, mailbox, date_received, sender, sender_rdomain, thread_id) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                docs,
+            )
+            cur.executemany(
+                "INSERT OR REPLACE INTO mail_search_fts (rowid, subject, sender, summary) "
+                "VALUES (?, ?, ?, ?)",
+                texts,
+            )
+            self._set_watermark(cur, watermark)
+        return watermark
+
+    # =========================================================================
+    # SEARCH
+    # =========================================================================
+
+    def search(
+        self,
+        query: SearchQuery,
+        mailbox_ids: Optional[Sequence[int]] = None,
+        limit: int = 20,
+        offset: int = 0,
+    ) -> List[int]:
+        """Ranked Mail.app ROWIDs matching query, best first.
+
+        Text matches are ordered by bm25 (subject > sender > summary), then
+        recency; filter-only queries are ordered by recency.
+        """
+        self._ensure_schema()
+        self.stats["searches"] += 1
+
+        where: List[str] = []
+        params: List[Any] = []
+        if query.match:
+            where.append("mail_search_fts MATCH ?")
+            params.append(query.match)
+        if query.sender:
+            where.append("d.sender = ?")
+            params.append(query.sender)
+        if query.domain:
+            # Subdomains count: domain:acme.com matches mail.acme.com ('/' sorts right after '.')
+            rdomain = reverse_domain(query.domain)
+            where.append("(d.sender_rdomain = ? OR (d.sender_rdomain > ? AND d.sender_rdomain < ?))")
+            params.extend([rdomain, rdomain + ".", rdomain + "/"])
+        if query.thread_id is not None:
+            where.append("d.thread_id = ?")
+            params.append(query.thread_id)
+        if mailbox_ids is not None:
+            if not mailbox_ids:
+                return []
+            # With a sender/domain/thread filter, unary + keeps the planner on that index
+            column = "+d.mailbox" if where and not query.match else "d.mailbox"
+            where.append(f"{column} IN ({', '.join('?' * len(mailbox_ids))})")
+            params.extend(mailbox_ids)
+
+        where_sql = ("WHERE " + " AND ".join(where)) if where else ""
+        if query.match:
+            weights = ", ".join(str(w) for w in _BM25_WEIGHTS)
+            sql = f"""
+                SELECT d.rowid
+                FROM mail_search_fts
+                JOIN mail_search_docs d ON d.rowid = mail_search_fts.rowid
+                {where_sql}
+                ORDER BY bm25(mail_search_fts, {weights}), d.date_received DESC
+                LIMIT ? OFFSET ?
+            """
+        else:
+            sql = f"""
+                SELECT d.rowid
+                FROM mail_search_docs d
+                {where_sql}
+                ORDER BY d.date_received DESC
+                LIMIT ? OFFSET ?
+            """
+        params.extend([limit, offset])
+
+        try:
+            rows = self._pool.reader().execute(sql, params).fetchall()
+        except sqlite3.OperationalError as e:
+            # Malformed MATCH expressions shouldn't take search down
+            logger.debug(f"Mail search query failed ({query.match!r}): {e}")
+            return []
+        return [row[0] for row in rows]
+
+
+def get_search_index(source_path: str | Path, db_path: Optional[Path] = None) -> MailSearchIndex:
+    """Shared MailSearchIndex for an Envelope Index / system DB pair."""
+    return MailSearchIndex.shared(source_path, db_path)
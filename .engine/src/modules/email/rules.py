@@ -0,0 +1,95 @@
+"""Sender-rule index for the email classification pipeline.
+
+Rules match a sender address exactly or a domain, where a domain rule
+also covers its subdomains (a rule on acme.com matches mail.acme.com).
+SenderRuleIndex keeps exact senders in a dict and domains in a trie keyed
+by reversed labels (com -> acme -> mail), so a lookup costs one dict probe
+plus one step per label of the sender's domain, however many rules exist.
+
+Every write to email_sender_rules (API, MCP tool, reclassify) calls
+bump_rules_version in the same transaction. Holders of an index compare
+that counter with the one they built from and rebuild only when it moved.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+from typing import Any, Dict, Iterable, List, Optional
+
+_RULE_TYPE_ORDER = {"always": 0, "never": 1, "suggest": 2}
+
+RULE_COLUMNS = "id, match_type, match_value, rule_type, category, instructions, extract_content"
+
+
+def bump_rules_version(conn: sqlite3.Connection) -> None:
+    """Record that email_sender_rules changed (call before committing the write)."""
+    conn.execute(
+        """INSERT INTO email_rules_version (id, version) VALUES (1, 1)
+           ON CONFLICT(id) DO UPDATE SET version = version + 1"""
+    )
+
+
+def get_rules_version(conn: sqlite3.Connection) -> int:
+    row = conn.execute("SELECT version FROM email_rules_version WHERE id = 1").fetchone()
+    return row[0] if row else 0
+
+
+class _DomainNode:
+    __slots__ = ("children", "rules")
+
+    def __init__(self):
+        self.children: Dict[str, _DomainNode] = {}
+        self.rules: List[Dict[str, Any]] = []
+
+
+class SenderRuleIndex:
+    """Immutable lookup structure over the enabled sender rules."""
+
+    def __init__(self, rules: Iterable[Dict[str, Any]], version: int = 0):
+        self.version = version
+        self._senders: Dict[str, List[Dict[str, Any]]] = {}
+        self._domains = _DomainNode()
+        self.size = 0
+
+        for rule in sorted(rules, key=lambda r: _RULE_TYPE_ORDER.get(r["rule_type"], 3)):
+            value = (rule["match_value"] or "").strip().lower()
+            if not value:
+                continue
+            if rule["match_type"] == "sender":
+                self._senders.setdefault(value, []).append(rule)
+            elif rule["match_type"] == "domain":
+                node = self._domains
+                for label in reversed(value.lstrip("@").split(".")):
+                    node = node.children.setdefault(label, _DomainNode())
+                node.rules.append(rule)
+            else:
+                continue
+            self.size += 1
+
+    @classmethod
+    def load(cls, conn: sqlite3.Connection) -> "SenderRuleIndex":
+        """Build from the enabled rules, tagged with the current rules version."""
+        version = get_rules_version(conn)
+        rows = conn.execute(f"SELECT {RULE_COLUMNS} FROM email_sender_rules WHERE enabled = 1").fetchall()
+        return cls((dict(row) for row in rows), version)
+
+    def match(self, sender_email: str) -> List[Dict[str, Any]]:
+        """Rules for an address: sender rules first, then domain rules from
+        the most specific domain up; within each, always > never > suggest."""
+        sender_email = sender_email.strip().lower()
+        matched = list(self._senders.get(sender_email, ()))
+
+        _, at, domain = sender_email.rpartition("@")
+        if not at or not domain:
+            return matched
+        levels: List[List[Dict[str, Any]]] = []
+        node: Optional[_DomainNode] = self._domains
+        for label in reversed(domain.split(".")):
+            node = node.children.get(label)
+            if node is None:
+                break
+            if node.rules:
+                levels.append(node.rules)
+        for rules in reversed(levels):
+            matched.extend(rules)
+        return matched
@@ -13,7 +13,7 @@ from __future__ import annotations
 import json
 import logging
 import sys
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from .models import DraftMessage, EmailMessage, Mailbox
 from .providers.apple import AppleMailAdapter
@@ -64,9 +64,11 @@ class EmailService:
                 WHERE is_enabled = 1
             """)
 
-            self._accounts_cache.clear()
-            self._email_to_id.clear()
-            self._name_to_id.clear()
+            # Build fresh maps and swap them in, so concurrent readers never
+            # see a half-loaded cache
+            accounts_cache: Dict[str, Dict[str, Any]] = {}
+            email_to_id: Dict[str, str] = {}
+            name_to_id: Dict[str, str] = {}
 
             for row_obj in rows:
                 account = dict(row_obj)
@@ -78,19 +80,27 @@ class EmailService:
                 else:
                     account["config_json"] = {}
 
-                self._accounts_cache[account_id] = account
+                accounts_cache[account_id] = account
 
                 if account.get("primary_email"):
-                    self._email_to_id[account["primary_email"].lower()] = account_id
+                    email_to_id[account["primary_email"].lower()] = account_id
 
                 if account.get("display_name"):
-                    self._name_to_id[account["display_name"].lower()] = account_id
+                    name_to_id[account["display_name"].lower()] = account_id
 
-            logger.info("Loaded %s email accounts", len(self._accounts_cache))
+            self._accounts_cache = accounts_cache
+            self._email_to_id = email_to_id
+            self._name_to_id = name_to_id
+            logger.debug("Loaded %s email accounts", len(self._accounts_cache))
 
         except Exception as e:
             logger.warning("Failed to load email accounts: %s", e)
 
+    def reload_accounts(self) -> None:
+        """Re-read the accounts table (long-lived services call this periodically)."""
+        if self._storage:
+            self._load_accounts()
+
     def resolve_account(self, identifier: Optional[str]) -> Optional[Dict[str, Any]]:
         if not identifier:
             return None
@@ -221,6 +231,44 @@ class EmailService:
         from dataclasses import replace
         return [replace(msg, account=account.get("id")) for msg in messages]
 
+    def get_messages_since(
+        self,
+        mailbox_name: str,
+        account_identifier: str,
+        since_ts: int,
+        since_rowid: int,
+        limit: int = 200,
+    ) -> Tuple[List[EmailMessage], int, int]:
+        """Messages after a (date_received, rowid) cursor, oldest first, plus the advanced cursor."""
+        account = self._resolve_read_account(account_identifier)
+        if not account or not self._apple_adapter:
+            return [], since_ts, since_rowid
+
+        account_id = self._apple_read_identifier(account)
+        messages, last_ts, last_rowid = self._apple_adapter.get_messages_since(
+            mailbox=mailbox_name,
+            account=account_id,
+            since_ts=since_ts,
+            since_rowid=since_rowid,
+            limit=limit,
+        )
+
+        from dataclasses import replace
+        return [replace(msg, account=account.get("id")) for msg in messages], last_ts, last_rowid
+
+    def get_latest_cursor(
+        self,
+        mailbox_name: str,
+        account_identifier: str,
+    ) -> Optional[Tuple[int, int]]:
+        """(date_received, rowid) of the newest message in a mailbox, None if unreadable."""
+        account = self._resolve_read_account(account_identifier)
+        if not account or not self._apple_adapter:
+            return None
+
+        account_id = self._apple_read_identifier(account)
+        return self._apple_adapter.get_latest_cursor(mailbox_name, account_id)
+
     def get_message(
         self,
         message_id: str,
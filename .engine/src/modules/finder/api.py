@@ -664,20 +664,35 @@ async def file_events_stream(request: Request):
 
     Pushes events when Desktop/ files are created, modified, or deleted.
     Event types: created, modified, deleted, moved
+
+    Honors Last-Event-ID: a reconnecting client gets only the changes it
+    missed, or a "resync" event if they've aged out of the replay log.
     """
+    last_event_id = request.headers.get("last-event-id") or request.query_params.get("last_event_id")
+
     async def event_generator():
-        queue = event_bus.subscribe()
+        # Subscribe and snapshot the replay log with no await in between
+        queue = event_bus.subscribe(patterns=["file.*"])
+        missed = event_bus.replay(last_event_id, ["file.*"])
         try:
-            while True:
+            if missed is None:
+                yield {
+                    "event": "resync",
+                    "data": json.dumps({"timestamp": datetime.now(timezone.utc).isoformat()})
+                }
+                missed = []
+            for event in missed:
+                yield {"id": event.id, "event": event.event_type[5:], "data": json.dumps(event.data)}
+
+            while not queue.closed:
                 if await request.is_disconnected():
                     break
 
                 try:
                     event = await asyncio.wait_for(queue.get(), timeout=30.0)
-                    # Only forward file events; strip "file." prefix for frontend
-                    if not event.event_type.startswith("file."):
-                        continue
+                    # Strip "file." prefix for frontend
                     yield {
+                        "id": event.id,
                         "event": event.event_type[5:],  # "file.created" → "created"
                         "data": json.dumps(event.data)   # flat {path, mtime} not wrapped
                     }
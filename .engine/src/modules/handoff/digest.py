@@ -0,0 +1,198 @@
+"""
+Handoff digest - a session's transcript parsed before it resets, not during.
+
+Once a session passes settings.handoff_prepare_percent context, the context
+monitor checkpoints its transcript every tick: only lines appended since the
+last checkpoint are parsed (transcript_parser.ParsedTranscript), and the
+parsed items are appended to settings.handoff_digest_dir/{session_id}.jsonl,
+next to a small {session_id}.json header (see HandoffDigest). handoff.py
+runs in its own process, hence the files.
+
+At reset, build_handoff_transcript() loads the digest and parses just the
+tail since the checkpoint. The newest RECENT_CHARS of the session go to the
+summarizer in full; everything before that is condensed. Without a digest
+(or if the transcript was replaced) the whole file is parsed, same output.
+"""
+
+import json
+import logging
+import threading
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+from core.config import settings
+from modules.sessions.transcript import read_appended_lines
+
+from .transcript_parser import ParsedTranscript
+
+logger = logging.getLogger(__name__)
+
+DIGEST_VERSION = 2
+RECENT_CHARS = 60_000  # Newest parsed content the summarizer sees in full
+_COMPACT = (",", ":")
+
+
+class HandoffDigest:
+    """Parsed transcript of one session, up to byte `offset`.
+
+    Saved as two files so a checkpoint costs only what it parsed:
+    {session_id}.jsonl holds the parsed items, one per line, and is only
+    appended to; {session_id}.json is a small header with the transcript
+    offset, the parser state and how many bytes of the items file it covers.
+    Items are appended first and the header replaced after, so a checkpoint
+    interrupted in between leaves lines past items_bytes that load() ignores
+    and the next save() truncates.
+    """
+
+    def __init__(self, session_id: str, path: Path, digest_dir: Optional[Path] = None):
+        self.session_id = session_id
+        self.path = path
+        self.digest_dir = digest_dir or settings.handoff_digest_dir
+        self.offset = 0
+        self.parsed = ParsedTranscript()
+        self._saved_items = 0  # parsed.items already in the items file
+        self._items_bytes = 0  # Bytes of the items file the header covers
+
+    @property
+    def digest_path(self) -> Path:
+        return self.digest_dir / f"{self.session_id}.json"
+
+    @property
+    def items_path(self) -> Path:
+        return self.digest_dir / f"{self.session_id}.jsonl"
+
+    def load(self) -> bool:
+        """Load the saved digest if it is for this transcript. Returns True on success."""
+        try:
+            data = json.loads(self.digest_path.read_text())
+            if data.get("version") != DIGEST_VERSION or data.get("path") != str(self.path):
+                return False
+            items_bytes = data["items_bytes"]
+            with open(self.items_path, "rb") as f:
+                raw = f.read(items_bytes)
+            if len(raw) != items_bytes:
+                return False
+            items = [tuple(json.loads(line)) for line in raw.splitlines()]
+        except (OSError, ValueError, KeyError):
+            return False
+
+        self.offset = data["offset"]
+        self.parsed.items = items
+        self.parsed.skip_next_user = data["skip_next_user"]
+        self.parsed.first_timestamp = data["first_timestamp"]
+        self.parsed.last_timestamp = data["last_timestamp"]
+        self._saved_items = len(items)
+        self._items_bytes = items_bytes
+        return True
+
+    def save(self):
+        """Append items parsed since the last save, then replace the header."""
+        new_items = self.parsed.items[self._saved_items:]
+        appended = "".join(json.dumps(item, separators=_COMPACT) + "\n" for item in new_items).encode()
+        header = {
+            "version": DIGEST_VERSION,
+            "path": str(self.path),
+            "offset": self.offset,
+            "items_bytes": self._items_bytes + len(appended),
+            "skip_next_user": self.parsed.skip_next_user,
+            "first_timestamp": self.parsed.first_timestamp,
+            "last_timestamp": self.parsed.last_timestamp,
+        }
+        try:
+            self.digest_dir.mkdir(parents=True, exist_ok=True)
+            with open(self.items_path, "ab") as f:
+                f.truncate(self._items_bytes)  # Drop lines of a save whose header never landed
+                f.write(appended)
+            tmp = self.digest_path.with_suffix(".tmp")
+            tmp.write_text(json.dumps(header, separators=_COMPACT))
+            tmp.replace(self.digest_path)
+        except OSError as e:
+            logger.warning(f"Could not save handoff digest for {self.session_id}: {e}")
+            return
+        self._saved_items = len(self.parsed.items)
+        self._items_bytes = header["items_bytes"]
+
+    def advance(self) -> int:
+        """Parse complete lines appended since the last checkpoint. Returns lines parsed."""
+        size = self.path.stat().st_size
+        if size < self.offset:
+            # Transcript replaced: start over
+            self.offset = 0
+            self.parsed = ParsedTranscript()
+            self._saved_items = self._items_bytes = 0
+        if size == self.offset:
+            return 0
+
+        lines, self.offset = read_appended_lines(self.path, self.offset)
+        for line in lines:
+            self.parsed.feed(line)
+        return len(lines)
+
+    def transcript(self) -> str:
+        """Formatted transcript for the summarizer."""
+        return self.parsed.format(full_chars=RECENT_CHARS)
+
+
+_digests: Dict[str, HandoffDigest] = {}
+_digests_lock = threading.Lock()
+
+
+def checkpoint_handoff_digest(session_id: str, transcript_path: Path) -> None:
+    """Bring a session's digest up to date with its transcript and save it."""
+    with _digests_lock:
+        digest = _digests.get(session_id)
+        if digest is None or digest.path != transcript_path:
+            digest = HandoffDigest(session_id, transcript_path)
+            digest.load()
+            _digests[session_id] = digest
+
+    try:
+        if digest.advance():
+            digest.save()
+    except OSError as e:
+        logger.warning(f"Handoff digest checkpoint failed for {session_id}: {e}")
+
+
+def build_handoff_transcript(session_id: str, transcript_path: Path) -> str:
+    """Summarizer transcript for a session at reset: digest plus the tail since it."""
+    if not transcript_path.exists():
+        return "(Transcript not found)"
+
+    digest = HandoffDigest(session_id, transcript_path)
+    if digest.load():
+        logger.info(f"Handoff digest for {session_id} covers {digest.offset} bytes")
+    digest.advance()
+    return digest.transcript()
+
+
+def _digest_files(digest_dir: Path, session_id: str) -> List[Path]:
+    """Header, items file and any leftover temp file of a session's digest."""
+    return [digest_dir / f"{session_id}{suffix}" for suffix in (".json", ".jsonl", ".tmp")]
+
+
+def discard_handoff_digest(session_id: str) -> None:
+    """Delete a session's digest (after its handoff is written)."""
+    with _digests_lock:
+        digest = _digests.pop(session_id, None)
+    digest_dir = digest.digest_dir if digest else settings.handoff_digest_dir
+    for path in _digest_files(digest_dir, session_id):
+        path.unlink(missing_ok=True)
+
+
+def prune_handoff_digests(active_session_ids: Iterable[str]) -> int:
+    """Delete digest files (headers, items, temp files) of sessions no longer active.
+
+    Returns files removed.
+    """
+    active = set(active_session_ids)
+    removed = 0
+    with _digests_lock:
+        for session_id in [s for s in _digests if s not in active]:
+            del _digests[session_id]
+    if not settings.handoff_digest_dir.exists():
+        return 0
+    for path in settings.handoff_digest_dir.iterdir():
+        if path.suffix in (".json", ".jsonl", ".tmp") and path.stem not in active:
+            path.unlink(missing_ok=True)
+            removed += 1
+    return removed
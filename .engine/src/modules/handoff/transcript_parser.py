@@ -9,6 +9,7 @@ Features:
 - Merges consecutive Claude messages
 - Shows timestamps for pacing context
 - Preserves interrupts and system warnings
+- Optionally condenses older activity, keeping only the newest in full
 """
 
 import json
@@ -18,6 +19,9 @@ from pathlib import Path
 from typing import List, Dict, Any, Optional
 
 
+CONDENSED_CLAUDE_CHARS = 300  # Condensed items keep this much of each Claude message
+
+
 def parse_transcript(path: Path, skip_first_user: bool = True) -> str:
     """
     Parse transcript JSONL into readable format for summarizer.
@@ -32,59 +36,95 @@ def parse_transcript(path: Path, skip_first_user: bool = True) -> str:
     if not path.exists():
         return "(Transcript not found)"
 
-    raw_items = []  # List of (timestamp, item_type, content)
-    first_user_seen = False
-    first_timestamp = None
-    last_timestamp = None
-
+    parsed = ParsedTranscript(skip_first_user)
     with open(path) as f:
         for line in f:
-            line = line.strip()
-            if not line:
-                continue
+            parsed.feed(line)
 
-            try:
-                event = json.loads(line)
-            except json.JSONDecodeError:
-                continue
-
-            event_type = event.get("type")
-            timestamp = _extract_timestamp(event)
-
-            # Track session duration
-            if timestamp:
-                if first_timestamp is None:
-                    first_timestamp = timestamp
-                last_timestamp = timestamp
-
-            # Skip noise
-            if event_type in ("progress", "file-history-snapshot", "summary"):
-                continue
-
-            if event_type == "user":
-                result = _parse_user_event(event, skip_first_user and not first_user_seen)
-                first_user_seen = True
-                if result:
-                    raw_items.append((timestamp, "user", result))
-
-            elif event_type == "assistant":
-                results = _parse_assistant_event(event)
-                for item in results:
-                    raw_items.append((timestamp, "claude" if item.startswith("Claude:") else "tool", item))
-
-            elif event_type == "system":
-                # System events (e.g., interrupts) - could add if useful
-                pass
+    return parsed.format()
+
+
+class ParsedTranscript:
+    """
+    Transcript items parsed so far. feed() lines as they arrive, format() any time.
+
+    Lets a transcript be parsed incrementally (see modules/handoff/digest.py)
+    with the same result as parse_transcript on the whole file.
+    """
 
-    # Post-process: group consecutive tools, merge Claude messages
-    processed = _post_process(raw_items)
+    def __init__(self, skip_first_user: bool = True):
+        self.items: List[tuple] = []  # List of (timestamp, item_type, content)
+        self.skip_next_user = skip_first_user
+        self.first_timestamp: Optional[str] = None
+        self.last_timestamp: Optional[str] = None
 
-    # Add session header with timing
-    header = _format_session_header(first_timestamp, last_timestamp)
-    if header:
-        processed.insert(0, header)
+    def feed(self, line: str):
+        """Parse one JSONL line."""
+        line = line.strip()
+        if not line:
+            return
 
-    return "\n\n".join(processed)
+        try:
+            event = json.loads(line)
+        except json.JSONDecodeError:
+            return
+
+        event_type = event.get("type")
+        timestamp = _extract_timestamp(event)
+
+        # Track session duration
+        if timestamp:
+            if self.first_timestamp is None:
+                self.first_timestamp = timestamp
+            self.last_timestamp = timestamp
+
+        # Skip noise
+        if event_type in ("progress", "file-history-snapshot", "summary"):
+            return
+
+        if event_type == "user":
+            result = _parse_user_event(event, self.skip_next_user)
+            self.skip_next_user = False
+            if result:
+                self.items.append((timestamp, "user", result))
+
+        elif event_type == "assistant":
+            results = _parse_assistant_event(event)
+            for item in results:
+                self.items.append((timestamp, "claude" if item.startswith("Claude:") else "tool", item))
+
+        elif event_type == "system":
+            # System events (e.g., interrupts) - could add if useful
+            pass
+
+    def format(self, full_chars: Optional[int] = None) -> str:
+        """
+        Format items for the summarizer.
+
+        Args:
+            full_chars: Keep only about this much of the newest content in
+                full; everything before it is condensed (see _condense).
+                None keeps everything in full.
+        """
+        older, recent = [], self.items
+        if full_chars is not None:
+            split = _recent_split(self.items, full_chars)
+            older, recent = self.items[:split], self.items[split:]
+
+        # Post-process: group consecutive tools, merge Claude messages
+        processed = _post_process(recent)
+        if older:
+            processed = (
+                ["=== Earlier (condensed) ==="] + _condense(older)
+                + ["=== Recent (in full) ==="] + processed
+            )
+
+        # Add session header with timing
+        header = _format_session_header(self.first_timestamp, self.last_timestamp)
+        if header:
+            processed.insert(0, header)
+
+        return "\n\n".join(processed)
 
 
 def _format_session_header(first_ts: Optional[str], last_ts: Optional[str]) -> Optional[str]:
@@ -176,6 +216,75 @@ def _post_process(items: List[tuple]) -> List[str]:
     return result
 
 
+def _recent_split(items: List[tuple], full_chars: int) -> int:
+    """Index where the newest full_chars of item content begin."""
+    total = 0
+    for i in range(len(items) - 1, -1, -1):
+        total += len(items[i][2])
+        if total > full_chars:
+            return i + 1
+    return 0
+
+
+def _condense(items: List[tuple]) -> List[str]:
+    """
+    Condensed form of older items for long sessions.
+
+    User messages are kept, Claude messages shortened to
+    CONDENSED_CLAUDE_CHARS, and each run of tool calls collapsed to one
+    line of counts plus the files it edited.
+    """
+    result = []
+    i = 0
+
+    while i < len(items):
+        timestamp, item_type, content = items[i]
+
+        if item_type == "tool":
+            end = i
+            while end < len(items) and items[end][1] == "tool":
+                end += 1
+            result.append(_condense_tools([item[2] for item in items[i:end]]))
+            i = end
+
+        elif item_type == "claude":
+            merged, count = _merge_claude_messages(items, i)
+            if len(merged) > CONDENSED_CLAUDE_CHARS:
+                merged = merged[:CONDENSED_CLAUDE_CHARS].rstrip() + " [...]"
+            result.append(merged)
+            i += count
+
+        else:
+            result.append(content)
+            i += 1
+
+    return result
+
+
+def _condense_tools(calls: List[str]) -> str:
+    """Collapse a run of tool calls: [12 tool calls: Read x5, Edit x3 - edited stop.py]"""
+    if len(calls) == 1:
+        return calls[0]
+
+    counts: Dict[str, int] = {}
+    edited: List[str] = []
+    for call in calls:
+        match = re.match(r'\[(MCP: \w+|Tool: [\w-]+|\w+)', call)
+        name = match.group(1) if match else call
+        counts[name] = counts.get(name, 0) + 1
+        match = re.match(r'\[(?:Edit|Write) ([^\]]+)\]', call)
+        if match and match.group(1) not in edited:
+            edited.append(match.group(1))
+
+    summary = ", ".join(
+        f"{name} x{count}" if count > 1 else name
+        for name, count in sorted(counts.items(), key=lambda kv: -kv[1])
+    )
+    if edited:
+        summary += f" - edited {', '.join(edited)}"
+    return f"[{len(calls)} tool calls: {summary}]"
+
+
 def _group_consecutive_tools(items: List[tuple], start: int) -> List[str]:
     """
     Group consecutive tool calls, collapsing repeated calls to same file.
@@ -123,10 +123,30 @@ async def get_unread(
 async def search_messages(
     q: str = Query(..., min_length=1, description="Search query"),
     limit: int = Query(50, ge=1, le=200),
+    chat_id: Optional[str] = Query(None, description="Only this chat (GUID)"),
+    handle: Optional[str] = Query(None, description="Only messages with this phone/email"),
+    since: Optional[str] = Query(None, description="ISO datetime, on or after"),
+    until: Optional[str] = Query(None, description="ISO datetime, before"),
 ):
-    """Search messages by text."""
+    """Search messages by text, best match first."""
     service = _get_service()
-    messages = await _run_blocking(service.search, query=q, limit=limit)
+    bounds = {}
+    for name, value in (("since", since), ("until", until)):
+        if value:
+            try:
+                bounds[name] = datetime.fromisoformat(value.replace('Z', '+00:00'))
+            except ValueError:
+                raise HTTPException(status_code=400, detail=f"Invalid {name} datetime")
+
+    messages = await _run_blocking(
+        service.search,
+        query=q,
+        limit=limit,
+        chat_id=chat_id,
+        handle_id=handle,
+        since=bounds.get("since"),
+        until=bounds.get("until"),
+    )
     return {"messages": messages, "count": len(messages), "query": q}
 
 
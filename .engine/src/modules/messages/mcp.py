@@ -1,6 +1,7 @@
 """Messages MCP tool - iMessage read/send via Apple Messages."""
 from __future__ import annotations
 
+from datetime import datetime
 from typing import Any, Dict, Optional
 
 from fastmcp import FastMCP
@@ -17,6 +18,8 @@ def messages(
     text: Optional[str] = None,
     chat_id: Optional[str] = None,
     query: Optional[str] = None,
+    since: Optional[str] = None,
+    until: Optional[str] = None,
     limit: int = 50,
 ) -> Dict[str, Any]:
     """iMessage operations - read conversations, search, and send messages.
@@ -31,9 +34,16 @@ def messages(
         # Read operations
         recipient: Phone number or email to read messages from (for read)
         chat_id: Chat GUID to read messages from (alternative to recipient)
-        query: Search query (required for search)
+        query: Search query (required for search). Words match as prefixes,
+            "quoted text" as a phrase; includes rich-text messages
         limit: Max results (default 50)
 
+        # Search filters (optional)
+        chat_id: Only this chat (GUID)
+        recipient: Only messages with this phone number or email
+        since: ISO datetime, messages on or after
+        until: ISO datetime, messages before
+
         # Send operations
         recipient: Phone number or email to send to (required for send)
         text: Message text (required for send)
@@ -54,6 +64,7 @@ def messages(
 
         # Search messages
         messages("search", query="lunch tomorrow")
+        messages("search", query='"dinner reservation"', recipient="+14155551234", since="2026-01-01")
 
         # Send a message
         messages("send", recipient="contact@example.com", text="Hello from Claude!")
@@ -77,7 +88,7 @@ def messages(
         elif operation == "unread":
             return _get_unread(service, limit)
         elif operation == "search":
-            return _search_messages(service, query, limit)
+            return _search_messages(service, query, limit, chat_id, recipient, since, until)
         elif operation == "send":
             return _send_message(service, recipient, text)
         elif operation == "test":
@@ -147,12 +158,35 @@ def _get_unread(service, limit: int) -> Dict[str, Any]:
     }
 
 
-def _search_messages(service, query: Optional[str], limit: int) -> Dict[str, Any]:
+def _search_messages(
+    service,
+    query: Optional[str],
+    limit: int,
+    chat_id: Optional[str] = None,
+    handle: Optional[str] = None,
+    since: Optional[str] = None,
+    until: Optional[str] = None,
+) -> Dict[str, Any]:
     """Search messages by text."""
     if not query:
         return {"success": False, "error": "query required for search operation"}
 
-    messages = service.search(query=query, limit=limit)
+    bounds = {}
+    for name, value in (("since", since), ("until", until)):
+        if value:
+            try:
+                bounds[name] = datetime.fromisoformat(value.replace('Z', '+00:00'))
+            except ValueError:
+                return {"success": False, "error": f"Invalid {name} datetime: {value}"}
+
+    messages = service.search(
+        query=query,
+        limit=limit,
+        chat_id=chat_id,
+        handle_id=handle,
+        since=bounds.get("since"),
+        until=bounds.get("until"),
+    )
     return {
         "success": True,
         "count": len(messages),
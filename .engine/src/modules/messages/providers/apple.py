@@ -16,14 +16,17 @@ Requirements:
 
 from __future__ import annotations
 
+import json
 import logging
 import os
 import plistlib
 import sqlite3
 import subprocess
 from datetime import datetime, timedelta, timezone
-from typing import List, Optional
+from typing import Any, List, Optional
 
+from .apple_search import MessageSearchIndex, SearchHit, get_search_index, handle_variants, match_expression
+from .apple_summary import ConversationSummary, get_conversation_summary
 from .base import (
     MessagesAdapter,
     Message,
@@ -53,6 +56,13 @@ def _apple_time_to_datetime(apple_time: Optional[int]) -> Optional[datetime]:
         return None
 
 
+def _datetime_to_apple_time(value: datetime) -> int:
+    """Convert a datetime (naive = local time) to an Apple Messages timestamp."""
+    if value.tzinfo is None:
+        value = value.astimezone()
+    return int((value - APPLE_EPOCH).total_seconds() * NANOSECONDS_PER_SECOND)
+
+
 def _extract_text_from_attributed_body(attributed_body: Optional[bytes]) -> Optional[str]:
     """Extract plain text from NSAttributedString binary archive.
 
@@ -169,6 +179,7 @@ class AppleMessagesAdapter(MessagesAdapter):
     def __init__(self):
         """Initialize Apple Messages adapter."""
         self._conn: Optional[sqlite3.Connection] = None
+        self._db_path = MESSAGES_DB_PATH
 
     @property
     def provider_type(self) -> ProviderType:
@@ -181,11 +192,11 @@ class AppleMessagesAdapter(MessagesAdapter):
     def _get_db_connection(self) -> Optional[sqlite3.Connection]:
         """Get a read-only connection to the Messages database."""
         try:
-            if not os.path.exists(MESSAGES_DB_PATH):
-                logger.error(f"Messages database not found at {MESSAGES_DB_PATH}")
+            if not os.path.exists(self._db_path):
+                logger.error(f"Messages database not found at {self._db_path}")
                 return None
             # Open in read-only mode
-            conn = sqlite3.connect(f"file:{MESSAGES_DB_PATH}?mode=ro", uri=True)
+            conn = sqlite3.connect(f"file:{self._db_path}?mode=ro", uri=True)
             conn.row_factory = sqlite3.Row
             return conn
         except Exception as e:
@@ -194,7 +205,18 @@ class AppleMessagesAdapter(MessagesAdapter):
 
     def is_available(self) -> bool:
         """Check if Apple Messages is available."""
-        return os.path.exists(MESSAGES_DB_PATH)
+        return os.path.exists(self._db_path)
+
+    def _get_summary(self) -> Optional[ConversationSummary]:
+        """Local conversation summary over chat.db, or None while it is still being built."""
+        if not self.is_available():
+            return None
+        try:
+            summary = get_conversation_summary(self._db_path)
+            return summary if summary.ensure_fresh() else None
+        except Exception as e:
+            logger.warning(f"Conversation summary unavailable, querying chat.db directly: {e}")
+            return None
 
     def get_conversations(
         self,
@@ -202,6 +224,28 @@ class AppleMessagesAdapter(MessagesAdapter):
         include_archived: bool = False,
     ) -> List[Conversation]:
         """Get list of conversations ordered by most recent."""
+        summary = self._get_summary()
+        if summary is None:
+            return self._get_conversations_direct(limit, include_archived)
+
+        conversations = []
+        for row in summary.conversations(limit=limit, include_archived=include_archived):
+            participants = json.loads(row['participants'])
+            conversations.append(Conversation(
+                id=row['guid'],
+                display_name=row['display_name'] or row['chat_identifier'],
+                participants=participants,
+                service=row['service_name'] or 'iMessage',
+                last_message_date=_apple_time_to_datetime(row['last_message_date']),
+                last_message_text=row['last_message_text'],
+                unread_count=row['unread_count'],
+                is_group=len(participants) > 1,
+                provider=ProviderType.APPLE,
+            ))
+        return conversations
+
+    def _get_conversations_direct(self, limit: int, include_archived: bool) -> List[Conversation]:
+        """Conversations computed from chat.db (fallback while the summary is unavailable)."""
         conn = self._get_db_connection()
         if not conn:
             return []
@@ -473,20 +517,153 @@ class AppleMessagesAdapter(MessagesAdapter):
         finally:
             conn.close()
 
+    def _get_search_index(self) -> Optional[MessageSearchIndex]:
+        """Local FTS5 index over chat.db, or None while it is still being built."""
+        if not self.is_available():
+            return None
+        try:
+            index = get_search_index(self._db_path)
+            return index if index.ensure_fresh() else None
+        except Exception as e:
+            logger.warning(f"Message search index unavailable, falling back to LIKE scan: {e}")
+            return None
+
     def search_messages(
         self,
         query: str,
         limit: int = 50,
+        chat_id: Optional[str] = None,
+        handle_id: Optional[str] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+    ) -> List[Message]:
+        """Search message text, best match first.
+
+        Covers messages whose text only lives in attributedBody. Optional
+        filters: chat GUID, handle (phone/email), and a [since, until) date range.
+        """
+        index = self._get_search_index()
+        match = match_expression(query)
+        if index is None or not match:
+            return self._search_messages_like(query, limit, chat_id, handle_id, since, until)
+
+        conn = self._get_db_connection()
+        if not conn:
+            return []
+
+        try:
+            chat_rowid = None
+            if chat_id:
+                row = conn.execute("SELECT ROWID FROM chat WHERE guid = ?", (chat_id,)).fetchone()
+                if not row:
+                    return []
+                chat_rowid = row[0]
+
+            # Hydration drops deleted rows, so over-fetch candidates (bounded IN list)
+            page_size = min(max(limit * 2, 50), 500)
+            offset = 0
+            messages: List[Message] = []
+            while len(messages) < limit:
+                hits = index.search(
+                    match,
+                    chat_rowid=chat_rowid,
+                    handles=handle_variants(handle_id) if handle_id else None,
+                    since=_datetime_to_apple_time(since) if since else None,
+                    until=_datetime_to_apple_time(until) if until else None,
+                    limit=page_size,
+                    offset=offset,
+                )
+                if not hits:
+                    break
+                messages.extend(self._hydrate_messages(conn, hits)[: limit - len(messages)])
+                if len(hits) < page_size:
+                    break
+                offset += page_size
+            return messages
+
+        except Exception as e:
+            logger.error(f"Search failed: {e}")
+            return []
+        finally:
+            conn.close()
+
+    def _hydrate_messages(self, conn: sqlite3.Connection, hits: List[SearchHit]) -> List[Message]:
+        """Build Messages for index hits from chat.db rows, keeping hit order."""
+        placeholders = ", ".join("?" * len(hits))
+        cursor = conn.execute(f"""
+            SELECT
+                m.ROWID as message_id,
+                m.guid,
+                m.date,
+                m.is_from_me,
+                m.is_read,
+                m.cache_has_attachments,
+                m.reply_to_guid,
+                m.service,
+                h.id as handle_id,
+                c.guid as chat_guid
+            FROM message m
+            LEFT JOIN handle h ON m.handle_id = h.ROWID
+            LEFT JOIN chat_message_join cmj ON m.ROWID = cmj.message_id
+            LEFT JOIN chat c ON cmj.chat_id = c.ROWID
+            WHERE m.ROWID IN ({placeholders})
+        """, [hit.rowid for hit in hits])
+        rows = {row['message_id']: row for row in cursor.fetchall()}
+
+        messages = []
+        for hit in hits:
+            row = rows.get(hit.rowid)
+            msg_date = _apple_time_to_datetime(row['date']) if row else None
+            if not msg_date:
+                continue
+            messages.append(Message(
+                id=row['guid'],
+                text=hit.text,
+                date=msg_date,
+                is_from_me=bool(row['is_from_me']),
+                is_read=bool(row['is_read']),
+                handle_id=row['handle_id'] or '',
+                service=row['service'] or 'iMessage',
+                chat_id=row['chat_guid'],
+                has_attachments=bool(row['cache_has_attachments']),
+                reply_to_guid=row['reply_to_guid'],
+                provider=ProviderType.APPLE,
+            ))
+        return messages
+
+    def _search_messages_like(
+        self,
+        query: str,
+        limit: int,
+        chat_id: Optional[str] = None,
+        handle_id: Optional[str] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
     ) -> List[Message]:
-        """Search messages by text content."""
+        """Unindexed substring search over message.text (fallback while the index builds)."""
         conn = self._get_db_connection()
         if not conn:
             return []
 
         try:
-            search_pattern = f"%{query}%"
+            where_clauses = ["m.text LIKE ?"]
+            params: List[Any] = [f"%{query}%"]
+            if chat_id:
+                where_clauses.append("c.guid = ?")
+                params.append(chat_id)
+            if handle_id:
+                variants = handle_variants(handle_id)
+                where_clauses.append(f"LOWER(h.id) IN ({', '.join('?' * len(variants))})")
+                params.extend(variants)
+            if since:
+                where_clauses.append("m.date >= ?")
+                params.append(_datetime_to_apple_time(since))
+            if until:
+                where_clauses.append("m.date < ?")
+                params.append(_datetime_to_apple_time(until))
+            params.append(limit)
 
-            sql = """
+            sql = f"""
                 SELECT
                     m.ROWID as message_id,
                     m.guid,
@@ -503,12 +680,12 @@ class AppleMessagesAdapter(MessagesAdapter):
                 LEFT JOIN handle h ON m.handle_id = h.ROWID
                 LEFT JOIN chat_message_join cmj ON m.ROWID = cmj.message_id
                 LEFT JOIN chat c ON cmj.chat_id = c.ROWID
-                WHERE m.text LIKE ?
+                WHERE {" AND ".join(where_clauses)}
                 ORDER BY m.date DESC
                 LIMIT ?
             """
 
-            cursor = conn.execute(sql, (search_pattern, limit))
+            cursor = conn.execute(sql, params)
             messages = []
 
             for row in cursor.fetchall():
@@ -581,7 +758,7 @@ end tell
 
     def test_connection(self) -> tuple[bool, str]:
         """Test connection to Apple Messages."""
-        if not os.path.exists(MESSAGES_DB_PATH):
+        if not os.path.exists(self._db_path):
             return False, "Messages database not found. Is Messages.app configured?"
 
         conn = self._get_db_connection()
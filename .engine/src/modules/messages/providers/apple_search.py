@@ -0,0 +1,262 @@
+"""Full-text shadow index over Messages' chat.db.
+
+chat.db has no text index, and on recent macOS many messages keep their
+text only in attributedBody (a typedstream NSAttributedString), so a
+LIKE '%q%' over message.text both scans every row and misses them. This
+module keeps a local FTS5 index of decoded message text in our own
+database: attributedBody is decoded once, at index time, and searches
+return ranked ROWIDs plus the indexed text. AppleMessagesAdapter then
+hydrates just those rows from chat.db.
+
+Sync is incremental (core.watermark_sync), like the conversation summary:
+message.ROWID only grows, so we index rows past the highest ROWID seen
+(the watermark) whenever chat.db (or its WAL) changes on disk. Edited messages keep the
+text they were indexed with; deleted ones drop out at hydration.
+
+Query syntax (match_expression): bare words match as prefixes, quoted
+text as a phrase; terms are ANDed. Chat, handle and date filters are
+separate arguments to search().
+"""
+
+from __future__ import annotations
+
+import logging
+import re
+import sqlite3
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, List, Optional, Sequence, Tuple
+
+from core.watermark_sync import WatermarkMirror
+
+logger = logging.getLogger(__name__)
+
+SYNC_BATCH_SIZE = 5000
+
+# bm25 costs a lookup per matching row; for a term in tens of thousands of
+# messages, only rank the newest RANK_WINDOW matches (unfiltered searches)
+RANK_WINDOW = 5000
+
+SCHEMA_SQL = """
+CREATE TABLE IF NOT EXISTS messages_search_state (
+    id INTEGER PRIMARY KEY CHECK (id = 1),
+    source TEXT NOT NULL,              -- chat.db path the index mirrors
+    watermark INTEGER NOT NULL,        -- highest chat.db message.ROWID indexed
+    synced_at TEXT
+);
+
+CREATE TABLE IF NOT EXISTS messages_search_docs (
+    rowid INTEGER PRIMARY KEY,         -- chat.db message.ROWID
+    chat_rowid INTEGER,
+    handle TEXT,                       -- lowercased handle.id (phone or email)
+    date INTEGER                       -- Apple nanoseconds since 2001
+);
+
+CREATE INDEX IF NOT EXISTS idx_messages_search_docs_chat
+ON messages_search_docs(chat_rowid, date DESC);
+
+CREATE INDEX IF NOT EXISTS idx_messages_search_docs_handle
+ON messages_search_docs(handle, date DESC);
+
+CREATE INDEX IF NOT EXISTS idx_messages_search_docs_date
+ON messages_search_docs(date DESC);
+
+CREATE VIRTUAL TABLE IF NOT EXISTS messages_search_fts USING fts5(
+    text,
+    tokenize = 'unicode61 remove_diacritics 2',
+    prefix = '2 3'
+);
+"""
+
+_PHRASE_RE = re.compile(r'"([^"]*)"')
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+
+@dataclass
+class SearchHit:
+    """A matching message: chat.db ROWID and its decoded text."""
+    rowid: int
+    text: str
+
+
+def _phrase(text: str, prefix: bool) -> Optional[str]:
+    tokens = _TOKEN_RE.findall(text.lower())
+    if not tokens:
+        return None
+    return f'"{" ".join(tokens)}"' + ("*" if prefix else "")
+
+
+def match_expression(text: str) -> str:
+    """FTS5 expression for user search text ('' if it has no searchable words)."""
+    terms: List[str] = []
+    for phrase in _PHRASE_RE.findall(text or ""):
+        term = _phrase(phrase, prefix=False)
+        if term:
+            terms.append(term)
+    for word in _PHRASE_RE.sub(" ", text or "").split():
+        term = _phrase(word, prefix=True)
+        if term:
+            terms.append(term)
+    return " AND ".join(terms)
+
+
+def handle_variants(handle: str) -> List[str]:
+    """Forms a handle may be stored in: emails lowercased, phones with and without +."""
+    handle = handle.strip().lower()
+    if "@" in handle:
+        return [handle]
+    bare = handle.lstrip("+")
+    return [f"+{bare}", bare]
+
+
+class MessageSearchIndex(WatermarkMirror):
+    """FTS5 index of decoded chat.db message text."""
+
+    SCHEMA_SQL = SCHEMA_SQL
+    STATE_TABLE = "messages_search_state"
+    DATA_TABLES = ("messages_search_docs", "messages_search_fts")
+    LABEL = "messages-search"
+
+    def __init__(self, source_path: str | Path, db_path: Optional[Path] = None):
+        super().__init__(source_path, db_path)
+        self.stats = {"syncs": 0, "rows_indexed": 0, "searches": 0}
+
+    # =========================================================================
+    # SYNC
+    # =========================================================================
+
+    def sync(self, batch_size: int = SYNC_BATCH_SIZE) -> int:
+        """Index messages past the watermark. Returns rows read."""
+        with self._lock:
+            self._ensure_schema()
+            src = sqlite3.connect(f"file:{self.source_path}?mode=ro", uri=True)
+            try:
+                query = """
+                    SELECT m.ROWID,
+                           cmj.chat_id,
+                           h.id,
+                           m.date,
+                           m.text,
+                           m.attributedBody
+                    FROM message m
+                    LEFT JOIN chat_message_join cmj ON cmj.message_id = m.ROWID
+                    LEFT JOIN handle h ON h.ROWID = m.handle_id
+                    WHERE m.ROWID > ?
+                    ORDER BY m.ROWID
+                    LIMIT ?
+                """
+                watermark = self.watermark
+                added = 0
+                while True:
+                    rows = src.execute(query, (watermark, batch_size)).fetchall()
+                    if not rows:
+                        break
+                    watermark = self._index_batch(rows)
+                    added += len(rows)
+                    if len(rows) < batch_size:
+                        break
+            finally:
+                src.close()
+
+            self.stats["syncs"] += 1
+            self.stats["rows_indexed"] += added
+            if added:
+                logger.debug(f"Message search index: +{added} messages (watermark {watermark})")
+            return added
+
+    def _index_batch(self, rows: Sequence[Tuple[Any, ...]]) -> int:
+        from .apple import _extract_text_from_attributed_body
+
+        docs = []
+        texts = []
+        for rowid, chat_id, handle, date, text, attributed_body in rows:
+            text = text or _extract_text_from_attributed_body(attributed_body)
+            if not text:
+                continue  # Attachments, reactions, system rows
+            docs.append((rowid, chat_id, (handle or "").lower() or None, date))
+            texts.append((rowid, text))
+
+        watermark = rows[-1][0]
+        with self._pool.write_transaction() as cur:
+            cur.executemany(
+                "INSERT OR REPLACE INTO messages_search_docs (rowid, chat_rowid, handle, date) VALUES (?, ?, ?, ?)",
+                docs,
+            )
+            cur.executemany("INSERT OR REPLACE INTO messages_search_fts (rowid, text) VALUES (?, ?)", texts)
+            self._set_watermark(cur, watermark)
+        return watermark
+
+    # =========================================================================
+    # SEARCH
+    # =========================================================================
+
+    def search(
+        self,
+        match: str,
+        chat_rowid: Optional[int] = None,
+        handles: Optional[Sequence[str]] = None,
+        since: Optional[int] = None,
+        until: Optional[int] = None,
+        limit: int = 50,
+        offset: int = 0,
+    ) -> List[SearchHit]:
+        """Messages matching an FTS5 expression, best first.
+
+        Ordered by bm25, then recency; without filters only the newest
+        RANK_WINDOW matches are considered. since/until are Apple
+        timestamps (nanoseconds since 2001); until is exclusive.
+        """
+        self._ensure_schema()
+        self.stats["searches"] += 1
+        if not match:
+            return []
+
+        where: List[str] = []
+        params: List[Any] = []
+        if chat_rowid is not None:
+            where.append("d.chat_rowid = ?")
+            params.append(chat_rowid)
+        if handles:
+            where.append(f"d.handle IN ({', '.join('?' * len(handles))})")
+            params.extend(handles)
+        if since is not None:
+            where.append("d.date >= ?")
+            params.append(since)
+        if until is not None:
+            where.append("d.date < ?")
+            params.append(until)
+
+        reader = self._pool.reader()
+        try:
+            if not where:
+                cutoff = reader.execute(
+                    """SELECT rowid FROM messages_search_fts WHERE messages_search_fts MATCH ?
+                       ORDER BY rowid DESC LIMIT 1 OFFSET ?""",
+                    (match, RANK_WINDOW - 1),
+                ).fetchone()
+                if cutoff is not None:
+                    where.append("messages_search_fts.rowid >= ?")
+                    params.append(cutoff[0])
+
+            filters = "".join(f" AND {clause}" for clause in where)
+            rows = reader.execute(
+                f"""
+                SELECT d.rowid, messages_search_fts.text
+                FROM messages_search_fts
+                JOIN messages_search_docs d ON d.rowid = messages_search_fts.rowid
+                WHERE messages_search_fts MATCH ?{filters}
+                ORDER BY bm25(messages_search_fts), d.date DESC
+                LIMIT ? OFFSET ?
+                """,
+                [match, *params, limit, offset],
+            ).fetchall()
+        except sqlite3.OperationalError as e:
+            # Malformed MATCH expressions shouldn't take search down
+            logger.debug(f"Message search query failed ({match!r}): {e}")
+            return []
+        return [SearchHit(row[0], row[1]) for row in rows]
+
+
+def get_search_index(source_path: str | Path, db_path: Optional[Path] = None) -> MessageSearchIndex:
+    """Shared MessageSearchIndex for a chat.db / system DB pair."""
+    return MessageSearchIndex.shared(source_path, db_path)
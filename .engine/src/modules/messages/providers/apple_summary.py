@@ -0,0 +1,289 @@
+"""Incrementally maintained conversation list over Messages' chat.db.
+
+Listing conversations straight from chat.db means four correlated
+subqueries per chat (last text, last attributedBody, last date, unread
+count) over a message table with hundreds of thousands of rows, plus a
+participants query per chat. This module keeps one summary row per chat
+in our own database instead, so get_conversations is a single indexed
+read.
+
+Sync is incremental (core.watermark_sync), like the Mail.app search
+index: message.ROWID only grows, so we remember the highest ROWID folded
+in (the watermark) and apply messages past it whenever chat.db (or its
+WAL) changes on disk.
+What ROWIDs can't tell us is refreshed on the same trigger:
+- chat rows (names, archive flag, participants) are few, so they are
+  re-read and only changed rows are written back
+- unread messages are tracked by ROWID in messages_unread; each sync
+  re-checks just those rows, so reading a thread clears its count
+A deleted last message is not noticed until the next message arrives.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import sqlite3
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+from core.watermark_sync import WatermarkMirror
+
+logger = logging.getLogger(__name__)
+
+SYNC_BATCH_SIZE = 20000
+_CHUNK = 500  # Bound on IN (...) parameters per query
+
+SCHEMA_SQL = """
+CREATE TABLE IF NOT EXISTS messages_conversation_state (
+    id INTEGER PRIMARY KEY CHECK (id = 1),
+    source TEXT NOT NULL,              -- chat.db path the summary mirrors
+    watermark INTEGER NOT NULL,        -- highest chat.db message.ROWID applied
+    synced_at TEXT
+);
+
+CREATE TABLE IF NOT EXISTS messages_conversations (
+    chat_rowid INTEGER PRIMARY KEY,    -- chat.db chat.ROWID
+    guid TEXT NOT NULL,
+    chat_identifier TEXT,
+    display_name TEXT,
+    service_name TEXT,
+    is_archived INTEGER NOT NULL DEFAULT 0,
+    participants TEXT NOT NULL DEFAULT '[]',  -- JSON list of handle ids
+    last_message_rowid INTEGER,
+    last_message_date INTEGER,         -- Apple nanoseconds since 2001
+    last_message_text TEXT,
+    unread_count INTEGER NOT NULL DEFAULT 0
+);
+
+CREATE INDEX IF NOT EXISTS idx_messages_conversations_recent
+ON messages_conversations(is_archived, last_message_date DESC);
+
+CREATE INDEX IF NOT EXISTS idx_messages_conversations_date
+ON messages_conversations(last_message_date DESC);
+
+CREATE TABLE IF NOT EXISTS messages_unread (
+    rowid INTEGER PRIMARY KEY,         -- chat.db message.ROWID, unread and not from me
+    chat_rowid INTEGER NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_messages_unread_chat
+ON messages_unread(chat_rowid);
+"""
+
+_CHAT_COLUMNS = ("guid", "chat_identifier", "display_name", "service_name", "is_archived", "participants")
+
+
+def _chunks(items: Sequence[Any], size: int = _CHUNK) -> Iterable[Sequence[Any]]:
+    for i in range(0, len(items), size):
+        yield items[i:i + size]
+
+
+class ConversationSummary(WatermarkMirror):
+    """Per-chat summary rows mirrored from chat.db."""
+
+    SCHEMA_SQL = SCHEMA_SQL
+    STATE_TABLE = "messages_conversation_state"
+    DATA_TABLES = ("messages_conversations", "messages_unread")
+    LABEL = "messages-summary"
+
+    def __init__(self, source_path: str | Path, db_path: Optional[Path] = None):
+        super().__init__(source_path, db_path)
+        self.stats = {"syncs": 0, "messages_applied": 0, "reads": 0}
+
+    # =========================================================================
+    # SYNC
+    # =========================================================================
+
+    def sync(self, batch_size: int = SYNC_BATCH_SIZE) -> int:
+        """Bring the summary up to date with chat.db. Returns messages applied."""
+        with self._lock:
+            self._ensure_schema()
+            src = sqlite3.connect(f"file:{self.source_path}?mode=ro", uri=True)
+            try:
+                # One read snapshot, so every new message's chat is in the chat pass
+                src.execute("BEGIN")
+                self._sync_chats(src)
+                watermark = self.watermark
+                applied = 0
+                while True:
+                    rows = src.execute(
+                        """
+                        SELECT m.ROWID, cmj.chat_id, m.date, m.is_read, m.is_from_me
+                        FROM message m
+                        JOIN chat_message_join cmj ON cmj.message_id = m.ROWID
+                        WHERE m.ROWID > ?
+                        ORDER BY m.ROWID
+                        LIMIT ?
+                        """,
+                        (watermark, batch_size),
+                    ).fetchall()
+                    if not rows:
+                        break
+                    watermark = self._apply_messages(src, rows)
+                    applied += len(rows)
+                    if len(rows) < batch_size:
+                        break
+                self._sync_unread(src)
+            finally:
+                src.close()
+
+            self.stats["syncs"] += 1
+            self.stats["messages_applied"] += applied
+            if applied:
+                logger.debug(f"Conversation summary: +{applied} messages (watermark {watermark})")
+            return applied
+
+    def _sync_chats(self, src: sqlite3.Connection) -> None:
+        """Mirror chat names, archive flags and participants; write only what changed."""
+        participants: Dict[int, List[str]] = {}
+        for chat_id, handle in src.execute(
+            """
+            SELECT chj.chat_id, h.id
+            FROM chat_handle_join chj
+            JOIN handle h ON h.ROWID = chj.handle_id
+            ORDER BY chj.chat_id, chj.ROWID
+            """
+        ):
+            participants.setdefault(chat_id, []).append(handle)
+
+        current: Dict[int, Tuple[Any, ...]] = {}
+        for rowid, guid, identifier, name, service, archived in src.execute(
+            "SELECT ROWID, guid, chat_identifier, display_name, service_name, is_archived FROM chat"
+        ):
+            current[rowid] = (
+                guid, identifier, name, service, int(archived or 0),
+                json.dumps(participants.get(rowid, [])),
+            )
+
+        columns = ", ".join(_CHAT_COLUMNS)
+        stored = {
+            row[0]: tuple(row[1:])
+            for row in self._pool.reader().execute(f"SELECT chat_rowid, {columns} FROM messages_conversations")
+        }
+        changed = [(rowid, *values) for rowid, values in current.items() if stored.get(rowid) != values]
+        removed = [(rowid,) for rowid in stored if rowid not in current]
+        if not changed and not removed:
+            return
+
+        updates = ", ".join(f"{c} = excluded.{c}" for c in _CHAT_COLUMNS)
+        with self._pool.write_transaction() as cur:
+            cur.executemany(
+                f"""
+                INSERT INTO messages_conversations (chat_rowid, {columns})
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(chat_rowid) DO UPDATE SET {updates}
+                """,
+                changed,
+            )
+            cur.executemany("DELETE FROM messages_conversations WHERE chat_rowid = ?", removed)
+            cur.executemany("DELETE FROM messages_unread WHERE chat_rowid = ?", removed)
+
+    def _apply_messages(self, src: sqlite3.Connection, rows: Sequence[Tuple[Any, ...]]) -> int:
+        """Fold a batch of new messages into the summary rows."""
+        latest: Dict[int, Tuple[int, int]] = {}  # chat -> (date, rowid) of newest in batch
+        unread: List[Tuple[int, int]] = []
+        for rowid, chat_id, date, is_read, is_from_me in rows:
+            key = (date or 0, rowid)
+            if chat_id not in latest or key > latest[chat_id]:
+                latest[chat_id] = key
+            if not is_read and not is_from_me:
+                unread.append((rowid, chat_id))
+
+        # Only fetch text for messages that actually become a chat's last message
+        stored: Dict[int, Tuple[int, int]] = {}
+        reader = self._pool.reader()
+        for chunk in _chunks(list(latest)):
+            for row in reader.execute(
+                f"""SELECT chat_rowid, last_message_date, last_message_rowid FROM messages_conversations
+                    WHERE chat_rowid IN ({', '.join('?' * len(chunk))})""",
+                chunk,
+            ):
+                stored[row[0]] = (row[1] or 0, row[2] or 0)
+        winners = {
+            chat_id: key for chat_id, key in latest.items()
+            if chat_id in stored and key > stored[chat_id]
+        }
+        texts = self._message_texts(src, [rowid for _, rowid in winners.values()])
+
+        watermark = rows[-1][0]
+        with self._pool.write_transaction() as cur:
+            cur.executemany(
+                """UPDATE messages_conversations
+                   SET last_message_rowid = ?, last_message_date = ?, last_message_text = ?
+                   WHERE chat_rowid = ?""",
+                [(rowid, date, texts.get(rowid), chat_id) for chat_id, (date, rowid) in winners.items()],
+            )
+            cur.executemany("INSERT OR IGNORE INTO messages_unread (rowid, chat_rowid) VALUES (?, ?)", unread)
+            self._recount_unread(cur, {chat_id for _, chat_id in unread})
+            self._set_watermark(cur, watermark)
+        return watermark
+
+    def _message_texts(self, src: sqlite3.Connection, rowids: List[int]) -> Dict[int, Optional[str]]:
+        from .apple import _extract_text_from_attributed_body
+
+        texts: Dict[int, Optional[str]] = {}
+        for chunk in _chunks(rowids):
+            for rowid, text, body in src.execute(
+                f"SELECT ROWID, text, attributedBody FROM message WHERE ROWID IN ({', '.join('?' * len(chunk))})",
+                chunk,
+            ):
+                texts[rowid] = text or _extract_text_from_attributed_body(body)
+        return texts
+
+    def _sync_unread(self, src: sqlite3.Connection) -> None:
+        """Drop tracked unread messages that have since been read (or deleted)."""
+        tracked = self._pool.reader().execute("SELECT rowid, chat_rowid FROM messages_unread").fetchall()
+        if not tracked:
+            return
+        still_unread: Set[int] = set()
+        rowids = [row[0] for row in tracked]
+        for chunk in _chunks(rowids):
+            still_unread.update(
+                row[0] for row in src.execute(
+                    f"""SELECT ROWID FROM message
+                        WHERE ROWID IN ({', '.join('?' * len(chunk))}) AND is_read = 0 AND is_from_me = 0""",
+                    chunk,
+                )
+            )
+        read = [(rowid, chat_id) for rowid, chat_id in tracked if rowid not in still_unread]
+        if not read:
+            return
+        with self._pool.write_transaction() as cur:
+            cur.executemany("DELETE FROM messages_unread WHERE rowid = ?", [(rowid,) for rowid, _ in read])
+            self._recount_unread(cur, {chat_id for _, chat_id in read})
+
+    @staticmethod
+    def _recount_unread(cur: sqlite3.Cursor, chat_ids: Set[int]) -> None:
+        cur.executemany(
+            """UPDATE messages_conversations
+               SET unread_count = (SELECT COUNT(*) FROM messages_unread u WHERE u.chat_rowid = ?)
+               WHERE chat_rowid = ?""",
+            [(chat_id, chat_id) for chat_id in chat_ids],
+        )
+
+    # =========================================================================
+    # READ
+    # =========================================================================
+
+    def conversations(self, limit: int = 50, include_archived: bool = False) -> List[sqlite3.Row]:
+        """Summary rows, most recent conversation first."""
+        self._ensure_schema()
+        self.stats["reads"] += 1
+        where = "" if include_archived else "WHERE is_archived = 0"
+        return self._pool.reader().execute(
+            f"""
+            SELECT chat_rowid, guid, chat_identifier, display_name, service_name, participants,
+                   last_message_date, last_message_text, unread_count
+            FROM messages_conversations
+            {where}
+            ORDER BY last_message_date DESC
+            LIMIT ?
+            """,
+            (limit,),
+        ).fetchall()
+
+
+def get_conversation_summary(source_path: str | Path, db_path: Optional[Path] = None) -> ConversationSummary:
+    """Shared ConversationSummary for a chat.db / system DB pair."""
+    return ConversationSummary.shared(source_path, db_path)
@@ -16,3 +16,6 @@ INSERT OR IGNORE INTO messages_settings (key, value) VALUES
 
 -- Note: No message cache tables - we read directly from Apple Messages DB
 -- ~/Library/Messages/chat.db
+-- The conversation list is served from a per-chat summary
+-- (messages_conversations), created and kept in sync by
+-- providers/apple_summary.py.
@@ -25,7 +25,8 @@ class MessagesService:
     Architecture:
     - Direct reads from Apple Messages SQLite
     - AppleScript for sending
-    - No local cache (matches calendar/email pattern)
+    - No local message cache (matches calendar/email pattern); the
+      conversation list reads a per-chat summary synced from chat.db
     - Resolves phone numbers to contact names via ContactsService
     - Builds phone → name lookup cache for fast resolution
     """
@@ -92,9 +93,24 @@ class MessagesService:
         messages = self._adapter.get_unread_messages(limit=limit)
         return [self._message_to_dict(m) for m in messages]
 
-    def search(self, query: str, limit: int = 50) -> List[Dict[str, Any]]:
-        """Search messages."""
-        messages = self._adapter.search_messages(query=query, limit=limit)
+    def search(
+        self,
+        query: str,
+        limit: int = 50,
+        chat_id: Optional[str] = None,
+        handle_id: Optional[str] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+    ) -> List[Dict[str, Any]]:
+        """Search messages, best match first, optionally within a chat, handle or date range."""
+        messages = self._adapter.search_messages(
+            query=query,
+            limit=limit,
+            chat_id=chat_id,
+            handle_id=handle_id,
+            since=since,
+            until=until,
+        )
         return [self._message_to_dict(m) for m in messages]
 
     # === Send Operations ===
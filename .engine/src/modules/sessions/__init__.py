@@ -2,16 +2,18 @@
 Sessions domain - session lifecycle management.
 
 Provides:
-- Session, SpawnResult models
+- Session, SpawnResult, SpawnHandle models
 - SessionRepository for database operations
 - SessionService for business logic
+- StandbyPool of pre-launched sessions for instant spawns
 """
 
 from pathlib import Path
 
 from core.config import settings
 
-from .models import Session, SpawnResult
+from .models import Session, SpawnHandle, SpawnResult
+from .pool import StandbyPool, get_standby_pool
 from .repository import SessionRepository
 from .service import SessionService, get_session_folder, get_session_workers_folder
 
@@ -36,8 +38,11 @@ SessionManager = SessionService
 __all__ = [
     "Session",
     "SpawnResult",
+    "SpawnHandle",
     "SessionRepository",
     "SessionService",
+    "StandbyPool",
+    "get_standby_pool",
     "SessionManager",  # Backwards compatibility
     "get_session_service",
     "get_session_folder",
@@ -28,12 +28,15 @@ from core.activity_stream import (
 from core.conversation_stream import stream_conversation
 
 from . import SessionService, get_session_service
+from .pool import get_standby_pool
 from .repository import SessionRepository
 from .transcript import (
     get_transcript_path_for_session,
     get_all_events,
+    get_cached_events,
     stream_transcript,
     has_pending_question,
+    resolve_transcript_path,
 )
 from .subagent import (
     list_subagents,
@@ -155,21 +158,15 @@ async def spawn_session(req: SpawnSessionRequest):
         session_id: The spawned session ID
         window_name: The tmux window name
     """
-    import asyncio
-
     try:
         manager = get_manager()
-
-        def do_spawn():
-            return manager.spawn(
-                role=req.role,
-                mode=req.mode,
-                description=req.description,
-                project_path=req.project_path,
-            )
-
-        loop = asyncio.get_event_loop()
-        result = await loop.run_in_executor(None, do_spawn)
+        handle = await manager.spawn_async(
+            role=req.role,
+            mode=req.mode,
+            description=req.description,
+            project_path=req.project_path,
+        )
+        result = await handle
 
         if result.success:
             await event_bus.publish("session.started", {
@@ -230,6 +227,20 @@ async def notify_event(req: NotifyEventRequest):
 # MUST come before /{session_id} routes to avoid route collision
 # ============================================
 
+def _sessions_waiting_for_input(sessions: list[dict]) -> set[str]:
+    """Session ids of active sessions with an unanswered interactive tool."""
+    waiting = set()
+    for session in sessions:
+        if session["ended_at"]:
+            continue
+        transcript_path = resolve_transcript_path(
+            session["transcript_path"], session["claude_session_id"], session["cwd"]
+        )
+        if transcript_path and has_pending_question(transcript_path):
+            waiting.add(session["session_id"])
+    return waiting
+
+
 @router.get("/activity")
 async def get_claude_activity():
     """Get Claude sessions (active + recent ended)."""
@@ -241,13 +252,12 @@ async def get_claude_activity():
         repo = get_repository()
         sessions = await _run_blocking(repo.get_sessions_for_activity)
 
+        # Check for pending AskUserQuestion on active sessions. Paths come from
+        # the activity rows and has_pending_question only reads appended bytes.
+        waiting_ids = await _run_blocking(_sessions_waiting_for_input, sessions)
+
         for session in sessions:
-            # Check for pending AskUserQuestion on active sessions
-            waiting = False
-            if not session["ended_at"]:
-                transcript_path = get_transcript_path_for_session(session["session_id"], DB_PATH)
-                if transcript_path:
-                    waiting = has_pending_question(transcript_path)
+            waiting = session["session_id"] in waiting_ids
 
             result["sessions"].append({
                 "session_id": session["session_id"],
@@ -337,10 +347,140 @@ async def wake_chief():
     return {"success": False, "error": "Failed to send wake - Chief may not be running"}
 
 
+@router.get("/pool")
+async def standby_pool_status():
+    """Standby pool occupancy and claim hit rate (spawn latency is in /api/system/perf)."""
+    pool = get_standby_pool()
+    if pool is None:
+        return {"enabled": False}
+    return {"enabled": True, **pool.stats()}
+
+
 # ============================================
 # Conversation routes (must come BEFORE /{session_id} routes!)
 # ============================================
 
+HISTORY_PAGE_MAX = 1000
+
+
+def _session_boundary(session: dict, prev_session: Optional[dict], session_number: int) -> dict:
+    """Build the session_boundary marker placed before a session's events."""
+    # Determine boundary type from previous session's end_reason and mode change
+    prev_mode = prev_session["mode"] if prev_session else None
+    curr_mode = session.get("mode")
+    prev_end_reason = prev_session["end_reason"] if prev_session else None
+
+    # Summarizer sessions are handoff generation — special boundary type
+    if curr_mode == "summarizer":
+        boundary_type = "summarizer"
+    elif prev_mode == "summarizer":
+        # Session after summarizer = the fresh session picking up from handoff
+        # This is a reset boundary (the summarizer was the handoff mechanism)
+        boundary_type = "reset"
+    elif prev_mode and curr_mode and prev_mode != curr_mode:
+        boundary_type = "mode_transition"
+    else:
+        boundary_type = "reset"
+
+    return {
+        "type": "session_boundary",
+        "timestamp": session["started_at"],
+        "uuid": f"boundary-{session['session_id']}",
+        "session_id": session["session_id"],
+        "role": session["role"],
+        "mode": curr_mode,
+        "prev_mode": prev_mode,
+        "started_at": session["started_at"],
+        "ended_at": session["ended_at"],
+        "boundary_type": boundary_type,
+        "end_reason": prev_end_reason,
+        "session_number": session_number,
+        "is_reset": boundary_type == "reset",  # backwards compat
+    }
+
+
+def _session_history_items(sessions: list[dict], index: int, include_thinking: bool) -> list[dict]:
+    """Events for sessions[index] (chronological list), led by its boundary marker.
+
+    Parsed events come from the (path, size, mtime) cache, so historic
+    sessions are only parsed once per process.
+    """
+    session = sessions[index]
+    events = get_cached_events(Path(session["transcript_path"]), include_thinking=include_thinking)
+    items = [{**event, "session_id": session["session_id"]} for event in events]
+    if index > 0:
+        items.insert(0, _session_boundary(session, sessions[index - 1], index + 1))
+    return items
+
+
+async def _get_history_page(
+    conversation_id: str,
+    include_thinking: bool,
+    limit: int,
+    cursor: Optional[str],
+) -> dict:
+    """Cursor-paginated history: newest events first, across session boundaries.
+
+    A cursor "<session_id>:<n>" means "items before position n of that
+    session" (empty n = the session's end). Each page is returned in
+    chronological order so the client can prepend it as-is.
+    """
+    repo = get_repository()
+    rows = await _run_blocking(repo.get_conversation_sessions, conversation_id)
+    if not rows:
+        raise HTTPException(
+            status_code=404,
+            detail=f"No sessions found for conversation: {conversation_id}"
+        )
+
+    sessions = [
+        row for row in reversed(rows)
+        if row["transcript_path"] and Path(row["transcript_path"]).exists()
+    ]
+
+    index = len(sessions) - 1
+    end: Optional[int] = None
+    if cursor:
+        session_id, _, position = cursor.rpartition(":")
+        positions = {session["session_id"]: i for i, session in enumerate(sessions)}
+        if session_id not in positions or (position and not position.isdigit()):
+            raise HTTPException(status_code=400, detail=f"Invalid cursor: {cursor}")
+        index = positions[session_id]
+        end = int(position) if position else None
+
+    page: list[dict] = []
+    sessions_touched = 0
+    start = 0
+    while index >= 0:
+        items = await _run_blocking(_session_history_items, sessions, index, include_thinking)
+        sessions_touched += 1
+        stop = len(items) if end is None else min(end, len(items))
+        start = max(0, stop - (limit - len(page)))
+        page[:0] = items[start:stop]
+        if len(page) >= limit:
+            break
+        index -= 1
+        end = None
+
+    if index >= 0 and start > 0:
+        next_cursor = f"{sessions[index]['session_id']}:{start}"
+    elif index > 0:
+        next_cursor = f"{sessions[index - 1]['session_id']}:"
+    else:
+        next_cursor = None
+
+    return {
+        "events": page,
+        "conversation_id": conversation_id,
+        "session_count": sessions_touched,
+        "total_session_count": len(rows),
+        "event_count": len(page),
+        "next_cursor": next_cursor,
+        "has_more": next_cursor is not None,
+        "has_earlier": next_cursor is not None,
+    }
+
+
 @router.get("/conversation/{conversation_id}/transcript/history")
 async def get_conversation_transcript_history(
     conversation_id: str,
@@ -348,13 +488,23 @@ async def get_conversation_transcript_history(
     hours: Optional[int] = 24,
     limit_sessions: Optional[int] = None,
     before_session: Optional[str] = None,
+    limit: Optional[int] = None,
+    cursor: Optional[str] = None,
 ):
     """Get combined transcript history for all sessions in a conversation.
 
     This returns the conversation history across session resets,
     with session boundary markers showing when each session started.
+
+    With limit (and cursor from the previous page's next_cursor), returns
+    one page of the newest events instead of whole sessions; the
+    hours/limit_sessions/before_session window is ignored in that mode.
     """
     try:
+        if limit or cursor:
+            page_size = max(1, min(limit or 200, HISTORY_PAGE_MAX))
+            return await _get_history_page(conversation_id, include_thinking, page_size, cursor)
+
         repo = get_repository()
         total_session_count = await _run_blocking(repo.count_conversation_sessions, conversation_id)
 
@@ -416,45 +566,11 @@ async def get_conversation_transcript_history(
             session_count += 1
 
             if all_events:
-                # Determine boundary type from previous session's end_reason and mode change
-                prev_mode = prev_session["mode"] if prev_session else None
-                curr_mode = session.get("mode")
-                prev_end_reason = prev_session["end_reason"] if prev_session else None
-
-                # Summarizer sessions are handoff generation — special boundary type
-                if curr_mode == "summarizer":
-                    boundary_type = "summarizer"
-                elif prev_mode == "summarizer":
-                    # Session after summarizer = the fresh session picking up from handoff
-                    # This is a reset boundary (the summarizer was the handoff mechanism)
-                    boundary_type = "reset"
-                elif prev_mode and curr_mode and prev_mode != curr_mode:
-                    boundary_type = "mode_transition"
-                else:
-                    boundary_type = "reset"
-
-                all_events.append({
-                    "type": "session_boundary",
-                    "timestamp": session["started_at"],
-                    "uuid": f"boundary-{session['session_id']}",
-                    "session_id": session["session_id"],
-                    "role": session["role"],
-                    "mode": curr_mode,
-                    "prev_mode": prev_mode,
-                    "started_at": session["started_at"],
-                    "ended_at": session["ended_at"],
-                    "boundary_type": boundary_type,
-                    "end_reason": prev_end_reason,
-                    "session_number": session_count,
-                    "is_reset": boundary_type == "reset",  # backwards compat
-                })
-
-            events = await _run_blocking(get_all_events, path, include_thinking=include_thinking)
-
-            for event in events:
-                event["session_id"] = session["session_id"]
-
-            all_events.extend(events)
+                all_events.append(_session_boundary(session, prev_session, session_count))
+
+            events = await _run_blocking(get_cached_events, path, include_thinking=include_thinking)
+
+            all_events.extend({**event, "session_id": session["session_id"]} for event in events)
             prev_session = session
 
         return {
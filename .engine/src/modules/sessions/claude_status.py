@@ -11,10 +11,11 @@ it uses an inaccurate calculation that underreports by ~15-20%.
 """
 
 import re
-import subprocess
 from dataclasses import dataclass
 from typing import Optional
 
+from core import tmux
+
 
 @dataclass
 class ClaudeStatus:
@@ -63,18 +64,7 @@ def capture_pane(pane_target: str, lines: int = 15) -> Optional[str]:
     Returns:
         Pane content as string, or None on error
     """
-    try:
-        result = subprocess.run(
-            ["tmux", "capture-pane", "-t", pane_target, "-p", "-S", f"-{lines}"],
-            capture_output=True,
-            text=True,
-            timeout=5
-        )
-        if result.returncode == 0:
-            return result.stdout
-        return None
-    except Exception:
-        return None
+    return tmux.capture_pane(pane_target, lines=lines)
 
 
 def capture_pane_title(pane_target: str) -> Optional[str]:
@@ -89,18 +79,7 @@ def capture_pane_title(pane_target: str) -> Optional[str]:
     Returns:
         Pane title string, or None on error
     """
-    try:
-        result = subprocess.run(
-            ["tmux", "display-message", "-t", pane_target, "-p", "#{pane_title}"],
-            capture_output=True,
-            text=True,
-            timeout=5
-        )
-        if result.returncode == 0:
-            return result.stdout.strip()
-        return None
-    except Exception:
-        return None
+    return tmux.capture_pane_title(pane_target)
 
 
 def parse_claude_status(pane_content: str) -> ClaudeStatus:
@@ -225,12 +204,7 @@ def get_all_claude_statuses() -> dict[str, ClaudeStatus]:
     
     try:
         # List all panes in life session
-        result = subprocess.run(
-            ["tmux", "list-panes", "-s", "-t", "life", "-F", "#{window_name}:#{pane_index}"],
-            capture_output=True,
-            text=True,
-            timeout=5
-        )
+        result = tmux.run("list-panes", "-s", "-t", "life", "-F", "#{window_name}:#{pane_index}")
         if result.returncode != 0:
             return statuses
             
@@ -0,0 +1,192 @@
+"""
+Context usage from transcripts - token counts without scraping the screen.
+
+Every assistant entry in a Claude Code transcript carries the API `usage`
+for its turn. input + cache_creation + cache_read + output tokens is what
+the conversation will occupy in the model's context window on the next
+turn. Compaction writes a compact_boundary entry with the new size, and a
+request the API rejects as too large (prompt too long, oversized image)
+shows up as an API error entry - the session is stuck until reset.
+
+Tracked per transcript the same way as has_pending_question: the first
+call reads the tail, later calls only read what was appended, or nothing
+when the transcript hub already fed the new lines.
+"""
+
+import json
+import logging
+import re
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+from core.config import settings
+
+from .transcript import read_appended_lines, _read_tail_lines
+
+logger = logging.getLogger(__name__)
+
+USAGE_TAIL_LINES = 500  # First read: the latest turn is almost always this recent
+LONG_CONTEXT_WINDOW = 1_000_000  # Assumed once a session has gone past the standard window
+_USAGE_KEYS = ("input_tokens", "cache_creation_input_tokens", "cache_read_input_tokens", "output_tokens")
+_FEED_MARKERS = ('"usage"', "compact_boundary", "api_error", "isApiErrorMessage")
+_CONTEXT_FULL_RE = re.compile(r"prompt is too long|exceeds the dimension limit", re.IGNORECASE)
+
+
+@dataclass
+class ContextUsage:
+    """A session's context window usage, as of its latest transcript entry."""
+    tokens: Optional[int]  # None until the first turn (or compaction) is seen
+    window: int
+    model: Optional[str] = None
+    full: bool = False  # API rejected the last request as too large
+
+    @property
+    def percent_used(self) -> Optional[int]:
+        if self.tokens is None:
+            return 100 if self.full else None
+        return min(100, round(self.tokens * 100 / self.window))
+
+    def to_dict(self) -> dict:
+        return {
+            "tokens": self.tokens,
+            "window": self.window,
+            "model": self.model,
+            "full": self.full,
+            "percent_used": self.percent_used,
+        }
+
+
+class _UsageState:
+    """Latest context size seen in a transcript, up to byte `offset`."""
+
+    __slots__ = ("offset", "tokens", "peak", "model", "full")
+
+    def __init__(self, offset: int = 0):
+        self.offset = offset
+        self.tokens: Optional[int] = None
+        self.peak = 0
+        self.model: Optional[str] = None
+        self.full = False
+
+    def feed(self, line: str):
+        # Cheap filter first: most lines are tool results and user text
+        if not any(marker in line for marker in _FEED_MARKERS):
+            return
+        try:
+            data = json.loads(line)
+        except json.JSONDecodeError:
+            return
+        if not isinstance(data, dict) or data.get("isSidechain"):
+            return
+
+        raw_type = data.get("type")
+        if raw_type == "system":
+            if data.get("subtype") == "compact_boundary":
+                post_tokens = (data.get("compactMetadata") or {}).get("postTokens")
+                self.tokens = post_tokens if isinstance(post_tokens, int) else None
+                self.full = False
+            elif data.get("subtype") == "api_error" and _CONTEXT_FULL_RE.search(line):
+                self.full = True
+            return
+        if raw_type != "assistant":
+            return
+
+        if data.get("isApiErrorMessage"):
+            if _CONTEXT_FULL_RE.search(line):
+                self.full = True
+            return
+        message = data.get("message") or {}
+        usage = message.get("usage")
+        if not isinstance(usage, dict) or message.get("model") == "<synthetic>":
+            return
+        tokens = sum(usage.get(key) or 0 for key in _USAGE_KEYS)
+        if tokens:
+            self.tokens = tokens
+            self.peak = max(self.peak, tokens)
+            self.model = message.get("model") or self.model
+            self.full = False
+
+    def snapshot(self) -> ContextUsage:
+        window = settings.context_window_tokens
+        if self.peak > window:
+            window = LONG_CONTEXT_WINDOW
+        return ContextUsage(tokens=self.tokens, window=window, model=self.model, full=self.full)
+
+
+_usage_states: Dict[str, _UsageState] = {}
+_path_locks: Dict[str, threading.Lock] = {}
+_usage_lock = threading.Lock()  # Guards the two dicts only, never held for I/O
+
+
+def _path_lock(key: str) -> threading.Lock:
+    """Per-transcript lock, so sessions' reads don't wait on each other."""
+    with _usage_lock:
+        lock = _path_locks.get(key)
+        if lock is None:
+            lock = _path_locks[key] = threading.Lock()
+        return lock
+
+
+def update_context_usage(transcript_path: Path, lines: List[str], start: int, end: int):
+    """Feed lines a reader already parsed (the transcript hub) into the cache.
+
+    Only applied when they continue exactly where the cached state left off.
+    Called from the event loop, so it never waits on a read in progress;
+    that reader picks the lines up from the file instead.
+    """
+    key = str(transcript_path)
+    lock = _path_lock(key)
+    if not lock.acquire(blocking=False):
+        return
+    try:
+        state = _usage_states.get(key)
+        if state is not None and state.offset == start:
+            for line in lines:
+                state.feed(line)
+            state.offset = end
+    finally:
+        lock.release()
+
+
+def get_context_usage(transcript_path: Path) -> Optional[ContextUsage]:
+    """Context usage for a transcript, or None if it can't be read."""
+    if not transcript_path or not transcript_path.exists():
+        return None
+
+    key = str(transcript_path)
+    try:
+        size = transcript_path.stat().st_size
+        with _path_lock(key):
+            state = _usage_states.get(key)
+
+            if state is None or size < state.offset:
+                lines, offset = _read_tail_lines(transcript_path, USAGE_TAIL_LINES)
+                state = _UsageState(offset)
+                for line in lines:
+                    state.feed(line)
+                with _usage_lock:
+                    _usage_states[key] = state
+            elif size > state.offset:
+                lines, state.offset = read_appended_lines(transcript_path, state.offset)
+                for line in lines:
+                    state.feed(line)
+
+            return state.snapshot()
+
+    except Exception as e:
+        logger.error(f"Error reading context usage: {e}")
+        return None
+
+
+def prune_context_usage(active_paths: Iterable[Optional[Path]]) -> int:
+    """Forget cached usage of transcripts not in active_paths. Returns entries removed."""
+    active = {str(path) for path in active_paths if path}
+    with _usage_lock:
+        stale = [key for key in _usage_states if key not in active]
+        for key in stale:
+            del _usage_states[key]
+        for key in [key for key in _path_locks if key not in active]:
+            del _path_locks[key]
+    return len(stale)
@@ -2,7 +2,8 @@
 Session domain models.
 """
 
-from dataclasses import dataclass
+import asyncio
+from dataclasses import dataclass, field
 from typing import Optional
 
 
@@ -16,6 +17,24 @@ class SpawnResult:
     error: Optional[str] = None
 
 
+@dataclass(eq=False)
+class SpawnHandle:
+    """A spawn in progress (SessionService.spawn_async).
+
+    IDs are known up front; await the handle for the SpawnResult.
+    """
+    session_id: str
+    window_name: str
+    conversation_id: str
+    task: "asyncio.Task[SpawnResult]" = field(repr=False)
+
+    def done(self) -> bool:
+        return self.task.done()
+
+    def __await__(self):
+        return self.task.__await__()
+
+
 @dataclass
 class Session:
     """Session data model."""
@@ -0,0 +1,223 @@
+"""
+Standby session pool - idle, pre-launched Claude windows per model.
+
+A cold spawn pays for the shell, the `claude` launch and MCP servers
+connecting before the first prompt can go in. The pool does that ahead of
+time: each standby is a `standby-{model}-{session_id}` window with Claude
+already at its prompt. SessionService.spawn claims one, renames the window,
+binds role/conversation to the standby's session_id in the DB and injects
+the role prompt; the pool launches a replacement in the background.
+
+Claude's environment is fixed at launch, so a standby starts with its final
+CLAUDE_SESSION_ID (plus mode=interactive and PROJECT_ROOT); everything else
+is looked up from the sessions row, which the claim rewrites.
+
+Configured with settings.session_pool ({model: count}); started and stopped
+with the app (start_standby_pool / stop_standby_pool).
+"""
+
+import asyncio
+import logging
+import threading
+import time
+import uuid
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Dict, List, Optional
+
+from core.config import settings
+from core.tmux import TMUX_SESSION
+from core.tmux import run as tmux_run, run_async as tmux_run_async
+
+if TYPE_CHECKING:
+    from .service import SessionService
+
+logger = logging.getLogger(__name__)
+
+STANDBY_ROLE = "standby"
+STANDBY_PREFIX = "standby-"
+WARM_RETRY_DELAY = 30.0  # seconds before relaunching after a standby failed to warm
+
+
+@dataclass
+class Standby:
+    """A pre-launched Claude session waiting at its prompt."""
+    session_id: str
+    model: str
+    window_name: str
+    pane_id: str
+    ready_at: float
+
+
+class StandbyPool:
+    """Keeps settings.session_pool standbys per model warm.
+
+    claim() is thread-safe (sync spawn() runs in worker threads); launching
+    and retiring standbys happens on the loop that called start().
+    """
+
+    def __init__(self, service: "SessionService", sizes: Dict[str, int], warm_timeout: float = 60):
+        self.service = service
+        self.sizes = {model: count for model, count in sizes.items() if count > 0}
+        self.warm_timeout = warm_timeout
+        self._lock = threading.Lock()
+        self._ready: Dict[str, List[Standby]] = {model: [] for model in self.sizes}
+        self._warming: Dict[str, int] = {model: 0 for model in self.sizes}
+        self._tasks: set[asyncio.Task] = set()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._stopping = False
+        self._counts = {"claims": 0, "hits": 0, "misses": 0, "discarded": 0, "warm_failures": 0}
+
+    async def start(self):
+        """Retire standbys left by a previous run and start filling the pool."""
+        self._loop = asyncio.get_running_loop()
+        await asyncio.to_thread(self._cleanup_orphan_windows)
+        logger.info(f"Standby pool starting: {self.sizes}")
+        for model in self.sizes:
+            self._fill(model)
+
+    async def stop(self):
+        """Cancel warm-ups and close every idle standby."""
+        self._stopping = True
+        for task in list(self._tasks):
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        with self._lock:
+            idle = [standby for ready in self._ready.values() for standby in ready]
+            for ready in self._ready.values():
+                ready.clear()
+        for standby in idle:
+            await asyncio.to_thread(self.discard, standby)
+
+    # =========================================================================
+    # CLAIM
+    # =========================================================================
+
+    def claim(self, model: Optional[str]) -> Optional[Standby]:
+        """Take a ready standby for `model` (None on a miss); refills in the background."""
+        with self._lock:
+            self._counts["claims"] += 1
+            ready = self._ready.get(model)
+            standby = ready.pop(0) if ready else None
+            self._counts["hits" if standby else "misses"] += 1
+        if standby and self._loop and not self._stopping:
+            self._loop.call_soon_threadsafe(self._fill, model)
+        return standby
+
+    def discard(self, standby: Standby, end_session: bool = True) -> None:
+        """Close a standby that won't be used (died while idle, or pool stopping).
+
+        end_session=False keeps its session row open: a claim that found the
+        standby dead starts Claude cold under the same session_id.
+        """
+        with self._lock:
+            self._counts["discarded"] += 1
+        tmux_run("kill-window", "-t", standby.pane_id)
+        if end_session:
+            self.service.repository.mark_ended(standby.session_id, "standby_discarded")
+
+    def stats(self) -> dict:
+        """Pool occupancy and claim hit rate."""
+        with self._lock:
+            counts = dict(self._counts)
+            ready = {model: len(standbys) for model, standbys in self._ready.items()}
+        return {
+            "sizes": dict(self.sizes),
+            "ready": ready,
+            "warming": dict(self._warming),
+            **counts,
+            "hit_rate": round(counts["hits"] / counts["claims"], 3) if counts["claims"] else None,
+        }
+
+    # =========================================================================
+    # WARMING
+    # =========================================================================
+
+    def _fill(self, model: str) -> None:
+        """Launch standbys until ready + warming reaches the target (loop thread)."""
+        if self._stopping:
+            return
+        with self._lock:
+            missing = self.sizes.get(model, 0) - len(self._ready.get(model, [])) - self._warming.get(model, 0)
+        for _ in range(max(missing, 0)):
+            self._warming[model] += 1
+            task = asyncio.create_task(self._warm(model), name=f"standby-{model}")
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _warm(self, model: str) -> None:
+        """Launch one standby and add it to the pool once Claude is at its prompt."""
+        session_id = uuid.uuid4().hex[:8]
+        window_name = f"{STANDBY_PREFIX}{model}-{session_id}"
+        target = f"{TMUX_SESSION}:{window_name}"
+        service = self.service
+        try:
+            await asyncio.to_thread(service._ensure_tmux_session)
+            await service._create_window_async(window_name)
+            await service._start_claude_in_window_async(
+                window_name, session_id=session_id, role=STANDBY_ROLE, mode="interactive", model=model,
+            )
+            if not await service._wait_for_claude_async(window_name, timeout=self.warm_timeout):
+                raise TimeoutError(f"no prompt after {self.warm_timeout}s")
+            result = await tmux_run_async("display-message", "-t", target, "-p", "#{pane_id}")
+            result.check_returncode()
+            standby = Standby(session_id, model, window_name, result.stdout.strip(), time.monotonic())
+        except asyncio.CancelledError:
+            await asyncio.to_thread(service._kill_window, window_name)
+            raise
+        except Exception as e:
+            logger.warning(f"Standby {window_name} failed to warm: {e}")
+            await asyncio.to_thread(service._kill_window, window_name)
+            with self._lock:
+                self._counts["warm_failures"] += 1
+            if not self._stopping:
+                self._loop.call_later(WARM_RETRY_DELAY, self._fill, model)
+            return
+        finally:
+            self._warming[model] -= 1
+
+        with self._lock:
+            self._ready[model].append(standby)
+        logger.info(f"Standby ready: {window_name}")
+
+    def _cleanup_orphan_windows(self) -> None:
+        """Kill standby-* windows from a previous run and end their sessions."""
+        result = tmux_run("list-windows", "-t", TMUX_SESSION, "-F", "#{window_name}")
+        if result.returncode != 0:
+            return
+        for name in result.stdout.split("\n"):
+            if name.startswith(STANDBY_PREFIX):
+                logger.info(f"Cleaning up orphan standby window: {name}")
+                tmux_run("kill-window", "-t", f"{TMUX_SESSION}:{name}")
+                self.service.repository.mark_ended(name.rsplit("-", 1)[-1], "standby_discarded")
+
+
+# =============================================================================
+# SHARED POOL
+# =============================================================================
+
+_pool: Optional[StandbyPool] = None
+
+
+def get_standby_pool() -> Optional[StandbyPool]:
+    """The running pool, or None when the pool is disabled or not started."""
+    return _pool
+
+
+async def start_standby_pool(service: "SessionService", sizes: Optional[Dict[str, int]] = None) -> Optional[StandbyPool]:
+    """Start the shared pool (settings.session_pool by default); None if empty."""
+    global _pool
+    sizes = settings.session_pool if sizes is None else sizes
+    if not any(count > 0 for count in sizes.values()):
+        return None
+    pool = StandbyPool(service, sizes, warm_timeout=settings.session_pool_warm_timeout)
+    await pool.start()
+    _pool = pool
+    return pool
+
+
+async def stop_standby_pool() -> None:
+    """Stop the shared pool and close its idle standbys."""
+    global _pool
+    pool, _pool = _pool, None
+    if pool is not None:
+        await pool.stop()
@@ -45,11 +45,11 @@ class SessionRepository:
             db.close()
 
     def get_active_sessions(self) -> list[Session]:
-        """Get all sessions where ended_at IS NULL."""
+        """Get all sessions where ended_at IS NULL (idle standbys excluded)."""
         db = self._get_db()
         try:
             rows = db.fetchall(
-                "SELECT * FROM sessions WHERE ended_at IS NULL ORDER BY started_at DESC"
+                "SELECT * FROM sessions WHERE ended_at IS NULL AND role IS NOT 'standby' ORDER BY started_at DESC"
             )
             return [Session.from_row(row) for row in rows]
         finally:
@@ -104,13 +104,15 @@ class SessionRepository:
             rows = db.fetchall("""
                 SELECT session_id, started_at, last_seen_at, ended_at, current_state, cwd, tmux_pane,
                        role, mode, session_type, session_subtype, description, mission_execution_id,
-                       status_text, conversation_id, parent_session_id
+                       status_text, conversation_id, parent_session_id,
+                       transcript_path, claude_session_id
                 FROM sessions
                 WHERE (
                     ended_at IS NULL
                     OR
                     (ended_at IS NOT NULL AND date(started_at) = date('now', 'localtime'))
                 )
+                AND role IS NOT 'standby'
                 ORDER BY COALESCE(ended_at, '9999-12-31') DESC, started_at DESC
             """)
             return [dict(row) for row in rows]
@@ -299,6 +301,52 @@ class SessionRepository:
         finally:
             db.close()
 
+    def bind_session(
+        self,
+        session_id: str,
+        role: str,
+        mode: str,
+        tmux_pane: Optional[str] = None,
+        cwd: Optional[str] = None,
+        description: Optional[str] = None,
+        conversation_id: Optional[str] = None,
+        parent_session_id: Optional[str] = None,
+    ) -> bool:
+        """Assign role/conversation to a pre-launched (standby) session.
+
+        The SessionStart hook has usually registered the row already, as
+        role 'standby'; if not, it is created here. started_at moves to
+        now: the session starts when it is claimed, not when it warmed up.
+        """
+        db = self._get_db()
+        try:
+            now = self._now()
+            db.execute("""
+                INSERT INTO sessions (
+                    session_id, role, mode, started_at, last_seen_at, tmux_pane, cwd,
+                    description, conversation_id, parent_session_id, created_at, updated_at
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(session_id) DO UPDATE SET
+                    role = excluded.role,
+                    mode = excluded.mode,
+                    started_at = excluded.started_at,
+                    last_seen_at = excluded.last_seen_at,
+                    tmux_pane = COALESCE(sessions.tmux_pane, excluded.tmux_pane),
+                    cwd = COALESCE(sessions.cwd, excluded.cwd),
+                    description = excluded.description,
+                    conversation_id = excluded.conversation_id,
+                    parent_session_id = excluded.parent_session_id,
+                    updated_at = excluded.updated_at
+            """, (
+                session_id, role, mode, now, now, tmux_pane, cwd,
+                description, conversation_id, parent_session_id, now, now,
+            ))
+            return True
+        except Exception:
+            return False
+        finally:
+            db.close()
+
     # NOTE: set_state() removed - dead code. current_state only set to "ended" via mark_ended().
 
     def mark_ended(self, session_id: str, reason: str) -> bool:
@@ -438,7 +486,7 @@ class SessionRepository:
             row = db.fetchone("""
                 SELECT session_id, role, conversation_id, tmux_pane, mode, status_text, spec_path
                 FROM sessions
-                WHERE session_id LIKE ? AND ended_at IS NULL
+                WHERE session_id LIKE ? AND ended_at IS NULL AND role IS NOT 'standby'
             """, (f"{id}%",))
 
             return dict(row) if row else None
@@ -460,7 +508,7 @@ class SessionRepository:
                        (SELECT COUNT(*) FROM sessions s2
                         WHERE s2.conversation_id = s.conversation_id) as sessions_count
                 FROM sessions s
-                WHERE s.ended_at IS NULL
+                WHERE s.ended_at IS NULL AND s.role IS NOT 'standby'
                 ORDER BY s.started_at DESC
             """)
 
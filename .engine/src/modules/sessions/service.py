@@ -11,6 +11,7 @@ Single source of truth for all session operations:
 
 """
 
+import asyncio
 import os
 import subprocess
 import time
@@ -21,9 +22,13 @@ from typing import Optional
 
 from core.config import settings
 from core.event_log import emit_event
-from core.tmux import send_keys, send_text, inject_message
+from core.perf import record_worker_latency
+from core.tmux import capture_pane, inject_message, send_keys, send_text, send_text_async
+from core.tmux import run as tmux_run, run_async as tmux_run_async, window_exists as tmux_window_exists
+from core.tmux import wait_for_pane, wait_for_pane_async
 
-from .models import Session, SpawnResult
+from .models import Session, SpawnHandle, SpawnResult
+from .pool import Standby, get_standby_pool
 from .repository import SessionRepository
 
 
@@ -43,6 +48,39 @@ DEFAULT_MODELS = {
 _REPO_ROOT = settings.repo_root
 _DB_PATH = settings.db_path
 
+# Running spawn_async tasks (asyncio only keeps weak references)
+_SPAWN_TASKS: set[asyncio.Task] = set()
+
+
+def _claude_prompt_visible(content: str) -> bool:
+    """Claude's input prompt is on screen.
+
+    Only the prompt counts — not just the banner. With --chrome, the
+    "Claude Code" banner appears seconds before the prompt while MCP
+    servers connect. Injecting during that gap loses the prompt.
+    """
+    return "❯" in content or content.strip().endswith(">")
+
+
+# Waiting for a fresh window's shell prompt: quick polls, short settle
+_SHELL_WAIT = {"timeout": 2, "poll_interval": 0.2, "quiet": 0.2, "settle": 0.2}
+
+
+# pane_current_command of a window whose Claude has exited
+_SHELLS = {"sh", "bash", "zsh", "fish", "dash"}
+
+
+def _shell_prompt_visible(content: str) -> bool:
+    """A fresh window's shell has drawn its prompt."""
+    content = content.strip()
+    return bool(content) and (content.endswith("$") or content.endswith("%") or "%" in content.split("\n")[-1])
+
+
+def _record_spawn_latency(pooled: bool, started: float, errored: bool = False) -> None:
+    """Spawn-to-first-prompt time, split by whether a standby was claimed."""
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    record_worker_latency("session_spawn.standby" if pooled else "session_spawn.cold", elapsed_ms, errored)
+
 
 class SessionService:
     """
@@ -91,67 +129,50 @@ class SessionService:
         Spawn a new Claude session in tmux.
 
         This is THE way to create sessions. All other code calls this.
+        With the standby pool running, eligible spawns take a pre-launched
+        Claude (see _claim_standby) and skip straight to the prompt.
         """
         window_created = False
+        started = time.perf_counter()
+        standby = None
 
         try:
-            # Generate session ID
-            session_id = uuid.uuid4().hex[:8]
-
-            # Generate conversation_id if not inheriting
-            if conversation_id is None:
-                if role == "chief":
-                    # Eternal conversation for Chief - stable folder
-                    conversation_id = "chief"
-                else:
-                    # Unique conversation per specialist task
-                    # Format: MMDD-HHMM-{role}-{id} for timeline sorting
-                    from datetime import datetime
-                    timestamp = datetime.now().strftime("%m%d-%H%M")
-                    role_slug = role.replace(" ", "-")
-                    conversation_id = f"{timestamp}-{role_slug}-{uuid.uuid4().hex[:8]}"
-
-            # Determine window name
-            if window_name is None:
-                window_name = f"{role}-{session_id}"
-
-            # Ensure tmux session exists
-            self._ensure_tmux_session()
-
-            # Check if window already exists
-            if self._window_exists(window_name):
-                if self._is_claude_running(window_name):
-                    return SpawnResult(
-                        success=False,
-                        error=f"Claude already running in window '{window_name}'"
-                    )
-                # Window exists but Claude not running - reuse it
-            else:
-                # Create new window
-                self._create_window(window_name)
+            standby = self._claim_standby(role, mode, window_name, mission_execution_id, spec_path)
+            session_id, conversation_id, window_name = self._spawn_names(
+                role, window_name, conversation_id, standby.session_id if standby else None
+            )
+
+            if standby and self._bind_standby(
+                standby, window_name, role, mode, description, conversation_id, parent_session_id,
+            ):
                 window_created = True
+            else:
+                standby = None
+                window_created = self._prepare_window(window_name)
+
+                # Start Claude in the window
+                self._start_claude_in_window(
+                    window_name=window_name,
+                    session_id=session_id,
+                    role=role,
+                    mode=mode,
+                    description=description,
+                    mission_execution_id=mission_execution_id,
+                    conversation_id=conversation_id,
+                    parent_session_id=parent_session_id,
+                    spec_path=spec_path,
+                )
 
-            # Start Claude in the window
-            self._start_claude_in_window(
-                window_name=window_name,
+                # Wait for Claude to be ready
+                if wait_for_ready:
+                    ready = self._wait_for_claude(window_name, timeout=30)
+                    if not ready:
+                        raise TimeoutError("Claude did not become ready in time")
+
+            result = self._deliver_prompt(
                 session_id=session_id,
-                role=role,
-                mode=mode,
-                description=description,
-                mission_execution_id=mission_execution_id,
+                window_name=window_name,
                 conversation_id=conversation_id,
-                parent_session_id=parent_session_id,
-                spec_path=spec_path,
-            )
-
-            # Wait for Claude to be ready
-            if wait_for_ready:
-                ready = self._wait_for_claude(window_name, timeout=30)
-                if not ready:
-                    raise TimeoutError("Claude did not become ready in time")
-
-            # Build and inject the initial prompt
-            prompt = self._build_prompt(
                 role=role,
                 mode=mode,
                 description=description,
@@ -160,34 +181,11 @@ class SessionService:
                 handoff_content=handoff_content,
                 handoff_reason=handoff_reason,
                 mission_id=mission_id,
-                conversation_id=conversation_id,
                 spec_path=spec_path,
+                initial_task=initial_task,
             )
-
-            if initial_task:
-                prompt = prompt + "\n\n" + initial_task
-
-            self._inject_prompt(window_name, prompt)
-
-            # Emit session/started event
-            emit_event(
-                "session",
-                "started",
-                actor=session_id,
-                data={
-                    "role": role,
-                    "mode": mode,
-                    "window": window_name,
-                    "description": description,
-                }
-            )
-
-            return SpawnResult(
-                success=True,
-                session_id=session_id,
-                window_name=window_name,
-                conversation_id=conversation_id,
-            )
+            _record_spawn_latency(standby is not None, started)
+            return result
 
         except Exception as e:
             # Rollback: kill window if we created it
@@ -196,8 +194,291 @@ class SessionService:
                     self._kill_window(window_name)
                 except Exception:
                     pass
+            _record_spawn_latency(standby is not None, started, errored=True)
             return SpawnResult(success=False, error=str(e))
 
+    async def spawn_async(
+        self,
+        role: str,
+        mode: str = "interactive",
+        *,
+        window_name: Optional[str] = None,
+        description: Optional[str] = None,
+        project_path: Optional[str] = None,
+        handoff_path: Optional[str] = None,
+        handoff_content: Optional[str] = None,
+        handoff_reason: Optional[str] = None,
+        mission_id: Optional[str] = None,
+        mission_execution_id: Optional[str] = None,
+        wait_for_ready: bool = True,
+        initial_task: Optional[str] = None,
+        conversation_id: Optional[str] = None,
+        parent_session_id: Optional[str] = None,
+        spec_path: Optional[str] = None,
+    ) -> SpawnHandle:
+        """
+        Start spawn() and return a handle right away.
+
+        The handle carries the session/window/conversation IDs; await it
+        for the SpawnResult, which resolves once Claude's prompt is visible
+        and the initial prompt is injected. Window setup, the launch and the
+        wait for readiness hold no thread; only the standby claim, the
+        session checks and prompt injection run in a worker thread.
+        """
+        started = time.perf_counter()
+        standby = await asyncio.to_thread(
+            self._claim_standby, role, mode, window_name, mission_execution_id, spec_path
+        )
+        session_id, conversation_id, window_name = self._spawn_names(
+            role, window_name, conversation_id, standby.session_id if standby else None
+        )
+
+        async def run() -> SpawnResult:
+            nonlocal standby
+            window_created = False
+            try:
+                if standby and await asyncio.to_thread(
+                    self._bind_standby,
+                    standby, window_name, role, mode, description, conversation_id, parent_session_id,
+                ):
+                    window_created = True
+                else:
+                    standby = None
+                    window_created = await self._prepare_window_async(window_name)
+                    await self._start_claude_in_window_async(
+                        window_name=window_name,
+                        session_id=session_id,
+                        role=role,
+                        mode=mode,
+                        description=description,
+                        mission_execution_id=mission_execution_id,
+                        conversation_id=conversation_id,
+                        parent_session_id=parent_session_id,
+                        spec_path=spec_path,
+                    )
+
+                    if wait_for_ready:
+                        ready = await self._wait_for_claude_async(window_name, timeout=30)
+                        if not ready:
+                            raise TimeoutError("Claude did not become ready in time")
+
+                result = await asyncio.to_thread(
+                    self._deliver_prompt,
+                    session_id=session_id,
+                    window_name=window_name,
+                    conversation_id=conversation_id,
+                    role=role,
+                    mode=mode,
+                    description=description,
+                    project_path=project_path,
+                    handoff_path=handoff_path,
+                    handoff_content=handoff_content,
+                    handoff_reason=handoff_reason,
+                    mission_id=mission_id,
+                    spec_path=spec_path,
+                    initial_task=initial_task,
+                )
+                _record_spawn_latency(standby is not None, started)
+                return result
+
+            except Exception as e:
+                if window_created:
+                    try:
+                        await asyncio.to_thread(self._kill_window, window_name)
+                    except Exception:
+                        pass
+                _record_spawn_latency(standby is not None, started, errored=True)
+                return SpawnResult(success=False, error=str(e))
+
+        task = asyncio.create_task(run(), name=f"spawn-{window_name}")
+        # Callers may drop the handle (fire-and-forget); keep the task alive
+        _SPAWN_TASKS.add(task)
+        task.add_done_callback(_SPAWN_TASKS.discard)
+        return SpawnHandle(
+            session_id=session_id,
+            window_name=window_name,
+            conversation_id=conversation_id,
+            task=task,
+        )
+
+    def _spawn_names(
+        self,
+        role: str,
+        window_name: Optional[str],
+        conversation_id: Optional[str],
+        session_id: Optional[str] = None,
+    ) -> tuple[str, str, str]:
+        """Generate (session_id, conversation_id, window_name) for a spawn.
+
+        A claimed standby brings its own session_id (already in its env).
+        """
+        # Generate session ID
+        session_id = session_id or uuid.uuid4().hex[:8]
+
+        # Generate conversation_id if not inheriting
+        if conversation_id is None:
+            if role == "chief":
+                # Eternal conversation for Chief - stable folder
+                conversation_id = "chief"
+            else:
+                # Unique conversation per specialist task
+                # Format: MMDD-HHMM-{role}-{id} for timeline sorting
+                timestamp = datetime.now().strftime("%m%d-%H%M")
+                role_slug = role.replace(" ", "-")
+                conversation_id = f"{timestamp}-{role_slug}-{uuid.uuid4().hex[:8]}"
+
+        # Determine window name
+        if window_name is None:
+            window_name = f"{role}-{session_id}"
+
+        return session_id, conversation_id, window_name
+
+    def _claim_standby(
+        self,
+        role: str,
+        mode: str,
+        window_name: Optional[str],
+        mission_execution_id: Optional[str],
+        spec_path: Optional[str],
+    ) -> Optional[Standby]:
+        """Take a ready standby from the pool, if one fits this spawn.
+
+        Standbys launch as plain interactive sessions and their env can't
+        change afterwards, so spawns that need more in the env (mission,
+        spec and workspace modes) start cold, as does Chief (--chrome,
+        fixed window) and a spawn into an existing window.
+        """
+        pool = get_standby_pool()
+        if pool is None or role == "chief" or mode != "interactive" or mission_execution_id or spec_path:
+            return None
+        if window_name and self._window_exists(window_name):
+            return None
+        return pool.claim(self.repository.get_model_for_role(role, DEFAULT_MODELS))
+
+    def _bind_standby(
+        self,
+        standby: Standby,
+        window_name: str,
+        role: str,
+        mode: str,
+        description: Optional[str],
+        conversation_id: str,
+        parent_session_id: Optional[str],
+    ) -> bool:
+        """Turn a claimed standby into this spawn's window and session.
+
+        Returns False (standby discarded) if Claude exited while idle - the
+        pane is back at its shell - so the caller can start cold instead,
+        keeping the standby's session_id.
+        """
+        current = tmux_run("display-message", "-t", standby.pane_id, "-p", "#{pane_current_command}")
+        if (
+            current.returncode != 0
+            or current.stdout.strip() in _SHELLS
+            or tmux_run("rename-window", "-t", standby.pane_id, window_name).returncode != 0
+        ):
+            pool = get_standby_pool()
+            if pool is not None:
+                pool.discard(standby, end_session=False)
+            else:
+                # Pool stopped between claim and bind: close the window ourselves
+                tmux_run("kill-window", "-t", standby.pane_id)
+            return False
+        self.repository.bind_session(
+            standby.session_id,
+            role=role,
+            mode=mode,
+            tmux_pane=standby.pane_id,
+            cwd=str(self.repo_root),
+            description=description,
+            conversation_id=conversation_id,
+            parent_session_id=parent_session_id,
+        )
+        return True
+
+    def _prepare_window(self, window_name: str) -> bool:
+        """Make sure an empty window exists for Claude. Returns True if we created it."""
+        if self._reuse_window(window_name):
+            return False
+        self._create_window(window_name)
+        return True
+
+    async def _prepare_window_async(self, window_name: str) -> bool:
+        """Async _prepare_window."""
+        if await asyncio.to_thread(self._reuse_window, window_name):
+            return False
+        await self._create_window_async(window_name)
+        return True
+
+    def _reuse_window(self, window_name: str) -> bool:
+        """Ensure the tmux session; True if the window exists without Claude in it."""
+        # Ensure tmux session exists
+        self._ensure_tmux_session()
+
+        # Check if window already exists
+        if not self._window_exists(window_name):
+            return False
+        if self._is_claude_running(window_name):
+            raise RuntimeError(f"Claude already running in window '{window_name}'")
+        # Window exists but Claude not running - reuse it
+        return True
+
+    def _deliver_prompt(
+        self,
+        session_id: str,
+        window_name: str,
+        conversation_id: str,
+        role: str,
+        mode: str,
+        description: Optional[str] = None,
+        project_path: Optional[str] = None,
+        handoff_path: Optional[str] = None,
+        handoff_content: Optional[str] = None,
+        handoff_reason: Optional[str] = None,
+        mission_id: Optional[str] = None,
+        spec_path: Optional[str] = None,
+        initial_task: Optional[str] = None,
+    ) -> SpawnResult:
+        """Inject the initial prompt into a ready session and announce it."""
+        # Build and inject the initial prompt
+        prompt = self._build_prompt(
+            role=role,
+            mode=mode,
+            description=description,
+            project_path=project_path,
+            handoff_path=handoff_path,
+            handoff_content=handoff_content,
+            handoff_reason=handoff_reason,
+            mission_id=mission_id,
+            conversation_id=conversation_id,
+            spec_path=spec_path,
+        )
+
+        if initial_task:
+            prompt = prompt + "\n\n" + initial_task
+
+        self._inject_prompt(window_name, prompt)
+
+        # Emit session/started event
+        emit_event(
+            "session",
+            "started",
+            actor=session_id,
+            data={
+                "role": role,
+                "mode": mode,
+                "window": window_name,
+                "description": description,
+            }
+        )
+
+        return SpawnResult(
+            success=True,
+            session_id=session_id,
+            window_name=window_name,
+            conversation_id=conversation_id,
+        )
+
     # =========================================================================
     # QUERY
     # =========================================================================
@@ -207,7 +488,7 @@ class SessionService:
         return self.repository.get_session(session_id)
 
     def get_active_sessions(self) -> list[Session]:
-        """Get all sessions where ended_at IS NULL."""
+        """Get all sessions where ended_at IS NULL (idle standbys excluded)."""
         return self.repository.get_active_sessions()
 
     def find_session_by_pane(self, tmux_pane: str) -> Optional[Session]:
@@ -640,15 +921,7 @@ Do this NOW before continuing any other work."""
 
     def _window_exists(self, window_name: str) -> bool:
         """Check if a tmux window exists."""
-        result = subprocess.run(
-            ["tmux", "list-windows", "-t", TMUX_SESSION, "-F", "#{window_name}"],
-            capture_output=True,
-            text=True
-        )
-        if result.returncode != 0:
-            return False
-        windows = result.stdout.strip().split("\n")
-        return window_name in windows
+        return tmux_window_exists(window_name, TMUX_SESSION)
 
     def _is_claude_running(self, window_name: str) -> bool:
         """Check if Claude is running in a window.
@@ -660,11 +933,7 @@ Do this NOW before continuing any other work."""
         target = f"{TMUX_SESSION}:{window_name}"
 
         # Method 1: Get pane PID and check its process tree
-        result = subprocess.run(
-            ["tmux", "display-message", "-t", target, "-p", "#{pane_pid}"],
-            capture_output=True,
-            text=True
-        )
+        result = tmux_run("display-message", "-t", target, "-p", "#{pane_pid}")
         if result.returncode == 0:
             pane_pid = result.stdout.strip()
             if pane_pid:
@@ -692,13 +961,8 @@ Do this NOW before continuing any other work."""
                                 return True
 
         # Method 2: Check pane content for Claude indicators
-        result = subprocess.run(
-            ["tmux", "capture-pane", "-t", target, "-p"],
-            capture_output=True,
-            text=True
-        )
-        if result.returncode == 0:
-            content = result.stdout
+        content = capture_pane(target)
+        if content is not None:
             # Look for Claude-specific indicators
             indicators = ["claude", "Opus", "Sonnet", "ctx:", "╭", "╰", "⏵"]
             last_lines = content.split("\n")[-10:]
@@ -722,19 +986,19 @@ Do this NOW before continuing any other work."""
         ], check=True)
 
         target = f"{TMUX_SESSION}:{window_name}"
-        for _ in range(10):
-            time.sleep(0.2)
-            result = subprocess.run(
-                ["tmux", "capture-pane", "-t", target, "-p"],
-                capture_output=True,
-                text=True
-            )
-            if result.returncode == 0:
-                content = result.stdout.strip()
-                if content and (content.endswith("$") or content.endswith("%") or "%" in content.split("\n")[-1]):
-                    time.sleep(0.2)
-                    return
-        time.sleep(0.5)
+        if not wait_for_pane(target, _shell_prompt_visible, **_SHELL_WAIT):
+            time.sleep(0.5)
+
+    async def _create_window_async(self, window_name: str):
+        """Async _create_window."""
+        result = await tmux_run_async(
+            "new-window", "-d", "-t", TMUX_SESSION, "-n", window_name, "-c", str(self.repo_root)
+        )
+        result.check_returncode()
+
+        target = f"{TMUX_SESSION}:{window_name}"
+        if not await wait_for_pane_async(target, _shell_prompt_visible, **_SHELL_WAIT):
+            await asyncio.sleep(0.5)
 
     def _kill_window(self, window_name: str):
         """Kill a tmux window."""
@@ -757,7 +1021,34 @@ Do this NOW before continuing any other work."""
     ):
         """Start Claude in an existing window."""
         target = f"{TMUX_SESSION}:{window_name}"
+        for command in self._claude_launch_commands(
+            session_id, role, mode, description, mission_execution_id,
+            conversation_id, parent_session_id, spec_path,
+        ):
+            send_text(target, command)
+
+    async def _start_claude_in_window_async(self, window_name: str, **launch) -> None:
+        """Async _start_claude_in_window (same keyword arguments)."""
+        target = f"{TMUX_SESSION}:{window_name}"
+        for command in self._claude_launch_commands(**launch):
+            await send_text_async(target, command)
 
+    def _claude_launch_commands(
+        self,
+        session_id: str,
+        role: str,
+        mode: str,
+        description: Optional[str] = None,
+        mission_execution_id: Optional[str] = None,
+        conversation_id: Optional[str] = None,
+        parent_session_id: Optional[str] = None,
+        spec_path: Optional[str] = None,
+        model: Optional[str] = None,
+    ) -> list[str]:
+        """Shell commands that export the session env and start Claude.
+
+        model overrides the role's configured model (standbys have no role yet).
+        """
         env_vars = [
             f"CLAUDE_SESSION_ID={session_id}",
             f"CLAUDE_SESSION_ROLE={role}",
@@ -783,7 +1074,6 @@ Do this NOW before continuing any other work."""
             env_vars.append(f"WORKSPACE={workspace_path}")
 
         env_cmd = "export " + " ".join(env_vars)
-        send_text(target, env_cmd)
 
         claude_session_uuid = str(uuid.uuid4())
         cmd_parts = [
@@ -792,7 +1082,7 @@ Do this NOW before continuing any other work."""
             f"--session-id {claude_session_uuid}",
         ]
 
-        model = self.repository.get_model_for_role(role, DEFAULT_MODELS)
+        model = model or self.repository.get_model_for_role(role, DEFAULT_MODELS)
         if model:
             cmd_parts.append(f"--model {model}")
 
@@ -801,42 +1091,19 @@ Do this NOW before continuing any other work."""
         if role in CHROME_ROLES:
             cmd_parts.append("--chrome")
 
-        send_text(target, " ".join(cmd_parts))
+        return [env_cmd, " ".join(cmd_parts)]
 
     def _wait_for_claude(self, window_name: str, timeout: int = 30) -> bool:
-        """Wait for Claude to be ready for input."""
-        target = f"{TMUX_SESSION}:{window_name}"
-        waited = 0
-        poll_interval = 0.5
-
-        while waited < timeout:
-            time.sleep(poll_interval)
-            waited += poll_interval
-
-            result = subprocess.run(
-                ["tmux", "capture-pane", "-t", target, "-p"],
-                capture_output=True,
-                text=True
-            )
-            if result.returncode == 0:
-                content = result.stdout
-                # Only return when actual input prompt is visible — not just the banner.
-                # With --chrome, "Claude Code" banner appears seconds before the prompt
-                # while MCP servers connect. Injecting during that gap loses the prompt.
-                has_prompt = "❯" in content or content.strip().endswith(">")
-                if has_prompt:
-                    time.sleep(1)
-                    return True
+        """Wait for Claude to be ready for input (see _claude_prompt_visible)."""
+        return wait_for_pane(f"{TMUX_SESSION}:{window_name}", _claude_prompt_visible, timeout=timeout)
 
-        return False
+    async def _wait_for_claude_async(self, window_name: str, timeout: int = 30) -> bool:
+        """Async _wait_for_claude: no thread is held while Claude starts."""
+        return await wait_for_pane_async(f"{TMUX_SESSION}:{window_name}", _claude_prompt_visible, timeout=timeout)
 
     def _get_active_window(self) -> str:
         """Get the currently active tmux window name."""
-        result = subprocess.run(
-            ["tmux", "display-message", "-t", TMUX_SESSION, "-p", "#{window_name}"],
-            capture_output=True,
-            text=True
-        )
+        result = tmux_run("display-message", "-t", TMUX_SESSION, "-p", "#{window_name}")
         return result.stdout.strip() if result.returncode == 0 else "unknown"
 
     def _get_schedule_snippet(self) -> str:
@@ -2,7 +2,7 @@
 Transcript Watcher Service
 
 Watches Claude Code transcript files for real-time structured output.
-Uses watchdog for filesystem events with polling fallback.
+Live tailing goes through the shared transcript hub (transcript_hub.py).
 
 Transcript files are written by Claude Code at:
     ~/.claude/projects/{project-hash}/{session-uuid}.jsonl
@@ -16,20 +16,22 @@ Schema: Each line is a JSON object with:
     - message: Content (structure varies by type)
 """
 
-import asyncio
 import json
 import logging
 import re
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass
-from datetime import datetime
 from pathlib import Path
-from typing import AsyncGenerator, Optional, Dict, Any, List
+from typing import AsyncGenerator, Optional, Dict, Any, List, Tuple
+
+from .transcript_index import get_transcript_index
 
 logger = logging.getLogger(__name__)
 
 # Constants
 CLAUDE_PROJECTS_DIR = Path.home() / ".claude" / "projects"
-POLL_INTERVAL_MS = 200
+EVENT_CACHE_MAX_EVENTS = 200_000  # Parsed events kept across all cached transcripts
 
 
 @dataclass
@@ -282,13 +284,16 @@ def format_event_for_sse(event: TranscriptEvent, include_thinking: bool = True)
 
 
 class TranscriptWatcher:
-    """Watches a transcript file and yields events as they arrive."""
+    """Watches a transcript file and yields events as they arrive.
+
+    A thin viewer on the shared transcript hub: all watchers of the same
+    file share one reader that parses each new line once.
+    """
 
     def __init__(self, transcript_path: Path):
         self.path = transcript_path
-        self.position = 0
         self._stop = False
-        self._last_enqueued: Optional[Dict[str, Any]] = None  # Track last enqueued event for dequeue handling
+        self._viewer = None
 
     async def watch(
         self,
@@ -306,122 +311,29 @@ class TranscriptWatcher:
         Yields:
             Formatted event dicts ready for SSE transmission
         """
-        # Wait for file to appear (for brand new sessions)
-        max_wait_seconds = 30
-        wait_interval = 0.5
-        waited = 0.0
-
-        while not self.path.exists() and waited < max_wait_seconds:
-            await asyncio.sleep(wait_interval)
-            waited += wait_interval
-
-        if not self.path.exists():
-            yield {"type": "error", "message": f"Transcript not found after {max_wait_seconds}s: {self.path}"}
-            return
-
-        # Start position - if after_uuid specified, we need to scan from beginning
-        if after_uuid or from_beginning:
-            self.position = 0
-        else:
-            self.position = self.path.stat().st_size
-
-        # If after_uuid specified, scan file to find it and skip to that position
-        found_after_uuid = after_uuid is None  # If no UUID specified, we're "already found"
-
-        if after_uuid:
-            # Scan the file to find the UUID and set position just after it
-            with open(self.path, 'r') as f:
-                while True:
-                    line_start = f.tell()
-                    line = f.readline()
-                    if not line:
-                        # Reached end without finding UUID - start from end (no history)
-                        self.position = f.tell()
-                        found_after_uuid = True
-                        break
-
-                    try:
-                        data = json.loads(line)
-                        if data.get("uuid") == after_uuid:
-                            # Found it - position is now just after this line
-                            self.position = f.tell()
-                            found_after_uuid = True
-                            break
-                    except json.JSONDecodeError:
-                        continue
-
-        # Send initial connected event
-        yield {
-            "type": "connected",
-            "transcript_path": str(self.path),
-            "timestamp": datetime.now().isoformat(),
-        }
-
-        poll_interval = POLL_INTERVAL_MS / 1000
-
-        while not self._stop:
-            try:
-                current_size = self.path.stat().st_size
-
-                if current_size > self.position:
-                    # File grew - read new content
-                    with open(self.path, 'r') as f:
-                        f.seek(self.position)
-                        new_content = f.read()
-                        self.position = f.tell()
-
-                    # Parse and yield events
-                    lines = new_content.strip().split('\n')
-                    logger.debug(f"[TRANSCRIPT] Read {len(lines)} new lines from {self.path.name}")
-                    for line in lines:
-                        if not line.strip():
-                            continue
-
-                        # Check for dequeue/remove before parsing (parser skips these)
-                        try:
-                            raw = json.loads(line)
-                            if raw.get("type") == "queue-operation" and raw.get("operation") in ("dequeue", "remove"):
-                                if self._last_enqueued:
-                                    # Re-emit with queued=false so frontend updates the message
-                                    unqueued = {**self._last_enqueued}
-                                    unqueued.pop("queued", None)
-                                    unqueued["replaces_queued"] = True
-                                    self._last_enqueued = None
-                                    yield unqueued
-                                continue
-                        except json.JSONDecodeError:
-                            pass
-
-                        events = parse_transcript_line(line)
-                        for event in events:
-                            # Track enqueued messages for dequeue handling
-                            if event.queued:
-                                formatted = format_event_for_sse(event, include_thinking)
-                                if formatted:
-                                    self._last_enqueued = formatted
-                                    yield formatted
-                                continue
-
-                            # Real user_message matching a queued one - clear tracking
-                            if event.event_type == "user_message" and self._last_enqueued and event.content == self._last_enqueued.get("content"):
-                                self._last_enqueued = None
-
-                            formatted = format_event_for_sse(event, include_thinking)
-                            if formatted:
-                                logger.debug(f"[TRANSCRIPT] Yielding {formatted['type']} event uuid={formatted.get('uuid', 'none')[:8]}")
-                                yield formatted
-
-                await asyncio.sleep(poll_interval)
-
-            except asyncio.CancelledError:
-                break
-            except Exception as e:
-                yield {"type": "error", "message": str(e)}
+        from .transcript_hub import transcript_hub
+
+        async for event in transcript_hub.stream(
+            self.path,
+            include_thinking=include_thinking,
+            from_beginning=from_beginning,
+            after_uuid=after_uuid,
+            viewer_ready=self._attach,
+        ):
+            if self._stop:
                 break
+            yield event
+
+    def _attach(self, viewer):
+        self._viewer = viewer
+        if self._stop:
+            viewer.close()
 
     def stop(self):
         """Stop the watcher."""
         self._stop = True
+        if self._viewer:
+            self._viewer.close()
 
 
 async def stream_transcript(
@@ -449,12 +361,20 @@ async def stream_transcript(
 def get_all_events(
     transcript_path: Path,
     include_thinking: bool = True,
+    start_line: int = 0,
+    end_line: Optional[int] = None,
 ) -> List[Dict[str, Any]]:
-    """Read all events from a transcript file.
+    """Read events from a transcript file.
+
+    Uses the transcript's offset index, so only lines appended since the
+    last call are scanned for metadata and only [start_line, end_line) is
+    parsed into events.
 
     Args:
         transcript_path: Path to the transcript file
         include_thinking: If False, filter out thinking blocks
+        start_line: First transcript line to parse (0-based, blank lines skipped)
+        end_line: Line to stop before, None for end of file
 
     Returns:
         List of formatted event dicts
@@ -464,45 +384,24 @@ def get_all_events(
 
     events = []
     try:
-        # Two-pass dedup for queue-operations:
-        # Pass 1: collect all user_message content strings
-        # Pass 2: only include enqueue events whose content has no matching user_message
-        lines = []
-        user_message_content: set[str] = set()
-        dequeue_count = 0  # Track if enqueued messages have been processed
-
-        with open(transcript_path, 'r') as f:
-            for line in f:
-                line = line.strip()
-                if not line:
-                    continue
-                lines.append(line)
-                try:
-                    data = json.loads(line)
-                    # Collect user message content for dedup
-                    if data.get("type") == "user":
-                        msg = data.get("message", {})
-                        content = msg.get("content", "")
-                        if isinstance(content, str):
-                            user_message_content.add(content[:2000])
-                    # Count dequeue/remove operations
-                    elif data.get("type") == "queue-operation" and data.get("operation") in ("dequeue", "remove"):
-                        dequeue_count += 1
-                except json.JSONDecodeError:
-                    pass
-
-        # Pass 2: parse and filter
-        enqueue_seen = 0
-        for line in lines:
+        index = get_transcript_index(transcript_path)
+
+        # Queue-operation dedup uses whole-file state from the index:
+        # skip enqueues whose content has a matching user_message, and show
+        # enqueues as normal (not queued) once they were dequeued/removed
+        with index.lock:
+            lines = list(index.read_lines(start_line, end_line))
+            dequeue_count = index.dequeue_count
+
+        for line_no, line in lines:
             parsed_events = parse_transcript_line(line)
             for event in parsed_events:
                 if event.queued:
-                    enqueue_seen += 1
-                    if event.content in user_message_content:
+                    if index.has_user_content(event.content):
                         # Real user_message exists - skip the enqueue entirely
                         continue
                     # No matching user_message but was dequeued/removed - show as normal (not queued)
-                    if enqueue_seen <= dequeue_count:
+                    if index.enqueue_ordinal(line_no) <= dequeue_count:
                         event.queued = False
 
                 formatted = format_event_for_sse(event, include_thinking)
@@ -514,6 +413,53 @@ def get_all_events(
     return events
 
 
+# Parsed-event cache: (path, include_thinking) -> (size, mtime_ns, events).
+# A size/mtime mismatch means the file changed and the entry is re-parsed.
+_event_cache: "OrderedDict[Tuple[str, bool], Tuple[int, int, List[Dict[str, Any]]]]" = OrderedDict()
+_event_cache_lock = threading.Lock()
+_event_cache_size = 0
+event_cache_stats = {"hits": 0, "misses": 0}
+
+
+def get_cached_events(
+    transcript_path: Path,
+    include_thinking: bool = True,
+) -> List[Dict[str, Any]]:
+    """get_all_events memoized on (path, size, mtime), LRU-bounded by event count.
+
+    The returned list and dicts are shared with the cache - copy before mutating.
+    """
+    global _event_cache_size
+
+    try:
+        stat = transcript_path.stat()
+    except OSError:
+        return []
+
+    key = (str(transcript_path), include_thinking)
+    with _event_cache_lock:
+        cached = _event_cache.get(key)
+        if cached and cached[0] == stat.st_size and cached[1] == stat.st_mtime_ns:
+            _event_cache.move_to_end(key)
+            event_cache_stats["hits"] += 1
+            return cached[2]
+        event_cache_stats["misses"] += 1
+
+    events = get_all_events(transcript_path, include_thinking=include_thinking)
+
+    with _event_cache_lock:
+        previous = _event_cache.pop(key, None)
+        if previous:
+            _event_cache_size -= len(previous[2])
+        _event_cache[key] = (stat.st_size, stat.st_mtime_ns, events)
+        _event_cache_size += len(events)
+        while _event_cache_size > EVENT_CACHE_MAX_EVENTS and len(_event_cache) > 1:
+            _, (_, _, evicted) = _event_cache.popitem(last=False)
+            _event_cache_size -= len(evicted)
+
+    return events
+
+
 def get_transcript_path_for_session(
     session_id: str,
     db_path: Path,
@@ -527,103 +473,239 @@ def get_transcript_path_for_session(
     Returns:
         Path to transcript file, or None if not found
     """
-    import sqlite3
+    from core.database import get_pool
 
     try:
-        conn = sqlite3.connect(str(db_path))
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
-
-        cursor.execute("""
+        row = get_pool(Path(db_path)).reader().execute("""
             SELECT transcript_path, claude_session_id, cwd
             FROM sessions
             WHERE session_id = ?
-        """, (session_id,))
-        row = cursor.fetchone()
-        conn.close()
+        """, (session_id,)).fetchone()
 
         if not row:
             return None
 
-        # Primary: use stored transcript_path
-        if row["transcript_path"]:
-            path = Path(row["transcript_path"])
-            if path.exists():
-                return path
-
-        # Fallback: reconstruct from claude_session_id
-        if row["claude_session_id"] and row["cwd"]:
-            # Project hash format: replace / with - and prepend -
-            cwd = row["cwd"]
-            project_hash = "-" + cwd.replace("/", "-")
-            fallback_path = CLAUDE_PROJECTS_DIR / project_hash / f"{row['claude_session_id']}.jsonl"
-            if fallback_path.exists():
-                return fallback_path
-
-        return None
+        return resolve_transcript_path(row["transcript_path"], row["claude_session_id"], row["cwd"])
 
     except Exception as e:
         logger.error(f"Error looking up transcript path: {e}")
         return None
 
 
-INTERACTIVE_TOOLS = {"AskUserQuestion", "EnterPlanMode", "ExitPlanMode"}
+def resolve_transcript_path(
+    transcript_path: Optional[str],
+    claude_session_id: Optional[str],
+    cwd: Optional[str],
+) -> Optional[Path]:
+    """Resolve a session's transcript from its sessions-row fields.
 
+    Callers that already have the row (e.g. the activity list) use this
+    directly instead of a per-session lookup.
+    """
+    # Primary: use stored transcript_path
+    if transcript_path:
+        path = Path(transcript_path)
+        if path.exists():
+            return path
 
-def has_pending_question(transcript_path: Path) -> bool:
-    """Check if a transcript has an unanswered interactive tool.
+    # Fallback: reconstruct from claude_session_id
+    if claude_session_id and cwd:
+        # Project hash format: replace / with - and prepend -
+        project_hash = "-" + cwd.replace("/", "-")
+        fallback_path = CLAUDE_PROJECTS_DIR / project_hash / f"{claude_session_id}.jsonl"
+        if fallback_path.exists():
+            return fallback_path
 
-    Reads the JSONL file from the end, looking for the last AskUserQuestion,
-    EnterPlanMode, or ExitPlanMode tool_use that doesn't have a matching tool_result.
+    return None
 
-    Returns True if there's a pending interactive tool, False otherwise.
-    """
-    if not transcript_path or not transcript_path.exists():
-        return False
 
-    try:
-        # Read from end of file — we only need the last ~50 lines
-        with open(transcript_path, 'r') as f:
-            lines = f.readlines()
+INTERACTIVE_TOOLS = {"AskUserQuestion", "EnterPlanMode", "ExitPlanMode"}
+PENDING_WINDOW_LINES = 100  # Only the most recent lines count toward a pending question
+TAIL_BLOCK_SIZE = 64 * 1024
+INTERACTIVE_STATE_MAX = 256  # Transcripts whose pending-question state stays cached (LRU)
 
-        # Check last 100 lines max for efficiency
-        recent_lines = lines[-100:] if len(lines) > 100 else lines
 
-        interactive_tool_use_ids: set[str] = set()
-        answered_ids: set[str] = set()
+class _InteractiveState:
+    """Unanswered interactive tool_use ids within the last PENDING_WINDOW_LINES lines.
 
-        for line in recent_lines:
-            try:
-                data = json.loads(line)
-            except json.JSONDecodeError:
-                continue
+    offset is the byte position just past the last line fed, so updates
+    only read what was appended since.
+    """
+
+    __slots__ = ("offset", "line_count", "pending")
+
+    def __init__(self, offset: int = 0):
+        self.offset = offset
+        self.line_count = 0
+        self.pending: Dict[str, int] = {}  # tool_use_id -> line number it appeared on
+
+    def feed(self, line: str):
+        self.line_count += 1
+        try:
+            data = json.loads(line)
+        except json.JSONDecodeError:
+            return
+        if not isinstance(data, dict):
+            return
 
-            raw_type = data.get("type")
-            msg = data.get("message", {})
+        raw_type = data.get("type")
+        if raw_type not in ("assistant", "user"):
+            return
+        content = (data.get("message") or {}).get("content", "")
+        if not isinstance(content, list):
+            return
 
+        for item in content:
+            if not isinstance(item, dict):
+                continue
             # Assistant tool_use: check for interactive tools
             if raw_type == "assistant":
-                content = msg.get("content", [])
-                if isinstance(content, list):
-                    for item in content:
-                        if (isinstance(item, dict)
-                            and item.get("type") == "tool_use"
-                            and item.get("name") in INTERACTIVE_TOOLS):
-                            tool_use_id = item.get("id", "")
-                            if tool_use_id:
-                                interactive_tool_use_ids.add(tool_use_id)
-
+                if item.get("type") == "tool_use" and item.get("name") in INTERACTIVE_TOOLS:
+                    tool_use_id = item.get("id", "")
+                    if tool_use_id:
+                        self.pending[tool_use_id] = self.line_count
             # User tool_result: check for matching result
-            if raw_type == "user":
-                content = msg.get("content", "")
-                if isinstance(content, list):
-                    for item in content:
-                        if isinstance(item, dict) and item.get("type") == "tool_result":
-                            tool_use_id = item.get("tool_use_id", "")
-                            if tool_use_id and tool_use_id in interactive_tool_use_ids:
-                                answered_ids.add(tool_use_id)
-
-        return len(interactive_tool_use_ids - answered_ids) > 0
+            elif item.get("type") == "tool_result":
+                self.pending.pop(item.get("tool_use_id", ""), None)
+
+    @property
+    def waiting(self) -> bool:
+        cutoff = self.line_count - PENDING_WINDOW_LINES
+        for tool_use_id in [k for k, line_no in self.pending.items() if line_no <= cutoff]:
+            del self.pending[tool_use_id]
+        return bool(self.pending)
+
+
+_interactive_states: "OrderedDict[str, _InteractiveState]" = OrderedDict()
+_interactive_locks: Dict[str, threading.Lock] = {}
+_interactive_lock = threading.Lock()  # Guards the two dicts only, never held for I/O
+
+
+def _interactive_path_lock(key: str) -> threading.Lock:
+    """Per-transcript lock, so one slow read doesn't hold up other sessions."""
+    with _interactive_lock:
+        lock = _interactive_locks.get(key)
+        if lock is None:
+            lock = _interactive_locks[key] = threading.Lock()
+        return lock
+
+
+def _cached_interactive_state(key: str) -> Optional[_InteractiveState]:
+    with _interactive_lock:
+        state = _interactive_states.get(key)
+        if state is not None:
+            _interactive_states.move_to_end(key)
+        return state
+
+
+def _store_interactive_state(key: str, state: _InteractiveState) -> None:
+    """Cache a transcript's state, evicting the least recently used ones."""
+    with _interactive_lock:
+        _interactive_states[key] = state
+        _interactive_states.move_to_end(key)
+        while len(_interactive_states) > INTERACTIVE_STATE_MAX:
+            evicted, _ = _interactive_states.popitem(last=False)
+            _interactive_locks.pop(evicted, None)
+
+
+def _read_tail_lines(path: Path, max_lines: int) -> Tuple[List[str], int]:
+    """Read up to max_lines complete lines from the end of a file, in blocks.
+
+    Returns (lines in file order, byte offset just past the last complete line).
+    A trailing line without a newline is still being written and is skipped.
+    """
+    with open(path, "rb") as f:
+        f.seek(0, 2)
+        size = f.tell()
+        pos = size
+        buf = b""
+        end = None
+        while pos > 0:
+            read = min(TAIL_BLOCK_SIZE, pos)
+            pos -= read
+            f.seek(pos)
+            buf = f.read(read) + buf
+            if end is None:
+                nl = buf.rfind(b"\n")
+                if nl < 0:
+                    continue
+                end = pos + nl + 1
+                buf = buf[:nl + 1]
+            if buf.count(b"\n") > max_lines:
+                break
+
+    if end is None:
+        return [], 0
+    lines = buf.split(b"\n")[:-1]
+    if pos > 0:
+        lines = lines[1:]  # First piece may be a partial line
+    return [line.decode("utf-8", "replace") for line in lines[-max_lines:]], end
+
+
+def read_appended_lines(path: Path, offset: int) -> Tuple[List[str], int]:
+    """Read complete lines appended after offset. Returns (lines, new offset)."""
+    with open(path, "rb") as f:
+        f.seek(offset)
+        data = f.read()
+    nl = data.rfind(b"\n")
+    if nl < 0:
+        return [], offset
+    return [line.decode("utf-8", "replace") for line in data[:nl].split(b"\n")], offset + nl + 1
+
+
+def update_interactive_state(transcript_path: Path, lines: List[str], start: int, end: int):
+    """Feed lines a reader already parsed (the transcript hub) into the cache.
+
+    Only applied when they continue exactly where the cached state left off.
+    Called from the event loop, so it never waits on a read in progress;
+    that reader picks the lines up from the file instead.
+    """
+    key = str(transcript_path)
+    lock = _interactive_path_lock(key)
+    if not lock.acquire(blocking=False):
+        return
+    try:
+        state = _cached_interactive_state(key)
+        if state is not None and state.offset == start:
+            for line in lines:
+                state.feed(line)
+            state.offset = end
+    finally:
+        lock.release()
+
+
+def has_pending_question(transcript_path: Path) -> bool:
+    """Check if a transcript has an unanswered interactive tool.
+
+    Looks for an AskUserQuestion, EnterPlanMode, or ExitPlanMode tool_use in
+    the last PENDING_WINDOW_LINES lines that has no matching tool_result.
+    The first call reads blocks backwards from the end of the file; later
+    calls only read what was appended (or nothing, if the transcript hub
+    already fed it).
+
+    Returns True if there's a pending interactive tool, False otherwise.
+    """
+    if not transcript_path or not transcript_path.exists():
+        return False
+
+    key = str(transcript_path)
+    try:
+        size = transcript_path.stat().st_size
+        with _interactive_path_lock(key):
+            state = _cached_interactive_state(key)
+
+            if state is None or size < state.offset:
+                lines, offset = _read_tail_lines(transcript_path, PENDING_WINDOW_LINES)
+                state = _InteractiveState(offset)
+                for line in lines:
+                    state.feed(line)
+                _store_interactive_state(key, state)
+            elif size > state.offset:
+                lines, state.offset = read_appended_lines(transcript_path, state.offset)
+                for line in lines:
+                    state.feed(line)
+
+            return state.waiting
 
     except Exception as e:
         logger.error(f"Error checking pending question: {e}")
@@ -0,0 +1,360 @@
+"""
+Transcript Hub
+
+One reader per transcript file, shared by every viewer streaming it.
+
+Before, each SSE client (session transcript, activity stream, conversation
+stream, Telegram) ran its own TranscriptWatcher that polled stat() every
+200ms and re-read and re-parsed the same appended bytes. The hub keeps a
+single watchfiles-driven reader per path that parses each new line once and
+broadcasts formatted events to all attached viewers. Viewers filter
+thinking blocks themselves; the reader is torn down when the last one
+leaves.
+
+A viewer that wants history (from_beginning / after_uuid) attaches first,
+then reads the backlog up to the reader's position at attach time, so no
+event is missed or duplicated at the seam.
+
+Viewer queues are bounded. A viewer that falls VIEWER_QUEUE_SIZE events
+behind stops receiving live events and keeps the offset of the first line
+it missed; after draining its queue the stream re-attaches and catches up
+from the file, the same way a history backlog is read.
+"""
+
+import asyncio
+import json
+import logging
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, AsyncGenerator, Dict, List, Optional, Tuple
+
+from watchfiles import awatch
+
+from .context_usage import update_context_usage
+from .transcript import format_event_for_sse, parse_transcript_line, update_interactive_state
+from .transcript_index import get_transcript_index
+
+logger = logging.getLogger(__name__)
+
+WATCH_DEBOUNCE_MS = 20
+# watchfiles can miss events on some filesystems; re-stat at least this often
+FALLBACK_POLL_MS = 2000
+FILE_WAIT_SECONDS = 30
+VIEWER_QUEUE_SIZE = 1000  # Events buffered per viewer before it must resync
+
+_CLOSED = object()
+
+
+class _LineProcessor:
+    """Turns transcript lines into formatted events (thinking included).
+
+    Carries queue-operation state: a dequeue/remove re-emits the last
+    enqueued message without the queued flag.
+    """
+
+    def __init__(self):
+        self._last_enqueued: Optional[Dict[str, Any]] = None
+
+    def process(self, line: str) -> List[Dict[str, Any]]:
+        if not line.strip():
+            return []
+
+        # Check for dequeue/remove before parsing (parser skips these)
+        try:
+            raw = json.loads(line)
+            if raw.get("type") == "queue-operation" and raw.get("operation") in ("dequeue", "remove"):
+                if self._last_enqueued:
+                    # Re-emit with queued=false so frontend updates the message
+                    unqueued = {**self._last_enqueued}
+                    unqueued.pop("queued", None)
+                    unqueued["replaces_queued"] = True
+                    self._last_enqueued = None
+                    return [unqueued]
+                return []
+        except (json.JSONDecodeError, AttributeError):
+            pass
+
+        out = []
+        for event in parse_transcript_line(line):
+            formatted = format_event_for_sse(event, include_thinking=True)
+            if not formatted:
+                continue
+            # Track enqueued messages for dequeue handling
+            if event.queued:
+                self._last_enqueued = formatted
+            # Real user_message matching a queued one - clear tracking
+            elif (event.event_type == "user_message" and self._last_enqueued
+                  and event.content == self._last_enqueued.get("content")):
+                self._last_enqueued = None
+            out.append(formatted)
+        return out
+
+
+def _read_complete_lines(path: Path, start: int, end: Optional[int] = None) -> Tuple[List[str], int]:
+    """Read complete lines in [start, end). Returns (lines, offset past the last one)."""
+    lines, end = _read_line_offsets(path, start, end)
+    return [line for _, line in lines], end
+
+
+def _read_line_offsets(
+    path: Path, start: int, end: Optional[int] = None
+) -> Tuple[List[Tuple[int, str]], int]:
+    """Like _read_complete_lines, but pairs each line with its start offset."""
+    with open(path, "rb") as f:
+        f.seek(start)
+        data = f.read() if end is None else f.read(max(0, end - start))
+    nl = data.rfind(b"\n")
+    if nl < 0:
+        return [], start
+    lines = []
+    offset = start
+    for raw in data[:nl].split(b"\n"):
+        lines.append((offset, raw.decode("utf-8", "replace")))
+        offset += len(raw) + 1
+    return lines, start + nl + 1
+
+
+@dataclass(eq=False)
+class TranscriptViewer:
+    """One attached consumer. Iterate it to receive formatted events."""
+    include_thinking: bool = True
+    queue: asyncio.Queue = field(default_factory=lambda: asyncio.Queue(maxsize=VIEWER_QUEUE_SIZE))
+    closed: bool = False
+    lagged_from: Optional[int] = None  # Offset of the first line this viewer missed
+
+    def offer(self, events: List[Dict[str, Any]], offset: int):
+        """Queue one line's events, or mark the viewer lagged at that line."""
+        if self.closed or self.lagged_from is not None:
+            return
+        if not self.include_thinking:
+            events = [event for event in events if event.get("type") != "thinking"]
+        if not events:
+            return
+        if self.queue.maxsize - self.queue.qsize() < len(events):
+            self.lagged_from = offset
+            return
+        for event in events:
+            self.queue.put_nowait(event)
+
+    def close(self):
+        self.closed = True
+        if not self.queue.full():
+            self.queue.put_nowait(_CLOSED)
+
+    @property
+    def needs_resync(self) -> bool:
+        return self.lagged_from is not None and not self.closed
+
+    async def next(self) -> Optional[Dict[str, Any]]:
+        """Next event, or None once the viewer was closed or fell behind."""
+        if self.queue.empty() and (self.closed or self.lagged_from is not None):
+            return None
+        item = await self.queue.get()
+        return None if item is _CLOSED else item
+
+
+class _TranscriptReader:
+    """Single tailing reader for one transcript file."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.position = path.stat().st_size
+        self.viewers: List[TranscriptViewer] = []
+        self.lines_parsed = 0
+        self.events_broadcast = 0
+        self._processor = _LineProcessor()
+        self._stop = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self):
+        self._task = asyncio.create_task(self._run(), name=f"transcript-hub-{self.path.name}")
+
+    async def stop(self):
+        self._stop.set()
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except (asyncio.CancelledError, Exception):
+                pass
+
+    async def _run(self):
+        try:
+            await self._drain()
+            async for _ in awatch(
+                self.path,
+                stop_event=self._stop,
+                debounce=WATCH_DEBOUNCE_MS,
+                step=10,
+                rust_timeout=FALLBACK_POLL_MS,
+                yield_on_timeout=True,
+            ):
+                await self._drain()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"Transcript hub reader error for {self.path.name}: {e}")
+            for viewer in self.viewers:
+                viewer.offer([{"type": "error", "message": str(e)}], self.position)
+                viewer.close()
+
+    async def _drain(self):
+        """Parse everything appended since the last drain and broadcast it."""
+        size = self.path.stat().st_size
+        if size < self.position:
+            # Truncated/rewritten - follow the new file from its start
+            self.position = 0
+        if size == self.position:
+            return
+
+        start = self.position
+        offset_lines, end = await asyncio.to_thread(_read_line_offsets, self.path, start)
+        if not offset_lines:
+            return
+        self.position = end
+        lines = [line for _, line in offset_lines]
+        update_interactive_state(self.path, lines, start, end)
+        update_context_usage(self.path, lines, start, end)
+
+        logger.debug(f"[TRANSCRIPT HUB] {len(lines)} new lines from {self.path.name} -> {len(self.viewers)} viewers")
+        for offset, line in offset_lines:
+            self.lines_parsed += 1
+            events = self._processor.process(line)
+            if not events:
+                continue
+            self.events_broadcast += len(events)
+            for viewer in self.viewers:
+                viewer.offer(events, offset)
+
+
+class TranscriptHub:
+    """Registry of shared transcript readers, keyed by resolved path."""
+
+    def __init__(self):
+        self._readers: Dict[Path, _TranscriptReader] = {}
+
+    def attach(self, path: Path, include_thinking: bool = True) -> Tuple[TranscriptViewer, int]:
+        """Attach a viewer. Returns it with the reader position at attach time.
+
+        Everything after that position will be delivered to the viewer;
+        anything before it is the caller's backlog to read.
+        """
+        key = path.resolve()
+        reader = self._readers.get(key)
+        if reader is None:
+            reader = _TranscriptReader(path)
+            self._readers[key] = reader
+            reader.start()
+        viewer = TranscriptViewer(include_thinking=include_thinking)
+        reader.viewers.append(viewer)
+        return viewer, reader.position
+
+    async def detach(self, path: Path, viewer: TranscriptViewer):
+        """Detach a viewer, stopping the reader if it was the last one."""
+        key = path.resolve()
+        reader = self._readers.get(key)
+        if reader is None:
+            return
+        if viewer in reader.viewers:
+            reader.viewers.remove(viewer)
+        if not reader.viewers:
+            del self._readers[key]
+            await reader.stop()
+
+    async def stream(
+        self,
+        path: Path,
+        include_thinking: bool = True,
+        from_beginning: bool = False,
+        after_uuid: Optional[str] = None,
+        viewer_ready=None,
+    ) -> AsyncGenerator[Dict[str, Any], None]:
+        """Yield transcript events for one viewer (same contract as TranscriptWatcher.watch).
+
+        Args:
+            path: Transcript file
+            include_thinking: If False, filter out thinking blocks
+            from_beginning: If True, replay the file from the start first
+            after_uuid: If provided, replay events after this UUID first
+            viewer_ready: Optional callback receiving the TranscriptViewer
+        """
+        # Wait for file to appear (for brand new sessions)
+        waited = 0.0
+        while not path.exists() and waited < FILE_WAIT_SECONDS:
+            await asyncio.sleep(0.5)
+            waited += 0.5
+
+        if not path.exists():
+            yield {"type": "error", "message": f"Transcript not found after {FILE_WAIT_SECONDS}s: {path}"}
+            return
+
+        viewer, live_from = self.attach(path, include_thinking)
+        if viewer_ready:
+            viewer_ready(viewer)
+        try:
+            # Backlog start: beginning, just after the resume UUID, or none
+            backlog_from = live_from
+            if from_beginning:
+                backlog_from = 0
+            elif after_uuid:
+                index = await asyncio.to_thread(get_transcript_index, path)
+                offset = index.offset_after(after_uuid)
+                if offset is not None:
+                    backlog_from = offset
+
+            yield {
+                "type": "connected",
+                "transcript_path": str(path),
+                "timestamp": datetime.now().isoformat(),
+            }
+
+            async for event in self._backlog(path, backlog_from, live_from, include_thinking):
+                yield event
+
+            while True:
+                event = await viewer.next()
+                if event is not None:
+                    yield event
+                    continue
+                if not viewer.needs_resync:
+                    break
+                # Fell too far behind: re-attach and catch up from the file
+                resume_from = viewer.lagged_from
+                await self.detach(path, viewer)
+                viewer, live_from = self.attach(path, include_thinking)
+                if viewer_ready:
+                    viewer_ready(viewer)
+                logger.debug(f"[TRANSCRIPT HUB] viewer of {path.name} resyncing from {resume_from}")
+                async for event in self._backlog(path, resume_from, live_from, include_thinking):
+                    yield event
+        finally:
+            await self.detach(path, viewer)
+
+    async def _backlog(
+        self, path: Path, start: int, end: int, include_thinking: bool
+    ) -> AsyncGenerator[Dict[str, Any], None]:
+        """Events for the complete lines in [start, end), parsed fresh."""
+        if start >= end:
+            return
+        lines, _ = await asyncio.to_thread(_read_complete_lines, path, start, end)
+        processor = _LineProcessor()
+        for line in lines:
+            for event in processor.process(line):
+                if event.get("type") == "thinking" and not include_thinking:
+                    continue
+                yield event
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        return {
+            str(path): {
+                "viewers": len(reader.viewers),
+                "position": reader.position,
+                "lines_parsed": reader.lines_parsed,
+                "events_broadcast": reader.events_broadcast,
+            }
+            for path, reader in self._readers.items()
+        }
+
+
+transcript_hub = TranscriptHub()
@@ -0,0 +1,296 @@
+"""
+Transcript Offset Index
+
+Sidecar index for Claude Code .jsonl transcripts so readers can seek instead
+of rescanning. Per transcript it records:
+
+    - byte offset of every non-empty line (line number -> offset)
+    - uuid -> line number (first occurrence)
+    - last parsed offset (always a line boundary)
+    - queue-operation counters: enqueue line numbers and dequeue/remove count
+    - hashes of user message content (for enqueue dedup in get_all_events)
+
+The index is extended incrementally: refresh() only parses bytes past the
+last parsed offset. It is persisted as JSON under
+settings.transcript_index_dir, keyed by a hash of the transcript path, and
+rebuilt from scratch if the file shrinks or its inode changes.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from bisect import bisect_right
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+
+from core.config import settings
+
+logger = logging.getLogger(__name__)
+
+INDEX_VERSION = 1
+READ_CHUNK = 1024 * 1024
+# Sidecars are rewritten at most this often; a stale one only costs re-indexing the tail
+SAVE_INTERVAL_S = 30.0
+
+
+def content_key(content: str) -> str:
+    """Short stable hash of user message content (first 2000 chars, as parsed)."""
+    return hashlib.blake2b(content[:2000].encode("utf-8", "replace"), digest_size=8).hexdigest()
+
+
+class TranscriptIndex:
+    """Incrementally maintained line/uuid offset index for one transcript."""
+
+    def __init__(self, path: Path, index_dir: Optional[Path] = None):
+        self.path = path
+        self.index_dir = index_dir or settings.transcript_index_dir
+        self.lock = threading.RLock()
+        self._reset()
+        self._dirty = False
+        self._saved_at = 0.0
+
+    def _reset(self, stat: Optional[os.stat_result] = None):
+        self.dev = stat.st_dev if stat else 0
+        self.ino = stat.st_ino if stat else 0
+        self.parsed_offset = 0
+        self.offsets: List[int] = []
+        self.uuids: Dict[str, int] = {}
+        self.user_content: Set[str] = set()
+        self.enqueue_lines: List[int] = []
+        self.dequeue_count = 0
+
+    # =========================================================================
+    # PERSISTENCE
+    # =========================================================================
+
+    @property
+    def sidecar_path(self) -> Path:
+        digest = hashlib.sha1(str(self.path).encode()).hexdigest()[:16]
+        return self.index_dir / f"{digest}.json"
+
+    def load(self) -> bool:
+        """Load the sidecar if present and compatible. Returns True on success."""
+        try:
+            data = json.loads(self.sidecar_path.read_text())
+        except (OSError, ValueError):
+            return False
+        if data.get("version") != INDEX_VERSION or data.get("path") != str(self.path):
+            return False
+
+        self.dev = data["dev"]
+        self.ino = data["ino"]
+        self.parsed_offset = data["parsed_offset"]
+        self.offsets = data["offsets"]
+        self.uuids = data["uuids"]
+        self.user_content = set(data["user_content"])
+        self.enqueue_lines = data["enqueue_lines"]
+        self.dequeue_count = data["dequeue_count"]
+        self._dirty = False
+        return True
+
+    def save(self, min_interval: float = 0.0):
+        """Write the sidecar if anything changed since the last load/save.
+
+        With min_interval, skip the write if the last one was more recent.
+        """
+        if not self._dirty or time.monotonic() - self._saved_at < min_interval:
+            return
+        data = {
+            "version": INDEX_VERSION,
+            "path": str(self.path),
+            "dev": self.dev,
+            "ino": self.ino,
+            "parsed_offset": self.parsed_offset,
+            "line_count": self.line_count,
+            "offsets": self.offsets,
+            "uuids": self.uuids,
+            "user_content": sorted(self.user_content),
+            "enqueue_lines": self.enqueue_lines,
+            "dequeue_count": self.dequeue_count,
+        }
+        try:
+            self.index_dir.mkdir(parents=True, exist_ok=True)
+            tmp = self.sidecar_path.with_suffix(".tmp")
+            tmp.write_text(json.dumps(data, separators=(",", ":")))
+            tmp.replace(self.sidecar_path)
+            self._dirty = False
+            self._saved_at = time.monotonic()
+        except OSError as e:
+            logger.warning(f"Could not persist transcript index for {self.path.name}: {e}")
+
+    # =========================================================================
+    # INCREMENTAL UPDATE
+    # =========================================================================
+
+    @property
+    def line_count(self) -> int:
+        return len(self.offsets)
+
+    @property
+    def enqueue_count(self) -> int:
+        return len(self.enqueue_lines)
+
+    def refresh(self) -> int:
+        """Index lines appended since the last refresh. Returns lines added."""
+        with self.lock:
+            try:
+                stat = self.path.stat()
+            except OSError:
+                return 0
+
+            if (stat.st_ino, stat.st_dev) != (self.ino, self.dev) or stat.st_size < self.parsed_offset:
+                # New or rewritten file - start over
+                self._reset(stat)
+                self._dirty = True
+
+            if stat.st_size == self.parsed_offset:
+                return 0
+
+            added = 0
+            with open(self.path, "rb") as f:
+                f.seek(self.parsed_offset)
+                for start, line, complete in _iter_lines(f, self.parsed_offset):
+                    if not complete:
+                        # Trailing bytes without a newline: only index once they parse
+                        try:
+                            json.loads(line)
+                        except ValueError:
+                            break
+                    self._index_line(start, line)
+                    self.parsed_offset = start + len(line) + (1 if complete else 0)
+                    added += 1
+
+            self._dirty = True
+            return added
+
+    def _index_line(self, start: int, line: bytes):
+        if not line.strip():
+            return
+        line_no = len(self.offsets)
+        self.offsets.append(start)
+
+        try:
+            data = json.loads(line)
+        except ValueError:
+            return
+        if not isinstance(data, dict):
+            return
+
+        uuid = data.get("uuid")
+        if uuid and uuid not in self.uuids:
+            self.uuids[uuid] = line_no
+
+        raw_type = data.get("type")
+        if raw_type == "user":
+            content = (data.get("message") or {}).get("content", "")
+            if isinstance(content, str):
+                self.user_content.add(content_key(content))
+        elif raw_type == "queue-operation":
+            operation = data.get("operation")
+            if operation in ("dequeue", "remove"):
+                self.dequeue_count += 1
+            elif operation == "enqueue":
+                # Mirrors parse_transcript_line: only these become queued events
+                content = data.get("content", "")
+                if content and not content.strip().startswith("<task-notification"):
+                    self.enqueue_lines.append(line_no)
+
+    # =========================================================================
+    # LOOKUPS
+    # =========================================================================
+
+    def line_of(self, uuid: str) -> Optional[int]:
+        """Line number of the first line carrying this uuid."""
+        return self.uuids.get(uuid)
+
+    def offset_after(self, uuid: str) -> Optional[int]:
+        """Byte offset just past the line carrying this uuid, None if unknown."""
+        line_no = self.uuids.get(uuid)
+        if line_no is None:
+            return None
+        if line_no + 1 < len(self.offsets):
+            return self.offsets[line_no + 1]
+        return self.parsed_offset
+
+    def enqueue_ordinal(self, line_no: int) -> int:
+        """1-based count of queued-event lines up to and including line_no."""
+        return bisect_right(self.enqueue_lines, line_no)
+
+    def has_user_content(self, content: str) -> bool:
+        return content_key(content) in self.user_content
+
+    def read_lines(self, start: int = 0, end: Optional[int] = None) -> Iterator[Tuple[int, str]]:
+        """Yield (line_no, text) for indexed lines in [start, end)."""
+        end = self.line_count if end is None else min(end, self.line_count)
+        if start >= end:
+            return
+        stop = self.offsets[end] if end < self.line_count else self.parsed_offset
+        with open(self.path, "rb") as f:
+            f.seek(self.offsets[start])
+            chunk = f.read(stop - self.offsets[start])
+        line_no = start
+        for raw in chunk.split(b"\n"):
+            if not raw.strip():
+                continue
+            yield line_no, raw.decode("utf-8", "replace")
+            line_no += 1
+
+
+def _iter_lines(f, offset: int) -> Iterator[Tuple[int, bytes, bool]]:
+    """Yield (start_offset, line_without_newline, newline_terminated) from f."""
+    pending = b""
+    pending_start = offset
+    while True:
+        chunk = f.read(READ_CHUNK)
+        if not chunk:
+            break
+        buf = pending + chunk
+        pos = 0
+        while True:
+            nl = buf.find(b"\n", pos)
+            if nl < 0:
+                break
+            yield pending_start + pos, buf[pos:nl], True
+            pos = nl + 1
+        pending_start += pos
+        pending = buf[pos:]
+    if pending:
+        yield pending_start, pending, False
+
+
+# =============================================================================
+# REGISTRY
+# =============================================================================
+
+_INDEXES: "OrderedDict[Path, TranscriptIndex]" = OrderedDict()
+_INDEXES_LOCK = threading.Lock()
+MAX_OPEN_INDEXES = 64
+
+
+def get_transcript_index(path: Path, persist: bool = True) -> TranscriptIndex:
+    """Get the up-to-date index for a transcript.
+
+    Loads the sidecar on first use in this process, then indexes any new
+    bytes. With persist=True the sidecar is rewritten when lines were added,
+    at most once per SAVE_INTERVAL_S.
+    """
+    path = Path(path)
+    with _INDEXES_LOCK:
+        index = _INDEXES.get(path)
+        if index is None:
+            if len(_INDEXES) >= MAX_OPEN_INDEXES:
+                _INDEXES.popitem(last=False)
+            index = TranscriptIndex(path)
+            index.load()
+            _INDEXES[path] = index
+        else:
+            _INDEXES.move_to_end(path)
+    with index.lock:
+        index.refresh()
+        if persist:
+            index.save(min_interval=SAVE_INTERVAL_S)
+    return index
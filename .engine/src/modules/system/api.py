@@ -11,7 +11,7 @@ from pathlib import Path
 from typing import Optional
 
 import yaml
-from fastapi import APIRouter
+from fastapi import APIRouter, Request
 from sse_starlette.sse import EventSourceResponse
 
 from core.config import settings
@@ -43,10 +43,19 @@ async def _run_blocking(fn, *args, **kwargs):
 # =============================================================================
 
 @router.get("/events")
-async def stream_events():
+async def stream_events(request: Request, topics: Optional[str] = None):
     """
     Unified SSE stream for all Dashboard real-time updates.
 
+    Pass ?topics=session.*,priority.* to receive only matching events.
+    Rapid session.state updates are coalesced per session if the client
+    falls behind.
+
+    Every event carries an SSE id. On reconnect the client sends it back
+    (Last-Event-ID header, or ?last_event_id= when reconnecting manually)
+    and only the missed events are replayed; if they are no longer
+    available a "resync" event tells the client to reload.
+
     Events:
         - session.started: {"session_id", "role", "conversation_id"}
         - session.ended: {"session_id"}
@@ -66,8 +75,13 @@ async def stream_events():
     Ping every 15s keeps connection alive.
     """
 
+    patterns = [t.strip() for t in topics.split(",") if t.strip()] if topics else None
+    last_event_id = request.headers.get("last-event-id") or request.query_params.get("last_event_id")
+
     async def event_generator():
-        queue = event_bus.subscribe()
+        # Subscribe and snapshot the replay log with no await in between
+        queue = event_bus.subscribe(patterns=patterns, policy="coalesce")
+        missed = event_bus.replay(last_event_id, patterns)
 
         try:
             # Send connection established event
@@ -77,15 +91,29 @@ async def stream_events():
                     "type": "connected",
                     "timestamp": datetime.now(timezone.utc).isoformat(),
                     "subscriber_count": event_bus.subscriber_count,
+                    "replayed": len(missed) if missed is not None else 0,
                 }),
             }
 
-            while True:
+            if missed is None:
+                yield {
+                    "event": "resync",
+                    "data": json.dumps({
+                        "type": "resync",
+                        "timestamp": datetime.now(timezone.utc).isoformat(),
+                    }),
+                }
+            else:
+                for event in missed:
+                    yield {"id": event.id, "event": event.event_type, "data": event.to_json()}
+
+            while not queue.closed:
                 try:
                     # Wait for event with timeout (allows graceful cleanup)
                     event = await asyncio.wait_for(queue.get(), timeout=30.0)
 
                     yield {
+                        "id": event.id,
                         "event": event.event_type,
                         "data": event.to_json(),
                     }
@@ -116,6 +144,7 @@ async def events_health():
     return {
         "status": "ok",
         "subscriber_count": event_bus.subscriber_count,
+        "subscribers": event_bus.stats(),
         "timestamp": datetime.now(timezone.utc).isoformat(),
     }
 
@@ -1,9 +1,18 @@
-"""Context monitoring loop - single 90% threshold warning + emergency reset.
+"""Context monitoring loop - single threshold warning + emergency reset.
 
 Monitors active sessions for context usage:
-1. At 90%: Send warning via TMUX injection (ESC + inject message)
+1. At settings.context_warning_percent (90%): Send warning via TMUX injection (ESC + inject message)
 2. At 100% (context full): Emergency reset (Claude is stuck, force handoff)
 
+Usage is read from each session's transcript (token counts per turn, see
+modules/sessions/context_usage.py), not from Claude Code's screen; only
+sessions without a transcript fall back to scraping the pane. All sessions
+are checked concurrently.
+
+Past settings.handoff_prepare_percent (70%), each tick also checkpoints the
+session's handoff digest (modules/handoff/digest.py), so a reset only has
+to parse the transcript written since the last tick.
+
 Single pathway for context warnings. Hooks don't handle this.
 Runs as background loop in main.py, polls every 30s.
 """
@@ -19,7 +28,10 @@ from typing import Optional
 from core.config import settings
 from core.storage import SystemStorage
 from adapters.telegram.messaging import get_messaging, MessageType
+from modules.handoff.digest import checkpoint_handoff_digest, prune_handoff_digests
 from modules.sessions.claude_status import get_session_claude_status
+from modules.sessions.context_usage import ContextUsage, get_context_usage, prune_context_usage
+from modules.sessions.transcript import resolve_transcript_path
 from core.tmux import send_escape_to_pane_async
 from core.perf import record_worker_latency
 
@@ -29,8 +41,9 @@ def _timestamp() -> str:
     return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
 
-# Single threshold - 90%
-WARNING_THRESHOLD = 90
+# Single threshold - 90% unless configured
+WARNING_THRESHOLD = settings.context_warning_percent
+HANDOFF_PREPARE_THRESHOLD = settings.handoff_prepare_percent
 POLL_INTERVAL = 30  # seconds
 
 # Paths
@@ -69,57 +82,84 @@ class ContextMonitor:
         self.running = False
 
     async def check_all_sessions(self):
-        """Check context for all active sessions."""
+        """Check context for all active sessions, concurrently."""
         storage = SystemStorage(self.db_path)
 
-        rows = storage.fetchall("""
-            SELECT session_id, tmux_pane, role, mode, conversation_id, context_warning_level
-            FROM sessions
-            WHERE ended_at IS NULL AND tmux_pane IS NOT NULL
-              AND mode != 'summarizer'
-        """)
-
-        for row in rows:
-            await self.check_session(
-                storage,
-                row['session_id'],
-                row['tmux_pane'],
-                row['role'] or 'builder',
-                row['mode'] or 'interactive',
-                row['conversation_id'],
-                row['context_warning_level'] or 0
+        try:
+            rows = storage.fetchall("""
+                SELECT session_id, tmux_pane, role, mode, conversation_id, context_warning_level,
+                       transcript_path, claude_session_id, cwd
+                FROM sessions
+                WHERE ended_at IS NULL AND tmux_pane IS NOT NULL
+                  AND mode != 'summarizer' AND role IS NOT 'standby'
+            """)
+
+            results = await asyncio.gather(
+                *(self.check_session(storage, row) for row in rows),
+                return_exceptions=True,
             )
+            for row, result in zip(rows, results):
+                if isinstance(result, Exception):
+                    print(f"Context check failed for {row['session_id'][:8]}: {result}")
+
+            await asyncio.to_thread(self.prune_caches, rows)
+        finally:
+            storage.close()
+
+    async def check_session(self, storage: SystemStorage, row) -> None:
+        """Check context for a single session (a sessions row)."""
+        session_id = row['session_id']
+        tmux_pane = row['tmux_pane']
+        mode = row['mode'] or 'interactive'
+
+        usage = await asyncio.to_thread(self.get_usage, row)
+        if usage is not None:
+            context_full, percent_used = usage.full, usage.percent_used
+        else:
+            # No transcript yet: fall back to Claude Code's on-screen warning
+            status = await asyncio.to_thread(get_session_claude_status, tmux_pane)
+            if not status:
+                return
+            context_full, percent_used = status.context_full, status.context_percent_used
 
-        storage.close()
-
-    async def check_session(
-        self,
-        storage: SystemStorage,
-        session_id: str,
-        tmux_pane: str,
-        role: str,
-        mode: str,
-        conversation_id: str,
-        already_warned: int
-    ):
-        """Check context for a single session."""
-        status = await asyncio.to_thread(get_session_claude_status, tmux_pane)
-        if not status:
-            return
+        # Parse ahead for the handoff while the session still has room
+        if usage is not None and (context_full or (percent_used or 0) >= HANDOFF_PREPARE_THRESHOLD):
+            await asyncio.to_thread(self.prepare_handoff, row)
 
         # PRIORITY 1: Context full - emergency reset (Claude is stuck)
-        if status.context_full:
+        if context_full:
             print(f"Context FULL detected: {session_id[:8]} - initiating emergency reset")
-            await self.emergency_reset(storage, session_id, tmux_pane, role, mode, conversation_id)
+            await self.emergency_reset(
+                storage, session_id, tmux_pane, row['role'] or 'builder', mode, row['conversation_id']
+            )
             return
 
-        # PRIORITY 2: Context warning at 90%
-        if already_warned >= WARNING_THRESHOLD:
+        # PRIORITY 2: Context warning at the threshold
+        if (row['context_warning_level'] or 0) >= WARNING_THRESHOLD:
             return  # Already warned this session
 
-        if status.context_percent_used and status.context_percent_used >= WARNING_THRESHOLD:
+        if percent_used and percent_used >= WARNING_THRESHOLD:
             is_autonomous = mode in ('background', 'mission', 'autonomous')
-            await self.send_warning(storage, session_id, tmux_pane, status.context_percent_used, is_autonomous)
+            await self.send_warning(storage, session_id, tmux_pane, percent_used, is_autonomous)
+
+    def get_usage(self, row) -> Optional[ContextUsage]:
+        """Transcript-derived usage for a sessions row; None without a transcript."""
+        path = resolve_transcript_path(row['transcript_path'], row['claude_session_id'], row['cwd'])
+        return get_context_usage(path) if path else None
+
+    def prune_caches(self, rows) -> None:
+        """Drop handoff digests and cached usage of sessions no longer active."""
+        prune_handoff_digests([row['session_id'] for row in rows])
+        prune_context_usage(
+            resolve_transcript_path(row['transcript_path'], row['claude_session_id'], row['cwd'])
+            for row in rows
+        )
+
+    def prepare_handoff(self, row) -> None:
+        """Checkpoint the session's handoff digest up to the end of its transcript."""
+        path = resolve_transcript_path(row['transcript_path'], row['claude_session_id'], row['cwd'])
+        if path:
+            checkpoint_handoff_digest(row['session_id'], path)
 
     async def send_warning(
         self,
@@ -0,0 +1,259 @@
+"""
+Shared helpers for engine micro-benchmarks.
+
+Benchmarks are standalone scripts (pytest only collects test_*.py):
+
+    python .engine/tests/benchmarks/bench_db_pool.py
+
+Each one builds its own fixtures in a temp directory and prints a
+before/after table; nothing touches the real system.db.
+"""
+
+import os
+import sqlite3
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Dict, List
+
+ENGINE_ROOT = Path(__file__).resolve().parents[2]
+SRC_DIR = ENGINE_ROOT / "src"
+
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+
+def make_db(db_path: Path) -> Path:
+    """Create a database with the engine schema applied."""
+    conn = sqlite3.connect(db_path)
+    conn.executescript((ENGINE_ROOT / "config" / "schema.sql").read_text())
+    conn.close()
+    return db_path
+
+
+def measure(fn: Callable[[], object], iterations: int, warmup: int = 5) -> Dict[str, float]:
+    """Time fn() and return latency stats in milliseconds."""
+    for _ in range(warmup):
+        fn()
+    samples: List[float] = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    samples.sort()
+    return {
+        "mean_ms": statistics.fmean(samples),
+        "p50_ms": samples[len(samples) // 2],
+        "p95_ms": samples[int((len(samples) - 1) * 0.95)],
+        "total_ms": sum(samples),
+    }
+
+
+def report(title: str, rows: Dict[str, Dict[str, float]]) -> None:
+    """Print a small aligned table of measure() results."""
+    print(f"\n{title}")
+    print(f"  {'case':<36} {'mean ms':>10} {'p50 ms':>10} {'p95 ms':>10}")
+    for name, stats in rows.items():
+        print(
+            f"  {name:<36} {stats['mean_ms']:>10.3f} "
+            f"{stats['p50_ms']:>10.3f} {stats['p95_ms']:>10.3f}"
+        )
+
+
+ENVELOPE_INDEX_SCHEMA = """
+    CREATE TABLE mailboxes (ROWID INTEGER PRIMARY KEY, url TEXT, total_count INTEGER, unread_count INTEGER);
+    CREATE TABLE subjects (ROWID INTEGER PRIMARY KEY, subject TEXT);
+    CREATE TABLE summaries (ROWID INTEGER PRIMARY KEY, summary TEXT);
+    CREATE TABLE addresses (ROWID INTEGER PRIMARY KEY, address TEXT, comment TEXT);
+    CREATE TABLE recipients (ROWID INTEGER PRIMARY KEY, message INTEGER, address INTEGER, type INTEGER, position INTEGER);
+    CREATE TABLE messages (
+        ROWID INTEGER PRIMARY KEY, message_id TEXT, document_id TEXT,
+        subject INTEGER, sender INTEGER, summary INTEGER, mailbox INTEGER,
+        date_sent INTEGER, date_received INTEGER, read INTEGER, flagged INTEGER,
+        deleted INTEGER, conversation_id INTEGER
+    );
+    CREATE TABLE server_messages (ROWID INTEGER PRIMARY KEY, message INTEGER);
+    CREATE TABLE server_labels (ROWID INTEGER PRIMARY KEY, server_message INTEGER, label INTEGER);
+    CREATE INDEX recipients_message_index ON recipients(message);
+    CREATE INDEX messages_mailbox_date_index ON messages(mailbox, date_received);
+"""
+
+_WORDS = (
+    "invoice meeting quarterly report update project launch review budget "
+    "travel itinerary receipt order shipped newsletter weekly digest offer "
+    "security alert password reset welcome account statement payment team "
+    "schedule interview offer contract proposal design feedback release notes"
+).split()
+_SYLLABLES = "ka lo mi ne ru sa te vi po da fe gu hi jo ko la me ni".split()
+# Long-tail vocabulary so term frequencies look like real mail (roughly Zipfian)
+_FILLER = [a + b + c for a in _SYLLABLES for b in _SYLLABLES for c in _SYLLABLES][:5000]
+_VOCAB = _FILLER[:100] + _WORDS + _FILLER[100:]
+_VOCAB_WEIGHTS = [1.0 / (rank + 1) for rank in range(len(_VOCAB))]
+
+
+def make_envelope_index(path: Path, count: int, account: str, start_ts: int = 1_700_000_000) -> Path:
+    """Generate a Mail.app Envelope-Index-shaped database with `count` messages.
+
+    Mailbox 1 is the account's INBOX, 2 its Archive; senders come from a
+    pool of ~2000 addresses across ~300 domains.
+    """
+    import random
+
+    rng = random.Random(42)
+    conn = sqlite3.connect(path)
+    conn.executescript(ENVELOPE_INDEX_SCHEMA)
+    conn.execute("INSERT INTO mailboxes VALUES (1, ?, 0, 0)", (f"imap://{account}/INBOX",))
+    conn.execute("INSERT INTO mailboxes VALUES (2, ?, 0, 0)", (f"imap://{account}/Archive",))
+    conn.executemany(
+        "INSERT INTO addresses VALUES (?, ?, ?)",
+        [(i, f"user{i}@domain{i % 300}.com", f"User {i}") for i in range(1, 2001)],
+    )
+    append_envelope_messages(conn, count, rng, start_ts)
+    conn.close()
+    return path
+
+
+def append_envelope_messages(conn: sqlite3.Connection, count: int, rng, start_ts: int) -> None:
+    """Append `count` messages (with subjects, summaries, recipients) to an Envelope Index."""
+    first = conn.execute("SELECT COALESCE(MAX(ROWID), 0) FROM messages").fetchone()[0] + 1
+    subjects, summaries, messages, recipients = [], [], [], []
+    for i in range(first, first + count):
+        words = rng.choices(_VOCAB, weights=_VOCAB_WEIGHTS, k=4)
+        subjects.append((i, f"{words[0].title()} {words[1]} {words[2]} {words[3]}"))
+        summaries.append((i, " ".join(rng.choices(_VOCAB, weights=_VOCAB_WEIGHTS, k=24))))
+        messages.append((
+            i, f"<{i}@example.com>", None, i, rng.randint(1, 2000), i,
+            1 if rng.random() < 0.7 else 2, start_ts + i * 30, start_ts + i * 30,
+            int(rng.random() < 0.8), 0, 0, i // 3,
+        ))
+        recipients.append((i, i, rng.randint(1, 2000), 0, 0))
+    conn.executemany("INSERT INTO subjects VALUES (?, ?)", subjects)
+    conn.executemany("INSERT INTO summaries VALUES (?, ?)", summaries)
+    conn.executemany("INSERT INTO messages VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", messages)
+    conn.executemany("INSERT INTO recipients VALUES (?, ?, ?, ?, ?)", recipients)
+    conn.commit()
+
+
+CHAT_DB_SCHEMA = """
+    CREATE TABLE handle (ROWID INTEGER PRIMARY KEY AUTOINCREMENT, id TEXT NOT NULL, service TEXT);
+    CREATE TABLE chat (
+        ROWID INTEGER PRIMARY KEY AUTOINCREMENT, guid TEXT UNIQUE NOT NULL, chat_identifier TEXT,
+        display_name TEXT, service_name TEXT, is_archived INTEGER DEFAULT 0
+    );
+    CREATE TABLE message (
+        ROWID INTEGER PRIMARY KEY AUTOINCREMENT, guid TEXT UNIQUE NOT NULL, text TEXT,
+        attributedBody BLOB, handle_id INTEGER DEFAULT 0, service TEXT, date INTEGER,
+        is_from_me INTEGER DEFAULT 0, is_read INTEGER DEFAULT 0,
+        cache_has_attachments INTEGER DEFAULT 0, reply_to_guid TEXT
+    );
+    CREATE TABLE chat_handle_join (chat_id INTEGER, handle_id INTEGER, UNIQUE(chat_id, handle_id));
+    CREATE TABLE chat_message_join (
+        chat_id INTEGER, message_id INTEGER, message_date INTEGER DEFAULT 0,
+        PRIMARY KEY (chat_id, message_id)
+    );
+    CREATE INDEX chat_message_join_idx_message_id_only ON chat_message_join(message_id);
+    CREATE INDEX chat_message_join_idx_message_date_id_chat_id ON chat_message_join(chat_id, message_date, message_id);
+    CREATE INDEX message_idx_date ON message(date);
+    CREATE INDEX message_idx_handle ON message(handle_id, date);
+"""
+
+
+def attributed_body(text: str) -> bytes:
+    """A typedstream NSAttributedString blob as Messages stores rich text."""
+    encoded = text.encode()[:127]
+    return (
+        b"\x04\x0bstreamtyped\x81\xe8\x03\x84\x01@\x84\x84\x84\x12NSAttributedString\x00"
+        b"\x84\x84\x08NSObject\x00\x85\x92\x84\x84\x84\x08NSString\x01\x94\x84\x01+"
+        + bytes([len(encoded)]) + encoded + b"\x86\x84\x02iI\x01" + bytes([len(encoded)]) + b"\x92\x84"
+    )
+
+
+def make_chat_db(path: Path, count: int, chats: int = 1500, start_s: int = 700_000_000) -> Path:
+    """Generate a Messages chat.db-shaped database with `count` messages.
+
+    About 10% of chats are groups of 3-6 handles; chat activity is skewed
+    (a few threads hold most messages). A third of incoming messages keep
+    their text only in attributedBody, as newer macOS versions do, and
+    about 1% are unread.
+    """
+    import random
+
+    rng = random.Random(19)
+    conn = sqlite3.connect(path)
+    conn.executescript(CHAT_DB_SCHEMA)
+    handles = [(i, f"+1555{i:07d}" if i % 4 else f"friend{i}@icloud.com", "iMessage") for i in range(1, 2 * chats)]
+    conn.executemany("INSERT INTO handle VALUES (?, ?, ?)", handles)
+    chat_rows, members = [], []
+    for c in range(1, chats + 1):
+        group = rng.random() < 0.1
+        picked = rng.sample(handles, rng.randint(3, 6)) if group else [handles[c - 1]]
+        chat_rows.append((
+            c, f"iMessage;{'+' if group else '-'};chat{c}", f"chat{c}" if group else picked[0][1],
+            f"Group {c}" if group else None, "iMessage", int(rng.random() < 0.05),
+        ))
+        members.extend((c, h[0]) for h in picked)
+    conn.executemany("INSERT INTO chat VALUES (?, ?, ?, ?, ?, ?)", chat_rows)
+    conn.executemany("INSERT INTO chat_handle_join VALUES (?, ?)", members)
+    append_chat_messages(conn, count, rng, start_s)
+    conn.close()
+    return path
+
+
+def append_chat_messages(conn: sqlite3.Connection, count: int, rng, start_s: int) -> None:
+    """Append `count` messages across existing chats, newest last."""
+    chats = conn.execute("SELECT COUNT(*) FROM chat").fetchone()[0]
+    first = conn.execute("SELECT COALESCE(MAX(ROWID), 0) FROM message").fetchone()[0] + 1
+    weights = [1.0 / (rank + 1) for rank in range(chats)]
+    messages, joins = [], []
+    for i in range(first, first + count):
+        chat_id = rng.choices(range(1, chats + 1), weights=weights)[0]
+        from_me = rng.random() < 0.4
+        text = " ".join(rng.choices(_VOCAB, weights=_VOCAB_WEIGHTS, k=rng.randint(3, 14)))
+        rich = not from_me and rng.random() < 0.33
+        date = (start_s + i * 20) * 1_000_000_000
+        messages.append((
+            i, f"msg-{i}", None if rich else text, attributed_body(text) if rich else None,
+            0 if from_me else chat_id, "iMessage", date, int(from_me), int(from_me or rng.random() > 0.01),
+        ))
+        joins.append((chat_id, i, date))
+    conn.executemany(
+        "INSERT INTO message (ROWID, guid, text, attributedBody, handle_id, service, date, is_from_me, is_read) "
+        "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+        messages,
+    )
+    conn.executemany("INSERT INTO chat_message_join VALUES (?, ?, ?)", joins)
+    conn.commit()
+
+
+# Stand-in for the claude CLI: a banner, a startup delay, then the ❯ prompt
+STUB_CLAUDE = """#!/bin/sh
+echo "Claude Code (stub)"
+sleep "${STUB_CLAUDE_DELAY:-0.5}"
+printf '\\n\\342\\235\\257 '
+exec cat > /dev/null
+"""
+
+
+def start_tmux_server(tmp: Path, stub_delay: float) -> None:
+    """Start a private tmux server (TMUX_TMPDIR=tmp) with a "life" session.
+
+    Windows run a non-login sh with a "$ " prompt, and `claude` on the
+    server's PATH is STUB_CLAUDE, printing its prompt after stub_delay
+    seconds. Stop it with `tmux kill-server`.
+    """
+    bin_dir = tmp / "bin"
+    bin_dir.mkdir()
+    (bin_dir / "claude").write_text(STUB_CLAUDE)
+    (bin_dir / "claude").chmod(0o755)
+    os.environ.update({
+        "TMUX_TMPDIR": str(tmp),
+        "PATH": f"{bin_dir}{os.pathsep}{os.environ['PATH']}",
+        "SHELL": "/bin/sh",
+        "PS1": "$ ",
+        "STUB_CLAUDE_DELAY": str(stub_delay),
+    })
+    os.environ.pop("TMUX", None)
+    subprocess.run(["tmux", "new-session", "-d", "-s", "life", "-n", "main", "cat"], check=True)
+    subprocess.run(["tmux", "set-option", "-g", "default-command", "/bin/sh"], check=True)
@@ -0,0 +1,117 @@
+"""
+Offline replay of a recorded inbox for EmailPipeline benchmarks.
+
+fixtures/email_replay.jsonl holds 150 anonymised inbox messages with the
+category a real classifier run gave each one. ReplayService serves them
+to the pipeline in place of EmailService/Apple Mail, and ReplayAgent
+stands in for EmailPipeline._run_agent: it reads the message ids out of
+the prompt, waits a simulated agent latency and writes the recorded
+labels through the real email("classify") / email("classify_batch")
+operations. Nothing touches the network or Mail.app.
+"""
+
+import asyncio
+import json
+import random
+import re
+from dataclasses import replace
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from modules.email import mcp as email_mcp
+from modules.email.models import EmailMessage, ProviderType
+
+FIXTURE = Path(__file__).parent / "fixtures" / "email_replay.jsonl"
+ACCOUNT = "replay"
+
+# Prompt template for single-email runs; batch prompts list the same pairs
+SINGLE_PROMPT = "message_id={message_id} account={account_id}"
+_IDS = re.compile(r"message_id=(\S+) account=(\S+)")
+
+
+def load_replay(path: Path = FIXTURE) -> List[dict]:
+    with open(path) as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+class ReplayService:
+    """The EmailService calls EmailPipeline makes, answered from the fixture."""
+
+    def __init__(self, records: List[dict]):
+        self.records = records
+        self.messages: Dict[str, EmailMessage] = {}
+        for r in records:
+            self.messages[r["id"]] = EmailMessage(
+                id=r["id"], subject=r["subject"], sender=r["sender"], sender_name=None,
+                recipients=[], cc=[], bcc=[], date_received=r["date_received"], date_sent=None,
+                is_read=False, is_flagged=False, mailbox="INBOX", account=ACCOUNT,
+                provider=ProviderType.APPLE_MAIL, content=r["body"], snippet=r["snippet"],
+            )
+
+    def get_accounts_with_capabilities(self):
+        return [{"id": ACCOUNT, "can_read": True}]
+
+    def reload_accounts(self):
+        pass
+
+    def get_latest_cursor(self, mailbox, account) -> Optional[Tuple[int, int]]:
+        return (0, len(self.records))
+
+    def get_messages_since(self, mailbox, account, since_ts, since_rowid, limit=200):
+        page = self.records[since_rowid:since_rowid + limit]
+        end = since_rowid + len(page)
+        return [self.messages[r["id"]] for r in page], 0, end
+
+    def get_message(self, msg_id, mailbox, account):
+        msg = self.messages.get(msg_id)
+        return replace(msg, account=account) if msg else None
+
+    def search_messages(self, *args, **kwargs):
+        return []
+
+    def mark_as_read(self, *args, **kwargs):
+        return True
+
+
+class ReplayAgent:
+    """Classifies from the fixture's labels after a simulated agent latency."""
+
+    def __init__(
+        self,
+        records: List[dict],
+        scale: float,
+        single_s: float = 20.0,
+        batch_s: float = 25.0,
+        batch_per_email_s: float = 1.5,
+        seed: int = 18,
+    ):
+        self.labels = {r["id"]: r["label"] for r in records}
+        self.scale = scale
+        self.single_s = single_s
+        self.batch_s = batch_s
+        self.batch_per_email_s = batch_per_email_s
+        self.rng = random.Random(seed)
+        self.invocations = 0
+        self.batch_invocations = 0
+        self.batched_emails = 0
+
+    async def __call__(self, prompt: str) -> None:
+        pairs = _IDS.findall(prompt)
+        self.invocations += 1
+        jitter = self.rng.lognormvariate(0, 0.2)
+        if len(pairs) == 1:
+            await asyncio.sleep(self.single_s * jitter * self.scale)
+            msg_id, account = pairs[0]
+            email_mcp._email_classify(
+                message_id=msg_id, account=account, category=self.labels[msg_id],
+                reasoning="replayed", summary="replayed",
+            )
+            return
+
+        self.batch_invocations += 1
+        self.batched_emails += len(pairs)
+        await asyncio.sleep((self.batch_s + self.batch_per_email_s * len(pairs)) * jitter * self.scale)
+        email_mcp._email_classify_batch([
+            {"message_id": msg_id, "account": account, "category": self.labels[msg_id], "summary": "replayed"}
+            for msg_id, account in pairs
+        ])
@@ -0,0 +1,121 @@
+"""
+ContextMonitor tick: scraping each pane vs reading transcript usage.
+
+Creates --sessions active sessions, each with a tmux pane and a transcript
+of --turns turns (about 2 MB at the default). Every tick appends one turn per
+transcript, as live sessions do between 30 s ticks. "screen (old)" is the
+previous tick: sessions one after another, each a capture-pane plus a
+display-message tmux process, regex over the screen. "screen (control)"
+is the same over the control-mode connection. "transcript" is the current
+ContextMonitor.check_all_sessions: all sessions at once, reading only the
+appended bytes of each transcript. Warnings are stubbed out.
+
+    python .engine/tests/benchmarks/bench_context_monitor.py [--sessions 20] [--turns 400] [--iterations 20]
+"""
+
+import argparse
+import asyncio
+import json
+import shutil
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+from _common import make_db, measure, report, start_tmux_server
+
+from core import tmux
+from core.config import settings
+from core.storage import SystemStorage
+from modules.sessions.claude_status import get_session_claude_status
+from workers.context_monitor import ContextMonitor
+
+
+def _turn(i: int) -> str:
+    return json.dumps({"type": "assistant", "message": {
+        "model": "claude-sonnet-4-5",
+        "content": [{"type": "text", "text": f"step {i} " + "x" * 2000}],
+        "usage": {"input_tokens": 500, "cache_creation_input_tokens": 200,
+                  "cache_read_input_tokens": 100 * i, "output_tokens": 300},
+    }}) + "\n"
+
+
+def _tool_result(i: int) -> str:
+    return json.dumps({"type": "user", "message": {"content": [
+        {"type": "tool_result", "tool_use_id": f"t{i}", "content": "y" * 3000},
+    ]}}) + "\n"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sessions", type=int, default=20)
+    parser.add_argument("--turns", type=int, default=400, help="turns already in each transcript")
+    parser.add_argument("--iterations", type=int, default=20)
+    args = parser.parse_args()
+
+    if shutil.which("tmux") is None:
+        sys.exit("tmux is not installed")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp_path = Path(tmp)
+        start_tmux_server(tmp_path, 0.0)
+        db_path = make_db(tmp_path / "system.db")
+        storage = SystemStorage(db_path)
+        transcripts = []
+        panes = []
+        for i in range(args.sessions):
+            window = f"s{i}"
+            subprocess.run(["tmux", "new-window", "-d", "-t", "life", "-n", window, "cat"], check=True)
+            pane = tmux.run("display-message", "-t", f"life:{window}", "-p", "#{pane_id}").stdout.strip()
+            path = tmp_path / f"{window}.jsonl"
+            path.write_text("".join(_turn(t) + _tool_result(t) for t in range(args.turns)))
+            storage.execute("""
+                INSERT INTO sessions (session_id, role, mode, started_at, last_seen_at, tmux_pane, transcript_path)
+                VALUES (?, 'builder', 'interactive', datetime('now'), datetime('now'), ?, ?)
+            """, (f"sess-{i}", pane, str(path)))
+            transcripts.append(path)
+            panes.append(pane)
+        storage.close()
+        size_kb = transcripts[0].stat().st_size // 1024
+
+        turn = [args.turns]
+
+        def append_turn():
+            turn[0] += 1
+            for path in transcripts:
+                with open(path, "a") as f:
+                    f.write(_tool_result(turn[0]) + _turn(turn[0]))
+
+        async def old_tick():
+            for pane in panes:
+                await asyncio.to_thread(get_session_claude_status, pane)
+
+        monitor = ContextMonitor(db_path)
+
+        async def no_warning(*args, **kwargs):
+            pass
+
+        monitor.send_warning = no_warning
+        monitor.emergency_reset = no_warning
+
+        def tick(coro):
+            append_turn()
+            asyncio.run(coro())
+
+        try:
+            rows = {}
+            tmux.close_control_client()
+            settings.tmux_control_mode = False
+            rows["screen (old)"] = measure(lambda: tick(old_tick), args.iterations, warmup=2)
+            settings.tmux_control_mode = True
+            rows["screen (control)"] = measure(lambda: tick(old_tick), args.iterations, warmup=2)
+            rows["transcript"] = measure(lambda: tick(monitor.check_all_sessions), args.iterations, warmup=2)
+        finally:
+            tmux.close_control_client()
+            subprocess.run(["tmux", "kill-server"], capture_output=True)
+
+    report(f"context monitor tick, {args.sessions} sessions, ~{size_kb} KB transcripts", rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""
+Conversation history: whole-window response vs cursor pages.
+
+Seeds a 50-session conversation (each session its own transcript) and
+requests /api/sessions/conversation/{id}/transcript/history through the
+FastAPI app:
+
+- full: every event of every session (the old response shape), cold
+  (parsed-event cache cleared) and warm
+- first page: limit=200 newest events, cold and warm
+
+Reports latency and response size.
+
+    python .engine/tests/benchmarks/bench_conversation_history.py [--sessions 50] [--turns 300]
+"""
+
+import argparse
+import json
+import logging
+import sqlite3
+import tempfile
+from pathlib import Path
+
+from _common import make_db, measure, report
+
+from fastapi.testclient import TestClient
+
+from core.config import settings
+from modules.sessions import transcript as transcript_module
+from modules.sessions import transcript_index
+
+
+def seed(db_path: Path, root: Path, sessions: int, turns: int) -> None:
+    conn = sqlite3.connect(db_path)
+    for s in range(sessions):
+        path = root / f"session-{s:02d}.jsonl"
+        with open(path, "w") as f:
+            for t in range(turns):
+                f.write(json.dumps({"type": "user", "uuid": f"{s}-u{t}", "timestamp": "t",
+                                    "message": {"content": f"question {t} " + "q" * 300}}) + "\n")
+                f.write(json.dumps({"type": "assistant", "uuid": f"{s}-a{t}", "timestamp": "t",
+                                    "message": {"model": "m", "content": [
+                                        {"type": "thinking", "thinking": "z" * 800},
+                                        {"type": "text", "text": "answer " + "a" * 600},
+                                    ]}}) + "\n")
+        conn.execute("""
+            INSERT INTO sessions (session_id, role, mode, conversation_id, transcript_path,
+                                  started_at, last_seen_at, created_at)
+            VALUES (?, 'chief', 'interactive', 'bench-conv', ?,
+                    datetime('now', ?), datetime('now'), datetime('now'))
+        """, (f"s{s:02d}", str(path), f"-{sessions - s} hours"))
+    conn.commit()
+    conn.close()
+
+
+def clear_caches() -> None:
+    transcript_module._event_cache.clear()
+    transcript_module._event_cache_size = 0
+    transcript_index._INDEXES.clear()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sessions", type=int, default=50)
+    parser.add_argument("--turns", type=int, default=300)
+    parser.add_argument("--iterations", type=int, default=10)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        settings.db_path = make_db(root / "bench.db")
+        settings.transcript_index_dir = root / "idx"
+        seed(settings.db_path, root, args.sessions, args.turns)
+
+        logging.getLogger("httpx").setLevel(logging.WARNING)
+        from app import create_app
+        client = TestClient(create_app(testing=True))
+        url = "/api/sessions/conversation/bench-conv/transcript/history"
+        full = {"hours": 0}
+        page = {"limit": 200}
+
+        sizes = {}
+
+        def fetch(params, cold):
+            if cold:
+                clear_caches()
+            response = client.get(url, params=params)
+            sizes[(tuple(params), cold)] = len(response.content)
+
+        report(f"history, {args.sessions} sessions x {args.turns * 2} lines", {
+            "full window (cold)": measure(lambda: fetch(full, True), args.iterations, warmup=1),
+            "full window (warm cache)": measure(lambda: fetch(full, False), args.iterations, warmup=1),
+            "first page limit=200 (cold)": measure(lambda: fetch(page, True), args.iterations, warmup=1),
+            "first page limit=200 (warm)": measure(lambda: fetch(page, False), args.iterations, warmup=1),
+        })
+        print("\nresponse size")
+        print(f"  full window      {sizes[(('hours',), False)] / 1e6:8.2f} MB")
+        print(f"  first page       {sizes[(('limit',), False)] / 1e3:8.1f} KB")
+
+
+if __name__ == "__main__":
+    main()
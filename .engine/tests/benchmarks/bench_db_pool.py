@@ -0,0 +1,134 @@
+"""
+Connect-per-call vs pooled connections for the Dashboard's hottest reads.
+
+Replays the SQL issued by /api/sessions/activity (activity list plus one
+transcript lookup per active session) and /api/analytics/overview +
+/api/analytics/system against a seeded database, once opening a fresh
+connection per call (the old get_db()/SystemStorage behaviour) and once
+through core.database's pool.
+
+    python .engine/tests/benchmarks/bench_db_pool.py [--iterations 200]
+"""
+
+import argparse
+import sqlite3
+import tempfile
+import uuid
+from pathlib import Path
+
+from _common import make_db, measure, report
+
+from core.database import ConnectionPool
+
+
+ACTIVITY_SQL = """
+    SELECT session_id, started_at, last_seen_at, ended_at, current_state, cwd, tmux_pane,
+           role, mode, session_type, session_subtype, description, mission_execution_id,
+           status_text, conversation_id, parent_session_id
+    FROM sessions
+    WHERE (
+        ended_at IS NULL
+        OR
+        (ended_at IS NOT NULL AND date(started_at) = date('now', 'localtime'))
+    )
+    ORDER BY COALESCE(ended_at, '9999-12-31') DESC, started_at DESC
+"""
+
+TRANSCRIPT_SQL = "SELECT transcript_path, claude_session_id, cwd FROM sessions WHERE session_id = ?"
+
+ANALYTICS_SQL = [
+    """SELECT julianday('now') - julianday(MAX(completed_at)) FROM priorities
+       WHERE level = 'critical' AND completed = 1 AND completed_at IS NOT NULL""",
+    """SELECT level, COUNT(*), SUM(CASE WHEN completed = 1 THEN 1 ELSE 0 END) FROM priorities
+       WHERE date >= date('now', '-7 days') AND date IS NOT NULL GROUP BY level""",
+    """SELECT SUM((julianday(COALESCE(ended_at, datetime('now'))) - julianday(started_at)) * 24)
+       FROM sessions WHERE date(started_at) = date('now', 'localtime')""",
+    """SELECT level, COUNT(*), SUM(CASE WHEN completed = 1 THEN 1 ELSE 0 END) FROM priorities
+       WHERE date = date('now', 'localtime') GROUP BY level""",
+    "SELECT COUNT(*) FROM sessions",
+    "SELECT COUNT(*) FROM contacts",
+    "SELECT COUNT(*) FROM priorities",
+]
+
+
+def seed(db_path: Path, active: int, ended: int) -> None:
+    conn = sqlite3.connect(db_path)
+    for i in range(active + ended):
+        conn.execute(
+            """INSERT INTO sessions (session_id, role, mode, started_at, last_seen_at,
+                                     ended_at, transcript_path, created_at, updated_at)
+               VALUES (?, 'builder', 'interactive', datetime('now'), datetime('now'),
+                       ?, '/tmp/none.jsonl', datetime('now'), datetime('now'))""",
+            (uuid.uuid4().hex[:8], None if i < active else "2099-01-01T00:00:00"),
+        )
+    conn.commit()
+    conn.close()
+
+
+def connect_per_call(db_path: Path) -> sqlite3.Connection:
+    """What get_db()/SystemStorage did before pooling."""
+    conn = sqlite3.connect(str(db_path))
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA journal_mode=WAL;")
+    conn.execute("PRAGMA busy_timeout=5000;")
+    conn.execute("PRAGMA foreign_keys=ON;")
+    return conn
+
+
+def activity_unpooled(db_path: Path) -> None:
+    conn = connect_per_call(db_path)
+    rows = conn.execute(ACTIVITY_SQL).fetchall()
+    conn.close()
+    for row in rows:
+        if row["ended_at"] is None:
+            conn = connect_per_call(db_path)
+            conn.execute(TRANSCRIPT_SQL, (row["session_id"],)).fetchone()
+            conn.close()
+
+
+def activity_pooled(pool: ConnectionPool) -> None:
+    rows = pool.reader().execute(ACTIVITY_SQL).fetchall()
+    for row in rows:
+        if row["ended_at"] is None:
+            pool.reader().execute(TRANSCRIPT_SQL, (row["session_id"],)).fetchone()
+
+
+def analytics_unpooled(db_path: Path) -> None:
+    for sql in ANALYTICS_SQL:
+        conn = connect_per_call(db_path)
+        conn.execute(sql).fetchall()
+        conn.close()
+
+
+def analytics_pooled(pool: ConnectionPool) -> None:
+    for sql in ANALYTICS_SQL:
+        with pool.connection() as conn:
+            conn.execute(sql).fetchall()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--active", type=int, default=12)
+    parser.add_argument("--ended", type=int, default=200)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = make_db(Path(tmp) / "bench.db")
+        seed(db_path, args.active, args.ended)
+        pool = ConnectionPool(db_path)
+
+        report(f"/api/sessions/activity ({args.active} active sessions)", {
+            "connect-per-call": measure(lambda: activity_unpooled(db_path), args.iterations),
+            "pooled": measure(lambda: activity_pooled(pool), args.iterations),
+        })
+        report(f"/api/analytics/* ({len(ANALYTICS_SQL)} queries)", {
+            "connect-per-call": measure(lambda: analytics_unpooled(db_path), args.iterations),
+            "pooled": measure(lambda: analytics_pooled(pool), args.iterations),
+        })
+        print(f"\npool connections opened: {pool.stats['opened']}, reused: {pool.stats['reused']}")
+        pool.close()
+
+
+if __name__ == "__main__":
+    main()
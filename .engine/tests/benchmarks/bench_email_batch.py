@@ -0,0 +1,109 @@
+"""
+EmailPipeline batch classification: one agent per email vs low-signal batches.
+
+Replays the recorded inbox in fixtures/email_replay.jsonl (150 messages,
+about two thirds bulk mail) through discovery and the classification
+workers, with ReplayAgent standing in for the Claude agent (20 s per
+single-email run, 25 s + 1.5 s per email for a batch run, in simulated
+time). Reports throughput, agent invocations and how many emails went
+through a batch. Runs offline.
+
+    python .engine/tests/benchmarks/bench_email_batch.py [--batch-size 10] [--scale 0.01]
+"""
+
+import argparse
+import asyncio
+import logging
+import sqlite3
+import tempfile
+import time
+from pathlib import Path
+
+from _common import make_db
+from _email_replay import ACCOUNT, SINGLE_PROMPT, ReplayAgent, ReplayService, load_replay
+
+from core.config import settings
+from modules.email import brief_draft
+from modules.email import mcp as email_mcp
+from modules.email.pipeline import EmailPipeline
+
+
+def remaining(db_path: Path) -> int:
+    conn = sqlite3.connect(db_path)
+    try:
+        return conn.execute("SELECT COUNT(*) FROM email_metadata WHERE classified = 0").fetchone()[0]
+    finally:
+        conn.close()
+
+
+def replay(records, batch_size: int, scale: float) -> dict:
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = make_db(Path(tmp) / "system.db")
+        settings.db_path = db_path  # the email tool ops write through core.database.get_db
+        conn = sqlite3.connect(db_path)
+        conn.execute(
+            """INSERT INTO email_discovery_cursor (account_id, mailbox, since_ts, since_rowid, updated_at)
+               VALUES (?, 'INBOX', 0, 0, 'x')""",
+            (ACCOUNT,),
+        )
+        conn.commit()
+        conn.close()
+
+        pipeline = EmailPipeline(str(db_path), poll_interval=3600, batch_size=batch_size)
+        agent = ReplayAgent(records, scale)
+        pipeline._service = ReplayService(records)
+        pipeline._run_agent = agent
+        pipeline._load_prompt = lambda: SINGLE_PROMPT
+        pipeline._ensure_initialized = lambda: asyncio.sleep(0)
+
+        async def run():
+            stop = asyncio.Event()
+            start = time.perf_counter()
+            task = asyncio.create_task(pipeline.start(stop))
+            await asyncio.sleep(scale)
+            while remaining(db_path):
+                await asyncio.sleep(scale)
+            elapsed = time.perf_counter() - start
+            stop.set()
+            await task
+            return elapsed
+
+        elapsed = asyncio.run(run())
+
+    minutes = elapsed / scale / 60
+    return {
+        "minutes": minutes,
+        "per_minute": len(records) / minutes,
+        "invocations": agent.invocations,
+        "batches": agent.batch_invocations,
+        "batched": agent.batched_emails,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--batch-size", type=int, default=EmailPipeline.BATCH_SIZE)
+    parser.add_argument("--scale", type=float, default=0.01, help="real seconds per simulated second")
+    args = parser.parse_args()
+
+    # Offline: no Dashboard notifications, no morning-brief file
+    email_mcp.notify_backend_event = lambda *a, **k: None
+    brief_draft.update_draft = lambda db_path: None
+    logging.getLogger("modules.email").setLevel(logging.WARNING)
+
+    records = load_replay()
+    rows = {
+        "one agent per email": replay(records, 1, args.scale),
+        f"batches of {args.batch_size}": replay(records, args.batch_size, args.scale),
+    }
+    print(f"\nclassify {len(records)} replayed emails (simulated time)")
+    print(f"  {'case':<22} {'minutes':>8} {'emails/min':>11} {'agent runs':>11} {'batch runs':>11} {'batched':>8}")
+    for name, r in rows.items():
+        print(
+            f"  {name:<22} {r['minutes']:>8.1f} {r['per_minute']:>11.1f} {r['invocations']:>11}"
+            f" {r['batches']:>11} {r['batched']:>8}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+"""
+EmailPipeline discovery: newest-50 rescan vs per-account cursor.
+
+Generates an Envelope Index (default 50k messages), lets each pipeline
+bootstrap, then repeatedly appends a burst of new mail (default 500
+messages, ~70% to INBOX) and times one discovery poll. "newest-50" is the
+old loop: re-read the latest 50 INBOX messages every poll, one SELECT and
+one INSERT per message. It misses everything past the 50th new message.
+
+    python .engine/tests/benchmarks/bench_email_discovery.py [--messages 50000] [--burst 500]
+"""
+
+import argparse
+import random
+import sqlite3
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+from _common import append_envelope_messages, make_db, make_envelope_index
+
+from core.config import settings
+from modules.email import service as service_module
+from modules.email.pipeline import EmailPipeline
+from modules.email.providers import apple as apple_module
+
+ACCOUNT = "6F1C2B9E-0000-4000-8000-000000000001"
+START_TS = 1_700_000_000
+
+
+class Newest50Pipeline(EmailPipeline):
+    """The pre-cursor discovery loop."""
+
+    def _discover_new_emails_sync(self):
+        svc = self._get_service(reload_accounts=True)
+        with self._get_conn() as conn:
+            now = datetime.now(timezone.utc).isoformat()
+            seen_msg_ids: set = set()
+            for acct in svc.get_accounts_with_capabilities():
+                if not acct.get("can_read"):
+                    continue
+                for msg in svc.get_messages("INBOX", acct["id"], limit=50, unread_only=False):
+                    if msg.id in seen_msg_ids:
+                        continue
+                    seen_msg_ids.add(msg.id)
+                    if conn.execute(
+                        "SELECT 1 FROM email_metadata WHERE email_message_id = ? LIMIT 1", (msg.id,)
+                    ).fetchone():
+                        continue
+                    conn.execute(
+                        """INSERT OR IGNORE INTO email_metadata
+                           (email_message_id, account_id, first_seen_at, last_updated_at, received_at)
+                           VALUES (?, ?, ?, ?, ?)""",
+                        (msg.id, acct["id"], now, now, msg.date_received),
+                    )
+                conn.commit()
+
+
+def make_system_db(path: Path) -> Path:
+    make_db(path)
+    conn = sqlite3.connect(path)
+    conn.execute(
+        """INSERT INTO accounts (id, email, account_type, discovered_via, apple_account_guid)
+           VALUES ('bench', 'me@example.com', 'imap', 'mail_app', ?)""",
+        (ACCOUNT,),
+    )
+    conn.commit()
+    conn.close()
+    return path
+
+
+def tracked(db_path: Path) -> int:
+    conn = sqlite3.connect(db_path)
+    try:
+        return conn.execute("SELECT COUNT(*) FROM email_metadata").fetchone()[0]
+    finally:
+        conn.close()
+
+
+def inbox_count(source: Path) -> int:
+    conn = sqlite3.connect(source)
+    try:
+        return conn.execute("SELECT COUNT(*) FROM messages WHERE mailbox = 1").fetchone()[0]
+    finally:
+        conn.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--messages", type=int, default=50_000)
+    parser.add_argument("--burst", type=int, default=500)
+    parser.add_argument("--rounds", type=int, default=10)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        source = make_envelope_index(root / "Envelope Index", args.messages, ACCOUNT, START_TS)
+        apple_module.IS_MACOS = True
+        service_module.IS_MACOS = True
+        apple_module._find_mail_db = lambda: str(source)
+
+        pipelines = {}
+        for name, cls in (("newest-50", Newest50Pipeline), ("cursor", EmailPipeline)):
+            db_path = make_system_db(root / f"{name}.db")
+            settings.db_path = db_path
+            pipeline = cls(str(db_path))
+            pipeline._discover_new_emails_sync()  # bootstrap
+            pipelines[name] = (pipeline, db_path, tracked(db_path), [])
+
+        rng = random.Random(11)
+        arrived = 0
+        for _ in range(args.rounds):
+            before = inbox_count(source)
+            conn = sqlite3.connect(source)
+            append_envelope_messages(conn, args.burst, rng, START_TS)
+            conn.close()
+            arrived += inbox_count(source) - before
+
+            for name, (pipeline, db_path, _, samples) in pipelines.items():
+                settings.db_path = db_path
+                start = time.perf_counter()
+                pipeline._discover_new_emails_sync()
+                samples.append((time.perf_counter() - start) * 1000)
+
+        print(f"\ndiscovery poll, {args.messages:,} messages, {args.rounds} bursts of {args.burst}")
+        print(f"  {'case':<14} {'mean ms':>10} {'p95 ms':>10} {'discovered':>12} {'missed':>8}")
+        for name, (_, db_path, bootstrapped, samples) in pipelines.items():
+            samples.sort()
+            found = tracked(db_path) - bootstrapped
+            print(
+                f"  {name:<14} {sum(samples) / len(samples):>10.2f} "
+                f"{samples[int((len(samples) - 1) * 0.95)]:>10.2f} {found:>12,} {arrived - found:>8,}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,213 @@
+"""
+EmailPipeline backlog drain: poll-and-gather batches vs continuous workers.
+
+Queues a backlog (default 200 emails, 10% from VIP senders) and drains it
+with a stub agent in simulated time (--scale real seconds per simulated
+second). Agent runs take ~20 s; the stub API serves --api-slots calls at
+once and fails the rest after 2 s as if rate limited. "batches (old)" is
+the previous loop: every 60 s poll take 9 emails, run them 3 at a time
+and wait for the slowest. "workers" is EmailPipeline.start with its
+priority queue and adaptive concurrency. Both run the real _classify_one.
+
+    python .engine/tests/benchmarks/bench_email_queue.py [--emails 200] [--api-slots 5]
+"""
+
+import argparse
+import asyncio
+import logging
+import math
+import random
+import re
+import sqlite3
+import tempfile
+import time
+import uuid
+from datetime import datetime, timezone
+from pathlib import Path
+from types import SimpleNamespace
+
+from _common import make_db
+
+from modules.email import brief_draft
+from modules.email.pipeline import EmailPipeline
+
+PROMPT = "classify {message_id} {account_id}"
+POLL_S = 60
+AGENT_S = 20
+PREFETCH_S = 0.5
+
+
+class StubService:
+    """get_message for queued ids, as Apple Mail would answer it."""
+
+    def get_message(self, msg_id, mailbox, account):
+        return SimpleNamespace(
+            id=msg_id, sender=f"Sender <s{msg_id}@example.com>", subject=f"Subject {msg_id}",
+            content="Body text", html_content=None, snippet="Body", date_received="2026-01-01T00:00:00",
+        )
+
+
+class StubAgent:
+    """Stands in for _run_agent: writes a classification like the MCP tool would."""
+
+    def __init__(self, db_path: Path, api_slots: int, scale: float, rng: random.Random):
+        self.db_path = db_path
+        self.api_slots = api_slots
+        self.scale = scale
+        self.rng = rng
+        self.active = 0
+        self.calls = 0
+        self.rate_limited = 0
+        self.done_at = {}
+
+    async def __call__(self, prompt: str) -> None:
+        self.calls += 1
+        self.active += 1
+        try:
+            if self.active > self.api_slots:
+                await asyncio.sleep(2 * self.scale)
+                self.rate_limited += 1
+                raise RuntimeError("429 rate limited")
+            await asyncio.sleep(self.rng.lognormvariate(math.log(AGENT_S), 0.3) * self.scale)
+        finally:
+            self.active -= 1
+
+        msg_id, acct_id = re.match(r"classify (\S+) (\S+)", prompt).groups()
+        now = datetime.now(timezone.utc).isoformat()
+        conn = sqlite3.connect(self.db_path)
+        conn.execute(
+            """INSERT OR REPLACE INTO email_classifications
+               (id, email_message_id, account_id, category, summary, classified_at)
+               VALUES (?, ?, ?, 'fyi', 'ok', ?)""",
+            (str(uuid.uuid4()), msg_id, acct_id, now),
+        )
+        conn.execute(
+            "UPDATE email_metadata SET classified = 1 WHERE email_message_id = ? AND account_id = ?",
+            (msg_id, acct_id),
+        )
+        conn.commit()
+        conn.close()
+        self.done_at[msg_id] = time.perf_counter()
+
+
+class BatchPipeline(EmailPipeline):
+    """The previous loop: a fixed batch per poll behind Semaphore(3)."""
+
+    async def start(self, stop_event=None):
+        semaphore = asyncio.Semaphore(3)
+
+        async def one(msg_id, acct_id):
+            async with semaphore:
+                await self._classify_one(msg_id, acct_id)
+
+        while not stop_event.is_set():
+            with self._get_conn() as conn:
+                pending = conn.execute(
+                    """SELECT email_message_id, account_id FROM email_metadata
+                       WHERE classified = 0 ORDER BY first_seen_at DESC LIMIT 9"""
+                ).fetchall()
+            await asyncio.gather(*(one(row[0], row[1]) for row in pending), return_exceptions=True)
+            try:
+                await asyncio.wait_for(stop_event.wait(), timeout=self._poll_interval)
+            except asyncio.TimeoutError:
+                pass
+
+
+def queue_backlog(db_path: Path, count: int, rng: random.Random) -> set:
+    vips = set()
+    rows = []
+    for i in range(count):
+        vip = rng.random() < 0.1
+        if vip:
+            vips.add(str(i))
+        rows.append((str(i), "bench", f"2026-01-01T00:{i // 60:02d}:{i % 60:02d}", "x", 0 if vip else 2))
+    conn = sqlite3.connect(db_path)
+    conn.executemany(
+        """INSERT INTO email_metadata
+           (email_message_id, account_id, first_seen_at, last_updated_at, classify_priority)
+           VALUES (?, ?, ?, ?, ?)""",
+        rows,
+    )
+    conn.commit()
+    conn.close()
+    return vips
+
+
+def remaining(db_path: Path) -> int:
+    conn = sqlite3.connect(db_path)
+    try:
+        return conn.execute("SELECT COUNT(*) FROM email_metadata WHERE classified = 0").fetchone()[0]
+    finally:
+        conn.close()
+
+
+def drain(pipeline_cls, args, seed: int):
+    rng = random.Random(seed)
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = make_db(Path(tmp) / "system.db")
+        vips = queue_backlog(db_path, args.emails, rng)
+
+        pipeline = pipeline_cls(str(db_path), poll_interval=POLL_S * args.scale)
+        agent = StubAgent(db_path, args.api_slots, args.scale, rng)
+        pipeline._service = StubService()
+        pipeline._run_agent = agent
+        pipeline._load_prompt = lambda: PROMPT
+        pipeline._ensure_initialized = lambda: asyncio.sleep(0)
+        pipeline._discover_new_emails = lambda: asyncio.sleep(0)
+
+        def prefetch(*_):
+            time.sleep(PREFETCH_S * args.scale)
+            return []
+
+        pipeline._get_previous_emails = prefetch
+        pipeline._get_thread_context = prefetch
+
+        async def run():
+            stop = asyncio.Event()
+            start = time.perf_counter()
+            task = asyncio.create_task(pipeline.start(stop))
+            while remaining(db_path):
+                await asyncio.sleep(args.scale)
+            elapsed = time.perf_counter() - start
+            stop.set()
+            await task
+            return start, elapsed
+
+        start, elapsed = asyncio.run(run())
+
+    sim = lambda seconds: seconds / args.scale
+    vip_waits = sorted(sim(agent.done_at[m] - start) for m in vips if m in agent.done_at)
+    return {
+        "minutes": sim(elapsed) / 60,
+        "per_minute": args.emails / (sim(elapsed) / 60),
+        "vip_p50_min": vip_waits[len(vip_waits) // 2] / 60 if vip_waits else float("nan"),
+        "calls": agent.calls,
+        "rate_limited": agent.rate_limited,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--emails", type=int, default=200)
+    parser.add_argument("--api-slots", type=int, default=5)
+    parser.add_argument("--scale", type=float, default=0.01, help="real seconds per simulated second")
+    args = parser.parse_args()
+
+    brief_draft.update_draft = lambda db_path: None  # keep the real Desktop untouched
+    logging.getLogger("modules.email.pipeline").setLevel(logging.CRITICAL)  # expected 429s
+
+    rows = {
+        "batches (old)": drain(BatchPipeline, args, seed=17),
+        "workers": drain(EmailPipeline, args, seed=17),
+    }
+    print(f"\ndrain a {args.emails}-email backlog ({args.api_slots} API slots, simulated time)")
+    print(f"  {'case':<20} {'minutes':>8} {'emails/min':>11} {'VIP p50 min':>12} {'agent calls':>12} {'rate limited':>13}")
+    for name, r in rows.items():
+        print(
+            f"  {name:<20} {r['minutes']:>8.1f} {r['per_minute']:>11.1f} {r['vip_p50_min']:>12.1f}"
+            f" {r['calls']:>12} {r['rate_limited']:>13}"
+        )
+
+
+if __name__ == "__main__":
+    main()
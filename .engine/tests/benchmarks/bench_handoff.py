@@ -0,0 +1,75 @@
+"""
+Reset handoff: parsing the whole transcript vs the prepared digest.
+
+Builds a transcript from --repeat copies of a recorded session
+(fixtures/handoff_transcript.jsonl). As the context monitor would once the
+session passes 70%, the digest is checkpointed before the last copy is
+appended, so the tail is one tick's worth of work. "old" is the previous
+handoff.py: parse_transcript over the whole file, all of it in full. "digest"
+is build_handoff_transcript: load the digest, parse the tail, condense
+everything but the newest RECENT_CHARS. The summarizer is a stub whose time
+grows with its input (--ms-per-kchar). handoff.py's 3 s wait for Claude to
+finish is the same in both and left out.
+
+    python .engine/tests/benchmarks/bench_handoff.py [--repeat 40] [--ms-per-kchar 10] [--iterations 5]
+"""
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from _common import measure, report
+
+from core.config import settings
+from modules.handoff.digest import build_handoff_transcript, checkpoint_handoff_digest
+from modules.handoff.transcript_parser import parse_transcript
+
+FIXTURE = Path(__file__).parent / "fixtures" / "handoff_transcript.jsonl"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=40, help="copies of the recorded session")
+    parser.add_argument("--ms-per-kchar", type=float, default=10.0, help="stub summarizer cost per 1000 chars")
+    parser.add_argument("--iterations", type=int, default=5)
+    args = parser.parse_args()
+
+    session = FIXTURE.read_text()
+    sizes = {}
+
+    def summarize(transcript: str):
+        time.sleep(len(transcript) / 1000 * args.ms_per_kchar / 1000)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp_path = Path(tmp)
+        settings.handoff_digest_dir = tmp_path / "digests"
+        path = tmp_path / "session.jsonl"
+
+        path.write_text(session * (args.repeat - 1))
+        checkpoint_handoff_digest("bench", path)
+        with open(path, "a") as f:
+            f.write(session)
+        size_kb = path.stat().st_size // 1024
+
+        def old_parse():
+            sizes["old"] = len(parse_transcript(path))
+
+        def digest_parse():
+            sizes["digest"] = len(build_handoff_transcript("bench", path))
+
+        rows = {
+            "parse (old)": measure(old_parse, args.iterations, warmup=1),
+            "parse (digest)": measure(digest_parse, args.iterations, warmup=1),
+            "reset (old)": measure(lambda: summarize(parse_transcript(path)), args.iterations, warmup=1),
+            "reset (digest)": measure(
+                lambda: summarize(build_handoff_transcript("bench", path)), args.iterations, warmup=1
+            ),
+        }
+
+    report(f"reset handoff, {size_kb} KB transcript, stub summarizer {args.ms_per_kchar} ms/1k chars", rows)
+    print(f"  summarizer input: old {sizes['old']:,} chars, digest {sizes['digest']:,} chars")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""
+Email HTML-to-text: old regex chain vs modules.email.html_text.
+
+Generates a corpus of marketing-style emails (default 60, 20-300 KB of
+nested tables, inline styles, tracking links, entities and zero-width
+padding) and converts each one with the old AppleMailAdapter regex chain
+and with modules.email.html_text, full-length and as a 3000-character
+prompt snippet. Also reports how many outputs match the old converter
+(list items aside, which it rendered with stray bullets).
+
+    python .engine/tests/benchmarks/bench_html_text.py [--emails 60]
+"""
+
+import argparse
+import html as html_module
+import random
+import re
+
+from _common import measure, report
+
+from modules.email.html_text import html_to_text
+
+WORDS = ("sale", "new", "arrivals", "members", "only", "free", "shipping", "today", "limited", "offer", "view", "more")
+
+
+def legacy_clean_text(text: str) -> str:
+    text = re.sub(r'[​-‏ - ­﻿͏ - ⁠-⁯؜᠎⠀　ㅤﾠ]', '', text)
+    text = text.replace('\r\n', '\n').replace('\r', '\n')
+    text = re.sub(r'[^\S\n]+', ' ', text)
+    result, blank_count = [], 0
+    for line in (line.strip() for line in text.split('\n')):
+        if not line:
+            blank_count += 1
+            if blank_count <= 2:
+                result.append('')
+        else:
+            blank_count = 0
+            result.append(line)
+    return '\n'.join(result).strip()
+
+
+def legacy_html_to_text(text: str) -> str:
+    """The converter AppleMailAdapter used before modules.email.html_text."""
+    text = re.sub(r'<style[^>]*>.*?</style>', '', text, flags=re.DOTALL | re.IGNORECASE)
+    text = re.sub(r'<script[^>]*>.*?</script>', '', text, flags=re.DOTALL | re.IGNORECASE)
+    text = re.sub(r'<br\s*/?>', '\n', text, flags=re.IGNORECASE)
+    text = re.sub(r'</?p[^>]*>', '\n', text, flags=re.IGNORECASE)
+    text = re.sub(r'</?div[^>]*>', '\n', text, flags=re.IGNORECASE)
+    text = re.sub(r'</?tr[^>]*>', '\n', text, flags=re.IGNORECASE)
+    text = re.sub(r'</?li[^>]*>', '\n• ', text, flags=re.IGNORECASE)
+    text = re.sub(r'</?h[1-6][^>]*>', '\n', text, flags=re.IGNORECASE)
+    text = re.sub(r'<a[^>]+href=["\']([^"\']+)["\'][^>]*>([^<]*)</a>', r'\2 (\1)', text, flags=re.IGNORECASE)
+    text = re.sub(r'<[^>]+>', '', text)
+    return legacy_clean_text(html_module.unescape(text))
+
+
+def marketing_email(rng: random.Random, target_bytes: int) -> str:
+    blocks = ["<html><head><style>td{font-family:Arial}.btn{padding:12px}</style></head><body>",
+              '<div style="display:none">Preview text&nbsp;&zwnj;&#847;&nbsp;&zwnj;&#847;</div>']
+    size = 0
+    i = 0
+    while size < target_bytes:
+        words = " ".join(rng.choice(WORDS) for _ in range(rng.randint(8, 30)))
+        block = (
+            f'<table role="presentation" width="100%"><tr><td style="padding:16px 24px;color:#222">'
+            f'<h3 style="margin:0">Item {i} &ndash; {words[:30]}</h3>'
+            f'<p style="font-size:14px;line-height:20px">{words} &amp; more&hellip;</p>'
+            f'<a href="https://click.example.com/t?u={rng.getrandbits(64):x}&amp;i={i}" class="btn">Shop now</a>'
+            f'<br><img src="https://img.example.com/{i}.png" width="600" alt="">'
+            f"</td></tr></table>\n"
+        )
+        blocks.append(block)
+        size += len(block)
+        i += 1
+    blocks.append("<script>pixel()</script></body></html>")
+    return "".join(blocks)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--emails", type=int, default=60)
+    parser.add_argument("--iterations", type=int, default=5)
+    args = parser.parse_args()
+
+    rng = random.Random(5)
+    corpus = [marketing_email(rng, rng.randint(20_000, 300_000)) for _ in range(args.emails)]
+    size_mb = sum(len(doc) for doc in corpus) / 1e6
+
+    matching = sum(legacy_html_to_text(doc) == html_to_text(doc) for doc in corpus)
+    rows = {
+        "regex chain (old)": measure(lambda: [legacy_html_to_text(d) for d in corpus], args.iterations, warmup=1),
+        "precompiled passes": measure(lambda: [html_to_text(d) for d in corpus], args.iterations, warmup=1),
+        "precompiled, limit=3000": measure(lambda: [html_to_text(d, limit=3000) for d in corpus], args.iterations, warmup=1),
+    }
+    report(f"convert {args.emails} emails ({size_mb:.1f} MB of HTML)", rows)
+    print(f"\n  outputs identical to the old converter: {matching}/{len(corpus)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+AppleMailAdapter polling paths: connection-per-call vs pooled connection + memo.
+
+Replays what the triage/pipeline poll does per account every 60 s
+(unread count, mailbox list, new-message cursor query, flag sync, a few
+message body reads) against a generated Envelope Index. "per-call" mimics
+the old adapter: a fresh read-only connection for every method and no
+memoized mailbox / Gmail / storage-dir lookups.
+
+    python .engine/tests/benchmarks/bench_mail_adapter.py [--messages 50000]
+"""
+
+import argparse
+import os
+import sqlite3
+import tempfile
+from pathlib import Path
+
+from _common import make_envelope_index, measure, report
+
+from core.config import settings
+from modules.email.providers import apple as apple_module
+from modules.email.providers.apple import AppleMailAdapter
+
+ACCOUNT = "6F1C2B9E-0000-4000-8000-000000000001"
+
+
+class PerCallAdapter(AppleMailAdapter):
+    """The pre-pooling behaviour: connect per call, resolve every lookup."""
+
+    def _get_db_connection(self):
+        conn = sqlite3.connect(f"file:{self._db_path}?mode=ro", uri=True)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    def _memo(self, kind, key, resolve):
+        return resolve()
+
+
+def make_mail_tree(home: Path, rowids) -> None:
+    messages = home / "Library" / "Mail" / "V10" / ACCOUNT / "INBOX.mbox" / "GUID" / "Data" / "Messages"
+    messages.mkdir(parents=True)
+    for rowid in rowids:
+        (messages / f"{rowid}.emlx").write_bytes(b"60\nContent-Type: text/plain\n\nHello, this is message body text.\n")
+
+
+def poll(adapter: AppleMailAdapter, since_rowid: int, read_ids) -> None:
+    adapter.get_unread_count("INBOX", "bench")
+    adapter.get_mailboxes("bench")
+    since_ts = 1_700_000_000 + since_rowid * 30
+    adapter.get_messages_since("INBOX", "bench", since_ts, since_rowid, limit=200)
+    adapter.get_flags_since("INBOX", "bench", since_ts, limit=1000)
+    for rowid in read_ids:
+        adapter.get_message(str(rowid), "INBOX", "bench")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--messages", type=int, default=50_000)
+    parser.add_argument("--iterations", type=int, default=50)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        source = make_envelope_index(root / "Envelope Index", args.messages, ACCOUNT)
+        read_ids = list(range(args.messages - 4, args.messages + 1))
+        make_mail_tree(root, read_ids)
+        os.environ["HOME"] = str(root)
+        settings.db_path = root / "system.db"
+        apple_module.IS_MACOS = True
+
+        adapters = {}
+        for name, cls in (("per-call", PerCallAdapter), ("pooled + memo", AppleMailAdapter)):
+            adapter = cls()
+            adapter._db_path = str(source)
+            adapter._account_identifier_cache["bench"] = ACCOUNT
+            adapters[name] = adapter
+
+        since = args.messages - 50
+        report(f"one account poll, {args.messages:,} messages, 5 body reads", {
+            name: measure(lambda a=adapter: poll(a, since, read_ids), args.iterations)
+            for name, adapter in adapters.items()
+        })
+        print("\n  pooled adapter counters:", adapters["pooled + memo"].get_cache_stats())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+"""
+AppleMailAdapter message bodies: full MIME parse per read vs streaming parse + body cache.
+
+Writes a Mail.app-style storage tree of large HTML newsletters (default 100
+messages: ~250 KB of table-heavy HTML plus a ~400 KB image attachment
+each, a third of them with a text/plain alternative) and times reading
+every body through get_message. "full parse" is the old path: read the
+whole .emlx, email.message_from_bytes, decode every part, convert.
+
+    python .engine/tests/benchmarks/bench_mail_body.py [--messages 100]
+"""
+
+import argparse
+import email
+import os
+import random
+import tempfile
+from email.mime.image import MIMEImage
+from email.mime.multipart import MIMEMultipart
+from email.mime.text import MIMEText
+from pathlib import Path
+
+from _common import make_envelope_index, measure, report
+
+from core.config import settings
+from modules.email.providers import apple as apple_module
+from modules.email.providers.apple import AppleMailAdapter
+from modules.email.providers.apple_body import get_body_cache
+
+ACCOUNT = "6F1C2B9E-0000-4000-8000-000000000001"
+
+
+def newsletter(rng: random.Random, with_plain: bool) -> bytes:
+    rows = []
+    for i in range(900):
+        words = " ".join(rng.choice(("market", "update", "offer", "weekly", "read", "more", "news")) for _ in range(12))
+        rows.append(
+            f'<tr><td style="padding:8px;font-family:Arial"><a href="https://example.com/a/{i}">'
+            f"Story {i}</a></td><td><p>{words} &amp; more&nbsp;&#8203;</p></td></tr>"
+        )
+    html = f"<html><head><style>td {{ color: #333; }}</style></head><body><table>{''.join(rows)}</table></body></html>"
+
+    message = MIMEMultipart("mixed")
+    alternative = MIMEMultipart("alternative")
+    if with_plain:
+        alternative.attach(MIMEText("Weekly update\n\n" + "\n".join(f"Story {i}" for i in range(900)), "plain"))
+    alternative.attach(MIMEText(html, "html", "utf-8"))
+    message.attach(alternative)
+    image = MIMEImage(os.urandom(400_000), "png")
+    image.add_header("Content-Disposition", "attachment", filename="hero.png")
+    message.attach(image)
+    return message.as_bytes()
+
+
+def make_mail_tree(home: Path, count: int) -> None:
+    messages_dir = home / "Library" / "Mail" / "V10" / ACCOUNT / "INBOX.mbox" / "GUID" / "Data" / "Messages"
+    messages_dir.mkdir(parents=True)
+    rng = random.Random(3)
+    for rowid in range(1, count + 1):
+        raw = newsletter(rng, with_plain=rowid % 3 == 0)
+        (messages_dir / f"{rowid}.emlx").write_bytes(b"%d\n" % len(raw) + raw + b"<?xml version='1.0'?><plist/>")
+
+
+def full_parse(adapter: AppleMailAdapter, path: Path) -> str:
+    """The pre-cache body read."""
+    _, _, raw_message = path.read_bytes().partition(b"\n")
+    msg = email.message_from_bytes(raw_message)
+    plain_text = html_text = None
+    for part in msg.walk():
+        if "attachment" in str(part.get("Content-Disposition", "")):
+            continue
+        payload = part.get_payload(decode=True)
+        if not payload:
+            continue
+        text = payload.decode(part.get_content_charset() or "utf-8", errors="replace")
+        if part.get_content_type() == "text/plain" and not plain_text:
+            plain_text = text
+        elif part.get_content_type() == "text/html" and not html_text:
+            html_text = text
+    return adapter._body_text(plain_text, html_text)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--messages", type=int, default=100)
+    parser.add_argument("--iterations", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        source = make_envelope_index(root / "Envelope Index", 100, ACCOUNT)
+        make_mail_tree(root, args.messages)
+        os.environ["HOME"] = str(root)
+        settings.db_path = root / "system.db"
+        settings.mail_body_cache_dir = root / "mail_body_cache"
+        apple_module.IS_MACOS = True
+
+        adapter = AppleMailAdapter()
+        adapter._db_path = str(source)
+        adapter._account_identifier_cache["bench"] = ACCOUNT
+        cache = get_body_cache()
+        rowids = range(1, args.messages + 1)
+        paths = [adapter._find_emlx(adapter._resolve_storage_dir(ACCOUNT, "INBOX"), r)[0] for r in rowids]
+
+        def read_all() -> None:
+            for rowid in rowids:
+                adapter.get_message(str(rowid), "INBOX", "bench")
+
+        def cold() -> None:
+            cache.clear_memory()
+            for path in paths:
+                path.touch()  # new mtime: both tiers miss
+            read_all()
+
+        def disk_hits() -> None:
+            cache.clear_memory()
+            read_all()
+
+        rows = {
+            "full parse (old)": measure(lambda: [full_parse(adapter, p) for p in paths], args.iterations, warmup=1),
+            "streaming parse, cold cache": measure(cold, args.iterations, warmup=1),
+            "disk tier hits": measure(disk_hits, args.iterations, warmup=1),
+            "memory tier hits": measure(read_all, args.iterations, warmup=1),
+        }
+        size_mb = sum(p.stat().st_size for p in paths) / 1e6
+        report(f"read {args.messages} newsletter bodies ({size_mb:.0f} MB of .emlx)", rows)
+        disk_kb = sum(p.stat().st_size for p in settings.mail_body_cache_dir.glob("*/*.z")) / 1e3
+        print(f"\n  memory tier: {cache.memory_bytes / 1e6:.1f} MB   disk tier: {disk_kb:,.0f} KB")
+
+
+if __name__ == "__main__":
+    main()
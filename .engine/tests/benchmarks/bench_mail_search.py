@@ -0,0 +1,81 @@
+"""
+Apple Mail search: LIKE scan over the Envelope Index vs the FTS5 shadow index.
+
+Generates an Envelope-Index-shaped database (default 200k messages) and
+times AppleMailAdapter.search through the legacy LIKE path and the indexed
+path, for the query shapes the email pipeline issues: a sender lookup
+(_get_previous_emails), a subject phrase (_get_thread_context) and a plain
+keyword search. Also reports the one-off initial sync and an incremental
+sync of newly arrived mail.
+
+    python .engine/tests/benchmarks/bench_mail_search.py [--messages 200000]
+"""
+
+import argparse
+import random
+import sqlite3
+import tempfile
+import time
+from pathlib import Path
+
+from _common import append_envelope_messages, make_envelope_index, measure, report
+
+from core.config import settings
+from modules.email.providers import apple as apple_module
+from modules.email.providers.apple import AppleMailAdapter
+from modules.email.providers.apple_search import MailSearchIndex
+
+ACCOUNT = "6F1C2B9E-0000-4000-8000-000000000001"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--messages", type=int, default=200_000)
+    parser.add_argument("--iterations", type=int, default=10)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        source = make_envelope_index(root / "Envelope Index", args.messages, ACCOUNT)
+        settings.db_path = root / "system.db"
+        apple_module.IS_MACOS = True
+
+        adapter = AppleMailAdapter()
+        adapter._db_path = str(source)
+        adapter._account_identifier_cache["bench"] = ACCOUNT
+
+        index = MailSearchIndex(source, settings.db_path)
+        start = time.perf_counter()
+        index.sync()
+        initial_ms = (time.perf_counter() - start) * 1000
+
+        conn = sqlite3.connect(source)
+        append_envelope_messages(conn, 500, random.Random(7), 1_700_000_000 + args.messages * 30)
+        conn.close()
+        start = time.perf_counter()
+        added = index.sync()
+        incremental_ms = (time.perf_counter() - start) * 1000
+
+        cases = {
+            "sender": ("user42@domain42.com", "from:user42@domain42.com"),
+            "subject phrase": ("Invoice meeting", '"invoice meeting"'),
+            "keyword": ("itinerary", "itinerary"),
+        }
+        rows = {}
+        for name, (like_query, fts_query) in cases.items():
+            rows[f"{name}: LIKE scan"] = measure(
+                lambda q=like_query: adapter._search_messages_like(q, "INBOX", "bench", 20),
+                args.iterations, warmup=1,
+            )
+            rows[f"{name}: FTS5 index"] = measure(
+                lambda q=fts_query: adapter.search(q, "INBOX", "bench", 20),
+                args.iterations,
+            )
+
+        report(f"AppleMailAdapter.search, {args.messages:,} messages, limit 20", rows)
+        print(f"\n  initial sync:     {initial_ms:,.0f} ms")
+        print(f"  incremental sync: {incremental_ms:,.1f} ms for {added} new messages")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""
+Messages conversation list: correlated chat.db subqueries vs the summary table.
+
+Generates a chat.db-shaped database (default 200k messages across 1500
+chats) and times AppleMessagesAdapter.get_conversations(limit=50). "direct"
+is the old path: four correlated subqueries per chat plus a participants
+query per listed row. "summary" reads ConversationSummary; its cost also
+includes the stat() freshness check. Also times the initial build and an
+incremental sync after a burst of new messages and reads.
+
+    python .engine/tests/benchmarks/bench_messages_conversations.py [--messages 200000] [--chats 1500]
+"""
+
+import argparse
+import random
+import sqlite3
+import tempfile
+import time
+from pathlib import Path
+
+from _common import append_chat_messages, make_chat_db, measure, report
+
+from core.config import settings
+from modules.messages.providers.apple import AppleMessagesAdapter
+from modules.messages.providers.apple_summary import get_conversation_summary
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--messages", type=int, default=200_000)
+    parser.add_argument("--chats", type=int, default=1500)
+    parser.add_argument("--iterations", type=int, default=20)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        chat_db = make_chat_db(Path(tmp) / "chat.db", args.messages, args.chats)
+        settings.db_path = Path(tmp) / "system.db"
+        adapter = AppleMessagesAdapter()
+        adapter._db_path = str(chat_db)
+        summary = get_conversation_summary(chat_db)
+
+        start = time.perf_counter()
+        summary.sync()
+        build_s = time.perf_counter() - start
+
+        direct = [c.id for c in adapter._get_conversations_direct(50, False)]
+        listed = [c.id for c in adapter.get_conversations(limit=50)]
+        rows = {
+            "direct (old)": measure(lambda: adapter._get_conversations_direct(50, False), args.iterations, warmup=1),
+            "summary": measure(lambda: adapter.get_conversations(limit=50), args.iterations, warmup=1),
+        }
+
+        conn = sqlite3.connect(chat_db)
+        append_chat_messages(conn, 500, random.Random(20), 700_000_000 + args.messages * 20)
+        conn.execute("UPDATE message SET is_read = 1 WHERE is_read = 0 AND ROWID % 2 = 0")
+        conn.commit()
+        conn.close()
+        start = time.perf_counter()
+        adapter.get_conversations(limit=50)
+        incremental_ms = (time.perf_counter() - start) * 1000
+
+    report(f"get_conversations(limit=50), {args.messages:,} messages / {args.chats:,} chats", rows)
+    print(f"\n  same 50 conversations in the same order: {direct == listed}")
+    print(f"  initial summary build: {build_s:.1f} s")
+    print(f"  list after 500 new messages + half the unread read: {incremental_ms:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""
+Messages search: LIKE over message.text vs the FTS5 index of decoded text.
+
+Generates a chat.db-shaped database (default 500k messages; a third of
+incoming messages keep their text only in attributedBody) and times
+AppleMessagesAdapter.search_messages(limit=50). "like" is the old
+unindexed scan of message.text; "fts" is MessageSearchIndex plus chat.db
+hydration. Also reports the initial index build, an incremental sync, and
+how many matches each finds (LIKE cannot see attributedBody-only rows).
+
+    python .engine/tests/benchmarks/bench_messages_search.py [--messages 500000]
+"""
+
+import argparse
+import random
+import sqlite3
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from _common import _VOCAB, append_chat_messages, make_chat_db, measure, report
+
+from core.config import settings
+from modules.messages.providers.apple import AppleMessagesAdapter
+from modules.messages.providers.apple_search import get_search_index
+
+APPLE_EPOCH = datetime(2001, 1, 1, tzinfo=timezone.utc)
+
+
+def queries(messages: int) -> dict:
+    """Search cases by how often the term occurs in the generated text."""
+    last_week = APPLE_EPOCH + timedelta(seconds=700_000_000 + messages * 20 - 7 * 86_400)
+    return {
+        "very common word": (_VOCAB[5], {}),
+        "mid-frequency word": (_VOCAB[400], {}),
+        "rare word": (_VOCAB[4000], {}),
+        "two-word phrase": (f'"{_VOCAB[40]} {_VOCAB[41]}"', {}),
+        "word in one chat": (_VOCAB[400], {"chat_id": "iMessage;-;chat3"}),
+        "word in last week": (_VOCAB[400], {"since": last_week}),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--messages", type=int, default=500_000)
+    parser.add_argument("--chats", type=int, default=1500)
+    parser.add_argument("--iterations", type=int, default=10)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        chat_db = make_chat_db(Path(tmp) / "chat.db", args.messages, args.chats)
+        settings.db_path = Path(tmp) / "system.db"
+        adapter = AppleMessagesAdapter()
+        adapter._db_path = str(chat_db)
+        index = get_search_index(chat_db)
+
+        start = time.perf_counter()
+        index.sync()
+        build_s = time.perf_counter() - start
+        assert adapter._get_search_index() is index
+
+        rows, found = {}, {}
+        for name, (query, filters) in queries(args.messages).items():
+            like = lambda: adapter._search_messages_like(query, 50, **filters)
+            fts = lambda: adapter.search_messages(query, limit=50, **filters)
+            rows[f"{name}: like (old)"] = measure(like, args.iterations, warmup=1)
+            rows[f"{name}: fts"] = measure(fts, args.iterations, warmup=1)
+            found[name] = (len(adapter._search_messages_like(query, args.messages, **filters)),
+                           len(adapter.search_messages(query, limit=args.messages, **filters)))
+
+        conn = sqlite3.connect(chat_db)
+        append_chat_messages(conn, 500, random.Random(20), 700_000_000 + args.messages * 20)
+        conn.close()
+        start = time.perf_counter()
+        index.sync()
+        incremental_ms = (time.perf_counter() - start) * 1000
+        db_mb = settings.db_path.stat().st_size / 1e6
+
+    report(f"search_messages(limit=50) over {args.messages:,} messages", rows)
+    print("\n  matches found (like / fts):")
+    for name, (like_n, fts_n) in found.items():
+        print(f"    {name:<20} {like_n:>8,} / {fts_n:>8,}")
+    print(f"\n  initial index build: {build_s:.1f} s ({db_mb:.0f} MB system.db)")
+    print(f"  incremental sync of 500 new messages: {incremental_ms:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
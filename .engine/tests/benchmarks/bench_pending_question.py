@@ -0,0 +1,102 @@
+"""
+/api/sessions/activity pending-question checks: full reads vs tail cache.
+
+For N active sessions with large transcripts, compares the old path
+(sqlite lookup per session + readlines() of the whole file) against
+has_pending_question's reverse block read (first call) and its
+append-only cache (subsequent polls).
+
+    python .engine/tests/benchmarks/bench_pending_question.py [--sessions 8] [--mb 20]
+"""
+
+import argparse
+import json
+import sqlite3
+import tempfile
+from pathlib import Path
+
+from _common import make_db, measure, report
+
+from modules.sessions import transcript
+from modules.sessions.transcript import INTERACTIVE_TOOLS, has_pending_question, resolve_transcript_path
+
+
+def write_transcript(path: Path, mb: int) -> None:
+    line = json.dumps({"type": "assistant", "message": {"content": [
+        {"type": "text", "text": "y" * 2000}]}}) + "\n"
+    with open(path, "w") as f:
+        f.write(line * (mb * 1024 * 1024 // len(line)))
+        f.write(json.dumps({"type": "assistant", "message": {"content": [
+            {"type": "tool_use", "id": "q", "name": "AskUserQuestion", "input": {}}]}}) + "\n")
+
+
+def legacy_has_pending_question(path: Path) -> bool:
+    with open(path) as f:
+        lines = f.readlines()
+    asked, answered = set(), set()
+    for line in lines[-100:]:
+        data = json.loads(line)
+        for item in data.get("message", {}).get("content", []):
+            if isinstance(item, dict) and item.get("type") == "tool_use" and item.get("name") in INTERACTIVE_TOOLS:
+                asked.add(item["id"])
+            elif isinstance(item, dict) and item.get("type") == "tool_result":
+                answered.add(item.get("tool_use_id"))
+    return bool(asked - answered)
+
+
+def legacy_activity(db_path: Path, session_ids) -> int:
+    waiting = 0
+    for session_id in session_ids:
+        conn = sqlite3.connect(str(db_path))
+        conn.row_factory = sqlite3.Row
+        row = conn.execute("SELECT transcript_path, claude_session_id, cwd FROM sessions WHERE session_id = ?",
+                           (session_id,)).fetchone()
+        conn.close()
+        waiting += legacy_has_pending_question(Path(row["transcript_path"]))
+    return waiting
+
+
+def current_activity(rows) -> int:
+    return sum(
+        has_pending_question(resolve_transcript_path(r["transcript_path"], None, None))
+        for r in rows
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sessions", type=int, default=8)
+    parser.add_argument("--mb", type=int, default=20)
+    parser.add_argument("--iterations", type=int, default=10)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        db_path = make_db(root / "bench.db")
+        conn = sqlite3.connect(db_path)
+        rows = []
+        for i in range(args.sessions):
+            path = root / f"s{i}.jsonl"
+            write_transcript(path, args.mb)
+            conn.execute("""INSERT INTO sessions (session_id, role, mode, transcript_path, started_at,
+                                                  last_seen_at, created_at)
+                            VALUES (?, 'chief', 'interactive', ?, datetime('now'), datetime('now'),
+                                    datetime('now'))""", (f"s{i}", str(path)))
+            rows.append({"transcript_path": str(path)})
+        conn.commit()
+        conn.close()
+        ids = [f"s{i}" for i in range(args.sessions)]
+
+        def cold():
+            transcript._interactive_states.clear()
+            return current_activity(rows)
+
+        report(f"pending checks, {args.sessions} active sessions x {args.mb} MB", {
+            "lookup + readlines": measure(lambda: legacy_activity(db_path, ids), args.iterations, warmup=1),
+            "tail read (cold cache)": measure(cold, args.iterations, warmup=1),
+            "append cache (poll)": measure(lambda: current_activity(rows), args.iterations),
+        })
+
+
+if __name__ == "__main__":
+    main()
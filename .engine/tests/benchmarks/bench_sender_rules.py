@@ -0,0 +1,132 @@
+"""
+EmailPipeline sender-rule matching: per-email table scan vs SenderRuleIndex.
+
+Fills email_sender_rules (default 5000 rules, ~70% domain) and matches a
+batch of senders (default 2000, about a third covered by some rule). "scan"
+is the old _match_rules: SELECT every enabled rule and compare each one in
+Python, per email, then one UPDATE + commit per applied rule. "index" is
+the pipeline as it is now: a version check per email, the in-memory index,
+and one batched times_applied flush per poll.
+
+    python .engine/tests/benchmarks/bench_sender_rules.py [--rules 5000] [--senders 2000]
+"""
+
+import argparse
+import random
+import sqlite3
+import tempfile
+import uuid
+from datetime import datetime, timezone
+from pathlib import Path
+
+from _common import make_db, measure, report
+
+from modules.email.pipeline import EmailPipeline
+from modules.email.rules import bump_rules_version
+
+TLDS = ("com", "org", "io", "net", "co.uk")
+
+
+def legacy_match_rules(conn: sqlite3.Connection, sender_email: str):
+    """The _match_rules loop used before SenderRuleIndex."""
+    parts = sender_email.split("@")
+    sender_domain = parts[1].lower() if len(parts) == 2 else ""
+    rows = conn.execute(
+        """SELECT id, match_type, match_value, rule_type, category,
+                  instructions, extract_content
+           FROM email_sender_rules
+           WHERE enabled = 1
+           ORDER BY
+               CASE match_type WHEN 'sender' THEN 0 ELSE 1 END,
+               CASE rule_type WHEN 'always' THEN 0 WHEN 'never' THEN 1 ELSE 2 END
+        """,
+    ).fetchall()
+    matched = []
+    for row in rows:
+        match_value = row["match_value"].lower()
+        if row["match_type"] == "sender" and sender_email == match_value:
+            matched.append(dict(row))
+        elif row["match_type"] == "domain" and sender_domain == match_value:
+            matched.append(dict(row))
+    return matched
+
+
+def populate(db_path: Path, count: int, rng: random.Random):
+    domains = [f"brand{i}.{rng.choice(TLDS)}" for i in range(count)]
+    rows = []
+    for i, domain in enumerate(domains):
+        if rng.random() < 0.7:
+            match_type, value = "domain", domain
+        else:
+            match_type, value = "sender", f"news{i}@{domain}"
+        rows.append((
+            str(uuid.uuid4()), match_type, value, rng.choice(("always", "never", "suggest")),
+            rng.choice(("fyi", "noise")), "2026-01-01", "2026-01-01",
+        ))
+    conn = sqlite3.connect(db_path)
+    conn.executemany(
+        """INSERT INTO email_sender_rules
+           (id, match_type, match_value, rule_type, category, created_at, updated_at)
+           VALUES (?, ?, ?, ?, ?, ?, ?)""",
+        rows,
+    )
+    bump_rules_version(conn)
+    conn.commit()
+    conn.close()
+    return domains
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rules", type=int, default=5000)
+    parser.add_argument("--senders", type=int, default=2000)
+    parser.add_argument("--iterations", type=int, default=3)
+    args = parser.parse_args()
+
+    rng = random.Random(16)
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = make_db(Path(tmp) / "system.db")
+        domains = populate(db_path, args.rules, rng)
+        senders = []
+        for i in range(args.senders):
+            if rng.random() < 0.33:
+                j = rng.randrange(len(domains))
+                senders.append(rng.choice((f"news{j}@{domains[j]}", f"promo@mail.{domains[j]}")))
+            else:
+                senders.append(f"person{i}@unrelated{i}.com")
+
+        conn = sqlite3.connect(db_path)
+        conn.row_factory = sqlite3.Row
+
+        def scan():
+            for sender in senders:
+                for rule in legacy_match_rules(conn, sender):
+                    conn.execute(
+                        "UPDATE email_sender_rules SET times_applied = times_applied + 1, updated_at = ? WHERE id = ?",
+                        (datetime.now(timezone.utc).isoformat(), rule["id"]),
+                    )
+                    conn.commit()
+
+        pipeline = EmailPipeline(str(db_path))
+
+        def index():
+            for sender in senders:
+                for rule in pipeline._match_rules(sender):
+                    pipeline._increment_rule_applied(rule["id"])
+            pipeline._flush_rule_hits()
+
+        scan_matches = sum(len(legacy_match_rules(conn, s)) for s in senders)
+        index_matches = sum(len(pipeline._match_rules(s)) for s in senders)
+
+        rows = {
+            "scan (old)": measure(scan, args.iterations, warmup=1),
+            "index": measure(index, args.iterations, warmup=1),
+        }
+        conn.close()
+
+    report(f"match + count {args.senders} senders against {args.rules} rules", rows)
+    print(f"\n  rule matches: scan {scan_matches}, index {index_matches} (index adds subdomain matches)")
+
+
+if __name__ == "__main__":
+    main()
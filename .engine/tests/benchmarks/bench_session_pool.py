@@ -0,0 +1,106 @@
+"""
+Specialist spawn latency: cold start vs a claimed standby session.
+
+Runs SessionService.spawn_async against a private tmux server whose `claude`
+is a stub that prints its prompt after --delay seconds; prompt injection is
+stubbed out. Fans out --fanout builder spawns at once, as Chief does, first
+with the pool off ("cold") and then from a filled pool of --pool standbys
+("standby"). Latency is spawn-to-first-prompt as recorded in core.perf.
+Then runs --stream spawns --interval seconds apart to show the claim hit
+rate that pool size sustains while it refills in the background.
+
+    python .engine/tests/benchmarks/bench_session_pool.py [--delay 2.0] [--pool 4] [--fanout 4] [--stream 12] [--interval 0.5]
+"""
+
+import argparse
+import asyncio
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from _common import make_db, start_tmux_server
+
+from core import perf, tmux
+from modules.sessions import service as service_module
+from modules.sessions.pool import start_standby_pool, stop_standby_pool
+from modules.sessions.service import SessionService
+
+
+async def _fan_out(service: SessionService, count: int) -> float:
+    start = time.perf_counter()
+    handles = [await service.spawn_async("builder") for _ in range(count)]
+    for result in await asyncio.gather(*handles):
+        assert result.success, result.error
+    return time.perf_counter() - start
+
+
+async def _wait_full(pool, timeout: float) -> None:
+    deadline = time.perf_counter() + timeout
+    while pool.stats()["ready"]["sonnet"] < pool.sizes["sonnet"]:
+        if time.perf_counter() > deadline:
+            sys.exit(f"pool did not fill: {pool.stats()}")
+        await asyncio.sleep(0.05)
+
+
+async def _run(service: SessionService, args) -> dict:
+    out = {}
+    out["cold_wall_s"] = await _fan_out(service, args.fanout)
+
+    pool = await start_standby_pool(service, {"sonnet": args.pool})
+    try:
+        await _wait_full(pool, args.delay * 4 + 10)
+        out["standby_wall_s"] = await _fan_out(service, args.fanout)
+
+        await _wait_full(pool, args.delay * 4 + 10)
+        before = pool.stats()
+        for _ in range(args.stream):
+            handle = await service.spawn_async("builder")
+            await handle
+            await asyncio.sleep(args.interval)
+        after = pool.stats()
+        out["stream_hits"] = after["hits"] - before["hits"]
+    finally:
+        await stop_standby_pool()
+    out["latency"] = perf.get_worker_snapshot()
+    return out
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--delay", type=float, default=2.0, help="stub claude startup time (s)")
+    parser.add_argument("--pool", type=int, default=4, help="standbys kept warm")
+    parser.add_argument("--fanout", type=int, default=4, help="spawns started at once")
+    parser.add_argument("--stream", type=int, default=12, help="spawns in the steady stream")
+    parser.add_argument("--interval", type=float, default=0.5, help="seconds between stream spawns")
+    args = parser.parse_args()
+
+    if shutil.which("tmux") is None:
+        sys.exit("tmux is not installed")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        start_tmux_server(Path(tmp), args.delay)
+        service_module.emit_event = lambda *a, **k: None
+        service = SessionService(db_path=make_db(Path(tmp) / "system.db"), repo_root=Path(tmp))
+        service._inject_prompt = lambda window_name, prompt: True
+        try:
+            out = asyncio.run(_run(service, args))
+        finally:
+            tmux.close_control_client()
+            subprocess.run(["tmux", "kill-server"], capture_output=True)
+
+    print(f"\nspawn-to-first-prompt, stub claude ready after {args.delay:.1f} s")
+    print(f"  {'case':<36} {'count':>6} {'avg ms':>10} {'p95 ms':>10}")
+    for key, name in (("session_spawn.cold", "cold"), ("session_spawn.standby", "standby")):
+        stats = out["latency"].get(key, {"count": 0, "avg_ms": 0.0, "p95_ms": 0.0})
+        print(f"  {name:<36} {stats['count']:>6} {stats['avg_ms']:>10.1f} {stats['p95_ms']:>10.1f}")
+    print(f"\n  fan-out of {args.fanout}")
+    print(f"  {'cold':<36} {out['cold_wall_s']:>8.2f} s")
+    print(f"  {f'standby pool of {args.pool}':<36} {out['standby_wall_s']:>8.2f} s")
+    print(f"\n  stream: {out['stream_hits']}/{args.stream} claims hit, one spawn every {args.interval:.1f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""
+Session spawn readiness: capture-pane polling vs pane output events.
+
+Runs SessionService.spawn against a private tmux server whose `claude` is
+a stub that prints its prompt after --delay seconds. "polling (old)" swaps
+in the previous waits (capture-pane every 0.5 s then a fixed 1 s sleep
+for Claude, every 0.2 s for the shell); "events" is the current spawn();
+"spawn_async" awaits the handle. Prompt injection is stubbed out, so only
+window setup, launch and readiness are timed. Then starts --concurrent
+sessions at once: spawn() needs a thread each, spawn_async runs them on
+one loop with a --workers thread pool for its short blocking steps.
+
+    python .engine/tests/benchmarks/bench_session_spawn.py [--delay 2.0] [--spawns 8] [--concurrent 8] [--workers 2]
+"""
+
+import argparse
+import asyncio
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from _common import make_db, measure, report, start_tmux_server
+
+from core import tmux
+from modules.sessions import service as service_module
+from modules.sessions.service import SessionService, _claude_prompt_visible, _shell_prompt_visible
+
+
+def _poll(target: str, ready, timeout: float, interval: float) -> bool:
+    waited = 0.0
+    while waited < timeout:
+        time.sleep(interval)
+        waited += interval
+        result = subprocess.run(["tmux", "capture-pane", "-t", target, "-p"], capture_output=True, text=True)
+        if result.returncode == 0 and ready(result.stdout):
+            return True
+    return False
+
+
+def _old_wait_for_claude(window_name: str, timeout: int = 30) -> bool:
+    if _poll(f"life:{window_name}", _claude_prompt_visible, timeout, 0.5):
+        time.sleep(1)
+        return True
+    return False
+
+
+def _old_create_window(service: SessionService, window_name: str) -> None:
+    subprocess.run(["tmux", "new-window", "-d", "-t", "life", "-n", window_name, "-c", str(service.repo_root)], check=True)
+    time.sleep(0.2 if _poll(f"life:{window_name}", _shell_prompt_visible, 2, 0.2) else 0.5)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--delay", type=float, default=2.0, help="stub claude startup time (s)")
+    parser.add_argument("--spawns", type=int, default=8)
+    parser.add_argument("--concurrent", type=int, default=8)
+    parser.add_argument("--workers", type=int, default=2, help="spawn_async thread pool size")
+    args = parser.parse_args()
+
+    if shutil.which("tmux") is None:
+        sys.exit("tmux is not installed")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        start_tmux_server(Path(tmp), args.delay)
+        service_module.emit_event = lambda *a, **k: None
+        service = SessionService(db_path=make_db(Path(tmp) / "system.db"), repo_root=Path(tmp))
+        service._inject_prompt = lambda window_name, prompt: True
+
+        def spawn():
+            result = service.spawn("builder")
+            assert result.success, result.error
+
+        async def spawn_async():
+            result = await (await service.spawn_async("builder"))
+            assert result.success, result.error
+
+        try:
+            rows = {}
+            service._wait_for_claude = _old_wait_for_claude
+            service._create_window = lambda window_name: _old_create_window(service, window_name)
+            rows["polling (old)"] = measure(spawn, args.spawns, warmup=1)
+            del service._wait_for_claude, service._create_window
+            rows["events"] = measure(spawn, args.spawns, warmup=1)
+            rows["spawn_async"] = measure(lambda: asyncio.run(spawn_async()), args.spawns, warmup=1)
+
+            start = time.perf_counter()
+            with ThreadPoolExecutor(args.concurrent) as pool:
+                for future in [pool.submit(spawn) for _ in range(args.concurrent)]:
+                    future.result()
+            threaded_s = time.perf_counter() - start
+
+            async def concurrent():
+                asyncio.get_running_loop().set_default_executor(ThreadPoolExecutor(args.workers))
+                handles = [await service.spawn_async("builder") for _ in range(args.concurrent)]
+                for result in await asyncio.gather(*handles):
+                    assert result.success, result.error
+
+            start = time.perf_counter()
+            asyncio.run(concurrent())
+            async_s = time.perf_counter() - start
+        finally:
+            tmux.close_control_client()
+            subprocess.run(["tmux", "kill-server"], capture_output=True)
+
+    report(f"spawn() latency, stub claude ready after {args.delay:.1f} s", rows)
+    print(f"\n  {args.concurrent} concurrent spawns")
+    print(f"  {f'spawn(), {args.concurrent} threads':<36} {threaded_s:>8.2f} s")
+    print(f"  {f'spawn_async, {args.workers} worker threads':<36} {async_s:>8.2f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""
+Dashboard SSE reconnect: full reload vs Last-Event-ID replay.
+
+Before replay, a reconnecting Dashboard re-fetched /api/files/tree and
+/api/sessions/activity. With the EventBus replay log it only receives
+the events it missed. This builds a synthetic Desktop tree and sessions
+table, publishes N events during a simulated disconnect, and times both
+catch-up paths (including JSON serialization of the payload).
+
+    python .engine/tests/benchmarks/bench_sse_reconnect.py [--files 2000] [--missed 20]
+"""
+
+import argparse
+import asyncio
+import json
+import sqlite3
+import tempfile
+import uuid
+from pathlib import Path
+
+from _common import make_db, measure, report
+
+from core.database import ConnectionPool
+from core.events import EventBus
+from modules.finder.api import build_file_tree
+
+from bench_db_pool import ACTIVITY_SQL
+
+
+def build_desktop(root: Path, files: int, per_dir: int = 40) -> Path:
+    desktop = root / "Desktop"
+    for i in range(files):
+        folder = desktop / f"project-{i // per_dir:03d}" / ("notes" if i % 3 else "")
+        folder.mkdir(parents=True, exist_ok=True)
+        (folder / f"file-{i:05d}.md").write_text("# note\n")
+    return desktop
+
+
+def seed_sessions(db_path: Path, count: int) -> None:
+    conn = sqlite3.connect(db_path)
+    conn.executemany(
+        """INSERT INTO sessions (session_id, role, mode, started_at, last_seen_at,
+                                 created_at, updated_at)
+           VALUES (?, 'builder', 'interactive', datetime('now'), datetime('now'),
+                   datetime('now'), datetime('now'))""",
+        [(uuid.uuid4().hex[:8],) for _ in range(count)],
+    )
+    conn.commit()
+    conn.close()
+
+
+def full_reload(desktop: Path, pool: ConnectionPool) -> int:
+    tree = build_file_tree(desktop, depth=0, max_depth=4)
+    sessions = [dict(row) for row in pool.reader().execute(ACTIVITY_SQL).fetchall()]
+    return len(json.dumps({"tree": tree})) + len(json.dumps({"sessions": sessions}))
+
+
+def replay(bus: EventBus, last_event_id: str) -> int:
+    missed = bus.replay(last_event_id)
+    return sum(len(event.to_json()) for event in missed)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--files", type=int, default=2000)
+    parser.add_argument("--sessions", type=int, default=50)
+    parser.add_argument("--missed", type=int, default=20)
+    parser.add_argument("--iterations", type=int, default=50)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        desktop = build_desktop(root, args.files)
+        db_path = make_db(root / "bench.db")
+        seed_sessions(db_path, args.sessions)
+        pool = ConnectionPool(db_path)
+
+        bus = EventBus(replay_size=1000, spill=False)
+        queue = bus.subscribe()
+
+        async def disconnect_window():
+            await bus.publish("session.state", {"session_id": "seed", "state": "idle"})
+            last_id = queue.get_nowait().id
+            for i in range(args.missed):
+                await bus.publish("file.modified", {"path": f"Desktop/project-000/file-{i:05d}.md"})
+            return last_id
+
+        last_id = asyncio.run(disconnect_window())
+
+        full_bytes = full_reload(desktop, pool)
+        replay_bytes = replay(bus, last_id)
+        report(f"Reconnect catch-up ({args.files} files, {args.sessions} sessions, "
+               f"{args.missed} missed events)", {
+            f"full reload ({full_bytes:,} bytes)": measure(
+                lambda: full_reload(desktop, pool), args.iterations),
+            f"Last-Event-ID replay ({replay_bytes:,} bytes)": measure(
+                lambda: replay(bus, last_id), args.iterations),
+        })
+        pool.close()
+
+
+if __name__ == "__main__":
+    main()
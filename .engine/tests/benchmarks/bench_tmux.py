@@ -0,0 +1,110 @@
+"""
+tmux helpers: a tmux process per command vs one control-mode connection.
+
+Starts a private tmux server (temp TMUX_TMPDIR) with a "life" session: one
+target pane running cat plus --busy panes printing continuously, like
+Claude sessions redrawing. Times capture_pane, capture_pane_title,
+window_exists and inject_message (submit=False, so the 300 ms Enter delay
+is left out) with control mode off ("subprocess") and on ("control"),
+then measures throughput with several threads capturing at once and,
+for control mode, pipelined capture_pane_async calls from one loop.
+
+    python .engine/tests/benchmarks/bench_tmux.py [--iterations 200] [--busy 8] [--threads 8]
+"""
+
+import argparse
+import asyncio
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from _common import measure, report
+
+from core import tmux
+from core.config import settings
+
+TARGET = f"{tmux.TMUX_SESSION}:main"
+MESSAGE = "Summarize today's inbox and flag anything that needs a reply.\n" * 8
+
+
+def _use_control(enabled: bool) -> None:
+    tmux.close_control_client()
+    settings.tmux_control_mode = enabled
+    if enabled:
+        assert tmux.get_control_client() is not None, "control mode failed to attach"
+
+
+def _threaded(threads: int, per_thread: int) -> float:
+    """capture_pane calls per second with `threads` callers."""
+    def worker() -> None:
+        for _ in range(per_thread):
+            tmux.capture_pane(TARGET)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(threads) as pool:
+        for future in [pool.submit(worker) for _ in range(threads)]:
+            future.result()
+    return threads * per_thread / (time.perf_counter() - start)
+
+
+async def _pipelined(count: int) -> float:
+    start = time.perf_counter()
+    await asyncio.gather(*(tmux.capture_pane_async(TARGET) for _ in range(count)))
+    return count / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--busy", type=int, default=8, help="panes printing continuously")
+    parser.add_argument("--threads", type=int, default=8)
+    args = parser.parse_args()
+
+    if shutil.which("tmux") is None:
+        sys.exit("tmux is not installed")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        os.environ["TMUX_TMPDIR"] = tmp
+        os.environ.pop("TMUX", None)
+        subprocess.run(
+            ["tmux", "new-session", "-d", "-s", tmux.TMUX_SESSION, "-n", "main", "-x", "200", "-y", "50", "cat > /dev/null"],
+            check=True,
+        )
+        for i in range(args.busy):
+            subprocess.run(
+                ["tmux", "new-window", "-d", "-t", tmux.TMUX_SESSION, "-n", f"busy-{i}",
+                 "while :; do date; sleep 0.02; done"],
+                check=True,
+            )
+
+        try:
+            rows = {}
+            throughput = {}
+            for mode in ("subprocess", "control"):
+                _use_control(mode == "control")
+                rows[f"capture_pane ({mode})"] = measure(lambda: tmux.capture_pane(TARGET), args.iterations)
+                rows[f"capture_pane_title ({mode})"] = measure(lambda: tmux.capture_pane_title(TARGET), args.iterations)
+                rows[f"window_exists ({mode})"] = measure(lambda: tmux.window_exists("main"), args.iterations)
+                rows[f"inject_message ({mode})"] = measure(
+                    lambda: tmux.inject_message(TARGET, MESSAGE, submit=False), args.iterations
+                )
+                throughput[f"{args.threads} threads ({mode})"] = _threaded(args.threads, args.iterations // 4)
+            throughput["pipelined async (control)"] = asyncio.run(_pipelined(args.iterations))
+            commands = tmux.get_control_client().stats["commands"]
+        finally:
+            tmux.close_control_client()
+            subprocess.run(["tmux", "kill-server"], capture_output=True)
+
+    report(f"tmux helpers, {args.busy} busy panes", rows)
+    print("\n  capture_pane throughput")
+    for name, rate in throughput.items():
+        print(f"  {name:<36} {rate:>10.0f} /s")
+    print(f"\n  commands over the control connection: {commands:,}")
+
+
+if __name__ == "__main__":
+    main()
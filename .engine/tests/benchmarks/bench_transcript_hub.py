@@ -0,0 +1,109 @@
+"""
+Transcript fan-out: per-viewer 200ms polling vs the shared hub.
+
+Attaches N viewers to one transcript and appends lines at intervals,
+measuring append-to-delivery latency on every viewer and how many times
+each line was parsed. The old per-viewer TranscriptWatcher polled stat()
+every 200ms (mean ~100ms added latency) and parsed each line once per
+viewer; that baseline is reproduced here with a minimal polling loop.
+
+    python .engine/tests/benchmarks/bench_transcript_hub.py [--viewers 6] [--lines 40]
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+import _common  # noqa: F401  (sys.path setup)
+
+from modules.sessions.transcript import parse_transcript_line
+from modules.sessions.transcript_hub import TranscriptHub
+
+POLL_INTERVAL_S = 0.2
+
+
+def line(i: int) -> str:
+    return json.dumps({"type": "assistant", "uuid": f"u{i}", "timestamp": str(time.time()),
+                       "message": {"content": [{"type": "text", "text": "x" * 500}]}}) + "\n"
+
+
+async def polling_viewer(path: Path, count: int, latencies: list, parses: list):
+    position = path.stat().st_size
+    seen = 0
+    while seen < count:
+        if path.stat().st_size > position:
+            with open(path) as f:
+                f.seek(position)
+                content = f.read()
+                position = f.tell()
+            for raw in content.strip().split("\n"):
+                parses.append(1)
+                for event in parse_transcript_line(raw):
+                    latencies.append(time.time() - float(event.timestamp))
+                    seen += 1
+        await asyncio.sleep(POLL_INTERVAL_S)
+
+
+async def hub_viewer(hub: TranscriptHub, path: Path, count: int, latencies: list):
+    seen = 0
+    async for event in hub.stream(path):
+        if event["type"] == "connected":
+            continue
+        latencies.append(time.time() - float(event["timestamp"]))
+        seen += 1
+        if seen == count:
+            break
+
+
+async def append_lines(path: Path, count: int):
+    await asyncio.sleep(0.3)
+    for i in range(count):
+        with open(path, "a") as f:
+            f.write(line(i))
+        await asyncio.sleep(0.05)
+
+
+def summarize(name: str, latencies: list, parses: int):
+    latencies = sorted(ms * 1000 for ms in latencies)
+    print(f"  {name:<24} mean {statistics.fmean(latencies):7.1f} ms  "
+          f"p95 {latencies[int(len(latencies) * 0.95) - 1]:7.1f} ms  line parses {parses}")
+
+
+async def run(viewers: int, lines: int, root: Path):
+    path = root / "poll.jsonl"
+    path.write_text("")
+    latencies, parses = [], []
+    await asyncio.gather(
+        append_lines(path, lines),
+        *(polling_viewer(path, lines, latencies, parses) for _ in range(viewers)),
+    )
+    summarize("per-viewer polling", latencies, len(parses))
+
+    path = root / "hub.jsonl"
+    path.write_text("")
+    hub = TranscriptHub()
+    latencies = []
+    tasks = [asyncio.create_task(hub_viewer(hub, path, lines, latencies)) for _ in range(viewers)]
+    await asyncio.sleep(0.1)
+    reader = next(iter(hub._readers.values()))
+    await asyncio.gather(append_lines(path, lines), *tasks)
+    summarize("shared hub", latencies, reader.lines_parsed)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--viewers", type=int, default=6)
+    parser.add_argument("--lines", type=int, default=40)
+    args = parser.parse_args()
+
+    print(f"\n{args.viewers} viewers, {args.lines} appended lines")
+    with tempfile.TemporaryDirectory() as tmp:
+        asyncio.run(run(args.viewers, args.lines, Path(tmp)))
+
+
+if __name__ == "__main__":
+    main()
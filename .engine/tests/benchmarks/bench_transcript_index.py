@@ -0,0 +1,126 @@
+"""
+Transcript history and resume: full rescans vs the offset index.
+
+Builds a synthetic Claude Code transcript (user/assistant/tool turns with
+padding to reach the target size) and times:
+
+- history: the old two-pass get_all_events vs the indexed reader, both for
+  the whole file and for a 200-line tail window
+- append: re-reading after a few new lines land
+- resume: TranscriptWatcher's old byte-0 scan for after_uuid vs an index seek
+
+    python .engine/tests/benchmarks/bench_transcript_index.py [--mb 50]
+"""
+
+import argparse
+import json
+import tempfile
+from pathlib import Path
+
+from _common import measure, report
+
+from core.config import settings
+from modules.sessions.transcript import format_event_for_sse, get_all_events, parse_transcript_line
+from modules.sessions.transcript_index import get_transcript_index
+
+
+def write_transcript(path: Path, target_mb: int) -> str:
+    """Write turns until the file reaches target_mb. Returns a uuid near the end."""
+    pad = "x" * 1500
+    i = 0
+    with open(path, "w") as f:
+        while f.tell() < target_mb * 1024 * 1024:
+            f.write(json.dumps({"type": "user", "uuid": f"u{i}", "timestamp": "t",
+                                "message": {"content": f"question {i} {pad}"}}) + "\n")
+            f.write(json.dumps({"type": "assistant", "uuid": f"a{i}", "timestamp": "t",
+                                "message": {"model": "m", "content": [
+                                    {"type": "thinking", "thinking": pad},
+                                    {"type": "text", "text": f"answer {i}"},
+                                    {"type": "tool_use", "id": f"t{i}", "name": "Read",
+                                     "input": {"file_path": "/tmp/x"}},
+                                ]}}) + "\n")
+            f.write(json.dumps({"type": "user", "uuid": f"r{i}", "timestamp": "t",
+                                "message": {"content": [{"type": "tool_result",
+                                                         "tool_use_id": f"t{i}", "content": pad}]}}) + "\n")
+            i += 1
+    return f"a{i - 5}"
+
+
+def legacy_get_all_events(path: Path):
+    """The two-pass reader this change replaced."""
+    lines, user_content, dequeue_count = [], set(), 0
+    with open(path) as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            lines.append(line)
+            data = json.loads(line)
+            if data.get("type") == "user":
+                content = data.get("message", {}).get("content", "")
+                if isinstance(content, str):
+                    user_content.add(content[:2000])
+            elif data.get("type") == "queue-operation" and data.get("operation") in ("dequeue", "remove"):
+                dequeue_count += 1
+    events = []
+    for line in lines:
+        for event in parse_transcript_line(line):
+            formatted = format_event_for_sse(event)
+            if formatted:
+                events.append(formatted)
+    return events
+
+
+def legacy_resume_offset(path: Path, after_uuid: str) -> int:
+    with open(path) as f:
+        while True:
+            line = f.readline()
+            if not line:
+                return f.tell()
+            if json.loads(line).get("uuid") == after_uuid:
+                return f.tell()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--mb", type=int, default=50)
+    parser.add_argument("--iterations", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        settings.transcript_index_dir = Path(tmp) / "idx"
+        path = Path(tmp) / "chief.jsonl"
+        resume_uuid = write_transcript(path, args.mb)
+
+        cold = measure(lambda: get_transcript_index(path), 1, warmup=0)
+        index = get_transcript_index(path)
+        tail = max(0, index.line_count - 200)
+        print(f"{path.stat().st_size / 1e6:.0f} MB, {index.line_count} lines; "
+              f"first index build {cold['total_ms']:.0f} ms")
+
+        report("history (whole file)", {
+            "two-pass rescan": measure(lambda: legacy_get_all_events(path), args.iterations, warmup=1),
+            "indexed": measure(lambda: get_all_events(path), args.iterations, warmup=1),
+        })
+        report("history (last 200 lines)", {
+            "two-pass rescan": measure(lambda: legacy_get_all_events(path)[-200:], args.iterations, warmup=1),
+            "indexed window": measure(lambda: get_all_events(path, start_line=tail), args.iterations, warmup=1),
+        })
+
+        def append_and_read():
+            with open(path, "a") as f:
+                f.write(json.dumps({"type": "user", "uuid": "new", "timestamp": "t",
+                                    "message": {"content": "more"}}) + "\n")
+            return get_all_events(path, start_line=tail)
+
+        report("history after append (last 200 lines)", {
+            "indexed window": measure(append_and_read, args.iterations, warmup=1),
+        })
+        report(f"resume after_uuid={resume_uuid}", {
+            "scan from byte 0": measure(lambda: legacy_resume_offset(path, resume_uuid), args.iterations, warmup=1),
+            "index seek": measure(lambda: get_transcript_index(path).offset_after(resume_uuid), args.iterations),
+        })
+
+
+if __name__ == "__main__":
+    main()
@@ -25,6 +25,8 @@ REPO_ROOT = ENGINE_ROOT.parent
 
 sys.path.insert(0, str(SRC_DIR))
 
+from tests.helpers import MAIL_ACCOUNT
+
 
 @pytest.fixture(scope="session")
 def repo_root() -> Path:
@@ -160,6 +162,50 @@ def mock_tmux() -> MockTmux:
     return MockTmux()
 
 
+# Stand-in for the claude CLI: a banner, a startup delay, then the ❯ prompt
+STUB_CLAUDE = """#!/bin/sh
+echo "Claude Code (stub)"
+sleep "${STUB_CLAUDE_DELAY:-0.5}"
+printf '\\n\\342\\235\\257 '
+exec cat > /dev/null
+"""
+
+
+@pytest.fixture
+def tmux_server(tmp_path: Path, monkeypatch) -> Generator[str, None, None]:
+    """A throwaway tmux server with a "life" session; yields the "main" window target.
+
+    Windows run sh with a "$ " prompt, and `claude` on the server's PATH
+    is STUB_CLAUDE (STUB_CLAUDE_DELAY=0.5).
+    """
+    import shutil
+    import subprocess
+    from core import tmux
+
+    if shutil.which("tmux") is None:
+        pytest.skip("tmux not installed")
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    (bin_dir / "claude").write_text(STUB_CLAUDE)
+    (bin_dir / "claude").chmod(0o755)
+    monkeypatch.setenv("TMUX_TMPDIR", str(tmp_path))
+    monkeypatch.delenv("TMUX", raising=False)
+    monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ['PATH']}")
+    monkeypatch.setenv("SHELL", "/bin/sh")
+    monkeypatch.setenv("PS1", "$ ")
+    monkeypatch.setenv("STUB_CLAUDE_DELAY", "0.5")
+    subprocess.run(
+        ["tmux", "new-session", "-d", "-s", tmux.TMUX_SESSION, "-n", "main", "-x", "120", "-y", "30", "cat"],
+        check=True,
+    )
+    # Non-login shells, so /etc/profile can't reset PATH or PS1
+    subprocess.run(["tmux", "set-option", "-g", "default-command", "/bin/sh"], check=True)
+    tmux.close_control_client()
+    yield f"{tmux.TMUX_SESSION}:main"
+    tmux.close_control_client()
+    subprocess.run(["tmux", "kill-server"], capture_output=True)
+
+
 @pytest.fixture
 def app(test_db: Path):
     """FastAPI app configured for tests."""
@@ -179,3 +225,188 @@ def app(test_db: Path):
 def client(app):
     """FastAPI test client."""
     return TestClient(app)
+
+
+# === Mail.app Envelope Index ===
+
+
+class FakeEnvelopeIndex:
+    """Minimal Envelope-Index-shaped database for AppleMailAdapter tests.
+
+    Mailbox 1 is MAIL_ACCOUNT's INBOX, mailbox 2 its Archive.
+    """
+
+    SCHEMA = """
+        CREATE TABLE mailboxes (ROWID INTEGER PRIMARY KEY, url TEXT, total_count INTEGER, unread_count INTEGER);
+        CREATE TABLE subjects (ROWID INTEGER PRIMARY KEY, subject TEXT);
+        CREATE TABLE summaries (ROWID INTEGER PRIMARY KEY, summary TEXT);
+        CREATE TABLE addresses (ROWID INTEGER PRIMARY KEY, address TEXT, comment TEXT);
+        CREATE TABLE recipients (ROWID INTEGER PRIMARY KEY, message INTEGER, address INTEGER);
+        CREATE TABLE messages (
+            ROWID INTEGER PRIMARY KEY, message_id TEXT, document_id TEXT,
+            subject INTEGER, sender INTEGER, summary INTEGER, mailbox INTEGER,
+            date_sent INTEGER, date_received INTEGER, read INTEGER, flagged INTEGER,
+            deleted INTEGER, conversation_id INTEGER
+        );
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        conn = sqlite3.connect(path)
+        conn.executescript(self.SCHEMA)
+        conn.execute("INSERT INTO mailboxes VALUES (1, ?, 0, 0)", (f"imap://{MAIL_ACCOUNT}/INBOX",))
+        conn.execute("INSERT INTO mailboxes VALUES (2, ?, 0, 0)", (f"imap://{MAIL_ACCOUNT}/Archive",))
+        conn.commit()
+        conn.close()
+
+    def execute(self, sql: str, params=()) -> None:
+        conn = sqlite3.connect(self.path)
+        conn.execute(sql, params)
+        conn.commit()
+        conn.close()
+
+    def append(self, messages) -> None:
+        """Add messages given as (subject, address, summary, thread, mailbox) tuples."""
+        conn = sqlite3.connect(self.path)
+        start = conn.execute("SELECT COALESCE(MAX(ROWID), 0) FROM messages").fetchone()[0]
+        for i, (subject, address, summary, thread, mailbox) in enumerate(messages, start=start + 1):
+            conn.execute("INSERT INTO subjects VALUES (?, ?)", (i, subject))
+            conn.execute("INSERT INTO summaries VALUES (?, ?)", (i, summary))
+            conn.execute("INSERT INTO addresses VALUES (?, ?, NULL)", (i, address))
+            conn.execute(
+                "INSERT INTO messages VALUES (?, ?, NULL, ?, ?, ?, ?, ?, ?, 0, 0, 0, ?)",
+                (i, f"<{i}@test>", i, i, i, mailbox, 1_700_000_000 + i, 1_700_000_000 + i, thread),
+            )
+        conn.commit()
+        conn.close()
+
+
+@pytest.fixture
+def envelope_index(tmp_path: Path) -> FakeEnvelopeIndex:
+    """Empty fake Envelope Index in tmp_path."""
+    return FakeEnvelopeIndex(tmp_path / "Envelope Index")
+
+
+@pytest.fixture
+def apple_adapter(envelope_index: FakeEnvelopeIndex, tmp_path: Path, monkeypatch):
+    """AppleMailAdapter reading envelope_index, with system.db in tmp_path.
+
+    The account is addressable as "test".
+    """
+    from core.config import settings
+    from modules.email.providers import apple as apple_module
+
+    monkeypatch.setattr(apple_module, "IS_MACOS", True)
+    monkeypatch.setattr(settings, "db_path", tmp_path / "system.db")
+    monkeypatch.setattr(settings, "mail_body_cache_dir", tmp_path / "mail_body_cache")
+    adapter = apple_module.AppleMailAdapter()
+    adapter._db_path = str(envelope_index.path)
+    adapter._account_identifier_cache["test"] = MAIL_ACCOUNT
+    return adapter
+
+
+# === Messages chat.db ===
+
+CHAT_DB_SCHEMA = """
+    CREATE TABLE handle (ROWID INTEGER PRIMARY KEY AUTOINCREMENT, id TEXT NOT NULL, service TEXT);
+    CREATE TABLE chat (
+        ROWID INTEGER PRIMARY KEY AUTOINCREMENT, guid TEXT UNIQUE NOT NULL, chat_identifier TEXT,
+        display_name TEXT, service_name TEXT, is_archived INTEGER DEFAULT 0
+    );
+    CREATE TABLE message (
+        ROWID INTEGER PRIMARY KEY AUTOINCREMENT, guid TEXT UNIQUE NOT NULL, text TEXT,
+        attributedBody BLOB, handle_id INTEGER DEFAULT 0, service TEXT, date INTEGER,
+        is_from_me INTEGER DEFAULT 0, is_read INTEGER DEFAULT 0,
+        cache_has_attachments INTEGER DEFAULT 0, reply_to_guid TEXT
+    );
+    CREATE TABLE chat_handle_join (chat_id INTEGER, handle_id INTEGER, UNIQUE(chat_id, handle_id));
+    CREATE TABLE chat_message_join (
+        chat_id INTEGER, message_id INTEGER, message_date INTEGER DEFAULT 0,
+        PRIMARY KEY (chat_id, message_id)
+    );
+    CREATE INDEX chat_message_join_idx_message_id_only ON chat_message_join(message_id);
+    CREATE INDEX chat_message_join_idx_message_date_id_chat_id ON chat_message_join(chat_id, message_date, message_id);
+    CREATE INDEX message_idx_date ON message(date);
+"""
+
+
+def attributed_body(text: str) -> bytes:
+    """A typedstream NSAttributedString blob as Messages stores rich text."""
+    encoded = text.encode()
+    return (
+        b"\x04\x0bstreamtyped\x81\xe8\x03\x84\x01@\x84\x84\x84\x12NSAttributedString\x00"
+        b"\x84\x84\x08NSObject\x00\x85\x92\x84\x84\x84\x08NSString\x01\x94\x84\x01+"
+        + bytes([len(encoded)]) + encoded + b"\x86\x84\x02iI\x01" + bytes([len(encoded)]) + b"\x92\x84"
+    )
+
+
+class FakeChatDb:
+    """Minimal chat.db-shaped database for AppleMessagesAdapter tests.
+
+    Dates are seconds after the Apple epoch; stored as nanoseconds like chat.db.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        conn = sqlite3.connect(path)
+        conn.executescript(CHAT_DB_SCHEMA)
+        conn.close()
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.path)
+
+    def add_chat(self, guid: str, handles, display_name=None, archived: bool = False) -> int:
+        conn = self._connect()
+        chat_id = conn.execute(
+            "INSERT INTO chat (guid, chat_identifier, display_name, service_name, is_archived) "
+            "VALUES (?, ?, ?, 'iMessage', ?)",
+            (guid, handles[0] if len(handles) == 1 else guid, display_name, int(archived)),
+        ).lastrowid
+        for handle in handles:
+            row = conn.execute("SELECT ROWID FROM handle WHERE id = ?", (handle,)).fetchone()
+            handle_id = row[0] if row else conn.execute(
+                "INSERT INTO handle (id, service) VALUES (?, 'iMessage')", (handle,)
+            ).lastrowid
+            conn.execute("INSERT INTO chat_handle_join VALUES (?, ?)", (chat_id, handle_id))
+        conn.commit()
+        conn.close()
+        return chat_id
+
+    def add_message(self, chat_id: int, text: str, seconds: int, from_me: bool = False,
+                    read: bool = False, rich: bool = False) -> int:
+        """Add a message; rich=True stores the text only in attributedBody."""
+        date = seconds * 1_000_000_000
+        conn = self._connect()
+        rowid = conn.execute(
+            "INSERT INTO message (guid, text, attributedBody, service, date, is_from_me, is_read) "
+            "VALUES (lower(hex(randomblob(16))), ?, ?, 'iMessage', ?, ?, ?)",
+            (None if rich else text, attributed_body(text) if rich else None, date, int(from_me), int(read)),
+        ).lastrowid
+        conn.execute("INSERT INTO chat_message_join VALUES (?, ?, ?)", (chat_id, rowid, date))
+        conn.commit()
+        conn.close()
+        return rowid
+
+    def execute(self, sql: str, params=()) -> None:
+        conn = self._connect()
+        conn.execute(sql, params)
+        conn.commit()
+        conn.close()
+
+
+@pytest.fixture
+def chat_db(tmp_path: Path) -> FakeChatDb:
+    """Empty fake chat.db in tmp_path."""
+    return FakeChatDb(tmp_path / "chat.db")
+
+
+@pytest.fixture
+def messages_adapter(chat_db: FakeChatDb, tmp_path: Path, monkeypatch):
+    """AppleMessagesAdapter reading chat_db, with system.db in tmp_path."""
+    from core.config import settings
+    from modules.messages.providers.apple import AppleMessagesAdapter
+
+    monkeypatch.setattr(settings, "db_path", tmp_path / "system.db")
+    adapter = AppleMessagesAdapter()
+    adapter._db_path = str(chat_db.path)
+    return adapter
@@ -0,0 +1,9 @@
+"""
+Constants shared by conftest.py fixtures and the tests using them.
+
+conftest.py is loaded by pytest, not importable as a module, so values the
+tests need by name live here: `from tests.helpers import MAIL_ACCOUNT`.
+"""
+
+# Account UUID of the fake Envelope Index (conftest.FakeEnvelopeIndex)
+MAIL_ACCOUNT = "6F1C2B9E-0000-4000-8000-000000000001"
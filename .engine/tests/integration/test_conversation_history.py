@@ -0,0 +1,54 @@
+"""Integration tests for paginated conversation transcript history."""
+
+import json
+import sqlite3
+
+from core.config import settings
+
+
+def _seed_conversation(test_db, tmp_path, sessions=3, messages=4):
+    conn = sqlite3.connect(test_db)
+    for s in range(sessions):
+        path = tmp_path / f"s{s}.jsonl"
+        path.write_text("".join(
+            json.dumps({"type": "user", "uuid": f"s{s}-m{m}", "timestamp": "t",
+                        "message": {"content": f"message {m}"}}) + "\n"
+            for m in range(messages)
+        ))
+        conn.execute("""
+            INSERT INTO sessions (
+                session_id, role, mode, conversation_id, transcript_path,
+                started_at, last_seen_at, created_at
+            ) VALUES (?, 'chief', 'interactive', 'conv-1', ?,
+                      datetime('now', ?), datetime('now'), datetime('now'))
+        """, (f"sess-{s}", str(path), f"-{sessions - s} minutes"))
+    conn.commit()
+    conn.close()
+
+
+def test_history_pages_newest_first_across_sessions(client, test_db, tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "transcript_index_dir", tmp_path / "idx")
+    _seed_conversation(test_db, tmp_path)
+    url = "/api/sessions/conversation/conv-1/transcript/history"
+
+    # Full history: 3 sessions x 4 messages + 2 boundaries
+    everything = client.get(url, params={"hours": 0}).json()["events"]
+    assert len(everything) == 14
+
+    pages, cursor = [], None
+    while True:
+        params = {"limit": 5}
+        if cursor:
+            params["cursor"] = cursor
+        payload = client.get(url, params=params).json()
+        pages.append(payload["events"])
+        cursor = payload["next_cursor"]
+        if not payload["has_more"]:
+            break
+
+    assert [len(page) for page in pages] == [5, 5, 4]
+    # Newest page first; each page chronological; together they match the full history
+    assert [e["uuid"] for page in reversed(pages) for e in page] == [e["uuid"] for e in everything]
+    assert pages[0][-1]["uuid"] == "s2-m3"
+
+    assert client.get(url, params={"limit": 5, "cursor": "nope:1"}).status_code == 400
@@ -0,0 +1,54 @@
+"""Unit tests for AppleMailAdapter's pooled connection and memoized lookups."""
+
+import os
+import shutil
+
+from tests.helpers import MAIL_ACCOUNT
+
+
+def test_connection_and_mailbox_lookups_are_reused(envelope_index, apple_adapter):
+    envelope_index.append([("Hello", "a@x.com", "", 1, 1), ("Old", "b@x.com", "", 2, 2)])
+
+    for _ in range(3):
+        assert [m.id for m in apple_adapter.get_messages("INBOX", account="test")] == ["1"]
+    stats = apple_adapter.get_cache_stats()
+    assert stats["connection"] == {"hits": 2, "misses": 1}
+    assert stats["is_gmail"] == {"hits": 2, "misses": 1}
+    assert stats["mailboxes"] == {"hits": 2, "misses": 1}
+
+    # A new mailbox changes the Envelope Index mtime and is picked up
+    envelope_index.execute("INSERT INTO mailboxes VALUES (3, ?, 0, 0)", (f"imap://{MAIL_ACCOUNT}/Receipts",))
+    envelope_index.execute("UPDATE messages SET mailbox = 3 WHERE ROWID = 2")
+    assert [m.id for m in apple_adapter.get_messages("Receipts", account="test")] == ["2"]
+    stats = apple_adapter.get_cache_stats()
+    assert stats["invalidations"] >= 1
+    assert stats["connection"]["misses"] == 1
+
+
+def test_replaced_database_reconnects(envelope_index, apple_adapter, tmp_path):
+    envelope_index.append([("Hello", "a@x.com", "", 1, 1)])
+    assert len(apple_adapter.get_messages("INBOX", account="test")) == 1
+
+    # Mail.app rebuilding its index swaps in a new file (new inode)
+    rebuilt = tmp_path / "rebuilt"
+    shutil.copy(envelope_index.path, rebuilt)
+    os.replace(rebuilt, envelope_index.path)
+    envelope_index.append([("Again", "a@x.com", "", 2, 1)])
+
+    assert len(apple_adapter.get_messages("INBOX", account="test")) == 2
+    assert apple_adapter.get_cache_stats()["connection"]["misses"] == 2
+
+
+def test_storage_dir_resolution_is_memoized(envelope_index, apple_adapter, tmp_path, monkeypatch):
+    envelope_index.append([("Hello", "a@x.com", "", 1, 1)])
+    messages_dir = tmp_path / "Library" / "Mail" / "V10" / MAIL_ACCOUNT / "INBOX.mbox" / "GUID" / "Data" / "Messages"
+    messages_dir.mkdir(parents=True)
+    (messages_dir / "1.emlx").write_bytes(b"42\nContent-Type: text/plain\n\nHello from emlx\n")
+    monkeypatch.setenv("HOME", str(tmp_path))
+
+    for _ in range(2):
+        message = apple_adapter.get_message("1", "INBOX", account="test")
+        assert message.content.strip() == "Hello from emlx"
+    stats = apple_adapter.get_cache_stats()
+    assert stats["storage_dir"] == {"hits": 1, "misses": 1}
+    assert stats["version_dir"] == {"hits": 0, "misses": 1}
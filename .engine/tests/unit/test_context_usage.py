@@ -0,0 +1,167 @@
+"""Unit tests for transcript-derived context usage and the ContextMonitor."""
+
+import asyncio
+import json
+import sqlite3
+
+from core.config import settings
+from modules.sessions import context_usage
+from modules.sessions.context_usage import get_context_usage, update_context_usage
+from workers import context_monitor
+from workers.context_monitor import ContextMonitor
+
+
+def _turn(input_tokens, cache_read=0, output=100, **extra):
+    return json.dumps({"type": "assistant", **extra, "message": {
+        "model": "claude-sonnet-4-5",
+        "content": [{"type": "text", "text": "ok"}],
+        "usage": {"input_tokens": input_tokens, "cache_creation_input_tokens": 0,
+                  "cache_read_input_tokens": cache_read, "output_tokens": output},
+    }}) + "\n"
+
+
+def _user(text):
+    return json.dumps({"type": "user", "message": {"content": text}}) + "\n"
+
+
+def _compacted(post_tokens):
+    return json.dumps({"type": "system", "subtype": "compact_boundary",
+                       "compactMetadata": {"trigger": "auto", "postTokens": post_tokens}}) + "\n"
+
+
+def _too_long():
+    return json.dumps({"type": "assistant", "isApiErrorMessage": True, "message": {
+        "model": "<synthetic>", "content": [{"type": "text", "text": "Prompt is too long"}],
+        "usage": {"input_tokens": 0, "output_tokens": 0},
+    }}) + "\n"
+
+
+def _append(path, text):
+    with open(path, "a") as f:
+        f.write(text)
+
+
+def test_usage_follows_turns_compaction_and_overflow(tmp_path):
+    path = tmp_path / "t.jsonl"
+    path.write_text(_user("hi") + _turn(1_000, cache_read=50_000) + _user("more" * 500))
+    usage = get_context_usage(path)
+    assert (usage.tokens, usage.window, usage.percent_used) == (51_100, 200_000, 26)
+    assert usage.model == "claude-sonnet-4-5" and not usage.full
+
+    # Appended turns replace the total; subagent turns don't count
+    _append(path, _turn(2_000, cache_read=178_000) + _turn(5, cache_read=190_000, isSidechain=True))
+    assert get_context_usage(path).percent_used == 90
+
+    # A partial line is ignored until complete
+    line = _turn(1_000, cache_read=190_000)
+    _append(path, line[:40])
+    assert get_context_usage(path).tokens == 180_100
+    _append(path, line[40:])
+    assert get_context_usage(path).tokens == 191_100
+
+    _append(path, _compacted(12_000))
+    assert get_context_usage(path).percent_used == 6
+
+    _append(path, _too_long())
+    usage = get_context_usage(path)
+    assert usage.full and usage.tokens == 12_000
+
+    # The next successful turn clears it
+    _append(path, _turn(14_000))
+    assert not get_context_usage(path).full
+
+
+def test_hub_lines_advance_cached_state(tmp_path):
+    path = tmp_path / "t.jsonl"
+    path.write_text(_turn(10_000))
+    assert get_context_usage(path).tokens == 10_100
+
+    start = path.stat().st_size
+    _append(path, _turn(300_000))
+    update_context_usage(path, [_turn(300_000).rstrip("\n")], start, path.stat().st_size)
+    state = context_usage._usage_states[str(path)]
+    assert state.offset == path.stat().st_size
+    # Past the standard window, so this session has the long-context window
+    usage = get_context_usage(path)
+    assert (usage.tokens, usage.window, usage.percent_used) == (300_100, 1_000_000, 30)
+
+
+
+def test_read_in_progress_blocks_neither_other_paths_nor_hub(tmp_path):
+    busy, other = tmp_path / "busy.jsonl", tmp_path / "other.jsonl"
+    busy.write_text(_turn(10_000))
+    other.write_text(_turn(20_000))
+    assert get_context_usage(busy).tokens == 10_100
+
+    # Simulate a slow read of `busy` holding its lock
+    with context_usage._path_lock(str(busy)):
+        assert get_context_usage(other).tokens == 20_100
+        start = busy.stat().st_size
+        _append(busy, _turn(50_000))
+        # The hub skips rather than waiting; the next read catches up from the file
+        update_context_usage(busy, [_turn(50_000).rstrip("\n")], start, busy.stat().st_size)
+        assert context_usage._usage_states[str(busy)].offset == start
+    assert get_context_usage(busy).tokens == 50_100
+
+
+def _insert_session(db, session_id, pane, transcript_path, warned=0):
+    conn = sqlite3.connect(db)
+    conn.execute("""
+        INSERT INTO sessions (
+            session_id, role, mode, started_at, last_seen_at, tmux_pane, transcript_path, context_warning_level
+        ) VALUES (?, 'builder', 'interactive', datetime('now'), datetime('now'), ?, ?, ?)
+    """, (session_id, pane, str(transcript_path) if transcript_path else None, warned))
+    conn.commit()
+    conn.close()
+
+
+def test_monitor_checks_transcripts_without_scraping(test_db, tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "handoff_digest_dir", tmp_path / "digests")
+    busy = tmp_path / "busy.jsonl"
+    busy.write_text(_turn(2_000, cache_read=178_000))
+    calm = tmp_path / "calm.jsonl"
+    calm.write_text(_turn(2_000))
+    stuck = tmp_path / "stuck.jsonl"
+    stuck.write_text(_turn(2_000, cache_read=198_000) + _too_long())
+    _insert_session(test_db, "busy-1", "%1", busy)
+    _insert_session(test_db, "calm-1", "%2", calm)
+    _insert_session(test_db, "stuck-1", "%3", stuck)
+    _insert_session(test_db, "warned-1", "%4", busy, warned=90)
+    _insert_session(test_db, "noscript", "%5", None)
+
+    scraped, warned, reset = [], [], []
+    monkeypatch.setattr(context_monitor, "get_session_claude_status", lambda pane: scraped.append(pane))
+    monitor = ContextMonitor(test_db)
+
+    async def send_warning(storage, session_id, tmux_pane, percent, is_autonomous):
+        warned.append((session_id, percent))
+
+    async def emergency_reset(storage, session_id, *args):
+        reset.append(session_id)
+
+    monkeypatch.setattr(monitor, "send_warning", send_warning)
+    monkeypatch.setattr(monitor, "emergency_reset", emergency_reset)
+
+    asyncio.run(monitor.check_all_sessions())
+    assert warned == [("busy-1", 90)]
+    assert reset == ["stuck-1"]
+    # Only the session without a transcript was scraped
+    assert scraped == ["%5"]
+
+    # A lower configured threshold warns earlier
+    monkeypatch.setattr(context_monitor, "WARNING_THRESHOLD", 50)
+    warned.clear()
+    _append(calm, _turn(2_000, cache_read=110_000))
+    asyncio.run(monitor.check_all_sessions())
+    assert ("calm-1", 56) in warned and ("busy-1", 90) in warned
+
+    # Once a session ends, the next tick forgets its transcript
+    conn = sqlite3.connect(test_db)
+    conn.execute("UPDATE sessions SET ended_at = datetime('now') WHERE session_id = 'stuck-1'")
+    conn.commit()
+    conn.close()
+    assert str(stuck) in context_usage._usage_states
+    asyncio.run(monitor.check_all_sessions())
+    assert str(stuck) not in context_usage._usage_states
+    assert str(stuck) not in context_usage._path_locks
+    assert str(calm) in context_usage._usage_states
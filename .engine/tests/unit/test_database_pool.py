@@ -0,0 +1,67 @@
+"""Unit tests for the pooled SQLite connection manager."""
+
+from core.database import ConnectionPool
+from core.storage import SystemStorage
+
+
+def test_connection_is_reused_and_rolled_back(test_db):
+    pool = ConnectionPool(test_db)
+
+    with pool.connection() as conn:
+        first = conn
+        conn.execute("INSERT INTO settings (key, value, updated_at) VALUES ('pool_test', 'x', '')")
+        # No commit: check-in must discard the write
+
+    with pool.connection() as conn:
+        assert conn is first
+        row = conn.execute("SELECT value FROM settings WHERE key = 'pool_test'").fetchone()
+        assert row is None
+
+    assert pool.stats["opened"] == 1
+    pool.close()
+
+
+def test_system_storage_routes_reads_and_writes(test_db):
+    storage = SystemStorage(test_db)
+
+    storage.execute("INSERT INTO settings (key, value, updated_at) VALUES ('routed', 'yes', '')")
+    row = storage.fetchone("SELECT value FROM settings WHERE key = ?", ("routed",))
+    assert row["value"] == "yes"
+
+    with storage.transaction() as cursor:
+        cursor.execute("UPDATE settings SET value = 'no' WHERE key = 'routed'")
+        # Reads inside a transaction see its uncommitted writes
+        assert storage.fetchone("SELECT value FROM settings WHERE key = 'routed'")["value"] == "no"
+
+    assert storage.fetchone("SELECT value FROM settings WHERE key = 'routed'")["value"] == "no"
+
+
+def test_owns_writer_tracks_plain_writer_blocks(test_db):
+    pool = ConnectionPool(test_db)
+
+    assert not pool.owns_writer()
+    with pool.writer():
+        assert pool.owns_writer()
+        with pool.write_transaction():
+            assert pool.owns_writer()
+        assert pool.owns_writer()
+    assert not pool.owns_writer()
+    pool.close()
+
+
+def test_close_stops_idle_async_connections(test_db):
+    import asyncio
+
+    pool = ConnectionPool(test_db)
+
+    async def checkout():
+        async with pool.async_connection() as conn:
+            await conn.execute("SELECT 1")
+            return conn
+
+    conn = asyncio.run(checkout())
+    assert conn._thread.is_alive()
+
+    pool.close()
+    conn._thread.join(timeout=2)
+    assert not conn._thread.is_alive()
@@ -0,0 +1,98 @@
+"""Unit tests for EmailPipeline's cursor-based new-mail discovery."""
+
+import sqlite3
+
+import pytest
+
+from tests.helpers import MAIL_ACCOUNT
+
+
+@pytest.fixture
+def pipeline(test_db, envelope_index, monkeypatch):
+    from core.config import settings
+    from modules.email import service as service_module
+    from modules.email.pipeline import EmailPipeline
+    from modules.email.providers import apple as apple_module
+
+    monkeypatch.setattr(service_module, "IS_MACOS", True)
+    monkeypatch.setattr(apple_module, "IS_MACOS", True)
+    monkeypatch.setattr(apple_module, "_find_mail_db", lambda: str(envelope_index.path))
+    monkeypatch.setattr(settings, "db_path", test_db)
+
+    conn = sqlite3.connect(test_db)
+    conn.execute(
+        """INSERT INTO accounts (id, email, account_type, discovered_via, apple_account_guid)
+           VALUES ('acct-1', 'me@example.com', 'imap', 'mail_app', ?)""",
+        (MAIL_ACCOUNT,),
+    )
+    conn.commit()
+    conn.close()
+    return EmailPipeline(str(test_db))
+
+
+def _tracked(db_path):
+    conn = sqlite3.connect(db_path)
+    try:
+        rows = conn.execute(
+            "SELECT email_message_id FROM email_metadata ORDER BY CAST(email_message_id AS INTEGER)"
+        )
+        return [row[0] for row in rows]
+    finally:
+        conn.close()
+
+
+def _cursor(db_path):
+    conn = sqlite3.connect(db_path)
+    try:
+        return conn.execute(
+            "SELECT since_ts, since_rowid FROM email_discovery_cursor WHERE account_id = 'acct-1'"
+        ).fetchone()
+    finally:
+        conn.close()
+
+
+def test_bootstrap_then_burst_is_fully_discovered(pipeline, envelope_index, test_db):
+    envelope_index.append([(f"Old {i}", "a@x.com", "", i, 1) for i in range(60)])
+
+    # First poll takes the newest 50 and anchors the cursor at the newest message
+    pipeline._discover_new_emails_sync()
+    assert len(_tracked(test_db)) == 50
+    assert _cursor(test_db) == (1_700_000_060, 60)
+
+    # A burst bigger than both the old fetch size and one page
+    burst = pipeline.DISCOVERY_PAGE_SIZE + 150
+    envelope_index.append([(f"New {i}", "b@x.com", "", i, 1) for i in range(burst)])
+    envelope_index.append([("Archived", "c@x.com", "", 0, 2)])
+    pipeline._discover_new_emails_sync()
+
+    tracked = _tracked(test_db)
+    assert len(tracked) == 50 + burst
+    assert tracked[-1] == str(60 + burst)
+    assert _cursor(test_db) == (1_700_000_060 + burst, 60 + burst)
+
+    # Nothing new: no rows, cursor unchanged
+    pipeline._discover_new_emails_sync()
+    assert len(_tracked(test_db)) == 50 + burst
+
+
+def test_already_tracked_messages_are_not_duplicated(pipeline, envelope_index, test_db):
+    envelope_index.append([("First", "a@x.com", "", 1, 1)])
+    pipeline._discover_new_emails_sync()
+    envelope_index.append([("Second", "a@x.com", "", 2, 1), ("Third", "a@x.com", "", 3, 1)])
+
+    # Another account already tracks message 2
+    conn = sqlite3.connect(test_db)
+    conn.execute(
+        """INSERT INTO email_metadata (email_message_id, account_id, first_seen_at, last_updated_at)
+           VALUES ('2', 'acct-other', 'x', 'x')"""
+    )
+    conn.commit()
+    conn.close()
+
+    pipeline._discover_new_emails_sync()
+    conn = sqlite3.connect(test_db)
+    rows = conn.execute(
+        "SELECT email_message_id, account_id FROM email_metadata ORDER BY email_message_id"
+    ).fetchall()
+    conn.close()
+    assert rows == [("1", "acct-1"), ("2", "acct-other"), ("3", "acct-1")]
@@ -0,0 +1,274 @@
+"""Unit tests for the classification queue, workers and adaptive concurrency."""
+
+import asyncio
+import sqlite3
+
+import pytest
+
+from modules.email.concurrency import AdaptiveLimiter
+from modules.email.rules import bump_rules_version
+from tests.helpers import MAIL_ACCOUNT
+
+
+def test_limiter_ramps_up_and_backs_off():
+    async def scenario():
+        limiter = AdaptiveLimiter(1, 6, 2)
+        seen = []
+
+        async def window(latency_ms=1000, failures=0):
+            for i in range(AdaptiveLimiter.WINDOW):
+                await limiter.record(latency_ms, i < failures)
+
+        for _ in range(3):
+            await window()
+        seen.append(limiter.limit)  # healthy windows: 2 -> 5
+        await window(latency_ms=2000)
+        seen.append(limiter.limit)  # slower than 1.5x the best window: one fewer
+
+        await limiter.record(1000, True)
+        seen.append(limiter.limit)  # a failure backs off at once; 3 is the new ceiling
+        for _ in range(AdaptiveLimiter.WINDOW - 1):
+            await limiter.record(1000, False)
+        await window()
+        seen.append(limiter.limit)  # healthy, but held at the ceiling
+        for _ in range(AdaptiveLimiter.PROBE_AFTER - 1):
+            await window()
+        seen.append(limiter.limit)  # probes above it after PROBE_AFTER windows
+
+        await window(failures=4)
+        seen.append(limiter.limit)  # mostly failing: one fewer, then halved
+        return seen
+
+    assert asyncio.run(scenario()) == [5, 4, 3, 3, 4, 1]
+
+
+def test_limiter_caps_concurrent_holders():
+    async def scenario():
+        limiter = AdaptiveLimiter(1, 4, 2)
+        peak = 0
+
+        async def job():
+            nonlocal peak
+            await limiter.acquire()
+            peak = max(peak, limiter.active)
+            await asyncio.sleep(0.01)
+            await limiter.release()
+
+        await asyncio.gather(*(job() for _ in range(8)))
+        return peak, limiter.active
+
+    assert asyncio.run(scenario()) == (2, 0)
+
+
+@pytest.fixture
+def pipeline(test_db):
+    from modules.email.pipeline import EmailPipeline
+    return EmailPipeline(str(test_db), poll_interval=3600)
+
+
+def _queue(db_path, rows):
+    conn = sqlite3.connect(db_path)
+    conn.executemany(
+        """INSERT INTO email_metadata
+           (email_message_id, account_id, first_seen_at, last_updated_at, classify_priority)
+           VALUES (?, 'acct-1', ?, ?, ?)""",
+        [(msg_id, seen, seen, priority) for msg_id, seen, priority in rows],
+    )
+    conn.commit()
+    conn.close()
+
+
+def test_workers_drain_queue_by_priority(pipeline, test_db, monkeypatch):
+    _queue(test_db, [
+        ("old-normal", "2026-01-01", 2),
+        ("new-normal", "2026-01-02", 2),
+        ("reply", "2026-01-01", 1),
+        ("vip", "2026-01-01", 0),
+    ])
+    order = []
+
+    async def fake_classify(msg_id, acct_id):
+        order.append(msg_id)
+        conn = sqlite3.connect(test_db)
+        conn.execute("UPDATE email_metadata SET classified = 1 WHERE email_message_id = ?", (msg_id,))
+        conn.commit()
+        conn.close()
+        await asyncio.sleep(0)
+
+    monkeypatch.setattr(pipeline, "_classify_one", fake_classify)
+    monkeypatch.setattr(pipeline, "_discover_new_emails", lambda: asyncio.sleep(0))
+    monkeypatch.setattr(pipeline, "_ensure_initialized", lambda: asyncio.sleep(0))
+    pipeline._limiter = AdaptiveLimiter(1, 1, 1)
+
+    async def scenario():
+        stop = asyncio.Event()
+        task = asyncio.create_task(pipeline.start(stop))
+        for _ in range(200):
+            if len(order) == 4:
+                break
+            await asyncio.sleep(0.01)
+        stop.set()
+        await task
+
+    asyncio.run(scenario())
+    assert order == ["vip", "reply", "new-normal", "old-normal"]
+
+
+def test_claim_skips_in_flight_and_gives_up_after_max_attempts(pipeline, test_db):
+    _queue(test_db, [("first", "2026-01-02", 2), ("second", "2026-01-01", 2)])
+
+    assert pipeline._claim_next() == [("first", "acct-1")]
+    assert pipeline._claim_next() == [("second", "acct-1")]
+    assert pipeline._claim_next() == []
+
+    # Neither got marked classified: each is retried MAX_ATTEMPTS times in all
+    claims = []
+    pipeline._in_flight.clear()
+    while items := pipeline._claim_next():
+        claims.append(items[0][0])
+        pipeline._in_flight.clear()
+    assert claims.count("first") == claims.count("second") == pipeline.MAX_ATTEMPTS - 1
+
+
+def test_discovery_sets_priority_and_settles_noise(test_db, envelope_index, monkeypatch):
+    from core.config import settings
+    from modules.email import service as service_module
+    from modules.email.pipeline import EmailPipeline
+    from modules.email.providers import apple as apple_module
+
+    monkeypatch.setattr(service_module, "IS_MACOS", True)
+    monkeypatch.setattr(apple_module, "IS_MACOS", True)
+    monkeypatch.setattr(apple_module, "_find_mail_db", lambda: str(envelope_index.path))
+    monkeypatch.setattr(settings, "db_path", test_db)
+
+    conn = sqlite3.connect(test_db)
+    conn.execute(
+        """INSERT INTO accounts (id, email, account_type, discovered_via, apple_account_guid)
+           VALUES ('acct-1', 'me@example.com', 'imap', 'mail_app', ?)""",
+        (MAIL_ACCOUNT,),
+    )
+    conn.execute(
+        """INSERT INTO contacts (id, name, email, source, pinned, created_at, updated_at)
+           VALUES ('c1', 'Boss', 'Boss@Work.com', 'manual', 1, 'x', 'x')"""
+    )
+    conn.execute(
+        """INSERT INTO email_sender_rules
+           (id, match_type, match_value, rule_type, category, created_at, updated_at)
+           VALUES ('r1', 'domain', 'deals.com', 'always', 'noise', 'x', 'x')"""
+    )
+    bump_rules_version(conn)
+    conn.commit()
+    conn.close()
+
+    pipeline = EmailPipeline(str(test_db))
+    envelope_index.append([
+        ("Hello", "friend@x.com", "", 1, 1),
+        ("Re: plans", "friend@x.com", "", 2, 1),
+        ("Quarterly review", "boss@work.com", "", 3, 1),
+        ("50% off", "promo@mail.deals.com", "", 4, 1),
+    ])
+    pipeline._discover_new_emails_sync()
+
+    conn = sqlite3.connect(test_db)
+    rows = conn.execute(
+        "SELECT email_message_id, classify_priority, classified FROM email_metadata ORDER BY email_message_id"
+    ).fetchall()
+    category = conn.execute("SELECT category, rule_id FROM email_classifications").fetchall()
+    conn.close()
+    assert rows == [("1", 2, 0), ("2", 1, 0), ("3", 0, 0), ("4", 3, 1)]
+    assert category == [("noise", "r1")]
+
+
+def test_classify_batch_tool_stores_valid_items(test_db, monkeypatch):
+    from core.config import settings
+    from modules.email import mcp as email_mcp
+
+    monkeypatch.setattr(settings, "db_path", test_db)
+    events = []
+    monkeypatch.setattr(email_mcp, "notify_backend_event", lambda name, data: events.append((name, data)))
+    _queue(test_db, [("a", "2026-01-01", 3), ("b", "2026-01-01", 3), ("c", "2026-01-01", 3)])
+
+    result = email_mcp._email_classify_batch([
+        {"message_id": "a", "account": "acct-1", "category": "fyi", "summary": "Weekly digest"},
+        {"message_id": "b", "account": "acct-1", "category": "spam"},
+        {"message_id": "c", "account": "acct-1"},
+    ])
+
+    assert result["stored"] == 1
+    assert [e["message_id"] for e in result["errors"]] == ["b", "c"]
+    conn = sqlite3.connect(test_db)
+    classified = conn.execute("SELECT email_message_id FROM email_metadata WHERE classified = 1").fetchall()
+    conn.close()
+    assert classified == [("a",)]
+    assert events == [("email.classified", {"batch": [{"message_id": "a", "category": "fyi"}]})]
+
+
+def test_batch_requeues_emails_the_agent_left_out(pipeline, test_db):
+    from types import SimpleNamespace
+
+    _queue(test_db, [("n1", "2026-01-01", 3), ("n2", "2026-01-01", 3)])
+    pipeline._service = SimpleNamespace(get_message=lambda msg_id, mailbox, account: SimpleNamespace(
+        id=msg_id, sender="news@substack.com", subject="Issue", content="Body", html_content=None,
+        snippet="Body", date_received="2026-01-01T00:00:00",
+    ))
+    prompts = []
+
+    async def fake_agent(prompt):
+        prompts.append(prompt)
+        conn = sqlite3.connect(test_db)
+        conn.execute(
+            """INSERT INTO email_classifications (id, email_message_id, account_id, category, classified_at)
+               VALUES ('x', 'n1', 'acct-1', 'fyi', 'x')"""
+        )
+        conn.execute("UPDATE email_metadata SET classified = 1 WHERE email_message_id = 'n1'")
+        conn.commit()
+        conn.close()
+
+    pipeline._run_agent = fake_agent
+    asyncio.run(pipeline._classify_batch([("n1", "acct-1"), ("n2", "acct-1")]))
+
+    assert len(prompts) == 1 and "message_id=n2 account=acct-1" in prompts[0]
+    conn = sqlite3.connect(test_db)
+    rows = conn.execute(
+        "SELECT email_message_id, classified, classify_priority FROM email_metadata ORDER BY email_message_id"
+    ).fetchall()
+    sender = conn.execute("SELECT sender FROM email_classifications WHERE email_message_id = 'n1'").fetchone()
+    conn.close()
+    assert rows == [("n1", 1, 3), ("n2", 0, 2)]
+    assert sender == ("news@substack.com",)
+
+
+def test_settle_forgets_classified_emails(pipeline, test_db):
+    _queue(test_db, [("done", "2026-01-02", 2), ("stuck", "2026-01-01", 2)])
+    claimed = pipeline._claim_next() + pipeline._claim_next()
+    assert claimed == [("done", "acct-1"), ("stuck", "acct-1")]
+
+    conn = sqlite3.connect(test_db)
+    conn.execute("UPDATE email_metadata SET classified = 1 WHERE email_message_id = 'done'")
+    conn.commit()
+    conn.close()
+
+    pipeline._settle(claimed)
+    assert not pipeline._in_flight
+    assert dict(pipeline._attempts) == {("stuck", "acct-1"): 1}
+
+
+def test_newsletters_are_tracked_per_sender_not_domain(pipeline, test_db):
+    conn = sqlite3.connect(test_db)
+    rows = [("Weekly <weekly@gmail.com>", "noise")] * 3 + [("Friend <friend@gmail.com>", "action_needed")]
+    conn.executemany(
+        "INSERT INTO email_classifications (id, email_message_id, account_id, category, sender, classified_at) "
+        "VALUES (?, ?, 'acct-1', ?, ?, '2026-01-01')",
+        [(f"c{i}", f"m{i}", category, sender) for i, (sender, category) in enumerate(rows)],
+    )
+    conn.commit()
+    conn.row_factory = sqlite3.Row
+    newsletters = pipeline._newsletter_senders(conn)
+    conn.close()
+
+    assert newsletters == {"weekly@gmail.com"}
+    assert pipeline._is_low_signal("weekly@gmail.com", newsletters)
+    assert not pipeline._is_low_signal("someone@gmail.com", newsletters)
+    # Human-style role addresses are not treated as bulk
+    assert not pipeline._is_low_signal("hello@smallshop.com", newsletters)
+    assert pipeline._is_low_signal("no-reply@smallshop.com", newsletters)
@@ -0,0 +1,61 @@
+"""Unit tests for the write-behind event log."""
+
+import sqlite3
+
+from core import event_log
+
+
+def test_get_events_reads_through_unflushed_buffer(test_db):
+    event_id = event_log.emit_event("marker", "created", actor="test", data={"n": 1}, db_path=test_db)
+
+    events = event_log.get_events(event_type="marker", db_path=test_db, date=_today())
+    assert [e["id"] for e in events] == [event_id]
+    assert events[0]["data"] == {"n": 1}
+
+    event_log.flush()
+    conn = sqlite3.connect(test_db)
+    count = conn.execute("SELECT COUNT(*) FROM events WHERE id = ?", (event_id,)).fetchone()[0]
+    conn.close()
+    assert count == 1
+
+    # Same event is not duplicated once it's on disk
+    events = event_log.get_events(event_type="marker", db_path=test_db, date=_today())
+    assert len(events) == 1
+
+
+def test_flush_writes_batch_in_one_call(test_db):
+    ids = [event_log.emit_event("session", "ended", actor=f"s{i}", db_path=test_db) for i in range(25)]
+
+    assert event_log.flush() >= 25
+    conn = sqlite3.connect(test_db)
+    stored = {row[0] for row in conn.execute("SELECT id FROM events")}
+    conn.close()
+    assert set(ids) <= stored
+
+
+def test_colliding_id_is_logged_and_the_rest_written(test_db, caplog):
+    conn = sqlite3.connect(test_db)
+    conn.execute(
+        "INSERT INTO events (id, timestamp, event_type, event_action, date) "
+        "VALUES ('dupe0001', '2026-01-01T00:00:00', 'marker', 'created', '2026-01-01')"
+    )
+    conn.commit()
+    conn.close()
+
+    rows = [
+        ("dupe0001", "2026-01-02T00:00:00", "session", "started", None, None, "2026-01-02"),
+        ("fresh001", "2026-01-02T00:00:01", "session", "ended", None, None, "2026-01-02"),
+    ]
+    with caplog.at_level("ERROR", logger=event_log.logger.name):
+        assert event_log._WriteBehindLog._write(test_db, rows) == 1
+    assert "dupe0001" in caplog.text
+
+    conn = sqlite3.connect(test_db)
+    stored = dict(conn.execute("SELECT id, event_type FROM events WHERE id IN ('dupe0001', 'fresh001')"))
+    conn.close()
+    assert stored == {"dupe0001": "marker", "fresh001": "session"}
+
+
+def _today() -> str:
+    from datetime import datetime
+    return datetime.now(event_log.PACIFIC).strftime("%Y-%m-%d")
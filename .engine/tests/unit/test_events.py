@@ -0,0 +1,143 @@
+"""Unit tests for EventBus topic routing and overflow policies."""
+
+import asyncio
+import sqlite3
+import threading
+
+from core.events import DISCONNECTED_EVENT, EventBus
+
+
+def test_patterns_route_only_matching_events():
+    async def scenario():
+        bus = EventBus()
+        files = bus.subscribe(patterns=["file.*"])
+        created = bus.subscribe(patterns=["*.created"])
+        everything = bus.subscribe()
+
+        await bus.publish("file.created", {"path": "a"})
+        await bus.publish("priority.created", {"id": "p"})
+        await bus.publish("session.ended", {"session_id": "s"})
+
+        return files.qsize(), created.qsize(), everything.qsize()
+
+    assert asyncio.run(scenario()) == (1, 2, 3)
+
+
+def test_coalesce_only_under_overflow_and_keeps_order():
+    async def scenario():
+        bus = EventBus()
+        queue = bus.subscribe(patterns=["session.state"], policy="coalesce", maxsize=3)
+        for state in ("busy", "idle"):
+            await bus.publish("session.state", {"session_id": "s1", "state": state})
+        await bus.publish("session.state", {"session_id": "s2", "state": "idle"})
+        # Queue is full now: the stale s1 entry goes, the new one lands last
+        await bus.publish("session.state", {"session_id": "s1", "state": "done"})
+        return [queue.get_nowait().data for _ in range(queue.qsize())], queue.coalesced
+
+    events, coalesced = asyncio.run(scenario())
+    assert events == [
+        {"session_id": "s1", "state": "idle"},
+        {"session_id": "s2", "state": "idle"},
+        {"session_id": "s1", "state": "done"},
+    ]
+    assert coalesced == 1
+
+
+def test_overflow_policies_count_drops():
+    async def scenario():
+        bus = EventBus()
+        oldest = bus.subscribe(maxsize=2)
+        strict = bus.subscribe(maxsize=2, policy="disconnect")
+        for i in range(3):
+            await bus.publish("marker.created", {"i": i})
+        return oldest, strict, bus.subscriber_count
+
+    oldest, strict, remaining = asyncio.run(scenario())
+    assert [oldest.get_nowait().data["i"] for _ in range(2)] == [1, 2]
+    assert oldest.dropped == 1
+    assert strict.closed and strict.get_nowait().event_type == DISCONNECTED_EVENT
+    assert remaining == 1
+
+
+def test_replay_returns_only_missed_matching_events():
+    async def scenario():
+        bus = EventBus(replay_size=10, spill=False)
+        queue = bus.subscribe()
+        await bus.publish("file.created", {"path": "a"})
+        last_id = queue.get_nowait().id
+        await bus.publish("session.ended", {"session_id": "s"})
+        await bus.publish("file.modified", {"path": "a"})
+        return bus, last_id
+
+    bus, last_id = asyncio.run(scenario())
+    assert [e.event_type for e in bus.replay(last_id)] == ["session.ended", "file.modified"]
+    assert [e.event_type for e in bus.replay(last_id, ["file.*"])] == ["file.modified"]
+    assert bus.replay(None) == []
+
+
+def test_replay_reports_gap_when_history_is_gone():
+    async def scenario():
+        bus = EventBus(replay_size=2, spill=False)
+        queue = bus.subscribe(maxsize=10)
+        for i in range(5):
+            await bus.publish("marker.created", {"i": i})
+        return bus, queue.get_nowait().id
+
+    bus, first_id = asyncio.run(scenario())
+    assert bus.replay(first_id) is None
+    assert bus.replay("from-another-process-3") is None
+
+
+def test_replay_reads_spilled_events(test_db, monkeypatch):
+    from core import config, events
+
+    monkeypatch.setattr(config.settings, "db_path", test_db)
+    monkeypatch.setattr(events._ReplayLog, "SPILL_BATCH_SIZE", 2)
+    flush_threads = []
+    flush = events._ReplayLog.flush
+
+    def recording_flush(self):
+        flush_threads.append(threading.current_thread())
+        flush(self)
+
+    monkeypatch.setattr(events._ReplayLog, "flush", recording_flush)
+
+    async def scenario():
+        bus = EventBus(replay_size=2, spill=True)
+        queue = bus.subscribe(maxsize=10)
+        for i in range(5):
+            await bus.publish("marker.created", {"i": i})
+        return bus, queue.get_nowait().id
+
+    # asyncio.run waits for the background flush of the first two evicted events
+    bus, first_id = asyncio.run(scenario())
+    # The spill write ran off the event loop
+    assert flush_threads and threading.main_thread() not in flush_threads
+
+    conn = sqlite3.connect(test_db)
+    assert conn.execute("SELECT COUNT(*) FROM event_replay").fetchone()[0] == 2
+    # Events 1 and 2 come from the table, 3 from the unwritten buffer, 4 from memory
+    assert [e.data["i"] for e in bus.replay(first_id)] == [1, 2, 3, 4]
+
+    # Spilled events stay out of the user-facing timeline
+    bus._replay.flush()
+    assert conn.execute("SELECT COUNT(*) FROM events WHERE event_type = 'bus'").fetchone()[0] == 0
+    assert conn.execute("SELECT COUNT(*) FROM event_replay").fetchone()[0] == 3
+    conn.close()
+
+
+def test_get_waits_for_the_next_event():
+    async def scenario():
+        bus = EventBus(spill=False)
+        queue = bus.subscribe()
+        waiter = asyncio.create_task(queue.get())
+        await asyncio.sleep(0)
+        assert not waiter.done()
+        await bus.publish("file.created", {"path": "a"})
+        event = await asyncio.wait_for(waiter, timeout=1)
+        try:
+            queue.get_nowait()
+        except asyncio.QueueEmpty:
+            return event.data, queue.empty()
+
+    assert asyncio.run(scenario()) == ({"path": "a"}, True)
@@ -0,0 +1,134 @@
+"""Unit tests for the handoff digest prepared ahead of a reset."""
+
+import asyncio
+import json
+import sqlite3
+
+from core.config import settings
+from modules.handoff import digest
+from modules.handoff.digest import build_handoff_transcript, checkpoint_handoff_digest
+from modules.handoff.transcript_parser import parse_transcript
+from workers import context_monitor
+from workers.context_monitor import ContextMonitor
+
+
+def _user(text, minute=0):
+    return json.dumps({"type": "user", "timestamp": f"2026-02-03T09:{minute:02d}:00Z",
+                       "message": {"content": text}}) + "\n"
+
+
+def _claude(text, minute=0, cache_read=0):
+    return json.dumps({"type": "assistant", "timestamp": f"2026-02-03T09:{minute:02d}:30Z", "message": {
+        "model": "claude-sonnet-4-5",
+        "content": [{"type": "text", "text": text}],
+        "usage": {"input_tokens": 1_000, "cache_creation_input_tokens": 0,
+                  "cache_read_input_tokens": cache_read, "output_tokens": 100},
+    }}) + "\n"
+
+
+def _edit(filename, minute=0):
+    return json.dumps({"type": "assistant", "timestamp": f"2026-02-03T09:{minute:02d}:40Z", "message": {
+        "content": [{"type": "tool_use", "id": "t", "name": "Edit", "input": {"file_path": f"/repo/{filename}"}}],
+    }}) + "\n"
+
+
+def _append(path, text):
+    with open(path, "a") as f:
+        f.write(text)
+
+
+def test_digest_parses_only_the_tail(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "handoff_digest_dir", tmp_path / "digests")
+    path = tmp_path / "t.jsonl"
+    path.write_text(_user("role injection") + _user("fix the sync", 1) + _claude("On it.", 2)
+                    + _edit("sync.py", 3) + _edit("sync.py", 3))
+    checkpoint_handoff_digest("s1", path)
+    saved = json.loads((tmp_path / "digests" / "s1.json").read_text())
+    items = (tmp_path / "digests" / "s1.jsonl").read_bytes()
+    assert saved["offset"] == path.stat().st_size and len(items.splitlines()) == 4
+
+    # A partial line is left for the next checkpoint
+    line = _claude("Tests pass.", 9)
+    _append(path, _user("thanks", 8) + line[:30])
+    checkpoint_handoff_digest("s1", path)
+    _append(path, line[30:])
+
+    # Same text as parsing the whole file, from the digest plus the tail
+    reads = []
+    monkeypatch.setattr(digest, "read_appended_lines", _counting(digest.read_appended_lines, reads))
+    assert build_handoff_transcript("s1", path) == parse_transcript(path)
+    assert reads == [saved["offset"] + len(_user("thanks", 8))]
+
+
+def test_checkpoint_appends_items_and_ignores_torn_saves(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "handoff_digest_dir", tmp_path / "digests")
+    path = tmp_path / "t.jsonl"
+    items_path = tmp_path / "digests" / "s1.jsonl"
+    path.write_text(_user("role injection") + _user("fix the sync", 1) + _claude("On it.", 2))
+    checkpoint_handoff_digest("s1", path)
+    first = items_path.read_bytes()
+
+    # Items saved earlier are left alone; only the new ones are appended
+    _append(path, _edit("sync.py", 3))
+    checkpoint_handoff_digest("s1", path)
+    assert items_path.read_bytes().startswith(first) and len(items_path.read_bytes()) > len(first)
+
+    # Lines past the header's items_bytes (a save cut short) are ignored, then overwritten
+    with open(items_path, "a") as f:
+        f.write('[null,"user","User: torn"]\n')
+    assert "torn" not in build_handoff_transcript("s1", path)
+    digest._digests.clear()
+    _append(path, _claude("Done.", 4))
+    checkpoint_handoff_digest("s1", path)
+    assert b"torn" not in items_path.read_bytes()
+    assert build_handoff_transcript("s1", path) == parse_transcript(path)
+
+
+def _counting(fn, calls):
+    def wrapper(path, offset):
+        calls.append(offset)
+        return fn(path, offset)
+    return wrapper
+
+
+def test_long_session_condenses_older_items(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "handoff_digest_dir", tmp_path / "digests")
+    monkeypatch.setattr(digest, "RECENT_CHARS", 2_000)
+    path = tmp_path / "t.jsonl"
+    path.write_text(_user("role injection"))
+    for i in range(20):
+        _append(path, _user(f"step {i}", i) + _claude(f"plan {i} " + "x" * 1_000, i)
+                + _edit("a.py", i) + _edit("b.py", i))
+
+    text = build_handoff_transcript("s1", path)
+    assert len(text) < len(parse_transcript(path)) / 2
+    earlier, recent = text.split("=== Recent (in full) ===")
+    # Older work keeps user messages and edited files, Claude messages shortened
+    assert "User: step 0" in earlier and "[2 tool calls: Edit x2 - edited a.py, b.py]" in earlier
+    assert "plan 0 " + "x" * 1_000 not in earlier and "[...]" in earlier
+    assert "Claude: plan 19 " + "x" * 1_000 in recent and "[Edit b.py]" in recent
+
+
+def test_monitor_prepares_digest_past_threshold(test_db, tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "handoff_digest_dir", tmp_path / "digests")
+    busy = tmp_path / "busy.jsonl"
+    busy.write_text(_claude("busy", cache_read=150_000))
+    calm = tmp_path / "calm.jsonl"
+    calm.write_text(_claude("calm", cache_read=10_000))
+    conn = sqlite3.connect(test_db)
+    for session_id, pane, path in (("busy-1", "%1", busy), ("calm-1", "%2", calm)):
+        conn.execute("""
+            INSERT INTO sessions (session_id, role, mode, started_at, last_seen_at, tmux_pane, transcript_path)
+            VALUES (?, 'builder', 'interactive', datetime('now'), datetime('now'), ?, ?)
+        """, (session_id, pane, str(path)))
+    conn.commit()
+    conn.close()
+    settings.handoff_digest_dir.mkdir()
+    for name in ("gone-1.json", "gone-1.jsonl", "gone-1.tmp"):
+        (settings.handoff_digest_dir / name).write_text("{}")
+
+    monitor = ContextMonitor(test_db)
+    monkeypatch.setattr(context_monitor, "get_session_claude_status", lambda pane: None)
+    asyncio.run(monitor.check_all_sessions())
+    # Only the session past 70% is prepared; digest files of ended sessions are pruned
+    assert sorted(p.name for p in settings.handoff_digest_dir.iterdir()) == ["busy-1.json", "busy-1.jsonl"]
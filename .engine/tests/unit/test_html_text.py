@@ -0,0 +1,63 @@
+"""Golden-output tests for the HTML email body converter.
+
+Expected strings are what the previous regex converter produced for the
+same input, except where noted.
+"""
+
+import pytest
+
+from modules.email.html_text import clean_text, html_to_text
+
+NEWSLETTER = """<!DOCTYPE html><html><head><title>Weekly</title><style type="text/css">.x{color:#333}</style></head>
+<body><table role="presentation"><tr><td align="center">
+  <h2 style="margin:0">This week&rsquo;s picks</h2>
+  <p>Hi Sam,<br>here are three things worth reading.</p>
+</td></tr>
+<tr><td><a href="https://news.example.com/r?id=1&amp;u=9">The quiet return of RSS</a> &mdash; 6 min</td></tr>
+<tr><td><a href="https://news.example.com/r?id=2"><img src="hero.png" alt="hero"></a></td></tr>
+<tr><td><div>Unsubscribe&nbsp;|&nbsp;<a href='https://example.com/prefs'>Preferences</a></div></td></tr>
+</table><script>track()</script></body></html>"""
+
+NEWSLETTER_TEXT = (
+    "Weekly\n\n\nThis week’s picks\n\n\nHi Sam,\nhere are three things worth reading.\n\n\n"
+    "The quiet return of RSS (https://news.example.com/r?id=1&u=9) — 6 min\n\n\n"
+    "Unsubscribe | Preferences (https://example.com/prefs)"
+)
+
+GOLDEN = [
+    (NEWSLETTER, NEWSLETTER_TEXT),
+    ("<p>Hello&nbsp;<b>world</b></p><p>Second &amp; third</p>", "Hello world\n\nSecond & third"),
+    ("<style>p{color:red}</style><script>var a = '<p>';</script><div>Body</div>", "Body"),
+    ('<a href="https://x.com"><img src="y.png"></a> image link', "image link"),
+    ("<h1>Title</h1>\n<table><tr><td>A</td><td>B</td></tr><tr><td>C</td></tr></table>", "Title\n\n\nAB\n\nC"),
+    ("line1<br>line2<br/>line3<BR />", "line1\nline2\nline3"),
+    ("   lots    of\tspace \n\n\n\n\n\n gaps &#8203;here​ ", "lots of space\n\n\ngaps here"),
+    ("x &lt;not a tag&gt; y", "x <not a tag> y"),
+]
+
+
+@pytest.mark.parametrize("html, expected", GOLDEN)
+def test_matches_previous_converter(html, expected):
+    assert html_to_text(html) == expected
+
+
+def test_list_items_and_comments():
+    # Previously every </li> added a stray "•" line and Outlook conditional
+    # comment contents leaked into the text
+    assert html_to_text("<ul><li>one</li><li>two</li></ul>") == "• one\n• two"
+    assert html_to_text("<!--[if mso]><xml><o:PixelsPerInch>96</o:PixelsPerInch></xml><![endif]-->Hi") == "Hi"
+
+
+def test_limit_stops_early():
+    assert html_to_text(NEWSLETTER, limit=40) == NEWSLETTER_TEXT[:40]
+    huge = "<p>" + "word " * 500_000 + "</p>"
+    assert html_to_text(huge, limit=20) == "word " * 4
+
+    # A prefix cut inside a style block or tag must not leak its contents
+    padded = "<p>" + "x " * 3000 + "</p><style>" + "a{b:c}" * 2000 + "</style><p>" + "y " * 3000
+    assert "{" not in html_to_text(padded, limit=4000)
+    assert html_to_text(padded, limit=4000) == html_to_text(padded)[:4000]
+
+
+def test_clean_text():
+    assert clean_text("  a \r\n\tb­ \n\n\n\n\nc  ") == "a\nb\n\n\nc"
@@ -0,0 +1,90 @@
+"""Unit tests for .emlx body extraction and the two-tier body cache."""
+
+import os
+from email.mime.application import MIMEApplication
+from email.mime.message import MIMEMessage
+from email.mime.multipart import MIMEMultipart
+from email.mime.text import MIMEText
+
+from tests.helpers import MAIL_ACCOUNT
+from modules.email.providers.apple_body import BodyCache, extract_text_parts, get_body_cache
+
+
+def _newsletter(with_plain: bool) -> bytes:
+    outer = MIMEMultipart("mixed")
+    alternative = MIMEMultipart("alternative")
+    if with_plain:
+        alternative.attach(MIMEText("Plain édition", "plain", "utf-8"))
+    alternative.attach(MIMEText("<p>HTML edition</p>", "html", "utf-8"))
+    outer.attach(alternative)
+    attachment = MIMEApplication(os.urandom(4096))
+    attachment.add_header("Content-Disposition", "attachment", filename="report.pdf")
+    outer.attach(attachment)
+    attached_text = MIMEText("not the body")
+    attached_text.add_header("Content-Disposition", "attachment", filename="notes.txt")
+    outer.attach(attached_text)
+    return outer.as_bytes()
+
+
+def test_extract_text_parts():
+    # Stops at the first text/plain part; HTML after it is never decoded
+    assert extract_text_parts(_newsletter(with_plain=True)) == ("Plain édition", None)
+    assert extract_text_parts(_newsletter(with_plain=False)) == (None, "<p>HTML edition</p>")
+    assert extract_text_parts(_newsletter(with_plain=True).replace(b"\n", b"\r\n"))[0] == "Plain édition"
+
+    forwarded = MIMEMultipart("mixed")
+    forwarded.attach(MIMEText("<p>see below</p>", "html"))
+    forwarded.attach(MIMEMessage(MIMEText("original text")))
+    assert extract_text_parts(forwarded.as_bytes()) == ("original text", "<p>see below</p>")
+
+    assert extract_text_parts(b"Subject: hi\n\nno content type") == ("no content type", None)
+
+
+def test_body_cache_tiers(tmp_path):
+    cache = BodyCache(tmp_path / "bodies", max_memory_bytes=2000)
+    key = (MAIL_ACCOUNT, 1, 111)
+    assert cache.get(key) is None
+    cache.put(key, "body one")
+    assert cache.get(key) == "body one"
+
+    # Memory is bounded by bytes: older entries fall back to disk
+    for rowid in range(2, 10):
+        cache.put((MAIL_ACCOUNT, rowid, 111), "x" * 400)
+    assert cache.memory_bytes <= 2000
+    assert cache.stats["evictions"] > 0
+    assert cache.get(key) == "body one"
+    assert cache.stats["disk_hits"] == 1
+
+    # A fresh process reads the disk tier; a new mtime is a miss
+    restarted = BodyCache(tmp_path / "bodies")
+    assert restarted.get(key) == "body one"
+    assert restarted.get((MAIL_ACCOUNT, 1, 222)) is None
+
+
+def test_disk_tier_is_pruned(tmp_path):
+    cache = BodyCache(tmp_path / "bodies", max_disk_bytes=20_000)
+    for rowid in range(50):
+        cache.put((MAIL_ACCOUNT, rowid, 1), os.urandom(1000).hex())
+    on_disk = sum(p.stat().st_size for p in (tmp_path / "bodies").glob("*/*.z"))
+    assert on_disk <= 20_000
+
+
+def test_adapter_caches_bodies_until_the_file_changes(envelope_index, apple_adapter, tmp_path, monkeypatch):
+    envelope_index.append([("News", "news@x.com", "", 1, 1)])
+    messages_dir = tmp_path / "Library" / "Mail" / "V10" / MAIL_ACCOUNT / "INBOX.mbox" / "GUID" / "Data" / "Messages"
+    messages_dir.mkdir(parents=True)
+    emlx = messages_dir / "1.emlx"
+    raw = _newsletter(with_plain=False)
+    emlx.write_bytes(b"%d\n" % len(raw) + raw + b"<?xml version='1.0'?><plist/>")
+    monkeypatch.setenv("HOME", str(tmp_path))
+
+    for _ in range(2):
+        assert apple_adapter.get_message("1", "INBOX", account="test").content == "HTML edition"
+    cache = get_body_cache()
+    assert cache.stats["misses"] == 1
+    assert cache.stats["memory_hits"] == 1
+
+    raw = MIMEText("Full download").as_bytes()
+    emlx.write_bytes(b"%d\n" % len(raw) + raw)
+    os.utime(emlx, ns=(1, 1))
+    assert apple_adapter.get_message("1", "INBOX", account="test").content == "Full download"
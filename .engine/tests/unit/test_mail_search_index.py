@@ -0,0 +1,100 @@
+"""Unit tests for the FTS5 shadow index over Mail.app's Envelope Index."""
+
+import sqlite3
+
+import pytest
+
+from modules.email.providers.apple_search import MailSearchIndex, get_search_index, parse_query
+
+MESSAGES = [
+    ("Quarterly report draft", "jane@acme.com", "numbers attached", 10, 1),
+    ("Lunch?", "bob@example.org", "quarterly offsite planning", 11, 1),
+    ("Re: Quarterly report draft", "jane@acme.com", "looks good", 10, 1),
+    ("Invoice 4411", "billing@mail.acme.com", "payment due", 12, 2),
+]
+
+
+def test_parse_query_builds_prefix_phrase_and_filters():
+    parsed = parse_query('invoice "quarterly report" from:Jane@Acme.com domain:@acme.com thread:42')
+    assert parsed.match == '"quarterly report" AND "invoice"*'
+    assert parsed.sender == "jane@acme.com"
+    assert parsed.domain == "acme.com"
+    assert parsed.thread_id == 42
+    # Addresses become a token run; non-address from:/subject: are column terms
+    assert parse_query("jane@acme.com").match == '"jane acme com"*'
+    assert parse_query("from:jane subject:draft").match == 'sender : "jane"* AND subject : "draft"*'
+
+
+def test_sync_is_incremental_and_search_ranks(envelope_index, tmp_path):
+    envelope_index.append(MESSAGES)
+    index = MailSearchIndex(envelope_index.path, tmp_path / "system.db")
+
+    assert index.sync() == 4
+    assert index.watermark == 4
+    assert index.sync() == 0
+
+    # Subject hits outrank summary-only hits (shorter subjects first); prefixes match
+    assert index.search(parse_query("quarter")) == [1, 3, 2]
+    assert index.search(parse_query('"report draft"')) == [1, 3]
+    assert index.search(parse_query("from:jane@acme.com")) == [3, 1]
+    assert index.search(parse_query("domain:acme.com")) == [4, 3, 1]
+    assert index.search(parse_query("thread:10 looks")) == [3]
+    assert index.search(parse_query("from:bob quarterly")) == [2]
+    assert index.search(parse_query("subject:quarterly from:jane")) == [1, 3]
+    assert index.search(parse_query("quarterly"), mailbox_ids=[2]) == []
+
+    envelope_index.append([("Quarterly numbers", "cfo@acme.com", "", 13, 1)])
+    assert index.ensure_fresh()
+    assert index.watermark == 5
+    assert index.search(parse_query("quarterly numbers")) == [5, 1]
+
+
+def test_adapter_search_uses_index_and_skips_deleted(envelope_index, apple_adapter):
+    envelope_index.append(MESSAGES)
+
+    # First use backfills the index in the background; meanwhile search scans Mail.app
+    assert [m.id for m in apple_adapter.search("quarterly report", account="test")] == ["3", "1"]
+    get_search_index(envelope_index.path)._backfill.join()
+
+    results = apple_adapter.search("quarterly report", mailbox="INBOX", account="test")
+    assert [m.id for m in results] == ["1", "3"]
+    assert results[0].sender == "jane@acme.com"
+
+    envelope_index.execute("UPDATE messages SET deleted = 1 WHERE ROWID = 1")
+    assert [m.id for m in apple_adapter.search("quarterly report", account="test")] == ["3"]
+
+    # Moved out of INBOX after indexing: the stale FTS row must not match
+    envelope_index.execute("UPDATE messages SET mailbox = 2 WHERE ROWID = 3")
+    assert apple_adapter.search("quarterly report", mailbox="INBOX", account="test") == []
+
+
+def test_failed_backfill_is_not_reported_fresh(envelope_index, tmp_path, monkeypatch):
+    envelope_index.append(MESSAGES)
+    index = MailSearchIndex(envelope_index.path, tmp_path / "system.db")
+    real_sync = index.sync
+
+    def broken_sync():
+        raise sqlite3.OperationalError("database is locked")
+
+    monkeypatch.setattr(index, "sync", broken_sync)
+    assert not index.ensure_fresh()
+    index._backfill.join()
+    # Same source stamp, but nothing was indexed: still not usable
+    assert not index.ensure_fresh()
+    index._backfill.join()
+
+    monkeypatch.setattr(index, "sync", real_sync)
+    assert not index.ensure_fresh()
+    index._backfill.join()
+    assert index.ensure_fresh()
+    assert index.watermark == 4
+
+
+def test_mirror_without_sync_fails_at_construction(tmp_path):
+    from core.watermark_sync import WatermarkMirror
+
+    class Incomplete(WatermarkMirror):
+        LABEL = "incomplete"
+
+    with pytest.raises(TypeError, match="sync"):
+        Incomplete(tmp_path / "source.db", tmp_path / "system.db")
@@ -0,0 +1,75 @@
+"""Unit tests for the FTS5 index over chat.db message text."""
+
+from datetime import datetime, timezone
+
+from modules.messages.providers.apple_search import (
+    MessageSearchIndex,
+    get_search_index,
+    handle_variants,
+    match_expression,
+)
+
+# Seconds after the Apple epoch (2001-01-01): 2024-01-01 is 725760000
+JAN_2024 = 725_760_000
+
+
+def _populate(chat_db):
+    alice = chat_db.add_chat("iMessage;-;+15550001", ["+15550001"])
+    bob = chat_db.add_chat("iMessage;-;bob@example.com", ["bob@example.com"])
+    chat_db.add_message(alice, "Dinner reservation at 8", JAN_2024)
+    chat_db.add_message(alice, "Running late for dinner", JAN_2024 + 86_400, rich=True)
+    chat_db.add_message(bob, "Dinner plans this week?", JAN_2024 + 2 * 86_400, rich=True)
+    chat_db.add_message(bob, "Café reservation confirmed", JAN_2024 + 3 * 86_400)
+    return alice, bob
+
+
+def test_match_expression_and_handle_variants():
+    assert match_expression('dinner "table for two"') == '"table for two" AND "dinner"*'
+    assert match_expression("?!") == ""
+    assert handle_variants("15550001") == ["+15550001", "15550001"]
+    assert handle_variants("Bob@Example.com") == ["bob@example.com"]
+
+
+def test_index_decodes_attributed_body_and_filters(chat_db, tmp_path):
+    alice, bob = _populate(chat_db)
+    chat_db.execute("UPDATE message SET handle_id = 1 WHERE ROWID IN (1, 2)")
+    chat_db.execute("UPDATE message SET handle_id = 2 WHERE ROWID IN (3, 4)")
+    index = MessageSearchIndex(chat_db.path, tmp_path / "system.db")
+
+    assert index.sync() == 4
+    assert index.sync() == 0
+    assert index.watermark == 4
+
+    hits = index.search(match_expression("dinner"))
+    assert sorted(h.rowid for h in hits) == [1, 2, 3]
+    assert {h.rowid: h.text for h in hits}[2] == "Running late for dinner"
+    assert [h.rowid for h in index.search(match_expression("cafe"))] == [4]  # diacritics folded
+    assert [h.rowid for h in index.search(match_expression("reserv"), chat_rowid=bob)] == [4]
+    assert sorted(h.rowid for h in index.search(match_expression("dinner"), handles=["+15550001"])) == [1, 2]
+    since = (JAN_2024 + 86_400) * 1_000_000_000
+    until = (JAN_2024 + 2 * 86_400) * 1_000_000_000
+    assert [h.rowid for h in index.search(match_expression("dinner"), since=since, until=until)] == [2]
+
+
+def test_adapter_search_uses_index_and_falls_back(chat_db, messages_adapter):
+    _populate(chat_db)
+
+    # While the index backfills, search scans message.text (rich-text rows are missed)
+    assert [m.text for m in messages_adapter.search_messages("dinner")] == ["Dinner reservation at 8"]
+    get_search_index(chat_db.path)._backfill.join()
+
+    results = messages_adapter.search_messages("dinner")
+    assert sorted(m.text for m in results) == [
+        "Dinner plans this week?", "Dinner reservation at 8", "Running late for dinner",
+    ]
+    assert {m.chat_id for m in results} == {"iMessage;-;+15550001", "iMessage;-;bob@example.com"}
+
+    results = messages_adapter.search_messages(
+        "dinner",
+        chat_id="iMessage;-;+15550001",
+        since=datetime(2024, 1, 1, 12, tzinfo=timezone.utc),
+    )
+    assert [m.text for m in results] == ["Running late for dinner"]
+
+    chat_db.execute("DELETE FROM message WHERE ROWID = 1")
+    assert "Dinner reservation at 8" not in [m.text for m in messages_adapter.search_messages("dinner")]
@@ -0,0 +1,68 @@
+"""Unit tests for the chat.db conversation summary."""
+
+from modules.messages.providers.apple_summary import ConversationSummary, get_conversation_summary
+
+
+def _snapshot(conversations):
+    return [
+        (c.id, c.display_name, c.participants, c.last_message_text, c.last_message_date,
+         c.unread_count, c.is_group)
+        for c in conversations
+    ]
+
+
+def _populate(chat_db):
+    alice = chat_db.add_chat("iMessage;-;+15550001", ["+15550001"])
+    group = chat_db.add_chat("iMessage;+;chat42", ["+15550001", "bob@example.com"], display_name="Climbing")
+    old = chat_db.add_chat("iMessage;-;+15550009", ["+15550009"], archived=True)
+    chat_db.add_chat("iMessage;-;+15550010", ["+15550010"])  # no messages yet
+    chat_db.add_message(alice, "Hey", 100, read=True)
+    chat_db.add_message(alice, "Running late", 200, rich=True)
+    chat_db.add_message(group, "Saturday?", 150)
+    chat_db.add_message(group, "I'm in", 160, from_me=True)
+    chat_db.add_message(old, "Old thread", 50)
+    return alice, group, old
+
+
+def test_summary_matches_direct_chat_db_read(chat_db, messages_adapter, tmp_path):
+    _populate(chat_db)
+    summary = ConversationSummary(chat_db.path, tmp_path / "system.db")
+
+    assert summary.sync() == 5
+    assert summary.sync() == 0
+    for include_archived in (False, True):
+        assert _snapshot(messages_adapter.get_conversations(include_archived=include_archived)) == _snapshot(
+            messages_adapter._get_conversations_direct(50, include_archived)
+        )
+
+    listed = messages_adapter.get_conversations()
+    assert [c.last_message_text for c in listed] == ["Running late", "I'm in", None]
+    assert [c.unread_count for c in listed] == [1, 1, 0]
+    assert listed[1].is_group and listed[1].display_name == "Climbing"
+
+
+def test_summary_follows_new_messages_reads_and_chat_changes(chat_db, messages_adapter):
+    alice, group, old = _populate(chat_db)
+
+    # First use backfills in the background; meanwhile the list comes from chat.db
+    assert len(messages_adapter.get_conversations()) == 3
+    summary = get_conversation_summary(chat_db.path)
+    summary._backfill.join()
+    assert summary.watermark == 5
+
+    late = chat_db.add_message(group, "Bringing rope", 300)
+    chat_db.add_message(alice, "Synced from another device", 120)  # older than alice's last message
+    chat_db.execute("UPDATE message SET is_read = 1 WHERE ROWID = 2")
+    chat_db.execute("UPDATE chat SET display_name = 'Crag crew' WHERE ROWID = ?", (group,))
+    chat_db.execute("DELETE FROM chat WHERE ROWID = ?", (old,))
+
+    listed = messages_adapter.get_conversations(include_archived=True)
+    assert [(c.display_name, c.last_message_text, c.unread_count) for c in listed] == [
+        ("Crag crew", "Bringing rope", 2),
+        ("+15550001", "Running late", 1),
+        ("+15550010", None, 0),
+    ]
+    assert summary.watermark == 7
+
+    chat_db.execute("UPDATE message SET is_read = 1 WHERE ROWID IN (3, ?)", (late,))
+    assert [c.unread_count for c in messages_adapter.get_conversations()] == [0, 1, 0]
@@ -0,0 +1,149 @@
+"""Unit tests for the CronScheduler due-time heap."""
+
+import asyncio
+from datetime import datetime, timedelta
+
+from core import scheduler as scheduler_module
+from core.config import settings
+from core.scheduler import PACIFIC, CronScheduler
+
+
+def _make_scheduler(tmp_path, monkeypatch, lines):
+    monkeypatch.setattr(settings, "desktop_dir", tmp_path)
+    monkeypatch.setattr(settings, "db_path", tmp_path / "system.db")
+    (tmp_path / "SCHEDULE.md").write_text("# Schedule\n\n" + "\n".join(lines) + "\n")
+    return CronScheduler()
+
+
+def test_reload_syncs_db_and_heap(tmp_path, monkeypatch):
+    soon = (datetime.now(PACIFIC) + timedelta(minutes=5)).replace(microsecond=0)
+    cron = _make_scheduler(tmp_path, monkeypatch, [
+        "## Recurring",
+        "0 * * * * | exec | rotate_logs",
+        "## One-Off",
+        f"{soon.isoformat()} | inject chief | ping",
+    ])
+    cron.load_schedule()
+
+    rows = {row["payload"]: row for row in cron.list_entries()}
+    assert set(rows) == {"rotate_logs", "ping"}
+    assert rows["ping"]["next_run"] == soon.isoformat()
+    # Heap head is the earliest entry
+    assert 0 < cron._seconds_until_due() <= 300
+
+    # Disabling drops an entry from the heap; removing it from the file deletes the row
+    one_off = rows["ping"]["id"]
+    cron.set_enabled(one_off, False)
+    assert one_off not in cron._next_run
+    cron.schedule_path.write_text("# Schedule\n\n0 * * * * | exec | rotate_logs\n")
+    cron.load_schedule()
+    assert [row["payload"] for row in cron.list_entries()] == ["rotate_logs"]
+
+
+def test_due_entries_fire_on_time_and_reschedule(tmp_path, monkeypatch):
+    fired = []
+    monkeypatch.setitem(scheduler_module.EXEC_REGISTRY, "tick", lambda: fired.append(1))
+    cron = _make_scheduler(tmp_path, monkeypatch, ["* * * * * | exec | tick"])
+    cron.load_schedule()
+    (entry_id,) = cron._by_id
+
+    # Force the entry due now
+    cron._schedule(entry_id, datetime.now(PACIFIC).isoformat())
+
+    async def dispatch():
+        await asyncio.gather(*await cron._process_due_entries())
+
+    asyncio.run(dispatch())
+
+    assert fired == [1]
+    history = cron.get_history()
+    assert history[0]["status"] == "delivered"
+    # Rescheduled for the next minute boundary
+    assert 0 < cron._seconds_until_due() <= 60
+    assert cron._pop_due(datetime.now(PACIFIC).timestamp()) == []
+
+
+def test_dispatch_runs_concurrently_but_serializes_each_target(tmp_path, monkeypatch):
+    cron = _make_scheduler(tmp_path, monkeypatch, [
+        "* * * * * | inject chief | one",
+        "* * * * * | inject chief | two",
+        "* * * * * | inject builder | three",
+    ])
+    cron.load_schedule()
+    active = {}
+    overlaps = []
+
+    async def fake_inject(target, payload):
+        active[target] = active.get(target, 0) + 1
+        overlaps.append(sum(active.values()))
+        assert active[target] == 1
+        await asyncio.sleep(0.05)
+        active[target] -= 1
+        return "delivered", None
+
+    monkeypatch.setattr(cron, "_dispatch_inject", fake_inject)
+    now = datetime.now(PACIFIC).isoformat()
+    for entry_id in cron._by_id:
+        cron._schedule(entry_id, now)
+
+    async def dispatch():
+        await asyncio.gather(*await cron._process_due_entries())
+
+    asyncio.run(dispatch())
+
+    # chief's two injects never overlap each other, but builder runs alongside
+    assert max(overlaps) == 2
+    assert [row["status"] for row in cron.get_history()] == ["delivered"] * 3
+
+
+def test_timed_out_inject_holds_target_until_it_finishes(tmp_path, monkeypatch):
+    monkeypatch.setitem(scheduler_module.DISPATCH_TIMEOUTS, "inject", 0.02)
+    cron = _make_scheduler(tmp_path, monkeypatch, [
+        "* * * * * | inject chief | one",
+        "* * * * * | inject chief | two",
+    ])
+    cron.load_schedule()
+    log = []
+
+    async def slow_inject(target, payload):
+        log.append(("start", payload))
+        await asyncio.sleep(0.1)
+        log.append(("end", payload))
+        return "delivered", None
+
+    monkeypatch.setattr(cron, "_dispatch_inject", slow_inject)
+    now = datetime.now(PACIFIC).isoformat()
+    for entry_id in cron._by_id:
+        cron._schedule(entry_id, now)
+
+    async def dispatch():
+        await asyncio.gather(*await cron._process_due_entries())
+        while cron._overrun:
+            await asyncio.sleep(0.01)
+
+    asyncio.run(dispatch())
+
+    # The second inject waits for the first to really finish, not just time out
+    assert [kind for kind, _ in log] == ["start", "end", "start", "end"]
+    assert [row["status"] for row in cron.get_history()] == ["timeout"] * 2
+
+
+def test_crashed_entry_is_rescheduled(tmp_path, monkeypatch):
+    cron = _make_scheduler(tmp_path, monkeypatch, ["* * * * * | exec | tick"])
+    cron.load_schedule()
+    (entry_id,) = cron._by_id
+    cron._schedule(entry_id, datetime.now(PACIFIC).isoformat())
+
+    async def explode(*args):
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(cron, "_dispatch", explode)
+
+    async def dispatch():
+        await asyncio.gather(*await cron._process_due_entries(), return_exceptions=True)
+        await asyncio.sleep(0)
+
+    asyncio.run(dispatch())
+
+    assert entry_id not in cron._in_flight
+    assert 0 < cron._seconds_until_due() <= 60
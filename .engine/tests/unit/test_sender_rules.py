@@ -0,0 +1,83 @@
+"""Unit tests for the sender-rule index and EmailPipeline rule matching."""
+
+import sqlite3
+
+import pytest
+
+from modules.email.rules import SenderRuleIndex, bump_rules_version
+
+
+def _rule(rule_id, match_type, match_value, rule_type="always"):
+    return {
+        "id": rule_id, "match_type": match_type, "match_value": match_value,
+        "rule_type": rule_type, "category": "noise", "instructions": None,
+        "extract_content": 0,
+    }
+
+
+def test_index_ordering_and_subdomains():
+    index = SenderRuleIndex([
+        _rule("d-suggest", "domain", "acme.com", "suggest"),
+        _rule("d-never", "domain", "acme.com", "never"),
+        _rule("sub", "domain", "mail.acme.com"),
+        _rule("tld", "domain", "com", "suggest"),
+        _rule("s", "sender", "Bob@Mail.Acme.com", "suggest"),
+        _rule("other", "domain", "notacme.com"),
+    ])
+
+    ids = [r["id"] for r in index.match("bob@mail.acme.com")]
+    assert ids == ["s", "sub", "d-never", "d-suggest", "tld"]
+
+    assert [r["id"] for r in index.match("x@acme.com")] == ["d-never", "d-suggest", "tld"]
+    assert [r["id"] for r in index.match("x@acme.org")] == []
+    assert index.match("not-an-address") == []
+
+
+@pytest.fixture
+def pipeline(test_db):
+    from modules.email.pipeline import EmailPipeline
+    return EmailPipeline(str(test_db))
+
+
+def _insert_rule(db_path, rule_id, match_type, match_value, bump=True):
+    conn = sqlite3.connect(db_path)
+    conn.execute(
+        """INSERT INTO email_sender_rules
+           (id, match_type, match_value, rule_type, category, created_at, updated_at)
+           VALUES (?, ?, ?, 'always', 'noise', '2026-01-01', '2026-01-01')""",
+        (rule_id, match_type, match_value),
+    )
+    if bump:
+        bump_rules_version(conn)
+    conn.commit()
+    conn.close()
+
+
+def test_pipeline_rebuilds_only_on_version_change(pipeline, test_db):
+    _insert_rule(test_db, "r1", "domain", "news.example.com")
+    assert [r["id"] for r in pipeline._match_rules("News <a@news.example.com>")] == ["r1"]
+    index = pipeline._rule_index
+
+    # A write that skips the version bump is not seen; the index is reused
+    _insert_rule(test_db, "r2", "sender", "a@news.example.com", bump=False)
+    assert [r["id"] for r in pipeline._match_rules("a@news.example.com")] == ["r1"]
+    assert pipeline._rule_index is index
+
+    _insert_rule(test_db, "r3", "domain", "example.com")
+    assert [r["id"] for r in pipeline._match_rules("a@news.example.com")] == ["r2", "r1", "r3"]
+    assert pipeline._rule_index is not index
+
+
+def test_rule_hits_are_batched(pipeline, test_db):
+    _insert_rule(test_db, "r1", "domain", "example.com")
+    for _ in range(3):
+        pipeline._increment_rule_applied("r1")
+
+    conn = sqlite3.connect(test_db)
+    times = lambda: conn.execute("SELECT times_applied FROM email_sender_rules WHERE id = 'r1'").fetchone()[0]
+    assert times() == 0
+    pipeline._flush_rule_hits()
+    assert times() == 3
+    pipeline._flush_rule_hits()
+    assert times() == 3
+    conn.close()
@@ -0,0 +1,155 @@
+"""Unit tests for SessionService spawn readiness (real tmux, stub claude)."""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from core import tmux
+from modules.sessions import SessionService, get_standby_pool
+from modules.sessions.pool import start_standby_pool, stop_standby_pool
+from modules.sessions.service import _claude_prompt_visible
+
+
+@pytest.fixture
+def service(tmux_server, test_db, tmp_path, monkeypatch):
+    """SessionService whose initial prompt goes straight to the pane."""
+    service = SessionService(db_path=test_db, repo_root=tmp_path)
+    service.injected = []
+
+    def inject(window_name, prompt):
+        service.injected.append((window_name, tmux.capture_pane(f"{tmux.TMUX_SESSION}:{window_name}")))
+        return True
+
+    monkeypatch.setattr(service, "_inject_prompt", inject)
+    monkeypatch.setattr("modules.sessions.service.emit_event", lambda *args, **kwargs: None)
+    return service
+
+
+def test_spawn_async_returns_handle_then_resolves_at_prompt(service, monkeypatch):
+    claim_threads = []
+    claim = service._claim_standby
+
+    def recording_claim(*args):
+        claim_threads.append(threading.current_thread())
+        return claim(*args)
+
+    monkeypatch.setattr(service, "_claim_standby", recording_claim)
+
+    async def scenario():
+        start = time.perf_counter()
+        handle = await service.spawn_async("builder", description="stub run")
+        assert time.perf_counter() - start < 0.1
+        assert not handle.done()
+        assert handle.window_name == f"builder-{handle.session_id}"
+
+        result = await handle
+        assert result.success, result.error
+        assert result.session_id == handle.session_id
+        return handle
+
+    handle = asyncio.run(scenario())
+    # The standby claim (tmux and SQLite round trips) stays off the event loop
+    assert claim_threads and threading.main_thread() not in claim_threads
+    window, screen = service.injected[0]
+    assert window == handle.window_name
+    assert _claude_prompt_visible(screen) and "Claude Code (stub)" in screen
+
+
+def test_spawn_waits_on_pane_output(service, monkeypatch):
+    result = service.spawn("researcher", window_name="research")
+    assert result.success, result.error
+    assert _claude_prompt_visible(service.injected[0][1])
+
+    # Already running: refused without touching the window
+    monkeypatch.setattr(service, "_is_claude_running", lambda window_name: True)
+    again = service.spawn("researcher", window_name="research")
+    assert not again.success and "already running" in again.error
+    assert tmux.window_exists("research")
+
+
+def test_wait_for_claude_times_out_without_prompt(service):
+    start = time.perf_counter()
+    assert not service._wait_for_claude("main", timeout=1)
+    assert time.perf_counter() - start < 2
+
+
+async def _pool_ready(pool, model, timeout=5.0):
+    deadline = time.perf_counter() + timeout
+    while pool.stats()["ready"][model] < pool.sizes[model]:
+        assert time.perf_counter() < deadline, pool.stats()
+        await asyncio.sleep(0.05)
+
+
+def test_spawn_claims_standby_and_pool_refills(service):
+    async def scenario():
+        pool = await start_standby_pool(service, {"sonnet": 1})
+        try:
+            await _pool_ready(pool, "sonnet")
+            standby = pool._ready["sonnet"][0]
+
+            result = await (await service.spawn_async("builder", description="pooled"))
+            assert result.success, result.error
+            assert result.session_id == standby.session_id
+            assert result.window_name == f"builder-{standby.session_id}"
+            assert not tmux.window_exists(standby.window_name)
+
+            # Chief never takes a standby; a miss falls back to a cold start
+            assert service._claim_standby("chief", "interactive", None, None, None) is None
+            cold = await (await service.spawn_async("researcher"))
+            assert cold.success and cold.session_id != standby.session_id
+
+            await _pool_ready(pool, "sonnet")
+            return standby, result, pool.stats()
+        finally:
+            await stop_standby_pool()
+
+    standby, result, stats = asyncio.run(scenario())
+    assert get_standby_pool() is None
+    assert (stats["hits"], stats["misses"], stats["hit_rate"]) == (1, 1, 0.5)
+
+    row = service.repository.get_session(result.session_id)
+    assert (row.role, row.description, row.conversation_id) == ("builder", "pooled", result.conversation_id)
+    assert row.tmux_pane == standby.pane_id
+    window, screen = service.injected[0]
+    assert window == result.window_name and _claude_prompt_visible(screen)
+    # Idle standbys are closed with the pool
+    windows = tmux.run("list-windows", "-t", tmux.TMUX_SESSION, "-F", "#{window_name}").stdout.split()
+    assert not any(name.startswith("standby-") for name in windows)
+
+
+def test_dead_standby_is_discarded_for_cold_start(service):
+    async def scenario():
+        pool = await start_standby_pool(service, {"sonnet": 1})
+        try:
+            await _pool_ready(pool, "sonnet")
+            standby = pool._ready["sonnet"][0]
+            tmux.send_keys(standby.pane_id, "C-c")  # Claude exits, pane is back at the shell
+            await asyncio.sleep(0.2)
+
+            result = await (await service.spawn_async("builder"))
+            return standby, result, pool.stats()
+        finally:
+            await stop_standby_pool()
+
+    standby, result, stats = asyncio.run(scenario())
+    assert result.success, result.error
+    assert stats["hits"] == 1 and stats["discarded"] == 1
+    # Started cold in a fresh window, under the id the handle already reported
+    assert result.session_id == standby.session_id
+    assert _claude_prompt_visible(service.injected[0][1])
+
+
+def test_bind_dead_standby_after_pool_stopped(service):
+    from modules.sessions.pool import Standby
+
+    created = tmux.run(
+        "new-window", "-d", "-t", tmux.TMUX_SESSION, "-n", "standby-sonnet-dead", "-P", "-F", "#{pane_id}"
+    )
+    standby = Standby("dead", "sonnet", "standby-sonnet-dead", created.stdout.strip(), time.monotonic())
+    assert get_standby_pool() is None
+
+    # Pane is at its shell: refused, window closed, no pool needed
+    assert not service._bind_standby(standby, "builder-dead", "builder", "interactive", None, "conv", None)
+    assert not tmux.window_exists("standby-sonnet-dead")
@@ -33,3 +33,21 @@ def test_get_sessions_for_activity_orders_active_first(test_db):
 
     sessions = repo.get_sessions_for_activity()
     assert sessions[0]["session_id"] == "active-1"
+
+
+def test_idle_standbys_are_not_active_sessions(test_db):
+    repo = SessionRepository(Path(test_db))
+
+    conn = sqlite3.connect(test_db)
+    conn.executemany(
+        """INSERT INTO sessions (session_id, role, mode, started_at, last_seen_at, created_at)
+           VALUES (?, ?, 'interactive', datetime('now'), datetime('now'), datetime('now'))""",
+        [("work-1", "builder"), ("standby-1", "standby")],
+    )
+    conn.commit()
+    conn.close()
+
+    assert [s.session_id for s in repo.get_active_sessions()] == ["work-1"]
+    assert [s["session_id"] for s in repo.get_sessions_for_activity()] == ["work-1"]
+    assert [c["active_session_id"] for c in repo.list_active_conversations()] == ["work-1"]
+    assert repo.resolve_id("standby") is None
@@ -0,0 +1,106 @@
+"""Unit tests for the tmux control-mode client (real tmux, private server)."""
+
+import asyncio
+import subprocess
+
+import pytest
+
+from core import tmux
+from core.config import settings
+
+
+def test_quote_arg_and_unescape_output():
+    assert tmux.quote_arg('say "hi"; $HOME \\') == '"say \\"hi\\"; \\$HOME \\\\"'
+    assert tmux.quote_arg("a\nb\x1b") == '"a\\012b\\033"'
+    assert tmux.unescape_output(b"ok\\015\\012back\\134slash") == b"ok\r\nback\\slash"
+
+
+async def _collect(queue, until, timeout=3.0):
+    events = []
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while not until(events):
+        events.append(await asyncio.wait_for(queue.get(), deadline - loop.time()))
+    return events
+
+
+def test_client_correlates_pipelined_replies_and_pushes_events(tmux_server):
+    async def scenario():
+        client = tmux.TmuxControlClient()
+        await client.start()
+        try:
+            replies = await asyncio.gather(
+                *(client.command("display-message", "-p", f"reply {i}") for i in range(50))
+            )
+            assert replies == [[f"reply {i}"] for i in range(50)]
+
+            with pytest.raises(tmux.TmuxError, match="can't find window"):
+                await client.pipeline([
+                    ("display-message", "-p", "first"),
+                    ("send-keys", "-t", "life:nope", "x"),
+                ])
+            assert await client.command("display-message", "-p", "still in step") == ["still in step"]
+
+            queue = client.subscribe(kinds=["output", "title"])
+            await client.command("send-keys", "-t", tmux_server, "-l", "ping\n")
+            await client.command("select-pane", "-t", tmux_server, "-T", "Working on it")
+            events = await _collect(queue, lambda evs: (
+                "ping" in "".join(e.data for e in evs if e.kind == "output")
+                and any(e.kind == "title" and e.data == "Working on it" for e in evs)
+            ))
+            assert {e.pane for e in events} == {"%0"}
+        finally:
+            await client.close()
+        assert not client.running
+
+    asyncio.run(scenario())
+
+
+def test_sync_helpers_share_one_connection_and_fall_back(tmux_server, monkeypatch):
+    assert tmux.inject_message(tmux_server, 'line one\nsays "hi" to $USER', submit=False)
+    client = tmux.get_control_client()
+    assert client is not None
+    assert "says \"hi\" to $USER" in tmux.capture_pane(tmux_server)
+    assert tmux.window_exists("main") and not tmux.window_exists("nope")
+    assert client.stats["commands"] >= 4
+    with pytest.raises(subprocess.CalledProcessError):
+        tmux.send_keys("life:nope", "x")
+
+    # Control mode off: same results by spawning tmux
+    tmux.close_control_client()
+    monkeypatch.setattr(settings, "tmux_control_mode", False)
+    assert tmux.get_control_client() is None
+    assert tmux.send_keys(tmux_server, "-l", "spawned").returncode == 0
+    assert "spawned" in tmux.capture_pane(tmux_server)
+    assert tmux.window_exists("main")
+
+
+def test_send_text_async_waits_for_pane_lock_held_by_a_thread(monkeypatch):
+    sent = []
+
+    async def fake_send_keys(target, *keys):
+        sent.append(keys)
+
+    monkeypatch.setattr(tmux, "send_keys_async", fake_send_keys)
+    lock = tmux._get_pane_lock("life:lock-test")
+
+    async def scenario():
+        lock.acquire()
+        task = asyncio.create_task(tmux.send_text_async("life:lock-test", "hi", submit=False))
+        await asyncio.sleep(0.05)
+        assert not task.done() and sent == []
+        lock.release()
+        assert await asyncio.wait_for(task, 2)
+
+        # Cancelled while waiting: the lock must not stay held afterwards
+        lock.acquire()
+        task = asyncio.create_task(tmux.send_text_async("life:lock-test", "bye", submit=False))
+        await asyncio.sleep(0.05)
+        task.cancel()
+        lock.release()
+        await asyncio.sleep(0.1)
+        return lock.acquire(timeout=1)
+
+    assert asyncio.run(scenario())
+    lock.release()
+    assert sent == [("-l", "hi")]
@@ -0,0 +1,81 @@
+"""Unit tests for the shared transcript hub."""
+
+import asyncio
+import json
+
+from modules.sessions.transcript_hub import TranscriptHub
+
+
+def _assistant(uuid):
+    return json.dumps({"type": "assistant", "uuid": uuid, "timestamp": "t", "message": {"content": [
+        {"type": "thinking", "thinking": "hmm"},
+        {"type": "text", "text": "hi"},
+    ]}}) + "\n"
+
+
+async def _collect(stream, count):
+    events = []
+    async for event in stream:
+        if event["type"] != "connected":
+            events.append(event)
+        if len(events) == count:
+            break
+    return events
+
+
+def test_one_reader_fans_out_with_per_viewer_filtering(tmp_path):
+    path = tmp_path / "t.jsonl"
+    path.write_text(_assistant("old"))
+
+    async def scenario():
+        hub = TranscriptHub()
+        full = asyncio.create_task(_collect(hub.stream(path, include_thinking=True), 2))
+        brief = asyncio.create_task(_collect(hub.stream(path, include_thinking=False), 1))
+        history = asyncio.create_task(_collect(hub.stream(path, after_uuid="missing", from_beginning=True), 4))
+        await asyncio.sleep(0.2)
+        assert len(hub.stats()) == 1
+
+        with open(path, "a") as f:
+            f.write(_assistant("new"))
+        results = await asyncio.wait_for(asyncio.gather(full, brief, history), timeout=5)
+        await asyncio.sleep(0)
+        return results, hub.stats()
+
+    (full, brief, history), stats = asyncio.run(scenario())
+    assert [e["type"] for e in full] == ["thinking", "text"]
+    assert [e["type"] for e in brief] == ["text"]
+    # Backlog from the start, then live events, with no gap or duplicate
+    assert [e["uuid"] for e in history] == ["old", "old", "new", "new"]
+    # Last viewer gone - reader torn down
+    assert stats == {}
+
+
+def test_lagging_viewer_resyncs_from_the_file(tmp_path, monkeypatch):
+    from modules.sessions import transcript_hub as hub_module
+
+    monkeypatch.setattr(hub_module, "VIEWER_QUEUE_SIZE", 4)
+    path = tmp_path / "t.jsonl"
+    path.write_text("")
+
+    async def scenario():
+        hub = TranscriptHub()
+        stream = hub.stream(path, include_thinking=False)
+        assert (await stream.__anext__())["type"] == "connected"
+        reader = next(iter(hub._readers.values()))
+        (viewer,) = reader.viewers
+
+        # Ten events land while the viewer isn't reading
+        with open(path, "a") as f:
+            for i in range(10):
+                f.write(_assistant(f"u{i}"))
+        await reader._drain()
+        assert viewer.queue.qsize() == 4 and viewer.lagged_from is not None
+
+        events = [await asyncio.wait_for(stream.__anext__(), timeout=5) for _ in range(10)]
+        await stream.aclose()
+        return events, hub.stats()
+
+    events, stats = asyncio.run(scenario())
+    # Nothing lost or duplicated across the resync
+    assert [e["uuid"] for e in events] == [f"u{i}" for i in range(10)]
+    assert stats == {}
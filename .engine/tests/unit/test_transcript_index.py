@@ -0,0 +1,72 @@
+"""Unit tests for the transcript offset index and windowed get_all_events."""
+
+import json
+
+from core.config import settings
+from modules.sessions import transcript_index
+from modules.sessions.transcript import get_all_events
+from modules.sessions.transcript_index import TranscriptIndex, get_transcript_index
+
+
+def _line(**data):
+    return json.dumps(data) + "\n"
+
+
+def _user(uuid, text):
+    return _line(type="user", uuid=uuid, timestamp="t", message={"content": text})
+
+
+def _assistant(uuid, text):
+    return _line(type="assistant", uuid=uuid, timestamp="t",
+                 message={"content": [{"type": "text", "text": text}]})
+
+
+def test_incremental_index_and_windowed_events(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "transcript_index_dir", tmp_path / "idx")
+    path = tmp_path / "session.jsonl"
+    path.write_text(
+        _user("u1", "hello")
+        + _assistant("a1", "hi")
+        + "\n"
+        + _line(type="queue-operation", operation="enqueue", content="later", timestamp="q1")
+        + _line(type="queue-operation", operation="dequeue", timestamp="q2")
+    )
+
+    events = get_all_events(path)
+    assert [e["uuid"] for e in events] == ["u1", "a1", "queue-q1"]
+    # Dequeued with no matching user message: shown as a normal message
+    assert "queued" not in events[2]
+
+    index = get_transcript_index(path)
+    assert index.line_count == 4
+    assert index.dequeue_count == 1 and index.enqueue_count == 1
+
+    # Append: only new bytes are indexed, and the real message dedups the enqueue
+    with open(path, "a") as f:
+        f.write(_user("u2", "later") + _assistant("a2", "ok"))
+    assert [e["uuid"] for e in get_all_events(path)] == ["u1", "a1", "u2", "a2"]
+    assert [e["uuid"] for e in get_all_events(path, start_line=4, end_line=5)] == ["u2"]
+
+    # Resume offset lands just past the requested line
+    with open(path, "rb") as f:
+        f.seek(index.offset_after("a1"))
+        assert json.loads(f.readline())["type"] == "queue-operation"
+
+    # Sidecar round-trips (writes are throttled, so force one)
+    index.save()
+    reloaded = TranscriptIndex(path)
+    assert reloaded.load()
+    assert reloaded.uuids == index.uuids and reloaded.parsed_offset == path.stat().st_size
+
+
+def test_rewritten_transcript_is_reindexed(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "transcript_index_dir", tmp_path / "idx")
+    monkeypatch.setattr(transcript_index, "_INDEXES", transcript_index.OrderedDict())
+    path = tmp_path / "session.jsonl"
+    path.write_text(_user("u1", "one") + _user("u2", "two"))
+    assert get_transcript_index(path).line_count == 2
+
+    path.write_text(_user("u3", "three"))
+    index = get_transcript_index(path)
+    assert index.line_count == 1
+    assert index.line_of("u1") is None and index.line_of("u3") == 0
@@ -0,0 +1,73 @@
+"""Unit tests for tail-reading pending-question detection."""
+
+import json
+from collections import OrderedDict
+
+from modules.sessions import transcript
+from modules.sessions.transcript import has_pending_question
+
+
+def _ask(tool_id):
+    return json.dumps({"type": "assistant", "message": {"content": [
+        {"type": "tool_use", "id": tool_id, "name": "AskUserQuestion", "input": {}},
+    ]}}) + "\n"
+
+
+def _answer(tool_id):
+    return json.dumps({"type": "user", "message": {"content": [
+        {"type": "tool_result", "tool_use_id": tool_id, "content": "ok"},
+    ]}}) + "\n"
+
+
+def _filler(n):
+    return "".join(json.dumps({"type": "user", "message": {"content": f"m{i}"}}) + "\n" for i in range(n))
+
+
+def test_pending_question_tracks_appends(tmp_path, monkeypatch):
+    monkeypatch.setattr(transcript, "TAIL_BLOCK_SIZE", 256)
+    path = tmp_path / "t.jsonl"
+    path.write_text(_filler(500) + _ask("q1") + _filler(3))
+    assert has_pending_question(path)
+
+    # Answer appended: only the new bytes are read
+    with open(path, "a") as f:
+        f.write(_answer("q1"))
+    assert not has_pending_question(path)
+
+    # A partially written line is ignored until complete
+    with open(path, "a") as f:
+        f.write(_ask("q2")[:20])
+    assert not has_pending_question(path)
+    with open(path, "a") as f:
+        f.write(_ask("q2")[20:])
+    assert has_pending_question(path)
+
+    # Questions older than the window no longer count
+    with open(path, "a") as f:
+        f.write(_filler(transcript.PENDING_WINDOW_LINES))
+    assert not has_pending_question(path)
+
+
+def test_tail_scan_only_sees_recent_window(tmp_path):
+    path = tmp_path / "t.jsonl"
+    path.write_text(_ask("old") + _filler(200))
+    assert not has_pending_question(path)
+
+
+def test_state_cache_is_bounded_and_reads_hold_per_path_locks(tmp_path, monkeypatch):
+    monkeypatch.setattr(transcript, "INTERACTIVE_STATE_MAX", 2)
+    monkeypatch.setattr(transcript, "_interactive_states", OrderedDict())
+    monkeypatch.setattr(transcript, "_interactive_locks", {})
+    paths = []
+    for name in ("a", "b", "c"):
+        path = tmp_path / f"{name}.jsonl"
+        path.write_text(_ask(name))
+        paths.append(path)
+        assert has_pending_question(path)
+    # Least recently used transcript dropped, with its lock
+    assert list(transcript._interactive_states) == [str(paths[1]), str(paths[2])]
+    assert str(paths[0]) not in transcript._interactive_locks
+
+    # A read in progress on one transcript doesn't block another
+    with transcript._interactive_path_lock(str(paths[1])):
+        assert has_pending_question(paths[0])
@@ -59,6 +59,8 @@ export function EventStreamProvider({ children }: EventStreamProviderProps) {
 	const reconnectAttempts = useRef(0);
 	const connectedRef = useRef(false);
 	const isVisibleRef = useRef(true);
+	// Last SSE id seen - lets the backend replay only what we missed
+	const lastEventIdRef = useRef<string | null>(null);
 
 	const connect = () => {
 		// Don't connect if tab is hidden
@@ -69,7 +71,9 @@ export function EventStreamProvider({ children }: EventStreamProviderProps) {
 			eventSourceRef.current.close();
 		}
 
-		const eventSource = new EventSource(`${API_BASE}/api/system/events`);
+		const resumeFrom = lastEventIdRef.current;
+		const query = resumeFrom ? `?last_event_id=${encodeURIComponent(resumeFrom)}` : '';
+		const eventSource = new EventSource(`${API_BASE}/api/system/events${query}`);
 		eventSourceRef.current = eventSource;
 
 		eventSource.onopen = () => {
@@ -78,13 +82,20 @@ export function EventStreamProvider({ children }: EventStreamProviderProps) {
 			connectedRef.current = true;
 			reconnectAttempts.current = 0;
 
-			// If reconnecting after a disconnect, invalidate all queries
-			// (backend is back, data may be stale)
-			if (wasDisconnected) {
+			// If reconnecting after a disconnect with nothing to resume from,
+			// invalidate all queries (backend is back, data may be stale).
+			// With a last id the backend replays missed events instead.
+			if (wasDisconnected && !resumeFrom) {
 				queryClient.invalidateQueries();
 			}
 		};
 
+		// Missed events aged out of the backend's replay log - full reload
+		eventSource.addEventListener('resync', () => {
+			lastEventIdRef.current = null;
+			queryClient.invalidateQueries();
+		});
+
 		eventSource.onerror = () => {
 			setConnected(false);
 			connectedRef.current = false;
@@ -99,6 +110,7 @@ export function EventStreamProvider({ children }: EventStreamProviderProps) {
 
 		// Handle all event types
 		eventSource.onmessage = (e) => {
+			if (e.lastEventId) lastEventIdRef.current = e.lastEventId;
 			try {
 				const event: SystemEvent = JSON.parse(e.data);
 
@@ -137,6 +149,7 @@ export function EventStreamProvider({ children }: EventStreamProviderProps) {
 
 		eventTypes.forEach((eventType) => {
 			eventSource.addEventListener(eventType, (e: MessageEvent) => {
+				if (e.lastEventId) lastEventIdRef.current = e.lastEventId;
 				try {
 					const event: SystemEvent = JSON.parse(e.data);
 
@@ -177,10 +190,12 @@ export function EventStreamProvider({ children }: EventStreamProviderProps) {
 					clearTimeout(reconnectTimeoutRef.current);
 				}
 			} else {
-				// Tab visible - reconnect and refresh stale data
+				// Tab visible - reconnect; missed events are replayed, so only
+				// refetch everything when there's nothing to resume from
+				if (!lastEventIdRef.current) {
+					queryClient.invalidateQueries();
+				}
 				connect();
-				// Mark all queries as stale to trigger background refetch
-				queryClient.invalidateQueries();
 			}
 		};
 
@@ -58,6 +58,8 @@ export function FileEventProvider({ children }: { children: ReactNode }) {
 	const reconnectTimeoutRef = useRef<NodeJS.Timeout | null>(null);
 	const reconnectAttemptsRef = useRef(0);
 	const isVisibleRef = useRef(true);
+	// Last SSE id seen - reconnects resume from here instead of missing changes
+	const lastEventIdRef = useRef<string | null>(null);
 
 	const dispatch = useCallback((eventType: FileEventType, data: FileChangeEvent) => {
 		for (const sub of subscriptionsRef.current.values()) {
@@ -77,7 +79,9 @@ export function FileEventProvider({ children }: { children: ReactNode }) {
 			eventSourceRef.current.close();
 		}
 
-		const eventSource = new EventSource(`${API_BASE}/api/files/events`);
+		const resumeFrom = lastEventIdRef.current;
+		const query = resumeFrom ? `?last_event_id=${encodeURIComponent(resumeFrom)}` : '';
+		const eventSource = new EventSource(`${API_BASE}/api/files/events${query}`);
 		eventSourceRef.current = eventSource;
 
 		eventSource.onopen = () => {
@@ -86,6 +90,8 @@ export function FileEventProvider({ children }: { children: ReactNode }) {
 		};
 
 		const handleSSE = (eventType: FileEventType) => (e: Event) => {
+			const { lastEventId } = e as MessageEvent;
+			if (lastEventId) lastEventIdRef.current = lastEventId;
 			try {
 				const data: FileChangeEvent = JSON.parse((e as MessageEvent).data);
 				dispatch(eventType, data);
@@ -102,6 +108,11 @@ export function FileEventProvider({ children }: { children: ReactNode }) {
 		// Heartbeat events keep connection alive
 		eventSource.addEventListener('heartbeat', () => {});
 
+		// Changes aged out of the backend's replay log - start fresh
+		eventSource.addEventListener('resync', () => {
+			lastEventIdRef.current = null;
+		});
+
 		eventSource.onerror = () => {
 			setConnected(false);
 			eventSource.close();